@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""Benchmark the executor's ready-queue on synthetic gate graphs.
+
+Builds layered random DAGs (default: 1,000 gates, up to 3 dependencies
+each on earlier gates) and reports:
+
+* **ready-queue** — pure scheduling cost of ``ReadyQueue`` when gates
+  complete one per iteration (the worst case for the scheduler loop);
+* **rescan** — the same replay using the previous strategy of rescanning
+  every pending gate and re-checking ``deps <= satisfied`` each iteration;
+* **executor** — a full ``CheckExecutor.run_checks`` over instant gates,
+  i.e. everything the scheduler adds on top of the gates themselves;
+* **packing** — one ``pack_budget`` call choosing among 200 (default)
+  ready timed gates under a swabbing budget, the per-iteration cost the
+  time-budget lane adds.  It should stay under a millisecond.
+
+Usage:
+    python scripts/bench_scheduler.py [--gates 1000] [--repeat 3]
+                                      [--candidates 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from slopmop.checks.base import BaseCheck, Flaw, GateCategory  # noqa: E402
+from slopmop.core.executor import CheckExecutor  # noqa: E402
+from slopmop.core.registry import CheckRegistry  # noqa: E402
+from slopmop.core.result import CheckResult, CheckStatus  # noqa: E402
+from slopmop.core.scheduling import ReadyQueue, pack_budget  # noqa: E402
+
+
+def synthetic_graph(
+    gates: int, max_deps: int = 3, seed: int = 0
+) -> Dict[str, Set[str]]:
+    """Random DAG: each gate depends on up to *max_deps* earlier gates."""
+    rng = random.Random(seed)
+    names = [f"overconfidence:g{i:04d}" for i in range(gates)]
+    graph: Dict[str, Set[str]] = {}
+    for i, name in enumerate(names):
+        k = rng.randint(0, min(max_deps, i))
+        graph[name] = set(rng.sample(names[:i], k)) if k else set()
+    return graph
+
+
+def replay_ready_queue(graph: Dict[str, Set[str]]) -> int:
+    """Complete gates one at a time through a ReadyQueue; return iterations."""
+    queue = ReadyQueue(graph)
+    pending = set(graph)
+    results: Dict[str, bool] = {}
+    iterations = 0
+    backlog: List[str] = []
+    while pending or backlog:
+        iterations += 1
+        queue.observe(results)
+        for name in queue.pop_ready(pending):
+            pending.discard(name)
+            backlog.append(name)
+        if backlog:
+            results[backlog.pop(0)] = True
+    return iterations
+
+
+def replay_rescan(graph: Dict[str, Set[str]]) -> int:
+    """Same replay with the old rescan-every-pending-gate strategy."""
+    pending = set(graph)
+    results: Dict[str, CheckResult] = {}
+    iterations = 0
+    backlog: List[str] = []
+    while pending or backlog:
+        iterations += 1
+        satisfied = set(results)
+        for name in list(pending):
+            deps = graph[name]
+            if deps <= satisfied and all(
+                results.get(d, CheckResult(d, CheckStatus.PASSED, 0)).passed
+                for d in deps
+            ):
+                pending.discard(name)
+                backlog.append(name)
+        if backlog:
+            done = backlog.pop(0)
+            results[done] = CheckResult(done, CheckStatus.PASSED, 0)
+    return iterations
+
+
+def synthetic_timings(candidates: int, seed: int = 0) -> Dict[str, float]:
+    """Historical durations for *candidates* ready timed gates (1-120s)."""
+    rng = random.Random(seed)
+    return {
+        f"overconfidence:t{i:04d}": rng.uniform(1.0, 120.0) for i in range(candidates)
+    }
+
+
+def time_packing(
+    timings: Dict[str, float], budget: float = 600.0, slots: int = 32, calls: int = 200
+) -> float:
+    """Mean seconds per ``pack_budget`` call over all of *timings*."""
+    names = list(timings)
+    start = time.perf_counter()
+    for _ in range(calls):
+        pack_budget(names, timings, budget, slots)
+    return (time.perf_counter() - start) / calls
+
+
+def _instant_check_class(full_name: str, deps: Sequence[str]) -> type:
+    short = full_name.split(":", 1)[1]
+
+    class InstantCheck(BaseCheck):
+        @property
+        def name(self) -> str:
+            return short
+
+        @property
+        def display_name(self) -> str:
+            return short
+
+        @property
+        def category(self) -> GateCategory:
+            return GateCategory.OVERCONFIDENCE
+
+        @property
+        def flaw(self) -> Flaw:
+            return Flaw.OVERCONFIDENCE
+
+        @property
+        def depends_on(self) -> List[str]:
+            return list(deps)
+
+        def is_applicable(self, project_root: str) -> bool:
+            return True
+
+        def run(self, project_root: str) -> CheckResult:
+            return CheckResult(self.full_name, CheckStatus.PASSED, 0.0)
+
+    return InstantCheck
+
+
+def run_executor(graph: Dict[str, Set[str]]) -> float:
+    """Run every gate of *graph* through CheckExecutor; return seconds."""
+    registry = CheckRegistry()
+    for name, deps in graph.items():
+        registry.register(_instant_check_class(name, sorted(deps)))
+    executor = CheckExecutor(registry=registry, fail_fast=False)
+    with tempfile.TemporaryDirectory() as root:
+        start = time.perf_counter()
+        summary = executor.run_checks(root, list(graph), use_cache=False)
+        elapsed = time.perf_counter() - start
+    if summary.passed != len(graph):
+        raise RuntimeError(f"expected {len(graph)} passes, got {summary.passed}")
+    return elapsed
+
+
+def _best_of(repeat: int, fn: Callable[..., object], *args: object) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark the executor ready-queue on synthetic gate graphs."
+    )
+    parser.add_argument("--gates", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--candidates",
+        type=int,
+        default=200,
+        help="Ready timed gates offered to the budget packer.",
+    )
+    parser.add_argument(
+        "--skip-executor",
+        action="store_true",
+        help="Only time the scheduling replays, not a full executor run.",
+    )
+    args = parser.parse_args(argv)
+
+    graph = synthetic_graph(args.gates, seed=args.seed)
+    edges = sum(len(deps) for deps in graph.values())
+    print(f"{args.gates} gates, {edges} dependency edges")
+    print(f"  ready-queue : {_best_of(args.repeat, replay_ready_queue, graph):.4f}s")
+    print(f"  rescan      : {_best_of(args.repeat, replay_rescan, graph):.4f}s")
+    packing = min(
+        time_packing(synthetic_timings(args.candidates, seed=args.seed))
+        for _ in range(args.repeat)
+    )
+    print(
+        f"  packing     : {packing * 1000:.3f}ms per call ({args.candidates} candidates)"
+    )
+    if not args.skip_executor:
+        best = min(run_executor(graph) for _ in range(args.repeat))
+        print(f"  executor    : {best:.4f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
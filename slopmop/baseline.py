@@ -161,6 +161,9 @@ def filter_summary_against_baseline(
         errors=sum(1 for r in preserved_results if r.status == CheckStatus.ERROR),
         total_duration=summary.total_duration,
         results=preserved_results,
+        timed_out=sum(1 for r in preserved_results if r.status == CheckStatus.TIMEOUT),
+        cache_stats=summary.cache_stats,
+        git=summary.git,
     )
 
     metadata: Dict[str, object] = {
@@ -5,24 +5,39 @@ This enables the Open/Closed principle - add new checks without modifying
 existing code.
 """
 
+import asyncio
 import logging
 import os
 import shutil
 import subprocess
+import time
 import warnings
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any, ClassVar, Dict, Iterable, List, Optional
+from types import ModuleType
+from typing import Any, ClassVar, Dict, Iterable, Iterator, List, Optional, Union
 
 from slopmop.checks.metadata import Reasoning, builtin_reasoning_for_check_class
+from slopmop.core.async_backend import LoopBackedRunner
+from slopmop.core.cache import InputScope, compute_fingerprint, scoped_fingerprint
+from slopmop.core.cache_explain import input_manifest
+from slopmop.core.file_cache import FileFindingCache, config_key, source_salt
+from slopmop.core.line_count import line_count
+from slopmop.core.resources import ResourceProfile
 from slopmop.core.result import (
     CheckResult,
     CheckStatus,
     Finding,
     ScopeInfo,
 )
+from slopmop.core.snapshot import active_snapshot
+from slopmop.core.tool_identity import (
+    describe_tools,
+    tool_identity,
+    with_tool_identity,
+)
 from slopmop.subprocess.runner import SubprocessResult, SubprocessRunner, get_runner
 from slopmop.utils import is_path_excluded
 
@@ -181,6 +196,27 @@ class ToolContext(Enum):
     DENO = "deno"
 
 
+class ExecutionAffinity(Enum):
+    """Where a gate's ``run()`` does its work — decides which pool runs it.
+
+    SUBPROCESS — The gate is a wrapper: it spends its wall clock blocked on
+                 an external tool (``process.communicate()``), releasing the
+                 GIL while it waits.  A worker thread is the right home.
+                 This is the default for all gates.
+
+    IN_PROCESS_CPU — The gate does its work in Python (AST walking, regex
+                     scanning over every file).  Threads serialize these
+                     behind the GIL, so the executor may route them to a
+                     process pool when one is enabled.  Gates declaring
+                     this must survive a pickle round-trip (instance state
+                     is plain data) and must not rely on executor-side
+                     mutable state during ``run()``.
+    """
+
+    SUBPROCESS = "subprocess"
+    IN_PROCESS_CPU = "in_process_cpu"
+
+
 def find_tool(name: str, project_root: str) -> Optional[str]:
     """Find a tool executable, preferring the project's own environment.
 
@@ -330,8 +366,19 @@ def git_project_files(
     ``git ls-files -co --exclude-standard`` lists tracked files plus untracked
     ones that aren't ignored — exactly "the project's own files", straight from
     the authority that already knows. Returns None when this isn't a git repo
-    or git can't be run, so callers fall back to walking.
+    or git can't be run, so callers fall back to walking.  During a run the
+    listing comes from the shared project snapshot, so git runs once.
     """
+    snapshot = active_snapshot(project_root)
+    if snapshot is not None:
+        listed = snapshot.git_files(timeout)
+        if listed is None:
+            return None
+        return [
+            f
+            for f in listed
+            if extensions is None or os.path.splitext(f)[1] in extensions
+        ]
     try:
         result = subprocess.run(  # nosec B603 B607 - fixed argv, no shell
             ["git", "ls-files", "-co", "--exclude-standard", "-z"],
@@ -508,7 +555,11 @@ def count_source_scope(
 
     Provides a fast, lightweight scan for scope metrics — no parsing,
     just file counting and line counting.  Used by checks to report
-    how many files/LOC they examined.
+    how many files/LOC they examined.  Files come from
+    :func:`iter_source_files` (the run's snapshot, or a walk that never
+    enters pruned directories); lines from
+    :func:`~slopmop.core.line_count.line_count`, which reads each file
+    once per process.
 
     Args:
         project_root: Project root directory
@@ -519,48 +570,71 @@ def count_source_scope(
     Returns:
         ScopeInfo with file and line counts
     """
-    root = Path(project_root)
-    dirs = include_dirs or ["."]
-    excluded = SCOPE_EXCLUDED_DIRS | (exclude_dirs or set())
+    rels = list(
+        iter_source_files(project_root, include_dirs, extensions or None, exclude_dirs)
+    )
+    snapshot = active_snapshot(project_root)
+    if snapshot is not None:
+        lines = sum(snapshot.line_count(rel) for rel in rels)
+    else:
+        root = Path(project_root)
+        lines = sum(line_count(root / rel) for rel in rels)
+    return ScopeInfo(files=len(rels), lines=lines)
+
+
+def iter_source_files(
+    project_root: str,
+    include_dirs: Optional[List[str]] = None,
+    extensions: Optional[Iterable[str]] = None,
+    exclude_dirs: Optional[Iterable[str]] = None,
+) -> Iterator[str]:
+    """Yield project-relative POSIX paths of the files a gate should scan.
 
-    total_files = 0
-    total_lines = 0
+    Dot directories, ``SCOPE_EXCLUDED_DIRS`` and ``*.egg-info`` are always
+    pruned; *exclude_dirs* filters (see :func:`is_path_excluded`) prune
+    matching directories and files on top.  During a run the answer comes
+    from the shared project snapshot instead of another walk.
 
+    Args:
+        project_root: Project root directory
+        include_dirs: Directories to scan (relative to root). Defaults to ["."]
+        extensions: File extensions to include. None = every file
+        exclude_dirs: Additional directories/filters to exclude
+    """
+    dirs = include_dirs or ["."]
+    excluded = SCOPE_EXCLUDED_DIRS | set(exclude_dirs or ())
+    snapshot = active_snapshot(project_root)
+    if snapshot is not None and snapshot.covers(dirs):
+        yield from snapshot.files(dirs, extensions, excluded)
+        return
+
+    # Walk lazily so callers with a file budget can stop early.
+    wanted = None if extensions is None else set(extensions)
+    root = Path(project_root)
+    seen: set[str] = set()
     for dir_name in dirs:
         scan_path = root / dir_name
-        if not scan_path.exists():
+        if not scan_path.is_dir():
             continue
-
-        for file_path in scan_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-
-            # Skip excluded directories
-            rel_path = file_path.relative_to(root)
-            if is_path_excluded(rel_path, excluded):
-                continue
-            if any(should_prune_dir(p) for p in rel_path.parts[:-1]):
-                continue
-
-            # Skip .egg-info directories (not exact match, contains pattern)
-            rel_str = str(rel_path)
-            if ".egg-info" in rel_str:
-                continue
-
-            # Filter by extension if specified
-            if extensions and file_path.suffix not in extensions:
-                continue
-
-            total_files += 1
-            try:
-                content = file_path.read_text(errors="replace")
-                total_lines += content.count("\n") + (
-                    1 if content and not content.endswith("\n") else 0
+        for root_dir, subdirs, files in os.walk(scan_path):
+            rel_root = Path(root_dir).relative_to(root)
+            subdirs[:] = [
+                d
+                for d in subdirs
+                if not (
+                    should_prune_dir(d)
+                    or ".egg-info" in d
+                    or is_path_excluded(rel_root / d, excluded)
                 )
-            except (OSError, UnicodeDecodeError):
-                pass  # Skip unreadable files
-
-    return ScopeInfo(files=total_files, lines=total_lines)
+            ]
+            for fname in files:
+                if wanted is not None and os.path.splitext(fname)[1] not in wanted:
+                    continue
+                rel = (rel_root / fname).as_posix()
+                if rel in seen or is_path_excluded(rel, excluded):
+                    continue
+                seen.add(rel)
+                yield rel
 
 
 class Flaw(Enum):
@@ -862,6 +936,7 @@ class BaseCheck(ABC):
 
     Optional overrides:
     - tool_context: ToolContext declaring how tools are resolved
+    - resource_profile: ResourceProfile used for executor packing
     - depends_on: List of check names this depends on
     - config_schema: Additional config fields beyond standard ones
     - init_config(): init-time config discovery for this gate only
@@ -918,6 +993,16 @@ class BaseCheck(ABC):
     # rather than relying on gate-name string matching.
     is_formatting_gate: ClassVar[bool] = False
 
+    # Which executor lane runs this gate.  Wrappers around external tools
+    # stay on the thread pool; pure-Python CPU-bound gates declare
+    # IN_PROCESS_CPU so they can escape the GIL.  See ExecutionAffinity.
+    execution_affinity: ClassVar[ExecutionAffinity] = ExecutionAffinity.SUBPROCESS
+
+    # What one run costs the machine (cores, peak RSS, I/O-bound, whether the
+    # tool fans out on its own).  The executor packs gates against detected
+    # capacity using this; the default is "one core, modest memory".
+    resource_profile: ClassVar[ResourceProfile] = ResourceProfile()
+
     # External tools a gate needs are declared via requirements() (the
     # Requirement contract — name, exact pin, kind/probe, install_hint). The
     # former required_tools / required_tool_versions / install_hint class
@@ -934,6 +1019,24 @@ class BaseCheck(ABC):
         """
         self.config = config
         self._runner = runner or get_runner()
+        # Inputs behind the last cache_fingerprint(), for `sm cache explain`.
+        self.cache_manifest: Optional[Dict[str, Any]] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle support for the process-pool lane.
+
+        The subprocess runner holds a lock and live ``Popen`` handles, none of
+        which can cross a process boundary.  Drop it here; the receiving
+        process re-attaches its own module-level runner in ``__setstate__``.
+        """
+        state = self.__dict__.copy()
+        state.pop("_runner", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for key, value in state.items():
+            setattr(self, key, value)
+        self._runner = get_runner()
 
     @property
     @abstractmethod
@@ -1212,23 +1315,98 @@ class BaseCheck(ABC):
         # Default implementation provides a generic message
         return "Not applicable to this project"
 
+    def input_scope(self, project_root: str) -> Optional[InputScope]:
+        """Declare the files this check's verdict depends on, as data.
+
+        When a check inspects only a well-defined subset of files (e.g.
+        only ``*.py`` files in ``src_dirs``), it should return that
+        subset as an :class:`~slopmop.core.cache.InputScope`.  Its cache
+        key then covers only those files plus :meth:`cache_config`, so
+        editing a JavaScript file won't invalidate a Python-only check's
+        cache — and vice versa.  Equal scopes are hashed once per run,
+        however many gates declare them.
+
+        The default returns ``None``: the project-wide fingerprint
+        (conservative, always correct, but invalidates on *any* source
+        change).
+        """
+        return None
+
+    def cache_config(self) -> Dict[str, Any]:
+        """The config folded into a scoped cache key (default: ``config``)."""
+        return self.config
+
     def cache_inputs(self, project_root: str) -> Optional[str]:
         """Return a per-check fingerprint, or ``None`` to use the global one.
 
-        The executor calls this before looking up cached results.  When
-        a check inspects only a well-defined subset of files (e.g. only
-        ``*.py`` files in ``src_dirs``), it should override this method
-        and return a fingerprint scoped to that subset via
-        :func:`slopmop.core.cache.hash_file_scope`.
+        The executor calls this before looking up cached results.  The
+        default derives it from :meth:`input_scope`; override this only
+        when a check's inputs can't be expressed as a scope.
+        """
+        scope = self.input_scope(project_root)
+        if scope is None:
+            return None
+        return scoped_fingerprint(project_root, scope, self.cache_config())
 
-        With a scoped fingerprint, editing a JavaScript file won't
-        invalidate a Python-only check's cache — and vice versa.
+    def cache_tools(self, project_root: str) -> List[object]:
+        """The tools this check's result depends on.
 
-        The default returns ``None``, which tells the executor to fall
-        back to the project-wide fingerprint (conservative, always
-        correct, but invalidates on *any* source change).
+        The executor folds their digest into the cache fingerprint, so
+        upgrading a declared tool (or the project venv, for ``PROJECT``
+        gates) invalidates this gate's cached results and nobody else's.
+        The default covers :meth:`requirements` and the interpreter; see
+        :mod:`slopmop.core.tool_identity`.
         """
-        return None
+        tools: Dict[str, Optional[str]] = {}
+        packages: List[str] = []
+        for req in self.requirements().items:
+            probe = self._effective_probe(req)
+            if probe == "binary":
+                tools[req.name] = self.resolve_requirement_path(req, project_root)
+            elif probe == "import":
+                packages.append(req.name)
+        project_python: Optional[str] = None
+        if self.tool_context is ToolContext.PROJECT:
+            from slopmop.checks.mixins import resolve_project_python
+
+            project_python = resolve_project_python(project_root)[0]
+        return describe_tools(project_root, tools, packages, project_python)
+
+    def cache_fingerprint(
+        self, project_root: str, project_fingerprint: Optional[str] = None
+    ) -> str:
+        """The result-cache key: :meth:`cache_inputs` plus the tool identity.
+
+        *project_fingerprint* is the run's project-wide fingerprint, used
+        when the check declares no scope; ``None`` recomputes it (after an
+        auto-fix has rewritten files).  Also records what the key was made
+        of in :attr:`cache_manifest`, for ``sm cache explain``.
+        """
+        inputs = self.cache_inputs(project_root) or project_fingerprint
+        if inputs is None:
+            inputs = compute_fingerprint(project_root)
+        tools = self.cache_tools(project_root)
+        scope = self.input_scope(project_root)
+        self.cache_manifest = input_manifest(
+            project_root, inputs, scope, self.cache_config(), tools
+        )
+        return with_tool_identity(inputs, tool_identity(tools))
+
+    def file_findings_cache(
+        self, project_root: str, helpers: Iterable[ModuleType] = ()
+    ) -> FileFindingCache:
+        """Return this gate's per-file finding cache.
+
+        For file-local gates — whose findings for a file depend only on
+        that file — so a one-file edit rescans one file instead of the
+        repo.  Entries are keyed by the gate's config and source, so
+        changing either starts afresh.  Pass the shared modules the
+        scan goes through as *helpers* so their source is keyed too.
+        See :mod:`slopmop.core.file_cache`.
+        """
+        salt = source_salt(type(self), tuple(helpers))
+        key = config_key(self.full_name, self.config, salt)
+        return FileFindingCache(project_root, self.full_name, key)
 
     @abstractmethod
     def run(self, project_root: str) -> CheckResult:
@@ -1241,6 +1419,26 @@ class BaseCheck(ABC):
             CheckResult with status, output, and any error info
         """
 
+    async def run_async(
+        self, project_root: str, runner: Optional[SubprocessRunner] = None
+    ) -> CheckResult:
+        """Execute the check on the executor's asyncio backend.
+
+        The default runs :meth:`run` on a worker thread with *runner* (the
+        event loop's subprocess runner) standing in for ``self._runner``,
+        so every command the gate shells out to is spawned, read and
+        killed by the loop.  :class:`CommandCheck` overrides it to await
+        its command on the loop without holding a thread.
+        """
+        if runner is None:
+            return await asyncio.to_thread(self.run, project_root)
+        previous = self._runner
+        self._runner = runner
+        try:
+            return await asyncio.to_thread(self.run, project_root)
+        finally:
+            self._runner = previous
+
     def can_auto_fix(self) -> bool:
         """Return True if this check can automatically fix issues.
 
@@ -1391,8 +1589,117 @@ class BaseCheck(ABC):
         Returns:
             SubprocessResult
         """
-        if command and cwd and not Path(command[0]).is_absolute():
-            resolved = find_tool(command[0], cwd)
-            if resolved:
-                command = [resolved, *command[1:]]
+        if cwd:
+            command = _resolve_tool_command(command, cwd)
         return self._runner.run(command, cwd=cwd, timeout=timeout, env=env)
+
+
+def _resolve_tool_command(command: List[str], project_root: str) -> List[str]:
+    """*command* with a bare executable name resolved via :func:`find_tool`."""
+    if command and not Path(command[0]).is_absolute():
+        resolved = find_tool(command[0], project_root)
+        if resolved:
+            return [resolved, *command[1:]]
+    return command
+
+
+@dataclass(frozen=True)
+class ToolCommand:
+    """The one tool invocation a :class:`CommandCheck` rests on.
+
+    Attributes:
+        command: Command to run as list of strings
+        timeout: Timeout in seconds (None = the runner's default)
+        env: Environment variables (None = inherit)
+        resolve: Resolve a bare executable name via :func:`find_tool`
+            first, as :meth:`BaseCheck._run_command` does
+    """
+
+    command: List[str]
+    timeout: Optional[int] = None
+    env: Optional[Dict[str, str]] = None
+    resolve: bool = True
+
+
+class CommandCheck(BaseCheck):
+    """A gate whose verdict rests on a single tool invocation.
+
+    The body is split around the command: :meth:`prepare_command` builds
+    it (or settles the gate without running anything) and
+    :meth:`interpret_command` turns its result into the verdict.  On the
+    thread backend :meth:`run` runs the command through ``self._runner``
+    as any gate would.  On the asyncio backend :meth:`run_async` awaits
+    it on the event loop, so the gate holds no worker thread while its
+    tool runs.
+    """
+
+    @abstractmethod
+    def prepare_command(self, project_root: str) -> Union[ToolCommand, CheckResult]:
+        """Build the command to run, or return the result without running one."""
+
+    @abstractmethod
+    def interpret_command(
+        self, project_root: str, result: SubprocessResult, duration: float
+    ) -> CheckResult:
+        """Turn the command's result into this gate's verdict.
+
+        *duration* covers preparation and the command itself.
+        """
+
+    def command_error(self, error: Exception, duration: float) -> CheckResult:
+        """Result for a command that could not be run at all.
+
+        The default re-raises, leaving it to the executor's error handling.
+        """
+        raise error
+
+    def _prepare_resolved(self, project_root: str) -> Union[ToolCommand, CheckResult]:
+        step = self.prepare_command(project_root)
+        if isinstance(step, ToolCommand) and step.resolve:
+            command = _resolve_tool_command(step.command, project_root)
+            return ToolCommand(command, step.timeout, step.env, resolve=False)
+        return step
+
+    def run(self, project_root: str) -> CheckResult:
+        start_time = time.time()
+        step = self.prepare_command(project_root)
+        if isinstance(step, CheckResult):
+            return step
+        run = self._run_command if step.resolve else self._runner.run
+        try:
+            result = run(
+                step.command, cwd=project_root, timeout=step.timeout, env=step.env
+            )
+        except Exception as e:
+            return self.command_error(e, time.time() - start_time)
+        return self.interpret_command(project_root, result, time.time() - start_time)
+
+    async def run_async(
+        self, project_root: str, runner: Optional[SubprocessRunner] = None
+    ) -> CheckResult:
+        """Run the command on the event loop that owns *runner*.
+
+        Preparation and interpretation still run on a worker thread (they
+        may touch the filesystem); only the command itself is awaited.
+        Validation uses this gate's own runner's validator.  Without a
+        loop-backed *runner* this falls back to :meth:`BaseCheck.run_async`.
+        """
+        if not isinstance(runner, LoopBackedRunner):
+            return await super().run_async(project_root, runner)
+        start_time = time.time()
+        step = await asyncio.to_thread(self._prepare_resolved, project_root)
+        if isinstance(step, CheckResult):
+            return step
+        try:
+            result = await runner.async_runner.run(
+                step.command,
+                timeout=step.timeout,
+                cwd=project_root,
+                env=step.env,
+                validator=self._runner.validator,
+            )
+        except Exception as e:
+            return self.command_error(e, time.time() - start_time)
+        return await asyncio.to_thread(
+            self.interpret_command, project_root, result, time.time() - start_time
+        )
@@ -24,12 +24,17 @@ See issue #53 for design rationale.
 """
 
 import logging
-import time
 from typing import Any, ClassVar, Dict, List, Optional, Type, cast
 
-from slopmop.checks.base import BaseCheck, GateCategory, GateLevel
+from slopmop.checks.base import (
+    BaseCheck,
+    CommandCheck,
+    GateCategory,
+    GateLevel,
+    ToolCommand,
+)
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
-from slopmop.subprocess.runner import SubprocessRunner
+from slopmop.subprocess.runner import SubprocessResult, SubprocessRunner
 from slopmop.subprocess.validator import CommandValidator
 
 logger = logging.getLogger(__name__)
@@ -126,7 +131,7 @@ def make_custom_check_class(
     }
     resolved_flaw = _CATEGORY_TO_FLAW.get(resolved_category, BaseFlaw.LAZINESS)
 
-    class _CustomCheck(BaseCheck):
+    class _CustomCheck(CommandCheck):
         """Dynamically generated custom gate."""
 
         # Store gate definition as class-level attributes so they
@@ -190,26 +195,23 @@ def make_custom_check_class(
             )
             return bool(result.returncode == 0 and not result.timed_out)
 
-        def run(self, project_root: str) -> CheckResult:
-            start = time.time()
-
-            try:
-                # Run as a shell command so pipes, globs, etc. work
-                result = self._runner.run(
-                    ["sh", "-c", self._command],
-                    cwd=project_root,
-                    timeout=self._timeout,
-                )
-            except Exception as e:
-                return self._create_result(
-                    status=CheckStatus.ERROR,
-                    duration=time.time() - start,
-                    error=f"Failed to execute custom gate command: {e}",
-                    fix_suggestion=f"Check that the command is valid: {self._command}",
-                )
+        def prepare_command(self, project_root: str) -> ToolCommand:
+            # Run as a shell command so pipes, globs, etc. work
+            return ToolCommand(
+                ["sh", "-c", self._command], timeout=self._timeout, resolve=False
+            )
 
-            duration = time.time() - start
+        def command_error(self, error: Exception, duration: float) -> CheckResult:
+            return self._create_result(
+                status=CheckStatus.ERROR,
+                duration=duration,
+                error=f"Failed to execute custom gate command: {error}",
+                fix_suggestion=f"Check that the command is valid: {self._command}",
+            )
 
+        def interpret_command(
+            self, project_root: str, result: SubprocessResult, duration: float
+        ) -> CheckResult:
             if result.timed_out:
                 msg = f"Custom gate timed out after {self._timeout}s"
                 return self._create_result(
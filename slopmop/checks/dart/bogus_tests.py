@@ -2,7 +2,7 @@
 
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import List, Optional, Pattern, Tuple
 
@@ -214,10 +214,20 @@ class DartBogusTestsCheck(BaseCheck):
     def _scan_tests(self, project_root: str) -> List[_BogusFinding]:
         root = Path(project_root).resolve()
         findings: List[_BogusFinding] = []
-        for test_file in find_dart_test_files(project_root):
-            rel = str(test_file.resolve().relative_to(root))
-            content = test_file.read_text(encoding="utf-8", errors="ignore")
-            findings.extend(self._analyze_file(rel, content))
+        with self.file_findings_cache(project_root) as cache:
+            for test_file in find_dart_test_files(project_root):
+                rel = test_file.resolve().relative_to(root).as_posix()
+                found = cache.scan(
+                    rel,
+                    lambda: [
+                        asdict(f)
+                        for f in self._analyze_file(
+                            rel,
+                            test_file.read_text(encoding="utf-8", errors="ignore"),
+                        )
+                    ],
+                )
+                findings.extend(_BogusFinding(**fd) for fd in found)
         return findings
 
     @staticmethod
@@ -11,6 +11,7 @@ from slopmop.checks.base import (
     GateCategory,
     Requirement,
     Requirements,
+    ResourceProfile,
     ToolContext,
     count_source_scope,
     find_tool,
@@ -59,6 +60,7 @@ class FlutterTestsCheck(BaseCheck):
         )
 
     role = CheckRole.FOUNDATION
+    resource_profile = ResourceProfile(memory_mb=1024, spawns_parallelism=True)
 
     @property
     def name(self) -> str:
@@ -22,10 +22,13 @@ treated as its own file.
 from __future__ import annotations
 
 import hashlib
+import logging
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Tuple
 
-from slopmop.core.result import Finding
+from slopmop.core.result import CheckResult, Finding
+
+logger = logging.getLogger(__name__)
 
 # Files above this size are never hashed — a duplicate multi-MB asset is not
 # what this is for, and hashing them on every gate would cost more than the
@@ -145,3 +148,40 @@ def collapse_duplicate_file_findings(
     positioned.extend((order[id(f)], f) for f in passthrough)
     positioned.sort(key=lambda pair: pair[0])
     return [f for _, f in positioned], collapsed
+
+
+def collapse_result_duplicates(result: CheckResult, project_root: str) -> CheckResult:
+    """Merge findings repeated across byte-identical copies of a file.
+
+    A repo that distributes templates or vendors a tool contains identical
+    copies of the same source file, so every gate reports the same defect once
+    per copy. Collapsing here keeps the first-run finding count honest without
+    each gate having to know about it. Failures are swallowed deliberately —
+    noise reduction must never break a gate's real result.
+    """
+    if not result.findings:
+        return result
+    try:
+        merged, collapsed = collapse_duplicate_file_findings(
+            result.findings, project_root
+        )
+        if not collapsed:
+            return result
+        result.findings = merged
+        note = (
+            f"({collapsed} finding(s) collapsed: the same issue in "
+            f"byte-identical copies of the same file.)"
+        )
+        result.output = f"{result.output}\n\n{note}" if result.output else note
+        # The gate baked its own count into `error` before we collapsed, so a
+        # summary reading "5 findings" would contradict the single line now
+        # shown. Annotate rather than rewrite — each gate phrases its count
+        # differently, and silently changing their number would be worse.
+        if result.error:
+            result.error = (
+                f"{result.error} ({len(merged)} unique; "
+                f"{collapsed} in identical copies)"
+            )
+    except Exception as exc:  # noqa: BLE001 — cosmetic pass, never fatal
+        logger.debug(f"finding collapse skipped for {result.name}: {exc}")
+    return result
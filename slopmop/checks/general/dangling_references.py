@@ -44,6 +44,7 @@ from slopmop.checks.base import (
     BaseCheck,
     CheckRole,
     ConfigField,
+    ExecutionAffinity,
     Flaw,
     GateCategory,
     GateLevel,
@@ -124,6 +125,7 @@ class DanglingReferencesCheck(BaseCheck):
 
     tool_context: ClassVar[ToolContext] = ToolContext.PURE
     role = CheckRole.DIAGNOSTIC
+    execution_affinity: ClassVar[ExecutionAffinity] = ExecutionAffinity.IN_PROCESS_CPU
     level = GateLevel.SCOUR
     remediation_churn = RemediationChurn.DOWNSTREAM_CHANGES_VERY_UNLIKELY
 
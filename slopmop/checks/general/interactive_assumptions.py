@@ -23,10 +23,10 @@ Files scanned: *.sh, *.bash, *.zsh, *.fish, *.yml, *.yaml,
 
 from __future__ import annotations
 
+import os
 import re
 import time
-from pathlib import Path
-from typing import ClassVar, List
+from typing import ClassVar, Dict, Iterable, List
 
 from slopmop.checks.base import (
     EXCLUDE_DIRS_DESCRIPTION,
@@ -34,15 +34,17 @@ from slopmop.checks.base import (
     BaseCheck,
     CheckRole,
     ConfigField,
+    ExecutionAffinity,
     Flaw,
     GateCategory,
     GateLevel,
     RemediationChurn,
     ToolContext,
-    should_prune_dir,
+    iter_source_files,
 )
+from slopmop.core import text_scan
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
-from slopmop.utils import is_path_excluded
+from slopmop.core.text_scan import LineRule, PatternSet, register_patterns, scan_file
 
 # ---------------------------------------------------------------------------
 # File classification
@@ -85,8 +87,19 @@ _APT_NONINTERACTIVE_RE: re.Pattern[str] = re.compile(
     r"-y\b|--yes\b|--assume-yes\b|-qq\b|DEBIAN_FRONTEND=noninteractive"
 )
 
-# A line that is visually a comment in sh/make/yaml/Dockerfile.
-_COMMENT_LINE_RE: re.Pattern[str] = re.compile(r"^\s*#")
+_NPX_MESSAGE = (
+    "npx invocation without --yes: will prompt to install packages "
+    "interactively and hang in CI / headless environments"
+)
+_APT_MESSAGE = (
+    "apt-get/apt install without -y: will prompt for confirmation "
+    "and hang in Docker builds and CI containers"
+)
+
+_MESSAGES: Dict[str, str] = {
+    "npx-without-yes": _NPX_MESSAGE,
+    "apt-without-y": _APT_MESSAGE,
+}
 
 
 # ---------------------------------------------------------------------------
@@ -94,69 +107,55 @@ _COMMENT_LINE_RE: re.Pattern[str] = re.compile(r"^\s*#")
 # ---------------------------------------------------------------------------
 
 
-def _is_scannable(path: Path) -> bool:
-    """Return True when this file should be scanned for interactive patterns."""
-    name = path.name
-    if path.suffix.lower() in _COMMAND_EXTS:
+def _is_scannable_name(name: str) -> bool:
+    """Return True when a file with this base name should be scanned."""
+    if os.path.splitext(name)[1].lower() in _COMMAND_EXTS:
         return True
     # Bare filenames (Makefile, GNUmakefile, …)
-    if path.suffix == "" and name in _COMMAND_FILENAMES:
+    if name in _COMMAND_FILENAMES:
         return True
     # Dockerfile and its variants: Dockerfile.dev, Dockerfile.prod, …
-    if name == "Dockerfile" or name.startswith("Dockerfile."):
-        return True
-    return False
-
-
-def _scan_line(
-    line: str,
-    lineno: int,
-    rel: Path,
-    hits: List[str],
-    findings: List[Finding],
-) -> None:
-    """Append to hits/findings for any interactive-assumption pattern in *line*."""
-    # Skip comment lines — they're documentation, not executable commands.
-    if _COMMENT_LINE_RE.match(line):
-        return
-
-    # -----------------------------------------------------------------------
-    # Pattern 1: npx without --yes
-    # -----------------------------------------------------------------------
-    if _NPX_RE.search(line) and not _NPX_YES_RE.search(line):
-        msg = (
-            "npx invocation without --yes: will prompt to install packages "
-            "interactively and hang in CI / headless environments"
-        )
-        hits.append(f"{rel}:{lineno}: npx-without-yes")
-        findings.append(
-            Finding(
-                message=msg,
-                level=FindingLevel.ERROR,
-                file=str(rel),
-                line=lineno,
-                rule_id="npx-without-yes",
-            )
-        )
+    return name == "Dockerfile" or name.startswith("Dockerfile.")
+
+
+_SCANNER_OWNER = "interactive-assumptions"
+
+# Scanned through the shared text-scan engine: comment lines (visually
+# ``#`` in sh/make/yaml/Dockerfile) are documentation, not commands.
+register_patterns(
+    PatternSet(
+        owner=_SCANNER_OWNER,
+        applies_to=_is_scannable_name,
+        rules=(
+            LineRule("npx-without-yes", _NPX_RE, unless=_NPX_YES_RE),
+            LineRule("apt-without-y", _APT_RE, unless=_APT_NONINTERACTIVE_RE),
+        ),
+        comment_prefixes=("#",),
+    )
+)
 
-    # -----------------------------------------------------------------------
-    # Pattern 2: apt-get / apt install without -y (or equivalent)
-    # -----------------------------------------------------------------------
-    if _APT_RE.search(line) and not _APT_NONINTERACTIVE_RE.search(line):
-        msg = (
-            "apt-get/apt install without -y: will prompt for confirmation "
-            "and hang in Docker builds and CI containers"
-        )
-        hits.append(f"{rel}:{lineno}: apt-without-y")
-        findings.append(
-            Finding(
-                message=msg,
-                level=FindingLevel.ERROR,
-                file=str(rel),
-                line=lineno,
-                rule_id="apt-without-y",
-            )
-        )
+
+def _scan_file(project_root: str, rel: str) -> List[Dict[str, object]]:
+    """Return *rel*'s findings as dicts (the per-file cache's form)."""
+    return [
+        Finding(
+            message=_MESSAGES[hit.rule_id],
+            level=FindingLevel.ERROR,
+            file=rel,
+            line=hit.line,
+            rule_id=hit.rule_id,
+        ).to_dict()
+        for hit in scan_file(project_root, rel).get(_SCANNER_OWNER, [])
+    ]
+
+
+def _scannable_files(project_root: str, excluded: Iterable[str]) -> List[str]:
+    """Sorted project-relative paths of the files this gate scans."""
+    return sorted(
+        rel
+        for rel in iter_source_files(project_root, exclude_dirs=excluded)
+        if _is_scannable_name(rel.rpartition("/")[2])
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -199,6 +198,7 @@ class InteractiveAssumptionsCheck(BaseCheck):
 
     tool_context: ClassVar[ToolContext] = ToolContext.PURE
     role = CheckRole.DIAGNOSTIC
+    execution_affinity: ClassVar[ExecutionAffinity] = ExecutionAffinity.IN_PROCESS_CPU
     level = GateLevel.SCOUR
     remediation_churn = RemediationChurn.DOWNSTREAM_CHANGES_VERY_UNLIKELY
 
@@ -239,54 +239,27 @@ class InteractiveAssumptionsCheck(BaseCheck):
 
     def is_applicable(self, project_root: str) -> bool:
         """Return True when the project contains at least one scannable file."""
-        root = Path(project_root)
-        for path in root.rglob("*"):
-            if not path.is_file() or not _is_scannable(path):
-                continue
-            try:
-                rel = path.relative_to(root)
-            except ValueError:
-                continue
-            if not (set(rel.parts) & _DEFAULT_EXCLUDED) and not any(
-                should_prune_dir(p) for p in rel.parts[:-1]
-            ):
-                return True
-        return False
+        return bool(_scannable_files(project_root, _DEFAULT_EXCLUDED))
 
     def skip_reason(self, project_root: str) -> str:
         return "No shell scripts, CI configs, or Dockerfiles found"
 
     def run(self, project_root: str) -> CheckResult:
         start = time.perf_counter()
-        root = Path(project_root)
 
         user_exclude: set[str] = set(self.config.get("exclude_dirs") or [])
         excluded = _DEFAULT_EXCLUDED | user_exclude
 
-        hits: List[str] = []
         findings: List[Finding] = []
         files_scanned = 0
 
-        for path in sorted(root.rglob("*")):
-            if not path.is_file() or not _is_scannable(path):
-                continue
-            try:
-                rel = path.relative_to(root)
-            except ValueError:
-                continue
-            if is_path_excluded(rel, excluded):
-                continue
-            if any(should_prune_dir(p) for p in rel.parts[:-1]):
-                continue
-
-            files_scanned += 1
-            try:
-                content = path.read_text(errors="replace")
-            except OSError:
-                continue
-
-            for lineno, line in enumerate(content.splitlines(), 1):
-                _scan_line(line, lineno, rel, hits, findings)
+        with self.file_findings_cache(project_root, [text_scan]) as cache:
+            for rel in _scannable_files(project_root, excluded):
+                files_scanned += 1
+                found = cache.scan(rel, lambda: _scan_file(project_root, rel))
+                findings.extend(Finding.from_dict(fd) for fd in found)
+
+        hits = [f"{f.file}:{f.line}: {f.rule_id}" for f in findings]
 
         elapsed = time.perf_counter() - start
 
@@ -13,7 +13,7 @@ actually exercising any behavior.
 import os
 import re
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any, Iterator, List, Optional, Pattern, Tuple, cast
 
@@ -467,12 +467,19 @@ class JavaScriptBogusTestsCheck(BaseCheck, JavaScriptCheckMixin):
         findings: List[BogusTestFinding] = []
         files_scanned = 0
 
-        for filepath in _find_test_files(project_root, exclude_dirs):
-            files_scanned += 1
-            file_findings = _analyze_file(
-                filepath, project_root, extra_patterns or None
-            )
-            findings.extend(file_findings)
+        with self.file_findings_cache(project_root) as cache:
+            for filepath in _find_test_files(project_root, exclude_dirs):
+                files_scanned += 1
+                found = cache.scan(
+                    filepath.relative_to(project_root).as_posix(),
+                    lambda: [
+                        asdict(f)
+                        for f in _analyze_file(
+                            filepath, project_root, extra_patterns or None
+                        )
+                    ],
+                )
+                findings.extend(BogusTestFinding(**fd) for fd in found)
 
         duration = time.time() - start_time
 
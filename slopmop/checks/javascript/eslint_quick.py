@@ -7,19 +7,21 @@ frontend JavaScript sources. Requires 'frontend_dirs' in .sb_config.json.
 import os
 import re
 import time
-from typing import List
+from typing import List, Union
 
 from slopmop.checks.base import (
-    BaseCheck,
     CheckRole,
+    CommandCheck,
     ConfigField,
     Flaw,
     GateCategory,
+    ToolCommand,
     ToolContext,
 )
 from slopmop.checks.mixins import JavaScriptCheckMixin
 from slopmop.checks.timeouts import QUICK_COMMAND_TIMEOUT
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
+from slopmop.subprocess.runner import SubprocessResult
 
 # ESLint stylish format detail line:  line:col  error|warning  message  rule-id
 _ESLINT_STYLISH_RE = re.compile(
@@ -27,7 +29,7 @@ _ESLINT_STYLISH_RE = re.compile(
 )
 
 
-class FrontendCheck(BaseCheck, JavaScriptCheckMixin):
+class FrontendCheck(CommandCheck, JavaScriptCheckMixin):
     """Quick frontend JavaScript validation.
 
     Wraps ESLint in errors-only (--quiet) mode for rapid feedback
@@ -108,7 +110,7 @@ class FrontendCheck(BaseCheck, JavaScriptCheckMixin):
         configured = self.config.get("frontend_dirs", [])
         return [d for d in configured if os.path.isdir(os.path.join(project_root, d))]
 
-    def run(self, project_root: str) -> CheckResult:
+    def prepare_command(self, project_root: str) -> Union[ToolCommand, CheckResult]:
         start_time = time.time()
 
         js_dirs = self._get_configured_dirs(project_root)
@@ -131,11 +133,13 @@ class FrontendCheck(BaseCheck, JavaScriptCheckMixin):
             '{"no-undef": "error", "no-unused-vars": "warn"}',
             "--quiet",  # errors only
         ] + js_dirs
+        return ToolCommand(cmd, timeout=QUICK_COMMAND_TIMEOUT)
 
-        result = self._run_command(cmd, cwd=project_root, timeout=QUICK_COMMAND_TIMEOUT)
-        duration = time.time() - start_time
-
+    def interpret_command(
+        self, project_root: str, result: SubprocessResult, duration: float
+    ) -> CheckResult:
         if result.success:
+            js_dirs = self._get_configured_dirs(project_root)
             return self._create_result(
                 status=CheckStatus.PASSED,
                 duration=duration,
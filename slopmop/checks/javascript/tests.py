@@ -10,6 +10,7 @@ from slopmop.checks.base import (
     ConfigField,
     Flaw,
     GateCategory,
+    ResourceProfile,
     ToolContext,
 )
 from slopmop.checks.constants import (
@@ -63,6 +64,7 @@ class JavaScriptTestsCheck(BaseCheck, JavaScriptCheckMixin):
 
     tool_context = ToolContext.NODE
     role = CheckRole.FOUNDATION
+    resource_profile = ResourceProfile(memory_mb=1024, spawns_parallelism=True)
 
     @property
     def name(self) -> str:
@@ -34,6 +34,7 @@ from slopmop.checks.base import (
     ConfigField,
     Flaw,
     GateCategory,
+    ResourceProfile,
     ToolContext,
 )
 from slopmop.checks.mixins import JavaScriptCheckMixin
@@ -72,6 +73,7 @@ class JavaScriptTypesCheck(BaseCheck, JavaScriptCheckMixin):
 
     tool_context = ToolContext.NODE
     role = CheckRole.FOUNDATION
+    resource_profile = ResourceProfile(memory_mb=1024)
 
     @property
     def name(self) -> str:
@@ -21,6 +21,7 @@ from slopmop.checks.base import (
     Flaw,
     GateCategory,
     GateLevel,
+    ResourceProfile,
 )
 from slopmop.checks.timeouts import PROBE_TIMEOUT, QUICK_COMMAND_TIMEOUT
 from slopmop.constants import NOT_A_GIT_REPO, action_buff_inspect_pr
@@ -59,6 +60,7 @@ class PRCommentsCheck(BaseCheck):
 
     level = GateLevel.SCOUR
     role = CheckRole.DIAGNOSTIC
+    resource_profile = ResourceProfile(memory_mb=64, io_bound=True)
 
     PROTOCOL_VERSION = "pr-feedback-v1"
     RESOLUTION_REASON_PRIORITY = [
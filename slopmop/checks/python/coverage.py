@@ -24,6 +24,7 @@ from slopmop.checks.base import (
     GateDiagnosticResult,
     GateLevel,
     RemediationChurn,
+    ResourceProfile,
     ToolContext,
 )
 from slopmop.checks.constants import (
@@ -42,6 +43,7 @@ from slopmop.constants import (
     COVERAGE_STANDARDS_PREFIX,
     COVERAGE_XML_NOT_FOUND,
 )
+from slopmop.core.python_ast import parse_python
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
 
 COVERAGE_THRESHOLD = 80
@@ -162,6 +164,7 @@ class PythonCoverageCheck(BaseCheck, PythonCheckMixin):
 
     tool_context = ToolContext.PROJECT
     role = CheckRole.FOUNDATION
+    resource_profile = ResourceProfile(memory_mb=1024)
     remediation_churn = RemediationChurn.DOWNSTREAM_CHANGES_UNLIKELY
 
     DEFAULT_THRESHOLD = 80
@@ -768,6 +771,7 @@ class PythonDiffCoverageCheck(BaseCheck, PythonCheckMixin):
     level = GateLevel.SCOUR
     tool_context = ToolContext.PROJECT
     role = CheckRole.FOUNDATION
+    resource_profile = ResourceProfile(memory_mb=1024)
 
     @property
     def name(self) -> str:
@@ -1019,11 +1023,8 @@ def _resolve_uncovered_range(
         return None
     start, end = span
 
-    source_path = Path(project_root) / filepath
-    try:
-        source = source_path.read_text(encoding="utf-8")
-        tree = ast.parse(source)
-    except (OSError, SyntaxError, ValueError):
+    tree = parse_python(project_root, Path(filepath).as_posix()).tree
+    if tree is None:
         return None
 
     enclosing: Optional[Union[ast.FunctionDef, ast.AsyncFunctionDef]] = None
@@ -2,25 +2,28 @@
 
 import os
 import re
-import time
 from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 from slopmop.checks.base import (
-    BaseCheck,
     CheckRole,
+    CommandCheck,
     ConfigField,
     Flaw,
     GateCategory,
     Requirements,
+    ResourceProfile,
+    ToolCommand,
     ToolContext,
     pip_cli_requirement,
 )
 from slopmop.checks.constants import COMMAND_NOT_FOUND
 from slopmop.checks.mixins import PythonCheckMixin
 from slopmop.checks.timeouts import SLOW_TOOL_TIMEOUT
+from slopmop.core.cache import InputScope
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
+from slopmop.subprocess.runner import SubprocessResult
 
 # mypy error code pattern: file.py:10: error: message  [code]
 _MYPY_ERROR_RE = re.compile(r"^(.+?):(\d+): error: (.+?)(?:\s+\[(\S+)\])?\s*$")
@@ -63,7 +66,7 @@ def _fix_strategy_for_mypy(code: str, message: str) -> Optional[str]:
     return None
 
 
-class PythonStaticAnalysisCheck(BaseCheck, PythonCheckMixin):
+class PythonStaticAnalysisCheck(CommandCheck, PythonCheckMixin):
     """Static type checking with mypy.
 
     Wraps mypy to enforce type safety across Python source. In strict
@@ -94,6 +97,7 @@ class PythonStaticAnalysisCheck(BaseCheck, PythonCheckMixin):
 
     tool_context = ToolContext.SM_TOOL
     role = CheckRole.FOUNDATION
+    resource_profile = ResourceProfile(memory_mb=1024)
 
     def requirements(self) -> Requirements:
         # Optional: a missing mypy WARNs (degrades), it doesn't fail the gate.
@@ -190,11 +194,8 @@ class PythonStaticAnalysisCheck(BaseCheck, PythonCheckMixin):
         """Whether strict typing mode is enabled."""
         return self.config.get("strict_typing", True)
 
-    def cache_inputs(self, project_root: str) -> Optional[str]:
-        from slopmop.core.cache import hash_file_scope
-
-        dirs = self._detect_source_dirs(project_root)
-        return hash_file_scope(project_root, dirs, {".py"}, self.config)
+    def input_scope(self, project_root: str) -> Optional[InputScope]:
+        return InputScope.of(self._detect_source_dirs(project_root), {".py"})
 
     def _detect_source_dirs(self, project_root: str) -> List[str]:
         """Detect source directories to type-check.
@@ -320,16 +321,16 @@ class PythonStaticAnalysisCheck(BaseCheck, PythonCheckMixin):
 
         return "\n".join(parts)
 
-    def run(self, project_root: str) -> CheckResult:
-        """Run mypy type checking."""
-        start_time = time.time()
-
+    def prepare_command(self, project_root: str) -> ToolCommand:
+        """Build the mypy command."""
         source_dirs = self._detect_source_dirs(project_root)
         cmd = self._build_command(source_dirs, project_root)
-        result = self._run_command(cmd, cwd=project_root, timeout=SLOW_TOOL_TIMEOUT)
-
-        duration = time.time() - start_time
+        return ToolCommand(cmd, timeout=SLOW_TOOL_TIMEOUT)
 
+    def interpret_command(
+        self, project_root: str, result: SubprocessResult, duration: float
+    ) -> CheckResult:
+        """Turn mypy's output into the verdict."""
         if result.timed_out:
             msg = "Type checking timed out after 2 minutes"
             return self._create_result(
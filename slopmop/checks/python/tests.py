@@ -16,6 +16,7 @@ from slopmop.checks.base import (
     ConfigField,
     Flaw,
     GateCategory,
+    ResourceProfile,
     ToolContext,
 )
 from slopmop.checks.constants import (
@@ -27,6 +28,7 @@ from slopmop.checks.constants import (
 )
 from slopmop.checks.mixins import PythonCheckMixin
 from slopmop.checks.timeouts import HEAVY_TASK_TIMEOUT
+from slopmop.core.cache import InputScope
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
 
 # pytest's short-summary line format is stable across 6.x/7.x/8.x:
@@ -118,6 +120,7 @@ class PythonTestsCheck(BaseCheck, PythonCheckMixin):
 
     tool_context = ToolContext.PROJECT
     role = CheckRole.FOUNDATION
+    resource_profile = ResourceProfile(memory_mb=1024)
 
     @property
     def name(self) -> str:
@@ -143,17 +146,19 @@ class PythonTestsCheck(BaseCheck, PythonCheckMixin):
     def depends_on(self) -> List[str]:
         return ["laziness:sloppy-formatting.py"]
 
-    def cache_inputs(self, project_root: str) -> Optional[str]:
-        """Scope the cache to Python files only.
+    def input_scope(self, project_root: str) -> Optional[InputScope]:
+        """Scope the cache to Python files plus pytest's own config.
 
-        pytest only cares about .py files, so edits to YAML, Markdown,
-        TOML, or other non-Python assets won't invalidate this check's
-        cache.  Saves the full test-suite time (~15s) on runs where only
-        docs or config changed.
+        pytest only cares about .py files (and where it reads its
+        options), so edits to YAML, Markdown, or other non-Python assets
+        won't invalidate this check's cache.  Saves the full test-suite
+        time (~15s) on runs where only docs changed.
         """
-        from slopmop.core.cache import hash_file_scope
-
-        return hash_file_scope(project_root, ["."], {".py"}, self.config)
+        return InputScope.of(
+            ["."],
+            {".py"},
+            extra_files=("pytest.ini", "pyproject.toml", "setup.cfg", "tox.ini"),
+        )
 
     def _testmon_available(self, project_root: str) -> bool:
         """Return True if pytest-testmon is importable in the project venv.
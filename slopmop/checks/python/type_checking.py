@@ -37,6 +37,7 @@ from slopmop.checks.base import (
     Flaw,
     GateCategory,
     Requirements,
+    ResourceProfile,
     ToolContext,
     pip_cli_requirement,
 )
@@ -220,6 +221,7 @@ class PythonTypeCheckingCheck(BaseCheck, PythonCheckMixin):
 
     tool_context = ToolContext.SM_TOOL
     role = CheckRole.FOUNDATION
+    resource_profile = ResourceProfile(memory_mb=1536)
 
     def requirements(self) -> Requirements:
         # REQUIRED, not optional: type checking cannot run at all without
@@ -0,0 +1,296 @@
+"""Incremental inventory of the string literals in a project's files.
+
+The string-duplication gate used to copy every Python file, docstrings
+stripped, into a temp tree and run the Node find-duplicate-strings
+scanner over it, so every run re-read the whole project.  It also wrote
+per-file literal counts to ``.slopmop/string-duplication-inventory.json``
+that nothing ever read back.
+
+:class:`StringInventory` reads that file back.  Each entry holds a
+file's sha256 and its literal counts, and :meth:`StringInventory.refresh`
+re-extracts only files whose sha256 changed (dropping files that are gone
+or no longer selected).  Next to the entries it keeps the global
+multiset: total occurrences of each literal and the files holding it.
+That is adjusted per changed file rather than rebuilt, so
+:meth:`StringInventory.duplicates` is a lookup.
+
+Python files are read with :mod:`tokenize`, so only real string tokens
+count: docstrings, comments and quotes inside other strings don't.
+Other files, and Python that doesn't tokenize, fall back to a
+quoted-text regex, as the Node scanner did.
+"""
+
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import threading
+import tokenize
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
+
+from slopmop.utils.state_files import atomic_write_text, load_versioned_json
+
+logger = logging.getLogger(__name__)
+
+INVENTORY_DIR = ".slopmop"
+INVENTORY_FILE = "string-duplication-inventory.json"
+# Version 1 counted regex matches in docstring-stripped copies.
+INVENTORY_VERSION = 2
+
+STRING_LITERAL_PATTERN = re.compile(
+    r"(?:\"[^\"\\]*(?:\\.[^\"\\]*)*\"|'[^'\\]*(?:\\.[^'\\]*)*')"
+)
+
+# Token types after which a string statement is a docstring (the rule
+# tools/find-duplicate-strings/strip_docstrings.py used).
+_DOCSTRING_PREDECESSORS = frozenset(
+    {tokenize.INDENT, tokenize.NEWLINE, tokenize.ENCODING}
+)
+# Python 3.12+ splits f-strings into several tokens.
+_FSTRING_START: Optional[int] = getattr(tokenize, "FSTRING_START", None)
+_FSTRING_END: Optional[int] = getattr(tokenize, "FSTRING_END", None)
+
+# (sha256, {literal: occurrences})
+_Entry = Tuple[str, Dict[str, int]]
+
+
+def _literal_body(token: str) -> str:
+    """*token* without its prefix letters and quotes."""
+    start = 0
+    while start < len(token) and token[start] not in "'\"":
+        start += 1
+    quote = 3 if token[start : start + 3] in ('"""', "'''") else 1
+    return token[start + quote : len(token) - quote]
+
+
+def _is_docstring(prev_type: int, col: int) -> bool:
+    return prev_type in _DOCSTRING_PREDECESSORS or (
+        prev_type == tokenize.NL and col == 0
+    )
+
+
+def python_strings(source: str) -> Dict[str, int]:
+    """Occurrences of each non-empty string literal in Python *source*.
+
+    Docstrings are skipped.  Values are the literal's text between its
+    quotes, escapes as written.
+
+    Raises:
+        tokenize.TokenError, SyntaxError: *source* doesn't tokenize.
+    """
+    lines = io.StringIO(source).readlines()
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+    counts: Dict[str, int] = {}
+
+    def count(token: str) -> None:
+        value = _literal_body(token)
+        if value:
+            counts[value] = counts.get(value, 0) + 1
+
+    prev_type = tokenize.INDENT
+    fstring_depth = 0
+    fstring_start = (0, 0)
+    fstring_is_doc = False
+    for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+        if _FSTRING_START is not None and tok.type == _FSTRING_START:
+            if fstring_depth == 0:
+                fstring_start = tok.start
+                fstring_is_doc = _is_docstring(prev_type, tok.start[1])
+            fstring_depth += 1
+        elif fstring_depth and tok.type == _FSTRING_END:
+            fstring_depth -= 1
+            if fstring_depth == 0 and not fstring_is_doc:
+                (row, col), (end_row, end_col) = fstring_start, tok.end
+                count(source[offsets[row - 1] + col : offsets[end_row - 1] + end_col])
+        elif fstring_depth == 0 and tok.type == tokenize.STRING:
+            if not _is_docstring(prev_type, tok.start[1]):
+                count(tok.string)
+        prev_type = tok.type
+    return counts
+
+
+def regex_strings(source: str) -> Dict[str, int]:
+    """Occurrences of each non-empty quoted run in *source*."""
+    counts: Dict[str, int] = {}
+    for match in STRING_LITERAL_PATTERN.finditer(source):
+        value = match.group(0)[1:-1]
+        if value:
+            counts[value] = counts.get(value, 0) + 1
+    return counts
+
+
+def extract_strings(rel: str, source: str) -> Dict[str, int]:
+    """Literal counts for the file *rel* containing *source*."""
+    if rel.endswith(".py"):
+        try:
+            return python_strings(source)
+        except (tokenize.TokenError, SyntaxError) as e:
+            logger.debug(f"Falling back to regex literals for {rel}: {e}")
+    return regex_strings(source)
+
+
+class StringInventory:
+    """Literal counts of a project's files, refreshed by content hash.
+
+    Thread-safe.  Call :meth:`save` after a refresh to persist the
+    counts for the next run.
+
+    Args:
+        project_root: Project whose files (and ``.slopmop/``) this covers.
+    """
+
+    def __init__(self, project_root: str):
+        self.project_root = project_root
+        self._root = Path(project_root)
+        self._path = self._root / INVENTORY_DIR / INVENTORY_FILE
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self._counts: Dict[str, int] = {}
+        self._holders: Dict[str, Set[str]] = {}
+        for rel, (digest, strings) in self._load().items():
+            self._add(rel, digest, strings)
+        self._dirty = False
+
+    def _load(self) -> Dict[str, _Entry]:
+        data = load_versioned_json(self._path, INVENTORY_VERSION)
+        files = data.get("files") if data is not None else None
+        if not isinstance(files, dict):
+            return {}
+        entries: Dict[str, _Entry] = {}
+        for rel, entry in cast(Dict[str, object], files).items():
+            if not isinstance(entry, dict):
+                continue
+            entry_d = cast(Dict[str, object], entry)
+            digest, strings = entry_d.get("sha256"), entry_d.get("strings")
+            if isinstance(digest, str) and isinstance(strings, dict):
+                entries[rel] = (
+                    digest,
+                    {
+                        value: n
+                        for value, n in cast(Dict[str, object], strings).items()
+                        if isinstance(n, int) and n > 0
+                    },
+                )
+        return entries
+
+    def _add(self, rel: str, digest: str, strings: Dict[str, int]) -> None:
+        self._entries[rel] = (digest, strings)
+        for value, n in strings.items():
+            self._counts[value] = self._counts.get(value, 0) + n
+            self._holders.setdefault(value, set()).add(rel)
+
+    def _remove(self, rel: str) -> None:
+        _, strings = self._entries.pop(rel)
+        for value, n in strings.items():
+            left = self._counts[value] - n
+            if left > 0:
+                self._counts[value] = left
+                self._holders[value].discard(rel)
+            else:
+                del self._counts[value]
+                del self._holders[value]
+
+    def refresh(self, rels: Iterable[str]) -> int:
+        """Make the inventory cover exactly *rels* as they are on disk.
+
+        Files whose sha256 matches their entry are not re-read for
+        literals; entries for files outside *rels* (or unreadable) are
+        dropped.
+
+        Returns:
+            How many files had their literals extracted.
+        """
+        wanted = set(rels)
+        extracted = 0
+        with self._lock:
+            for rel in [rel for rel in self._entries if rel not in wanted]:
+                self._remove(rel)
+                self._dirty = True
+            for rel in sorted(wanted):
+                try:
+                    data = (self._root / rel).read_bytes()
+                except OSError:
+                    if rel in self._entries:
+                        self._remove(rel)
+                        self._dirty = True
+                    continue
+                digest = hashlib.sha256(data).hexdigest()
+                entry = self._entries.get(rel)
+                if entry is not None and entry[0] == digest:
+                    continue
+                if entry is not None:
+                    self._remove(rel)
+                source = data.decode("utf-8", errors="replace")
+                self._add(rel, digest, extract_strings(rel, source))
+                self._dirty = True
+                extracted += 1
+        return extracted
+
+    def duplicates(self, threshold: int) -> List[Dict[str, Any]]:
+        """Literals occurring more than *threshold* times, most frequent first.
+
+        Each item has the shape the Node scanner emitted: ``key``,
+        ``count``, ``fileCount`` and ``files`` (absolute paths, sorted).
+        """
+        with self._lock:
+            found: List[Dict[str, Any]] = [
+                {
+                    "key": value,
+                    "count": n,
+                    "fileCount": len(self._holders[value]),
+                    "files": [
+                        os.path.join(self.project_root, rel)
+                        for rel in sorted(self._holders[value])
+                    ],
+                }
+                for value, n in self._counts.items()
+                if n > threshold
+            ]
+        found.sort(key=lambda item: (-item["count"], item["key"]))
+        return found
+
+    def save(self, **header: object) -> None:
+        """Persist the inventory if it changed.
+
+        *header* fields (e.g. the patterns that selected the files) are
+        written alongside ``version`` for anyone inspecting the file.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = json.dumps(
+                {
+                    **header,
+                    "version": INVENTORY_VERSION,
+                    "files": {
+                        rel: {"sha256": digest, "strings": strings}
+                        for rel, (digest, strings) in self._entries.items()
+                    },
+                },
+                separators=(",", ":"),
+                sort_keys=True,
+            )
+            self._dirty = False
+        try:
+            atomic_write_text(self._path, payload)
+        except OSError as e:
+            logger.debug(f"Failed to write string inventory: {e}")
+
+
+_inventories: Dict[str, StringInventory] = {}
+_inventories_lock = threading.Lock()
+
+
+def get_string_inventory(project_root: str) -> StringInventory:
+    """Return the process-wide :class:`StringInventory` for *project_root*."""
+    key = os.path.realpath(project_root)
+    with _inventories_lock:
+        inventory = _inventories.get(key)
+        if inventory is None:
+            inventory = _inventories[key] = StringInventory(project_root)
+        return inventory
@@ -23,6 +23,7 @@ from slopmop.checks.base import (
     BaseCheck,
     CheckRole,
     ConfigField,
+    ExecutionAffinity,
     Flaw,
     GateCategory,
     RemediationChurn,
@@ -30,6 +31,8 @@ from slopmop.checks.base import (
     ToolContext,
     count_source_scope,
 )
+from slopmop.core.cache import InputScope
+from slopmop.core.python_ast import parse_python
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
 from slopmop.utils import is_path_excluded
 
@@ -121,6 +124,7 @@ class AmbiguityMinesCheck(BaseCheck):
 
     tool_context = ToolContext.PURE
     role = CheckRole.FOUNDATION
+    execution_affinity = ExecutionAffinity.IN_PROCESS_CPU
     remediation_churn = RemediationChurn.DOWNSTREAM_CHANGES_VERY_LIKELY
 
     @property
@@ -162,19 +166,11 @@ class AmbiguityMinesCheck(BaseCheck):
             ),
         ]
 
-    def cache_inputs(self, project_root: str) -> Optional[str]:
-        from slopmop.core.cache import hash_file_scope
-
-        dirs = self.config.get("include_dirs", ["."])
-        if not dirs:
-            dirs = ["."]
-        exclude = set(self.config.get("exclude_dirs", []))
-        return hash_file_scope(
-            project_root,
-            dirs,
+    def input_scope(self, project_root: str) -> Optional[InputScope]:
+        return InputScope.of(
+            self.config.get("include_dirs") or ["."],
             {".py"},
-            self.config,
-            exclude_dirs=exclude,
+            self.config.get("exclude_dirs", []),
         )
 
     def is_applicable(self, project_root: str) -> bool:
@@ -331,13 +327,11 @@ class AmbiguityMinesCheck(BaseCheck):
                     if rel in seen_files:
                         continue
                     seen_files.add(rel)
-                    try:
-                        with open(fpath, encoding="utf-8") as f:
-                            source = f.read()
-                        tree = ast.parse(source, filename=rel)
-                    except (SyntaxError, UnicodeDecodeError):
+                    parsed = parse_python(project_root, rel)
+                    if parsed.tree is None:
                         continue
-                    source_lines = source.splitlines(keepends=True)
+                    tree = parsed.tree
+                    source_lines = parsed.source.splitlines(keepends=True)
                     for node in ast.iter_child_nodes(tree):
                         if not isinstance(
                             node, (ast.FunctionDef, ast.AsyncFunctionDef)
@@ -37,14 +37,15 @@ entirely (empty/tautological checks remain active regardless).
 import ast
 import os
 import time
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from slopmop.checks.base import (
     BaseCheck,
     CheckRole,
     ConfigField,
+    ExecutionAffinity,
     Flaw,
     GateCategory,
     RemediationChurn,
@@ -54,6 +55,8 @@ from slopmop.checks.constants import (
     skip_reason_no_test_files,
     tautological_assertion_reason,
 )
+from slopmop.core import python_ast
+from slopmop.core.python_ast import parse_python
 from slopmop.core.result import (
     CheckResult,
     CheckStatus,
@@ -380,6 +383,28 @@ class _TestAnalyzer(ast.NodeVisitor):
         return None
 
 
+def _analyze_file(test_file: Path, project_root: str, min_stmts: int) -> Dict[str, Any]:
+    """Analyze one test file; plain data so the per-file cache can store it."""
+    findings: List[Dict[str, Any]] = []
+    short: List[Dict[str, Any]] = []
+    error: Optional[str] = None
+    rel = os.path.relpath(str(test_file), project_root)
+    parsed = parse_python(project_root, Path(rel).as_posix())
+    if parsed.tree is None:
+        error = f"  {rel}: {parsed.error}"
+    else:
+        analyzer = _TestAnalyzer(
+            str(test_file),
+            project_root,
+            parsed.source.splitlines(),
+            min_test_statements=min_stmts,
+        )
+        analyzer.visit(parsed.tree)
+        findings = [asdict(f) for f in analyzer.findings]
+        short = [asdict(f) for f in analyzer.short_test_findings]
+    return {"findings": findings, "short": short, "error": error}
+
+
 class BogusTestsCheck(BaseCheck):
     """Bogus test detection via AST analysis.
 
@@ -441,6 +466,7 @@ class BogusTestsCheck(BaseCheck):
     """
 
     role = CheckRole.DIAGNOSTIC
+    execution_affinity = ExecutionAffinity.IN_PROCESS_CPU
     remediation_churn = RemediationChurn.DOWNSTREAM_CHANGES_LIKELY
 
     @property
@@ -547,34 +573,31 @@ class BogusTestsCheck(BaseCheck):
         files_scanned = 0
         parse_errors: List[str] = []
 
-        for test_dir in test_dirs:
-            d = root / test_dir
-            if not d.exists():
-                continue
-
-            for test_file in sorted(d.rglob("test_*.py")):
-                # Skip excluded patterns
-                if any(pat in test_file.name for pat in exclude_patterns):
+        with self.file_findings_cache(project_root, [python_ast]) as cache:
+            for test_dir in test_dirs:
+                d = root / test_dir
+                if not d.exists():
                     continue
 
-                files_scanned += 1
-                try:
-                    source = test_file.read_text(encoding="utf-8")
-                    source_lines = source.splitlines()
-                    tree = ast.parse(source, filename=str(test_file))
-                    analyzer = _TestAnalyzer(
-                        str(test_file),
-                        project_root,
-                        source_lines,
-                        min_test_statements=min_stmts,
+                for test_file in sorted(d.rglob("test_*.py")):
+                    # Skip excluded patterns
+                    if any(pat in test_file.name for pat in exclude_patterns):
+                        continue
+
+                    files_scanned += 1
+                    rel = Path(os.path.relpath(test_file, project_root)).as_posix()
+                    found = cache.scan(
+                        rel,
+                        lambda: _analyze_file(test_file, project_root, min_stmts),
+                    )
+                    all_findings.extend(
+                        BogusTestFinding(**fd) for fd in found["findings"]
                     )
-                    analyzer.visit(tree)
-                    all_findings.extend(analyzer.findings)
-                    all_short_findings.extend(analyzer.short_test_findings)
-                except (SyntaxError, UnicodeDecodeError) as e:
-                    parse_errors.append(
-                        f"  {os.path.relpath(str(test_file), project_root)}: {e}"
+                    all_short_findings.extend(
+                        BogusTestFinding(**fd) for fd in found["short"]
                     )
+                    if found["error"]:
+                        parse_errors.append(found["error"])
 
         duration = time.time() - start_time
 
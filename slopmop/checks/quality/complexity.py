@@ -11,32 +11,35 @@ Note: This is a cross-cutting quality check. While it uses radon
 import os
 import re
 import time
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from slopmop.checks.base import (
     SCOPE_EXCLUDED_DIRS,
-    BaseCheck,
     CheckRole,
+    CommandCheck,
     ConfigField,
     Flaw,
     GateCategory,
     RemediationChurn,
     Requirements,
+    ToolCommand,
     ToolContext,
+    iter_source_files,
     pip_cli_requirement,
-    should_prune_dir,
 )
 from slopmop.checks.constants import COMMAND_NOT_FOUND
 from slopmop.checks.mixins import PythonCheckMixin
 from slopmop.checks.timeouts import SLOW_TOOL_TIMEOUT
+from slopmop.core.cache import InputScope
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
+from slopmop.subprocess.runner import SubprocessResult
 
 MAX_RANK = "C"
 # Keep this aligned with config_schema.default for max_complexity.
 MAX_COMPLEXITY = 15
 
 
-class ComplexityCheck(BaseCheck, PythonCheckMixin):
+class ComplexityCheck(CommandCheck, PythonCheckMixin):
     """Cyclomatic complexity enforcement.
 
     Wraps radon to flag functions with complexity rank D or higher.
@@ -130,14 +133,9 @@ class ComplexityCheck(BaseCheck, PythonCheckMixin):
 
     def is_applicable(self, project_root: str) -> bool:
         """Check if there are Python files to analyze."""
-        from pathlib import Path
-
-        root = Path(project_root)
-        for _, dirs, files in os.walk(root):
-            dirs[:] = [d for d in dirs if not should_prune_dir(d)]
-            if any(f.endswith(".py") for f in files):
-                return True
-        return False
+        return (
+            next(iter_source_files(project_root, extensions={".py"}), None) is not None
+        )
 
     def _get_target_dirs(self, project_root: str) -> List[str]:
         """Get directories to check from config, with sensible fallbacks."""
@@ -150,13 +148,10 @@ class ComplexityCheck(BaseCheck, PythonCheckMixin):
         # Fallback: check project root for .py files
         return ["."]
 
-    def cache_inputs(self, project_root: str) -> Optional[str]:
-        from slopmop.core.cache import hash_file_scope
-
-        dirs = self._get_target_dirs(project_root)
-        return hash_file_scope(project_root, dirs, {".py"}, self.config)
+    def input_scope(self, project_root: str) -> Optional[InputScope]:
+        return InputScope.of(self._get_target_dirs(project_root), {".py"})
 
-    def run(self, project_root: str) -> CheckResult:
+    def prepare_command(self, project_root: str) -> Union[ToolCommand, CheckResult]:
         start_time = time.time()
         dirs = self._get_target_dirs(project_root)
 
@@ -182,9 +177,11 @@ class ComplexityCheck(BaseCheck, PythonCheckMixin):
             "--ignore",
             ",".join(sorted(SCOPE_EXCLUDED_DIRS)),
         ] + dirs
-        result = self._run_command(cmd, cwd=project_root, timeout=SLOW_TOOL_TIMEOUT)
-        duration = time.time() - start_time
+        return ToolCommand(cmd, timeout=SLOW_TOOL_TIMEOUT)
 
+    def interpret_command(
+        self, project_root: str, result: SubprocessResult, duration: float
+    ) -> CheckResult:
         # returncode 127 = shell "command not found"
         # returncode -1 = FileNotFoundError from SubprocessRunner
         if result.returncode == 127 or (
@@ -10,24 +10,26 @@ universal concern regardless of project type.
 
 import os
 import re
-import time
 from typing import Any, List, Optional, cast
 
 from slopmop.checks.base import (
-    BaseCheck,
     CheckRole,
+    CommandCheck,
     ConfigField,
     Flaw,
     GateCategory,
     RemediationChurn,
     Requirements,
+    ToolCommand,
     ToolContext,
     count_source_scope,
     find_tool,
+    iter_source_files,
     pip_cli_requirement,
 )
 from slopmop.checks.constants import COMMAND_NOT_FOUND
 from slopmop.checks.timeouts import SLOW_TOOL_TIMEOUT
+from slopmop.core.cache import InputScope
 from slopmop.core.result import (
     CheckResult,
     CheckStatus,
@@ -35,6 +37,7 @@ from slopmop.core.result import (
     FindingLevel,
     ScopeInfo,
 )
+from slopmop.subprocess.runner import SubprocessResult
 
 DEFAULT_MIN_CONFIDENCE = 80
 MAX_FINDINGS_TO_SHOW = 15
@@ -56,7 +59,7 @@ DEFAULT_EXCLUDE_PATTERNS = [
 MANDATORY_EXCLUDE_PATTERNS = ["**/ephemeral/**"]
 
 
-class DeadCodeCheck(BaseCheck):
+class DeadCodeCheck(CommandCheck):
     """Dead code detection via static AST analysis.
 
     Wraps vulture to find unused functions, classes, imports,
@@ -159,10 +162,9 @@ class DeadCodeCheck(BaseCheck):
 
     def is_applicable(self, project_root: str) -> bool:
         """Applicable if there are Python files to scan."""
-        from pathlib import Path
-
-        root = Path(project_root)
-        return any(root.rglob("*.py"))
+        return (
+            next(iter_source_files(project_root, extensions={".py"}), None) is not None
+        )
 
     def skip_reason(self, project_root: str) -> str:
         """Return reason for skipping - no Python source files."""
@@ -198,11 +200,8 @@ class DeadCodeCheck(BaseCheck):
         configured = self.config.get("src_dirs", ["."])
         return [d for d in configured if os.path.isdir(os.path.join(project_root, d))]
 
-    def cache_inputs(self, project_root: str) -> Optional[str]:
-        from slopmop.core.cache import hash_file_scope
-
-        dirs = self._get_src_dirs(project_root) or ["."]
-        return hash_file_scope(project_root, dirs, {".py"}, self.config)
+    def input_scope(self, project_root: str) -> Optional[InputScope]:
+        return InputScope.of(self._get_src_dirs(project_root) or ["."], {".py"})
 
     def _build_command(self, project_root: str) -> List[str]:
         """Build the vulture command with all configured options."""
@@ -251,12 +250,12 @@ class DeadCodeCheck(BaseCheck):
                 excludes.append(name)
         return excludes
 
-    def run(self, project_root: str) -> CheckResult:
-        start_time = time.time()
-        cmd = self._build_command(project_root)
-        result = self._run_command(cmd, cwd=project_root, timeout=SLOW_TOOL_TIMEOUT)
-        duration = time.time() - start_time
+    def prepare_command(self, project_root: str) -> ToolCommand:
+        return ToolCommand(self._build_command(project_root), timeout=SLOW_TOOL_TIMEOUT)
 
+    def interpret_command(
+        self, project_root: str, result: SubprocessResult, duration: float
+    ) -> CheckResult:
         # Handle tool not installed — warn but don't block
         if result.returncode == 127 or (
             result.returncode == -1 and COMMAND_NOT_FOUND in result.stderr
@@ -20,20 +20,29 @@ import os
 import re
 import time
 from pathlib import Path
-from typing import ClassVar, List, Tuple
+from typing import ClassVar, Dict, List, Tuple
 
 from slopmop.checks.base import (
     SCOPE_EXCLUDED_DIRS,
     BaseCheck,
     CheckRole,
     ConfigField,
+    ExecutionAffinity,
     Flaw,
     GateCategory,
     RemediationChurn,
     ToolContext,
+    iter_source_files,
 )
+from slopmop.core import text_scan
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
-from slopmop.utils import is_path_excluded
+from slopmop.core.text_scan import (
+    LineRule,
+    PatternSet,
+    register_patterns,
+    scan_file,
+    suffix_in,
+)
 
 # (extensions, compiled-regex, human-label)
 _PATTERNS: List[Tuple[Tuple[str, ...], re.Pattern[str], str]] = [
@@ -66,6 +75,25 @@ _PATTERNS: List[Tuple[Tuple[str, ...], re.Pattern[str], str]] = [
 
 _ALL_EXTS = frozenset(ext for exts, _, _ in _PATTERNS for ext in exts)
 
+# Lines that are (or continue) a comment in any supported language.
+_COMMENT_PREFIXES = ("#", "//", "/*", "*")
+
+_SCANNER_OWNER = "debugger-artifacts"
+
+# Scanned through the shared text-scan engine, one pattern set per
+# language, so a file is read once for every line-pattern gate.
+register_patterns(
+    *(
+        PatternSet(
+            owner=_SCANNER_OWNER,
+            applies_to=suffix_in(frozenset(exts)),
+            rules=(LineRule(label, pattern),),
+            comment_prefixes=_COMMENT_PREFIXES,
+        )
+        for exts, pattern, label in _PATTERNS
+    )
+)
+
 # Paths that legitimately contain debugger references (tests, examples,
 # docs, third-party vendored code). Dot-directories are pruned automatically
 # via should_prune_dir(); this list covers non-dot dirs.
@@ -93,6 +121,7 @@ class DebuggerArtifactsCheck(BaseCheck):
 
     tool_context: ClassVar[ToolContext] = ToolContext.PURE
     role = CheckRole.DIAGNOSTIC
+    execution_affinity: ClassVar[ExecutionAffinity] = ExecutionAffinity.IN_PROCESS_CPU
     remediation_churn = RemediationChurn.DOWNSTREAM_CHANGES_VERY_UNLIKELY
 
     @property
@@ -155,37 +184,28 @@ class DebuggerArtifactsCheck(BaseCheck):
 
     def run(self, project_root: str) -> CheckResult:
         start = time.perf_counter()
-        root = Path(project_root)
 
         user_exclude = set(self.config.get("exclude_dirs") or [])
         excluded = _DEFAULT_EXCLUDE | user_exclude
         max_files = int(self.config.get("max_files") or 50000)
 
-        hits: List[str] = []
         findings: List[Finding] = []
         files_scanned = 0
 
-        for root_dir, dirs, files in os.walk(root):
-            rel_root = Path(root_dir).relative_to(root)
-            dirs[:] = [
-                d
-                for d in dirs
-                if not (d.startswith(".") or is_path_excluded(rel_root / d, excluded))
-            ]
-            for fname in files:
-                fpath = Path(root_dir) / fname
-                if fpath.suffix not in _ALL_EXTS:
-                    continue
-                rel = rel_root / fname
-                if is_path_excluded(rel, excluded):
-                    continue
-
+        with self.file_findings_cache(project_root, [text_scan]) as cache:
+            for rel_path in iter_source_files(
+                project_root, extensions=_ALL_EXTS, exclude_dirs=excluded
+            ):
                 files_scanned += 1
                 if files_scanned > max_files:
                     return self._max_files_warning(max_files, start)
 
-                self._scan_file(fpath, rel, hits, findings)
+                found = cache.scan(
+                    rel_path, lambda: self._scan_file(project_root, rel_path)
+                )
+                findings.extend(Finding.from_dict(fd) for fd in found)
 
+        hits = [f"{f.file}:{f.line}: {f.message}" for f in findings]
         elapsed = time.perf_counter() - start
 
         if not hits:
@@ -236,38 +256,20 @@ class DebuggerArtifactsCheck(BaseCheck):
         )
 
     @staticmethod
-    def _scan_file(
-        path: Path,
-        rel: Path,
-        hits: List[str],
-        findings: List[Finding],
-    ) -> None:
-        """Scan a single file for debugger artifact patterns."""
-        patterns = [p for exts, p, _ in _PATTERNS if path.suffix in exts]
-        labels = {p.pattern: lbl for exts, p, lbl in _PATTERNS if path.suffix in exts}
-        if not patterns:
-            return
-
-        try:
-            for lineno, line in enumerate(
-                path.read_text(errors="replace").splitlines(), 1
-            ):
-                stripped = line.lstrip()
-                if stripped.startswith(("#", "//", "/*", "*")):
-                    continue
-                for pat in patterns:
-                    if pat.search(line):
-                        label = labels[pat.pattern]
-                        hits.append(f"{rel}:{lineno}: {label}")
-                        findings.append(
-                            Finding(
-                                message=label,
-                                level=FindingLevel.ERROR,
-                                file=str(rel),
-                                line=lineno,
-                                rule_id=label,
-                            )
-                        )
-                        break
-        except (OSError, UnicodeDecodeError):
-            pass
+    def _scan_file(project_root: str, rel: str) -> List[Dict[str, object]]:
+        """Scan a single file for debugger artifact patterns.
+
+        Returns the file's findings as dicts — the per-file cache's
+        JSON-serialisable form.
+        """
+        hits = scan_file(project_root, rel).get(_SCANNER_OWNER, [])
+        return [
+            Finding(
+                message=hit.rule_id,
+                level=FindingLevel.ERROR,
+                file=rel,
+                line=hit.line,
+                rule_id=hit.rule_id,
+            ).to_dict()
+            for hit in hits
+        ]
@@ -1,64 +1,37 @@
-"""String duplication check using vendored find-duplicate-strings tool."""
+"""String duplication check using the incremental literal inventory."""
 
-import fnmatch
-import glob as globmod
-import hashlib
-import json
 import os
-import re
-import shutil
-import tempfile
 import time
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, cast
+from typing import Any, ClassVar, Dict, List, Optional, cast
 
 from slopmop.checks.base import (
     BaseCheck,
     CheckRole,
     ConfigField,
+    ExecutionAffinity,
     Flaw,
     GateCategory,
     GateLevel,
-    Requirement,
-    Requirements,
     ScopeInfo,
     ToolContext,
     count_source_scope,
-    find_tool,
-    should_prune_dir,
+    iter_source_files,
 )
+from slopmop.checks.quality._string_inventory import get_string_inventory
+from slopmop.core.cache import InputScope
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
-
-STRING_DUPLICATION_INVENTORY = "string-duplication-inventory.json"
-STRING_LITERAL_PATTERN = re.compile(
-    r"(?:\"[^\"\\]*(?:\\.[^\"\\]*)*\"|'[^'\\]*(?:\\.[^'\\]*)*')"
-)
-
-
-def _remap_scan_paths(stdout: str, tmp_dir: str, project_root: str) -> str:
-    """Rewrite tempdir paths in scanner output back to project paths.
-
-    The scanner reports RESOLVED paths. On macOS ``tempfile`` hands back
-    ``/var/folders/...`` while the resolved form is
-    ``/private/var/folders/...``, so replacing only the unresolved spelling
-    matched the suffix and left ``/private`` glued to the front of the
-    project path, producing findings like
-    ``../../../../../private/Users/.../web_scraper.py``. Swap the longest
-    spelling first so one form can't partially match inside the other.
-    """
-    for candidate in sorted(
-        {tmp_dir, str(Path(tmp_dir).resolve())}, key=len, reverse=True
-    ):
-        stdout = stdout.replace(candidate, project_root)
-    return stdout
+from slopmop.utils import _glob_match
 
 
 class StringDuplicationCheck(BaseCheck):
     """Duplicate string literal detection.
 
-    Wraps the vendored find-duplicate-strings tool to detect string
-    literals repeated across multiple files. These are candidates
-    for extraction to a constants module.
+    Counts string literals across files and flags those repeated more
+    than the threshold. These are candidates for extraction to a
+    constants module. Literal counts persist per file in
+    .slopmop/string-duplication-inventory.json, so a run only re-reads
+    files whose content changed since the last one.
 
     Level: scour. Cross-file scanning is comparatively expensive and the
     signal changes slowly, so it runs in the pre-PR sweep rather than on
@@ -80,22 +53,19 @@ class StringDuplicationCheck(BaseCheck):
       Duplicate strings found: Extract repeated strings to a
           constants.py module. The output shows each string,
           its count, and which files contain it.
-      Tool not found: Requires Node.js. The tool is vendored
-          in tools/find-duplicate-strings/.
 
     Re-check:
       sm scour -g myopia:string-duplication.py --verbose
     """
 
-    tool_context = ToolContext.NODE
+    tool_context = ToolContext.PURE
     level = GateLevel.SCOUR
-    # DIAGNOSTIC not FOUNDATION — the detection tool is vendored in
-    # tools/find-duplicate-strings/, not pip/npm-installable.  The
-    # protocol's litmus test is "could a developer reproduce this gate
-    # with one shell command?"  A vendored Node script fails that test
-    # even though the gate's mechanism (subprocess) looks foundational.
+    # DIAGNOSTIC not FOUNDATION — the protocol's litmus test is "could a
+    # developer reproduce this gate with one shell command?"  No standard
+    # tool answers "which literals repeat across files", so this fails it.
     # Role is about reproducibility, not mechanism.
     role = CheckRole.DIAGNOSTIC
+    execution_affinity: ClassVar[ExecutionAffinity] = ExecutionAffinity.IN_PROCESS_CPU
 
     @property
     def name(self) -> str:
@@ -194,45 +164,12 @@ class StringDuplicationCheck(BaseCheck):
             ),
         ]
 
-    def cache_inputs(self, project_root: str) -> Optional[str]:
+    def input_scope(self, project_root: str) -> Optional[InputScope]:
         """Scope the cache to .py files only."""
-        from slopmop.core.cache import hash_file_scope
+        return InputScope.of(["."], {".py"})
 
-        return hash_file_scope(
-            project_root,
-            ["."],
-            {".py"},
-            self._get_effective_config(),
-        )
-
-    def requirements(self) -> Requirements:
-        """The find-duplicate-strings scanner and the Node runtime it needs.
-
-        Both optional: when absent the gate degrades to a WARNED result rather
-        than failing. The vendored copy under ``tools/`` is a *development*
-        convenience — its built ``lib/`` and ``node_modules/`` are gitignored, so
-        it isn't present in a fresh clone or a pip/pipx-installed slop-mop. A
-        deployed slop-mop (e.g. the GitHub Action) therefore needs the scanner
-        from npm; declaring it here puts it in the dependency manifest so the
-        Action installs it instead of the gate discovering it missing at runtime.
-        """
-        return Requirements(
-            items=(
-                Requirement(
-                    kind="npm",
-                    name="find-duplicate-strings",
-                    version="3.1.1",
-                    optional=True,
-                    reason="the string-duplication scanner CLI",
-                ),
-                Requirement(
-                    kind="system",
-                    name="node",
-                    optional=True,
-                    reason="runtime for the find-duplicate-strings duplication scanner",
-                ),
-            )
-        )
+    def cache_config(self) -> Dict[str, Any]:
+        return self._get_effective_config()
 
     def is_applicable(self, project_root: str) -> bool:
         """Check if there are source files to analyze."""
@@ -248,40 +185,6 @@ class StringDuplicationCheck(BaseCheck):
         """Measure scope — counts Python files (default scan target)."""
         return count_source_scope(project_root, extensions={".py"})
 
-    def _get_tool_path(self, project_root: str = "") -> Optional[Path]:
-        """Find the find-duplicate-strings tool.
-
-        Searches in order:
-        1. The target project's tools/ directory (works for projects
-           that vendor the tool, or when sm is pip-installed)
-        2. The slopmop package source tree (works in a git checkout)
-        3. Global ``find-duplicate-strings`` binary via the shared resolver
-
-        Returns the path to index.js, or None if not found.
-        """
-        tool_rel = Path("tools") / "find-duplicate-strings" / "lib" / "cli" / "index.js"
-
-        # 1. Target project's tools/ directory
-        if project_root:
-            candidate = Path(project_root) / tool_rel
-            if candidate.exists():
-                return candidate
-
-        # 2. slopmop package source tree (development checkout)
-        pkg_root = Path(__file__).parent.parent.parent.parent
-        candidate = pkg_root / tool_rel
-        if candidate.exists():
-            return candidate
-
-        # 3. Global binary — resolve via the same venv-aware find_tool the
-        # requirements contract uses, so "declared present" and "the gate
-        # found it" can't drift.
-        global_bin = find_tool("find-duplicate-strings", project_root)
-        if global_bin:
-            return Path(global_bin)
-
-        return None
-
     def _get_effective_config(self) -> dict[str, Any]:
         """Get effective configuration with defaults."""
         defaults: dict[str, Any] = {
@@ -310,60 +213,6 @@ class StringDuplicationCheck(BaseCheck):
         }
         return {**defaults, **self.config}
 
-    def _build_command(
-        self,
-        config: dict[str, Any],
-        tool_path: Optional[Path] = None,
-        project_root: str = "",
-    ) -> list[str]:
-        """Build the find-duplicate-strings command."""
-        if tool_path is None:
-            tool_path = self._get_tool_path(project_root) or Path(
-                "find-duplicate-strings"
-            )
-        threshold = config.get("threshold", 3)
-        include_patterns = config.get("include_patterns", ["**/*.py"])
-        ignore_patterns = config.get("ignore_patterns", [])
-
-        # Build glob pattern - join multiple patterns for the tool
-        # The tool accepts a single glob pattern, so we use brace expansion
-        if len(include_patterns) == 1:
-            glob_pattern = include_patterns[0]
-        else:
-            # Create brace expansion: **/*.{py,js,ts}
-            extensions: list[str] = []
-            for pattern in include_patterns:
-                if pattern.startswith("**/*."):
-                    extensions.append(pattern[5:])  # Extract extension
-                else:
-                    extensions.append(pattern)
-            if extensions:
-                glob_pattern = f"**/*.{{{','.join(extensions)}}}"
-            else:
-                glob_pattern = include_patterns[0]
-
-        # Resolve node through the same find_tool the requirement uses, so the
-        # runtime the gate invokes matches the one doctor/the contract probe.
-        node = find_tool("node", project_root) or "node"
-        cmd: list[str] = (
-            # If tool_path points to a .js file, invoke via node;
-            # if it's a global binary, call it directly.
-            [node, str(tool_path)]
-            if str(tool_path).endswith(".js")
-            else [str(tool_path)]
-        )
-        cmd += [
-            glob_pattern,
-            "--threshold",
-            str(threshold),
-            "--json",
-        ]
-
-        if ignore_patterns:
-            cmd.extend(["--ignore", ",".join(ignore_patterns)])
-
-        return cmd
-
     def _filter_results(
         self, findings: list[dict[str, Any]], config: dict[str, Any]
     ) -> list[dict[str, Any]]:
@@ -461,9 +310,9 @@ class StringDuplicationCheck(BaseCheck):
                 # start argument this produced paths like
                 # "../../../../../private/Users/..." — unreadable, and not
                 # clickable in an editor or CI annotation.
-                # Both sides are realpath'd first: the scanner emits resolved
-                # absolute paths, so a symlinked project root (/Users vs
-                # /private/Users on macOS) would otherwise escape upward again.
+                # Both sides are realpath'd first: a symlinked project root
+                # (/Users vs /private/Users on macOS) resolved on one side
+                # only would otherwise escape upward again.
                 try:
                     start = os.path.realpath(project_root or os.getcwd())
                     rel_path = os.path.relpath(os.path.realpath(file_path), start)
@@ -483,228 +332,15 @@ class StringDuplicationCheck(BaseCheck):
 
         return "\n".join(lines)
 
-    def _get_strip_docstrings_path(self, project_root: str = "") -> Optional[Path]:
-        """Find the strip_docstrings.py helper script.
-
-        Searches in the same locations as _get_tool_path:
-        1. Target project's tools/ directory
-        2. slopmop package source tree
-        """
-        script_rel = Path("tools") / "find-duplicate-strings" / "strip_docstrings.py"
-
-        if project_root:
-            candidate = Path(project_root) / script_rel
-            if candidate.exists():
-                return candidate
-
-        pkg_root = Path(__file__).parent.parent.parent.parent
-        candidate = pkg_root / script_rel
-        if candidate.exists():
-            return candidate
-
-        return None
-
-    def _load_strip_function(
-        self, project_root: str = ""
-    ) -> Optional[Callable[[str], str]]:
-        """Dynamically load the strip_docstrings function.
-
-        Returns the function, or None if the module can't be loaded.
-        The script lives outside the slopmop package tree, so we
-        use importlib to load it by file path.
-        """
-        import importlib.util
-
-        script_path = self._get_strip_docstrings_path(project_root)
-        if script_path is None or not script_path.exists():
-            return None
-
-        spec = importlib.util.spec_from_file_location(
-            "strip_docstrings", str(script_path)
-        )
-        if not (spec and spec.loader):
-            return None
-
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)
-        return cast(Callable[[str], str], mod.strip_docstrings)
-
-    def _preprocess_python_files(
-        self, project_root: str, config: Dict[str, Any]
-    ) -> Optional[str]:
-        """Strip docstrings from Python files into a temp directory.
-
-        Creates lightweight copies with docstrings blanked so the Node
-        tool scans clean source.  Line numbers are preserved (multi-line
-        docstrings become ``pass`` + blank lines matching the original
-        span), so reported positions stay correct.
-
-        We use a temp directory rather than modifying files in-place
-        because quality checks run in parallel — an in-place approach
-        would race with the lint-format check that also reads source.
-
-        Returns the temp directory path, or None if no .py files found.
-        The caller must clean up the temp dir (shutil.rmtree).
-        """
-        include_patterns = config.get("include_patterns", ["**/*.py"])
-        ignore_patterns = config.get("ignore_patterns", [])
-
-        # Only process Python files
-        has_python = any(
-            p.endswith(".py") or p.endswith(".py}") for p in include_patterns
-        )
-        if not has_python:
-            return None
-
-        strip_fn = self._load_strip_function(project_root)
-        if strip_fn is None:
-            return None
-
-        # Find all matching .py files using include_patterns (dot-dir pruned)
-        py_files_set: set[str] = set()
-        for pattern in include_patterns:
-            if not (pattern.endswith(".py") or pattern.endswith(".py}")):
-                continue
-            for f in globmod.glob(os.path.join(project_root, pattern), recursive=True):
-                rel = os.path.relpath(f, project_root)
-                rel_parts = Path(rel).parts
-                if any(should_prune_dir(part) for part in rel_parts[:-1]):
-                    continue
-                if any(fnmatch.fnmatch(rel, ign) for ign in ignore_patterns):
-                    continue
-                py_files_set.add(f)
-        py_files = list(py_files_set)
-
-        if not py_files:
-            return None
-
-        # Write stripped copies into temp dir, preserving relative paths
-        tmp_dir = tempfile.mkdtemp(prefix="sm-string-dup-")
-        src_root = Path(project_root).resolve()
-
-        for filepath in py_files:
-            try:
-                with open(filepath, encoding="utf-8", errors="replace") as fh:
-                    source = fh.read()
-                stripped = strip_fn(source)
-            except Exception:
-                continue  # can't read or tokenize — skip this file
-
-            try:
-                rel_path = Path(filepath).resolve().relative_to(src_root)
-            except ValueError:
-                rel_path = Path(Path(filepath).name)
-
-            out_path = Path(tmp_dir) / rel_path
-            out_path.parent.mkdir(parents=True, exist_ok=True)
-            out_path.write_text(stripped, encoding="utf-8")
-
-        return tmp_dir
-
-    def _write_string_inventory(
-        self,
-        project_root: str,
-        scan_root: str,
-        config: Dict[str, Any],
-        *,
-        remap_to_project_root: bool,
-    ) -> None:
-        """Persist per-file literal counts for future incremental scans."""
-        inventory = self._build_string_inventory(
-            project_root,
-            scan_root,
-            config,
-            remap_to_project_root=remap_to_project_root,
-        )
-        output_dir = Path(project_root) / ".slopmop"
-        output_dir.mkdir(parents=True, exist_ok=True)
-        output_path = output_dir / STRING_DUPLICATION_INVENTORY
-        output_path.write_text(
-            json.dumps(inventory, indent=2, sort_keys=True) + "\n",
-            encoding="utf-8",
-        )
-
-    def _build_string_inventory(
-        self,
-        project_root: str,
-        scan_root: str,
-        config: Dict[str, Any],
-        *,
-        remap_to_project_root: bool,
-    ) -> Dict[str, Any]:
-        files: Dict[str, Dict[str, Any]] = {}
-        project_path = Path(project_root)
-        scan_path = Path(scan_root)
-
-        for scan_file in self._iter_inventory_files(scan_root, config):
-            try:
-                rel_path = scan_file.resolve().relative_to(scan_path.resolve())
-            except ValueError:
-                rel_path = Path(scan_file.name)
-
-            original_file = (
-                project_path / rel_path if remap_to_project_root else scan_file
-            )
-            file_key = rel_path.as_posix()
-            files[file_key] = {
-                "sha256": self._file_sha256(original_file),
-                "strings": self._extract_file_strings(scan_file),
-            }
-
-        return {
-            "version": 1,
-            "generated_by": self.full_name,
-            "include_patterns": config.get("include_patterns", ["**/*.py"]),
-            "ignore_patterns": config.get("ignore_patterns", []),
-            "files": files,
-        }
-
-    def _iter_inventory_files(
-        self, scan_root: str, config: Dict[str, Any]
-    ) -> List[Path]:
+    def _scan_files(self, project_root: str, config: Dict[str, Any]) -> List[str]:
+        """Project-relative paths matching an include and no ignore pattern."""
         include_patterns = cast(List[str], config.get("include_patterns", ["**/*.py"]))
         ignore_patterns = cast(List[str], config.get("ignore_patterns", []))
-        root = Path(scan_root)
-        files: List[Path] = []
-
-        for pattern in include_patterns:
-            if not pattern.endswith(".py"):
-                continue
-            for file_path in globmod.glob(str(root / pattern), recursive=True):
-                candidate = Path(file_path)
-                try:
-                    rel_path = candidate.relative_to(root).as_posix()
-                except ValueError:
-                    rel_path = candidate.name
-                if any(
-                    fnmatch.fnmatch(rel_path, ignored) for ignored in ignore_patterns
-                ):
-                    continue
-                files.append(candidate)
-
-        return sorted(set(files))
-
-    @staticmethod
-    def _file_sha256(path: Path) -> str:
-        try:
-            return hashlib.sha256(path.read_bytes()).hexdigest()
-        except OSError:
-            return ""
-
-    @staticmethod
-    def _extract_file_strings(path: Path) -> Dict[str, int]:
-        try:
-            source = path.read_text(encoding="utf-8", errors="replace")
-        except OSError:
-            return {}
-
-        strings: Dict[str, int] = {}
-        for match in STRING_LITERAL_PATTERN.finditer(source):
-            value = match.group(0)[1:-1]
-            if not value:
-                continue
-            strings[value] = strings.get(value, 0) + 1
-        return strings
+        return [
+            rel
+            for rel in iter_source_files(project_root, exclude_dirs=ignore_patterns)
+            if any(_glob_match(rel, pattern) for pattern in include_patterns)
+        ]
 
     @staticmethod
     def _to_findings(
@@ -712,7 +348,7 @@ class StringDuplicationCheck(BaseCheck):
     ) -> List[Finding]:
         """One Finding per duplicate, anchored at the first occurrence's file.
 
-        The Node tool doesn't give line numbers, so SARIF consumers get a
+        The inventory doesn't record line numbers, so SARIF consumers get a
         file-level annotation rather than an inline one — still enough for
         Code Scanning to open the right file in the diff view.
         """
@@ -744,75 +380,22 @@ class StringDuplicationCheck(BaseCheck):
         start_time = time.time()
         effective_config = self._get_effective_config()
 
-        # Check if tool exists
-        tool_path = self._get_tool_path(project_root)
-        if tool_path is None:
-            msg = (
-                "find-duplicate-strings tool not installed locally. "
-                "Run: sm init (sets up tools/) or install globally: "
-                "npm install -g find-duplicate-strings"
-            )
-            return self._create_result(
-                status=CheckStatus.WARNED,
-                duration=time.time() - start_time,
-                output="",
-                error=msg,
-                findings=[Finding(message=msg, level=FindingLevel.WARNING)],
-            )
-
-        # Strip docstrings into a temp directory so the Node tool scans
-        # clean source.  Line numbers are preserved (multi-line docstrings
-        # become pass + \n).  We can't modify files in-place because
-        # quality checks run in parallel and lint would see modified files.
-        tmp_dir = self._preprocess_python_files(project_root, effective_config)
-        scan_root = tmp_dir if tmp_dir else project_root
-
+        inventory = get_string_inventory(project_root)
         try:
-            cmd = self._build_command(effective_config, tool_path, project_root)
-            result = self._run_command(cmd, cwd=scan_root)
-            try:
-                self._write_string_inventory(
-                    project_root,
-                    scan_root,
-                    effective_config,
-                    remap_to_project_root=bool(tmp_dir),
-                )
-            except Exception:
-                pass
+            inventory.refresh(self._scan_files(project_root, effective_config))
         except Exception as e:
             return self._create_result(
                 status=CheckStatus.ERROR,
                 duration=time.time() - start_time,
                 output="",
-                error=f"Failed to run find-duplicate-strings: {e}",
-            )
-        finally:
-            if tmp_dir:
-                shutil.rmtree(tmp_dir, ignore_errors=True)
-
-        # Parse JSON output — remap temp paths back to originals
-        stdout = result.stdout.strip() if result.stdout else ""
-        stderr = result.stderr.strip() if result.stderr else ""
-
-        if tmp_dir and stdout:
-            stdout = _remap_scan_paths(stdout, tmp_dir, project_root)
-
-        if not stdout:
-            return self._create_result(
-                status=CheckStatus.PASSED,
-                duration=time.time() - start_time,
-                output="No duplicate strings found.",
-            )
-
-        try:
-            findings = json.loads(stdout)
-        except json.JSONDecodeError as e:
-            return self._create_result(
-                status=CheckStatus.ERROR,
-                duration=time.time() - start_time,
-                output=stdout,
-                error=f"Failed to parse tool output: {e}\nStderr: {stderr}",
+                error=f"Failed to scan string literals: {e}",
             )
+        inventory.save(
+            generated_by=self.full_name,
+            include_patterns=effective_config.get("include_patterns", ["**/*.py"]),
+            ignore_patterns=effective_config.get("ignore_patterns", []),
+        )
+        findings = inventory.duplicates(cast(int, effective_config.get("threshold", 2)))
 
         # Filter and format results
         filtered = self._filter_results(findings, effective_config)
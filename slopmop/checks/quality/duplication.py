@@ -32,6 +32,7 @@ from slopmop.checks.base import (
     should_prune_dir,
 )
 from slopmop.checks.timeouts import HEAVY_TASK_TIMEOUT, QUICK_COMMAND_TIMEOUT
+from slopmop.core.cache import InputScope
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
 
 DEFAULT_THRESHOLD = 5.0  # Percent duplication allowed
@@ -142,20 +143,11 @@ class RepeatedCodeCheck(BaseCheck):
             ),
         ]
 
-    def cache_inputs(self, project_root: str) -> Optional[str]:
-        from slopmop.core.cache import hash_file_scope
-
-        dirs = self.config.get("include_dirs", ["."])
-        if not dirs:
-            dirs = ["."]
-        exclude = set(self.config.get("exclude_dirs", []))
-        exts = {".py", ".js", ".ts", ".jsx", ".tsx"}
-        return hash_file_scope(
-            project_root,
-            dirs,
-            exts,
-            self.config,
-            exclude_dirs=exclude,
+    def input_scope(self, project_root: str) -> Optional[InputScope]:
+        return InputScope.of(
+            self.config.get("include_dirs") or ["."],
+            {".py", ".js", ".ts", ".jsx", ".tsx"},
+            self.config.get("exclude_dirs", []),
         )
 
     def is_applicable(self, project_root: str) -> bool:
@@ -10,22 +10,25 @@ This is a cross-cutting quality check that applies to all source files.
 import ast
 import io
 import logging
-import os
 import re
 import time
 import tokenize
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Any, List, Optional, Set, Tuple
 
 from slopmop.checks.base import (
     BaseCheck,
     CheckRole,
     ConfigField,
+    ExecutionAffinity,
     Flaw,
     GateCategory,
     RemediationChurn,
     count_source_scope,
+    iter_source_files,
 )
+from slopmop.core import python_ast
+from slopmop.core.python_ast import parse_python
 from slopmop.core.result import (
     CheckResult,
     CheckStatus,
@@ -33,7 +36,6 @@ from slopmop.core.result import (
     FindingLevel,
     ScopeInfo,
 )
-from slopmop.utils import is_path_excluded
 
 logger = logging.getLogger(__name__)
 
@@ -201,7 +203,7 @@ _FIX_SUGGESTION_SUFFIX = "\n\nVerify with: "
 
 
 def _find_biggest_python_definition(
-    content: str,
+    project_root: str, rel_path: str
 ) -> Optional[Tuple[str, int, int]]:
     """Find the largest top-level class or function in a Python file.
 
@@ -216,9 +218,8 @@ def _find_biggest_python_definition(
     too — the caller's mental model is "delete these N lines from
     the file", and that N includes prose.
     """
-    try:
-        tree = ast.parse(content)
-    except SyntaxError:
+    tree = parse_python(project_root, rel_path).tree
+    if tree is None:
         return None
     defs = [
         node
@@ -308,6 +309,7 @@ class LocLockCheck(BaseCheck):
     """
 
     role = CheckRole.DIAGNOSTIC
+    execution_affinity = ExecutionAffinity.IN_PROCESS_CPU
     remediation_churn = RemediationChurn.DOWNSTREAM_CHANGES_VERY_LIKELY
 
     @property
@@ -394,10 +396,6 @@ class LocLockCheck(BaseCheck):
         config_excludes = set(self.config.get("exclude_dirs", []))
         return EXCLUDED_DIRS | config_excludes
 
-    def _should_skip_path(self, path: Path, excluded_dirs: Set[str]) -> bool:
-        """Check if path should be skipped."""
-        return is_path_excluded(path, excluded_dirs)
-
     def _get_extensions(self) -> Set[str]:
         """Get file extensions to check."""
         config_exts = self.config.get("extensions", [])
@@ -434,54 +432,65 @@ class LocLockCheck(BaseCheck):
         file_violations: List[Tuple[str, int, Optional[Tuple[str, int, int]]]] = []
         func_violations: List[Tuple[str, str, int, int]] = []
 
-        root = Path(project_root)
-
-        for include_dir in include_dirs:
-            scan_path = root / include_dir
-            if not scan_path.exists():
-                continue
-
-            for root_dir, dirs, files in os.walk(scan_path):
-                rel_root = Path(root_dir).relative_to(root)
-                dirs[:] = [
-                    d
-                    for d in dirs
-                    if not (
-                        d.startswith(".")
-                        or self._should_skip_path(rel_root / d, excluded_dirs)
+        with self.file_findings_cache(project_root, [python_ast]) as cache:
+            for rel_path in iter_source_files(
+                project_root, include_dirs, extensions, excluded_dirs
+            ):
+                facts = cache.scan(
+                    rel_path,
+                    lambda: self._measure_file(
+                        project_root, rel_path, max_file_lines, max_func_lines
+                    ),
+                )
+                if facts is None:
+                    continue
+                line_count, target, funcs = facts
+                if line_count > max_file_lines:
+                    move_target = (
+                        (str(target[0]), int(target[1]), int(target[2]))
+                        if target
+                        else None
+                    )
+                    file_violations.append((rel_path, line_count, move_target))
+                for func_name, start_line, func_lines in funcs:
+                    func_violations.append(
+                        (rel_path, func_name, start_line, func_lines)
                     )
-                ]
-                for fname in files:
-                    file_path = Path(root_dir) / fname
-                    if file_path.suffix not in extensions:
-                        continue
-                    rel_path_obj = rel_root / fname
-                    if self._should_skip_path(rel_path_obj, excluded_dirs):
-                        continue
-
-                    rel_path = str(rel_path_obj)
-
-                    try:
-                        content = file_path.read_text(encoding="utf-8", errors="ignore")
-
-                        line_count = _count_code_lines(content, file_path.suffix)
 
-                        if line_count > max_file_lines:
-                            target = self._pick_move_target(content, file_path.suffix)
-                            file_violations.append((rel_path, line_count, target))
+        return file_violations, func_violations
 
-                        funcs = self._find_functions(content, file_path.suffix)
-                        for func_name, start_line, func_lines in funcs:
-                            if func_lines > max_func_lines:
-                                func_violations.append(
-                                    (rel_path, func_name, start_line, func_lines)
-                                )
+    def _measure_file(
+        self,
+        project_root: str,
+        rel_path: str,
+        max_file_lines: int,
+        max_func_lines: int,
+    ) -> Optional[List[Any]]:
+        """Return ``[code lines, move target, oversized functions]`` for a file.
 
-                    except (OSError, UnicodeDecodeError) as e:
-                        logger.debug(f"Could not read {rel_path}: {e}")
-                        continue
+        The move target is only computed for oversized files, and only
+        functions over *max_func_lines* are listed.  ``None`` if the file
+        can't be read.  Plain lists, so the per-file cache can store them.
+        """
+        file_path = Path(project_root) / rel_path
+        try:
+            content = file_path.read_text(encoding="utf-8", errors="ignore")
+        except (OSError, UnicodeDecodeError) as e:
+            logger.debug(f"Could not read {file_path}: {e}")
+            return None
 
-        return file_violations, func_violations
+        line_count = _count_code_lines(content, file_path.suffix)
+        target = None
+        if line_count > max_file_lines:
+            target = self._pick_move_target(project_root, rel_path, content)
+        funcs: List[List[object]] = [
+            [func_name, start_line, func_lines]
+            for func_name, start_line, func_lines in self._find_functions(
+                content, file_path.suffix
+            )
+            if func_lines > max_func_lines
+        ]
+        return [line_count, list(target) if target else None, funcs]
 
     def run(self, project_root: str) -> CheckResult:
         """Run LOC enforcement check."""
@@ -545,11 +554,12 @@ class LocLockCheck(BaseCheck):
         )
 
     def _pick_move_target(
-        self, content: str, extension: str
+        self, project_root: str, rel_path: str, content: str
     ) -> Optional[Tuple[str, int, int]]:
         """Find the thing to move OUT of an oversized file.
 
-        For Python: biggest top-level class or function via AST.
+        For Python: biggest top-level class or function, from the tree
+        :func:`parse_python` shares with the other Python gates.
         For everything else: biggest function via the existing regex
         machinery — not as good (misses classes) but still actionable.
 
@@ -557,8 +567,9 @@ class LocLockCheck(BaseCheck):
         nothing identifiable was found.  ``None`` degrades gracefully
         to a generic message; it doesn't hide the violation.
         """
+        extension = Path(rel_path).suffix
         if extension == ".py":
-            hit = _find_biggest_python_definition(content)
+            hit = _find_biggest_python_definition(project_root, rel_path)
             if hit is not None:
                 return hit
         funcs = self._find_functions(content, extension)
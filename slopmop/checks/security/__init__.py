@@ -29,6 +29,7 @@ from slopmop.checks.base import (
     GateLevel,
     Requirement,
     Requirements,
+    ResourceProfile,
     ToolContext,
 )
 from slopmop.checks.mixins import PythonCheckMixin
@@ -36,6 +37,7 @@ from slopmop.checks.security._detect_secrets import DetectSecretsMixin
 from slopmop.checks.timeouts import SLOW_TOOL_TIMEOUT
 from slopmop.constants import NO_ISSUES_FOUND
 from slopmop.core.result import CheckResult, CheckStatus, Finding, FindingLevel
+from slopmop.subprocess.runner import submit_in_gate
 
 _SCANNER_NOT_INSTALLED = "{name} (not installed)"
 _SECURITY_INSTALL_HINT = "pipx install slopmop[security]"
@@ -180,6 +182,7 @@ class SecurityLocalCheck(BaseCheck, PythonCheckMixin, DetectSecretsMixin):
 
     tool_context = ToolContext.SM_TOOL
     role = CheckRole.FOUNDATION
+    resource_profile = ResourceProfile(memory_mb=1024, spawns_parallelism=True)
     level = GateLevel.SCOUR
 
     @property
@@ -475,7 +478,8 @@ class SecurityLocalCheck(BaseCheck, PythonCheckMixin, DetectSecretsMixin):
 
         with ThreadPoolExecutor(max_workers=len(sub_checks)) as executor:
             futures = {
-                executor.submit(fn, project_root): fn.__name__ for fn in sub_checks
+                submit_in_gate(executor, fn, project_root): fn.__name__
+                for fn in sub_checks
             }
             for future in futures:
                 try:
@@ -767,7 +771,8 @@ class SecurityCheck(SecurityLocalCheck):
 
         with ThreadPoolExecutor(max_workers=4) as executor:
             futures = {
-                executor.submit(fn, project_root): fn.__name__ for fn in sub_checks
+                submit_in_gate(executor, fn, project_root): fn.__name__
+                for fn in sub_checks
             }
             for future in futures:
                 try:
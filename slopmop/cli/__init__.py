@@ -14,6 +14,7 @@ if TYPE_CHECKING:
     from slopmop.cli.audit import cmd_audit
     from slopmop.cli.barnacle import cmd_barnacle
     from slopmop.cli.buff import cmd_buff
+    from slopmop.cli.cache import cmd_cache
     from slopmop.cli.capabilities import cmd_capabilities
     from slopmop.cli.captain import cmd_captain
     from slopmop.cli.config import cmd_config
@@ -37,6 +38,7 @@ _EXPORT_MAP = {
     "cmd_audit": ("slopmop.cli.audit", "cmd_audit"),
     "cmd_barnacle": ("slopmop.cli.barnacle", "cmd_barnacle"),
     "cmd_buff": ("slopmop.cli.buff", "cmd_buff"),
+    "cmd_cache": ("slopmop.cli.cache", "cmd_cache"),
     "cmd_capabilities": ("slopmop.cli.capabilities", "cmd_capabilities"),
     "cmd_captain": ("slopmop.cli.captain", "cmd_captain"),
     "cmd_commit_hooks": ("slopmop.cli.hooks", "cmd_commit_hooks"),
@@ -75,6 +77,7 @@ __all__ = [
     "cmd_agent",
     "cmd_audit",
     "cmd_barnacle",
+    "cmd_cache",
     "cmd_capabilities",
     "cmd_captain",
     "cmd_commit_hooks",
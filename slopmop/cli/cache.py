@@ -0,0 +1,46 @@
+"""`sm cache` — inspect the result cache.
+
+``sm cache explain GATE`` recomputes the gate's cache key exactly as a
+run would and says whether it would hit; on a miss it names what changed
+since the gate's last stored result — config, tools, or input files.
+Runs no gates.
+"""
+
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from slopmop.core.cache import ResultCache, compute_fingerprint
+from slopmop.core.cache_explain import explain
+from slopmop.core.snapshot import ProjectSnapshot, use_snapshot
+
+
+def cmd_cache(args: argparse.Namespace) -> int:
+    """Handle ``sm cache`` actions (currently only ``explain``)."""
+    from slopmop.checks import ensure_checks_registered
+    from slopmop.checks.custom import register_custom_gates
+    from slopmop.core.registry import get_registry
+    from slopmop.sm import load_config
+
+    root = Path(getattr(args, "project_root", ".")).resolve()
+    project_root = str(root)
+    ensure_checks_registered()
+    config = load_config(root)
+    register_custom_gates(config)
+    check = get_registry().get_check(args.gate, config)
+    if check is None:
+        print(f"Unknown gate '{args.gate}'. Run `sm status` to list gates.")
+        return 1
+
+    cache = ResultCache.load(project_root)
+    try:
+        with use_snapshot(ProjectSnapshot(project_root)):
+            fingerprint = check.cache_fingerprint(
+                project_root, compute_fingerprint(project_root)
+            )
+            lines = explain(cache, check.full_name, fingerprint, check.cache_manifest)
+    finally:
+        cache.close()
+    print("\n".join(lines))
+    return 0
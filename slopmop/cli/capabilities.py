@@ -164,6 +164,16 @@ _VERB_CATALOG: List[Dict[str, object]] = [
             "0": "catalog emitted",
         },
     },
+    {
+        "name": "cache",
+        "summary": "Explain why a gate would miss the result cache. Runs no gates.",
+        "group": "introspection",
+        "formats": ["human"],
+        "exit_codes": {
+            "0": "explanation emitted",
+            "1": "unknown gate",
+        },
+    },
     {
         "name": "config",
         "summary": "View or update quality-gate configuration.",
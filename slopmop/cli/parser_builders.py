@@ -648,3 +648,41 @@ class CapabilitiesParserBuilder:
             default=".",
             help=PROJECT_ROOT_HELP,
         )
+
+
+class CacheParserBuilder:
+    """Build the cache parser (result-cache introspection)."""
+
+    def __init__(
+        self,
+        subparsers: argparse._SubParsersAction[argparse.ArgumentParser],
+    ) -> None:
+        self.subparsers = subparsers
+
+    def build(self) -> None:
+        """Register the cache parser and its actions."""
+        cache_parser = self.subparsers.add_parser(
+            "cache",
+            help="Inspect the result cache",
+            description=(
+                "Inspect the result cache without running gates. `explain GATE` "
+                "says whether GATE's next run would reuse a cached result and, "
+                "if not, what changed since its last stored one."
+            ),
+        )
+        actions = cache_parser.add_subparsers(dest="cache_action", required=True)
+        explain_parser = actions.add_parser(
+            "explain",
+            help="Explain why a gate would miss the cache",
+        )
+        explain_parser.add_argument(
+            "gate",
+            metavar="GATE",
+            help="Full gate name (e.g. laziness:complexity-creep.py).",
+        )
+        explain_parser.add_argument(
+            "--project-root",
+            type=str,
+            default=".",
+            help=PROJECT_ROOT_HELP,
+        )
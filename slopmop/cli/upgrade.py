@@ -6,6 +6,7 @@ import argparse
 import json
 import os
 import shutil
+import sqlite3
 import subprocess
 import sys
 import urllib.error
@@ -38,12 +39,17 @@ UNSUPPORTED_INSTALL_ERROR = (
 )
 STATE_BACKUP_FILES = (
     "cache.json",
+    "cache.db",
     "timings.json",
     "current_pr.json",
     "last_swab.json",
     "last_scour.json",
     "baseline_snapshot.json",
 )
+# SQLite stores run in WAL mode: recent commits sit in the ``-wal``/``-shm``
+# sidecars until checkpointed, so the main file alone may be stale.
+SQLITE_STATE_FILES = frozenset({"cache.db"})
+SQLITE_SIDECAR_SUFFIXES = ("-wal", "-shm")
 
 
 class UpgradeError(RuntimeError):
@@ -263,6 +269,21 @@ def _backup_dir(project_root: Path, stamp: Optional[str] = None) -> Path:
     )
 
 
+def _checkpoint_sqlite(path: Path) -> None:
+    """Fold the write-ahead log into *path* so the main file is current."""
+    try:
+        conn = sqlite3.connect(str(path), timeout=10)
+    except sqlite3.Error:
+        return
+    try:
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    except sqlite3.Error:
+        # Busy or not a database; the sidecars are copied below instead.
+        pass
+    finally:
+        conn.close()
+
+
 def _backup_upgrade_state(
     project_root: Path,
     *,
@@ -283,9 +304,21 @@ def _backup_upgrade_state(
     state_root = state_dir_path(project_root)
     for name in STATE_BACKUP_FILES:
         source = state_root / name
-        if source.exists():
-            destination = backup_dir / name
-            shutil.copy2(source, destination)
+        if not source.exists():
+            continue
+        names = [name]
+        if name in SQLITE_STATE_FILES:
+            _checkpoint_sqlite(source)
+            names += [name + suffix for suffix in SQLITE_SIDECAR_SUFFIXES]
+        for member in names:
+            member_source = state_root / member
+            # A truncated WAL holds nothing the main file lacks.
+            if not member_source.exists() or (
+                member != name and member_source.stat().st_size == 0
+            ):
+                continue
+            destination = backup_dir / member
+            shutil.copy2(member_source, destination)
             copied.append(destination.name)
 
     manifest: Dict[str, object] = {
@@ -17,10 +17,12 @@ from typing import Any, Dict, List, Optional
 from slopmop.baseline import baseline_snapshot_path, filter_summary_against_baseline
 from slopmop.checks import ensure_checks_registered
 from slopmop.checks.base import GateLevel
-from slopmop.core.executor import CheckExecutor
+from slopmop.core.deadlines import gate_deadlines
+from slopmop.core.executor import DEFAULT_KILL_GRACE_SECONDS, CheckExecutor
 from slopmop.core.lock import SmLockError, max_expected_duration, sm_lock
 from slopmop.core.registry import get_registry
-from slopmop.core.result import CheckResult, CheckStatus
+from slopmop.core.result import CheckResult, CheckStatus, ExecutionSummary
+from slopmop.core.shared_cache import shared_cache_backend
 from slopmop.reporting.adapters import (
     ConsoleAdapter,
     JsonAdapter,
@@ -30,7 +32,11 @@ from slopmop.reporting.adapters import (
 from slopmop.reporting.console import ConsoleReporter
 from slopmop.reporting.dynamic import DynamicDisplay
 from slopmop.reporting.report import RunReport
-from slopmop.reporting.timings import clear_timings, load_timing_averages
+from slopmop.reporting.timings import (
+    clear_timings,
+    load_timing_averages,
+    load_timings,
+)
 from slopmop.subprocess.runner import get_runner
 from slopmop.workflow.state_machine import RepoPhase
 from slopmop.workflow.state_store import read_phase
@@ -87,11 +93,19 @@ def _is_json_mode(args: argparse.Namespace) -> bool:
     return False
 
 
+def _is_jsonl_mode(args: argparse.Namespace) -> bool:
+    """Return whether validation streams JSON-lines events (``--jsonl``)."""
+    return bool(getattr(args, "jsonl_output", False))
+
+
 def _is_porcelain_mode(args: argparse.Namespace) -> bool:
     """Return whether validation should print token-terse agent output."""
     if getattr(args, "porcelain", False):
         return True
 
+    if _is_jsonl_mode(args):
+        return False
+
     # Don't auto-enable agent/porcelain output when the user has explicitly
     # chosen --json or --no-json; only auto-detect when json mode is unset.
     if getattr(args, "json_output", None) is not None:
@@ -168,7 +182,7 @@ def _setup_dynamic_display(
 
     def _combined(result: CheckResult) -> None:
         display.on_check_complete(result)
-        if result.failed or result.status == CheckStatus.ERROR:
+        if result.failed or result.status in (CheckStatus.ERROR, CheckStatus.TIMEOUT):
             deferred_failures.append(result)
 
     executor.set_progress_callback(_combined)
@@ -323,6 +337,17 @@ def _run_validation(
         get_runner().terminate_all()
 
 
+def _run_streaming_jsonl(
+    executor: CheckExecutor, run_kwargs: Dict[str, Any]
+) -> ExecutionSummary:
+    """Run checks, printing each event as one compact JSON line as it happens."""
+    stream = executor.iter_results(**run_kwargs)
+    for event in stream:
+        print(json.dumps(event.to_dict(), separators=(",", ":")), flush=True)
+    assert stream.summary is not None  # for type checker
+    return stream.summary
+
+
 def _run_validation_locked(
     args: argparse.Namespace,
     gates: List[str],
@@ -336,7 +361,9 @@ def _run_validation_locked(
     """Inner validation pipeline, called while holding the repo lock."""
     from slopmop.sm import load_config
 
-    json_mode = _is_json_mode(args)
+    # JSON lines is a JSON mode: no console output may interleave with it.
+    jsonl_mode = _is_jsonl_mode(args)
+    json_mode = _is_json_mode(args) or jsonl_mode
     porcelain_mode = _is_porcelain_mode(args)
 
     # Clear timing history if requested
@@ -356,10 +383,17 @@ def _run_validation_locked(
     process_results_in_remediation_order = (
         read_phase(project_root) == RepoPhase.REMEDIATION
     )
+    kill_grace: Optional[float] = getattr(args, "kill_grace", None)
     executor = CheckExecutor(
         registry=registry,
         fail_fast=use_fail_fast,
         process_results_in_remediation_order=process_results_in_remediation_order,
+        process_workers=max(0, getattr(args, "process_workers", 0) or 0),
+        speculative=bool(getattr(args, "speculative", False)),
+        kill_grace_period=(
+            DEFAULT_KILL_GRACE_SECONDS if kill_grace is None else max(0.0, kill_grace)
+        ),
+        backend=getattr(args, "backend", None) or "thread",
     )
 
     # Set up progress reporting (per-check status lines during the run;
@@ -431,10 +465,15 @@ def _run_validation_locked(
     if not args.quiet and not json_mode and not porcelain_mode and not sarif_to_stdout:
         _print_header(project_root, gates, args, swabbing_timeout=swabbing_timeout)
 
-    # Load timing history for budget filtering
-    timings: Optional[dict[str, float]] = None
-    if swabbing_timeout is not None and swabbing_timeout > 0:
-        timings = load_timing_averages(str(project_root))
+    # Load timing history for budget packing and critical-path ordering
+    timings: Optional[dict[str, float]] = load_timing_averages(str(project_root))
+    # Opt-in per-gate deadlines from the same history: a wedged tool fails
+    # at a few times its usual duration instead of at its fixed timeout
+    # tier.  Off by default so a cold or loaded machine never turns a
+    # slow-but-healthy gate into a blocking failure.
+    deadlines: Optional[Dict[str, float]] = None
+    if getattr(args, "adaptive_timeouts", False):
+        deadlines = gate_deadlines(load_timings(str(project_root)))
 
     # Set up dynamic display if appropriate
     dynamic_display: Optional[DynamicDisplay] = None
@@ -481,7 +520,7 @@ def _run_validation_locked(
 
     try:
         # Run checks
-        summary = executor.run_checks(
+        run_kwargs: Dict[str, Any] = dict(
             project_root=str(project_root),
             check_names=gates,
             config=config,
@@ -489,7 +528,13 @@ def _run_validation_locked(
             swabbing_timeout=swabbing_timeout,
             timings=timings,
             use_cache=not getattr(args, "no_cache", False),
+            deadlines=deadlines,
+            shared_cache=shared_cache_backend(str(project_root), config),
         )
+        if jsonl_mode:
+            summary = _run_streaming_jsonl(executor, run_kwargs)
+        else:
+            summary = executor.run_checks(**run_kwargs)
 
         # Stop dynamic display before printing summary
         if dynamic_display:
@@ -578,7 +623,13 @@ def _run_validation_locked(
                 print(payload)
                 return 0 if effective_summary.all_passed else 1
 
-        if json_mode:
+        if jsonl_mode:
+            summary_line: Dict[str, object] = {
+                "event": "summary",
+                "report": JsonAdapter.render(report),
+            }
+            print(json.dumps(summary_line, separators=(",", ":")), flush=True)
+        elif json_mode:
             output = JsonAdapter.render(report)
             if output_file and not sarif_requested:
                 # Mirror JSON to disk for archival — pretty-printed for humans.
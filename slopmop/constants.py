@@ -19,6 +19,7 @@ STATUS_EMOJI = {
     CheckStatus.SKIPPED: "⏭️",
     CheckStatus.NOT_APPLICABLE: "⊘",
     CheckStatus.ERROR: "💥",
+    CheckStatus.TIMEOUT: "⏰",
 }
 
 # Role → badge emoji.  Keyed by the string values of CheckRole members
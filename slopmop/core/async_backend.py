@@ -0,0 +1,180 @@
+"""Event-loop plumbing for the executor's asyncio backend.
+
+On the asyncio backend every gate is a coroutine on one event loop that
+lives on a daemon thread for the duration of a run:
+
+* :class:`AsyncGateLoop` owns that loop and exposes the same
+  ``submit(...) -> concurrent.futures.Future`` / ``shutdown(...)`` surface
+  as the ``ThreadPoolExecutor`` it replaces, so the scheduler loop in
+  ``CheckExecutor`` is unchanged;
+* :class:`LoopBackedRunner` is a drop-in ``SubprocessRunner`` whose
+  ``run()`` hands the command to an :class:`AsyncSubprocessRunner` on
+  that loop.  Gates with synchronous ``run()`` bodies run on the loop's
+  worker threads (the thread fallback), but every tool process they
+  start is spawned, read, timed out and killed by the loop.
+
+Command gates (``slopmop.checks.base.CommandCheck``) don't take that
+fallback: their ``run_async`` awaits :attr:`LoopBackedRunner.async_runner`
+directly on the loop, so no thread is held while their tool runs.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Collection,
+    Coroutine,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    TypeVar,
+)
+
+from slopmop.subprocess.async_runner import AsyncSubprocessRunner
+from slopmop.subprocess.runner import GATE_OWNER, SubprocessResult, SubprocessRunner
+
+T = TypeVar("T")
+
+BACKENDS = ("thread", "asyncio")
+
+
+class LoopBackedRunner(SubprocessRunner):
+    """``SubprocessRunner`` that delegates process supervision to a loop."""
+
+    def __init__(self, gate_loop: "AsyncGateLoop", async_runner: AsyncSubprocessRunner):
+        super().__init__()
+        self._gate_loop = gate_loop
+        self._async_runner = async_runner
+
+    @property
+    def async_runner(self) -> AsyncSubprocessRunner:
+        """The loop's runner; only await it from coroutines on that loop."""
+        return self._async_runner
+
+    def run(
+        self,
+        command: List[str],
+        timeout: Optional[int] = None,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        capture_output: bool = True,
+    ) -> SubprocessResult:
+        if self._gate_loop.in_loop_thread():
+            # Blocking the loop on itself would deadlock.
+            return super().run(command, timeout, cwd, env, capture_output)
+        return self._gate_loop.call(
+            self._async_runner.run(
+                command,
+                timeout=timeout,
+                cwd=cwd,
+                env=env,
+                capture_output=capture_output,
+                owner=GATE_OWNER.get(),
+            )
+        )
+
+    def terminate_all(self, grace_period: float = 5.0) -> int:
+        count = self._gate_loop.call(self._async_runner.terminate_all(grace_period))
+        return count + super().terminate_all(grace_period)
+
+    def terminate_owned_by(
+        self, owners: Collection[Hashable], grace_period: float = 5.0
+    ) -> Set[Hashable]:
+        killed = self._gate_loop.call(
+            self._async_runner.terminate_owned_by(owners, grace_period)
+        )
+        return killed | super().terminate_owned_by(owners, grace_period)
+
+
+class AsyncGateLoop:
+    """An event loop on a daemon thread, driven like a thread pool.
+
+    Args:
+        max_workers: Gates allowed to run at once — the same cap the
+            thread backend's pool size enforces.  Also sizes the pool that
+            runs synchronous gate bodies.
+    """
+
+    def __init__(self, max_workers: int):
+        self._max_workers = max(1, max_workers)
+        self._loop = asyncio.new_event_loop()
+        self._workers = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers, thread_name_prefix="slopmop-gate"
+        )
+        self._loop.set_default_executor(self._workers)
+        self._slots = asyncio.Semaphore(self._max_workers)
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever, name="slopmop-asyncio", daemon=True
+        )
+        self._thread.start()
+        self.runner = LoopBackedRunner(self, AsyncSubprocessRunner())
+
+    def in_loop_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    def call(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run *coro* on the loop and block the calling thread for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def submit(
+        self, fn: Callable[..., Awaitable[T]], *args: Any
+    ) -> "concurrent.futures.Future[T]":
+        """Schedule ``fn(*args)`` as a gate; mirrors ``Executor.submit``.
+
+        Like a pool future, the returned future can only be cancelled
+        while the gate is still queued for a slot — once it starts it
+        runs to completion (fail-fast stops it by killing its processes).
+        """
+        future: "concurrent.futures.Future[T]" = concurrent.futures.Future()
+        self._loop.call_soon_threadsafe(self._start, future, fn, args)
+        return future
+
+    def _start(
+        self,
+        future: "concurrent.futures.Future[T]",
+        fn: Callable[..., Awaitable[T]],
+        args: Any,
+    ) -> None:
+        task = self._loop.create_task(self._run_gate(future, fn, args))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_gate(
+        self,
+        future: "concurrent.futures.Future[T]",
+        fn: Callable[..., Awaitable[T]],
+        args: Any,
+    ) -> None:
+        async with self._slots:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = await fn(*args)
+            except BaseException as e:  # noqa: BLE001 — handed to the waiter
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    async def _drain(self) -> None:
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Stop the loop; mirrors ``ThreadPoolExecutor.shutdown``.
+
+        Gates already running always finish first — closing the loop
+        under them would orphan their worker threads.  Cancelled queued
+        gates return as soon as they get a slot.
+        """
+        if not self._loop.is_closed() and self._thread.is_alive():
+            self.call(self._drain())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+        self._workers.shutdown(wait=wait)
+        self._loop.close()
@@ -2,34 +2,70 @@
 
 When source files and configuration haven't changed between runs,
 re-running every check from scratch is wasted work.  This module
-computes a project-wide fingerprint (based on file modification times
-and config content) and caches check results keyed by that fingerprint.
+computes a project-wide fingerprint (based on file content and config)
+and caches check results keyed by that fingerprint.  Per-file content
+hashes come from git's index for clean tracked files
+(``slopmop.core.git_index``) and a stat-keyed index
+(``slopmop.core.file_index``) for the rest, so an unchanged tree is
+fingerprinted without re-reading it.
 
 On a cache hit the executor returns the stored result instantly,
 making back-to-back ``sm swab`` runs take virtually zero time.
 
-Cache location: ``.slopmop/cache.json`` (separate from timings.json).
+Cache location: ``.slopmop/cache.db``, an SQLite store (see
+``slopmop.core.cache_store``) used through :class:`ResultCache`, which
+imports a ``cache.json`` left by an older slop-mop once.
 
 Design decisions:
 - **Project-wide fingerprint**: One fingerprint covers all checks.
   If *any* source file changes, all caches invalidate.  Conservative
   but cheap and always correct.
+- **Several fingerprints per gate**: Each gate keeps its most recently
+  used results (LRU), so ``git checkout main && sm swab && git checkout
+  feature && sm swab`` hits both times.  A total size cap evicts the
+  least recently used entries across all gates.
 - **ERROR results are not cached**: Errors are often transient (missing
   tool, network issue) and should be retried.
-- **auto_fixed results are not cached**: Auto-fix is a side effect;
-  caching would skip the fix on the next run.
+- **auto_fixed results are not cached as-is**: Auto-fix is a side
+  effect; caching it under the pre-fix fingerprint would skip the fix
+  on the next run.  The executor re-keys a fixed check to the post-fix
+  tree and stores its verdict there as a plain result instead.
 """
 
 import hashlib
 import json
 import logging
 import os
-import subprocess
+import threading
+import time
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional, cast
-
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    cast,
+)
+
+from slopmop.core.cache_store import (
+    STORE_FILE,
+    CacheStore,
+    StoredResult,
+    decode_blob,
+    encode_blob,
+)
+from slopmop.core.file_index import content_hashes
+from slopmop.core.git_context import git_context
+from slopmop.core.git_index import git_blob_ids
 from slopmop.core.result import CheckResult, CheckStatus
+from slopmop.core.shared_cache import SharedCacheBackend, shared_key
+from slopmop.core.snapshot import ProjectSnapshot, active_snapshot
 from slopmop.utils import is_path_excluded
 
 logger = logging.getLogger(__name__)
@@ -37,6 +73,11 @@ logger = logging.getLogger(__name__)
 CACHE_DIR = ".slopmop"
 CACHE_FILE = "cache.json"
 
+# Fingerprints remembered per gate (LRU), so switching between a few
+# branches keeps hitting, and the cap on the whole cache file.
+DEFAULT_ENTRIES_PER_GATE = 8
+DEFAULT_MAX_CACHE_BYTES = 16 * 1024 * 1024
+
 # Directories to skip when computing the source fingerprint.
 # Dot-directories are excluded automatically via d.startswith(".") in the
 # walk filter; this set covers non-dot noise dirs.
@@ -76,6 +117,108 @@ def _cache_path(project_root: str) -> Path:
     return Path(project_root) / CACHE_DIR / CACHE_FILE
 
 
+@dataclass(frozen=True)
+class InputScope:
+    """The files a gate's verdict depends on, declared as data.
+
+    Returned by ``BaseCheck.input_scope()``.  Scopes are hashable, so a
+    run hashes each distinct scope once (see :func:`scope_digest`) no
+    matter how many gates declare it.  Build with :meth:`of`, which
+    normalizes ordering so equal scopes compare equal.
+
+    Attributes:
+        dirs: Directories relative to the root (``"."`` for everything).
+        extensions: File suffixes to include (e.g. ``{".py"}``).
+        exclude_dirs: Extra path filters, merged with ``_EXCLUDED_DIRS``.
+        extra_files: Individual files outside the walk (lockfiles,
+            tool config) that also feed the verdict.
+    """
+
+    dirs: Tuple[str, ...]
+    extensions: FrozenSet[str]
+    exclude_dirs: FrozenSet[str] = frozenset()
+    extra_files: Tuple[str, ...] = ()
+
+    @classmethod
+    def of(
+        cls,
+        dirs: Iterable[str],
+        extensions: Iterable[str],
+        exclude_dirs: Iterable[str] = (),
+        extra_files: Iterable[str] = (),
+    ) -> "InputScope":
+        return cls(
+            dirs=tuple(sorted(set(dirs))) or (".",),
+            extensions=frozenset(extensions),
+            exclude_dirs=frozenset(exclude_dirs),
+            extra_files=tuple(sorted(set(extra_files))),
+        )
+
+
+def scope_file_hashes(project_root: str, scope: InputScope) -> List[Tuple[str, str]]:
+    """``(path, content hash)`` for every file in *scope*, in path order.
+
+    Content hashing rather than mtime means IDE auto-saves or git
+    operations that touch mtimes without changing content won't bust
+    the cache — only genuine content changes do.  During a run the
+    shared snapshot answers (and memoizes) this without another walk.
+    """
+    snapshot = active_snapshot(project_root)
+    if snapshot is None:
+        return _scope_file_hashes(project_root, scope, None)
+    return snapshot.memoize(
+        ("scope_files", scope),
+        lambda: _scope_file_hashes(project_root, scope, snapshot),
+    )
+
+
+def _scope_file_hashes(
+    project_root: str, scope: InputScope, snapshot: Optional[ProjectSnapshot]
+) -> List[Tuple[str, str]]:
+    excluded = _EXCLUDED_DIRS | scope.exclude_dirs
+    if snapshot is not None and snapshot.covers(scope.dirs):
+        rels = snapshot.files(scope.dirs, scope.extensions, excluded)
+        pairs = snapshot.file_hashes(rels)
+    else:
+        rels = _walk_scope(
+            project_root, list(scope.dirs), set(scope.extensions), excluded
+        )
+        pairs = content_hashes(project_root, rels)
+    walked = set(rels)
+    extras = [f for f in scope.extra_files if f not in walked]
+    if extras:
+        pairs = sorted([*pairs, *content_hashes(project_root, extras)])
+    return pairs
+
+
+def scope_digest(project_root: str, scope: InputScope) -> str:
+    """Hash of *scope*'s file contents, computed once per run per scope."""
+
+    def compute() -> str:
+        hasher = hashlib.sha256()
+        _fold(hasher, scope_file_hashes(project_root, scope))
+        return hasher.hexdigest()
+
+    snapshot = active_snapshot(project_root)
+    if snapshot is None:
+        return compute()
+    return snapshot.memoize(("scope_digest", scope), compute)
+
+
+def scoped_fingerprint(
+    project_root: str, scope: InputScope, config: Dict[str, Any]
+) -> str:
+    """Fingerprint of *scope*'s files plus the gate *config* that reads them."""
+    hasher = hashlib.sha256()
+    # Config changes invalidate too; it's hashed here, not in the shared
+    # scope digest, so gates with equal scopes share one file hash.
+    hasher.update(b"config:")
+    hasher.update(json.dumps(config, sort_keys=True).encode())
+    hasher.update(b"scope:")
+    hasher.update(scope_digest(project_root, scope).encode())
+    return hasher.hexdigest()
+
+
 def hash_file_scope(
     project_root: str,
     dirs: list[str],
@@ -85,10 +228,11 @@ def hash_file_scope(
 ) -> str:
     """Compute a fingerprint scoped to specific directories and extensions.
 
-    Used by checks that override ``BaseCheck.cache_inputs()`` to declare
-    a narrow input scope.  Only files matching *dirs* and *extensions*
-    contribute to the hash, so edits outside this scope won't invalidate
-    the check's cache.
+    The imperative spelling of :func:`scoped_fingerprint`, for checks
+    that override ``BaseCheck.cache_inputs()`` directly; prefer
+    declaring ``BaseCheck.input_scope()``.  Only files matching *dirs*
+    and *extensions* contribute to the hash, so edits outside this scope
+    won't invalidate the check's cache.
 
     Args:
         project_root: Project root directory.
@@ -102,20 +246,16 @@ def hash_file_scope(
     Returns:
         Hex digest string.
     """
-    hasher = hashlib.sha256()
-    root = Path(project_root)
-    excluded = _EXCLUDED_DIRS | (exclude_dirs or set())
+    scope = InputScope.of(dirs, extensions, exclude_dirs or ())
+    return scoped_fingerprint(project_root, scope, config)
 
-    # 1. Hash the check config so config changes invalidate
-    hasher.update(b"config:")
-    hasher.update(json.dumps(config, sort_keys=True).encode())
 
-    # 2. Collect paths, sort, then stream reads into the hasher.
-    # Content hashing rather than mtime means IDE auto-saves or git
-    # operations that touch mtimes without changing content won't bust
-    # the cache — only genuine content changes do.
-    # Streaming avoids holding all file contents in memory at once.
-    paths: list[tuple[str, Path]] = []
+def _walk_scope(
+    project_root: str, dirs: list[str], extensions: set[str], excluded: set[str]
+) -> list[str]:
+    """Sorted files under *dirs* for :func:`scope_file_hashes` (no snapshot)."""
+    root = Path(project_root)
+    rels: set[str] = set()
     for dir_name in dirs:
         scan_path = root / dir_name
         if not scan_path.exists():
@@ -129,33 +269,26 @@ def hash_file_scope(
                 if not (d.startswith(".") or d in excluded or ".egg-info" in d)
             ]
             for fname in files:
-                file_path = Path(root_dir) / fname
-                if file_path.suffix not in extensions:
+                if os.path.splitext(fname)[1] not in extensions:
                     continue
                 rel = rel_root / fname
                 if is_path_excluded(rel, excluded) or ".egg-info" in rel.as_posix():
                     continue
-                paths.append((str(rel), file_path))
-
-    paths.sort(key=lambda e: e[0])
-    for rel_path, file_path in paths:
-        try:
-            content = file_path.read_bytes()
-        except OSError:
-            continue
-        hasher.update(f"file:{rel_path}\n".encode())
-        hasher.update(content)
+                rels.add(rel.as_posix())
+    return sorted(rels)
 
-    return hasher.hexdigest()
 
-
-def compute_fingerprint(project_root: str) -> str:
-    """Compute a project-wide fingerprint from source file mtimes and config.
+def compute_fingerprint(project_root: str, fresh_walk: bool = False) -> str:
+    """Compute a project-wide fingerprint from source file content and config.
 
     The fingerprint changes whenever:
     - Any source file is created, modified, or deleted
     - .sb_config.json changes
 
+    During a run the file list comes from the shared project snapshot;
+    pass ``fresh_walk=True`` to re-list the tree (needed to notice files a
+    gate created or deleted mid-run).
+
     Returns a hex digest string.
     """
     hasher = hashlib.sha256()
@@ -173,12 +306,29 @@ def compute_fingerprint(project_root: str) -> str:
     else:
         hasher.update(b"config:missing")
 
-    # 2. Collect paths, sort, then stream reads into the hasher.
+    # 2. Fold in each file's content hash, in path order.
     # Content hashing rather than mtime: IDE auto-saves, git checkouts,
     # and stash operations that touch mtimes without changing file content
     # won't invalidate the cache — only genuine content changes do.
-    # Streaming avoids holding all file contents in memory at once.
-    paths: list[tuple[str, Path]] = []
+    # The file index keeps that guarantee while skipping the reads of
+    # files whose (size, mtime_ns, inode) hasn't moved, and clean tracked
+    # files take git's blob IDs (one ``git ls-files``), so a clean checkout
+    # is fingerprinted without reading it.  Hashes are never memoized
+    # here; the snapshot's git answer lasts until an auto-fix invalidates it.
+    snapshot = None if fresh_walk else active_snapshot(project_root)
+    if snapshot is not None:
+        rels = snapshot.files(extensions=_SOURCE_EXTENSIONS, hidden=True)
+        known = snapshot.blob_ids()
+    else:
+        rels = _walk_fingerprint_scope(root)
+        known = git_blob_ids(project_root)
+    _fold(hasher, content_hashes(project_root, rels, known))
+    return hasher.hexdigest()
+
+
+def _walk_fingerprint_scope(root: Path) -> list[str]:
+    """Sorted source files for :func:`compute_fingerprint` (no snapshot)."""
+    rels: list[str] = []
     for root_dir, dirs_list, files in os.walk(root):
         rel_root = Path(root_dir).relative_to(root)
         dirs_list[:] = [
@@ -191,31 +341,23 @@ def compute_fingerprint(project_root: str) -> str:
             )
         ]
         for fname in files:
-            file_path = Path(root_dir) / fname
-            if file_path.suffix not in _SOURCE_EXTENSIONS:
+            if os.path.splitext(fname)[1] not in _SOURCE_EXTENSIONS:
                 continue
             rel = rel_root / fname
             if any(p in _EXCLUDED_DIRS or ".egg-info" in p for p in rel.parts):
                 continue
-            paths.append((str(rel), file_path))
+            rels.append(rel.as_posix())
+    rels.sort()
+    return rels
 
-    # Sort for deterministic ordering
-    paths.sort(key=lambda e: e[0])
 
-    # Stream reads: one file at a time instead of all at once
-    for rel_path, file_path in paths:
-        try:
-            content = file_path.read_bytes()
-        except OSError:
-            continue
-        hasher.update(f"file:{rel_path}\n".encode())
-        hasher.update(content)
-
-    return hasher.hexdigest()
+def _fold(hasher: "hashlib._Hash", pairs: list[tuple[str, str]]) -> None:
+    for rel, digest in pairs:
+        hasher.update(f"file:{rel}\n{digest}\n".encode())
 
 
 def load_cache(project_root: str) -> Dict[str, Any]:
-    """Load the cache file, returning an empty dict on any error."""
+    """Load a legacy ``cache.json``, returning an empty dict on any error."""
     path = _cache_path(project_root)
     if not path.exists():
         return {}
@@ -229,79 +371,253 @@ def load_cache(project_root: str) -> Dict[str, Any]:
         return {}
 
 
-def save_cache(project_root: str, cache: Dict[str, Any]) -> None:
-    """Write the cache dict to disk."""
-    path = _cache_path(project_root)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    try:
-        with open(path, "w") as f:
-            json.dump(cache, f, indent=2)
-    except OSError as e:
-        logger.debug(f"Failed to write cache: {e}")
-
-
-def get_cached_result(
-    cache: Dict[str, Any],
-    check_name: str,
-    fingerprint: str,
-) -> Optional[CheckResult]:
-    """Return cached CheckResult if fingerprint matches, else None."""
-    entry = cache.get(check_name)
-    if not isinstance(entry, dict):
-        return None
-    entry_d = cast(Dict[str, Any], entry)
-    if entry_d.get("fingerprint") != fingerprint:
-        return None
-    result_dict = entry_d.get("result")
-    if not isinstance(result_dict, dict):
-        return None
-    try:
-        result = CheckResult.from_dict(cast(Dict[str, Any], result_dict))
-        result.duration = 0.0
-        result.cached = True
-        result.cache_timestamp = entry_d.get("timestamp")
-        result.cache_commit = entry_d.get("commit")
-        return result
-    except Exception:
+def _gate_entries(cache: Dict[str, Any], check_name: str) -> List[Dict[str, Any]]:
+    """A gate's cached entries, most recently used first.
+
+    Accepts the single-entry form written before the cache kept history
+    (``{"fingerprint": ..., "result": ...}``).
+    """
+    raw = cache.get(check_name)
+    if not isinstance(raw, dict):
+        return []
+    raw_d = cast(Dict[str, Any], raw)
+    if "fingerprint" in raw_d:
+        return [raw_d]
+    entries = raw_d.get("entries")
+    if not isinstance(entries, list):
+        return []
+    return [
+        cast(Dict[str, Any], e)
+        for e in cast(List[object], entries)
+        if isinstance(e, dict)
+    ]
+
+
+def _cacheable(result: CheckResult) -> bool:
+    """ERROR/TIMEOUT results are transient; auto_fixed ones side-effecting."""
+    return (
+        result.status not in (CheckStatus.ERROR, CheckStatus.TIMEOUT)
+        and not result.auto_fixed
+    )
+
+
+def _shared_row(
+    shared: SharedCacheBackend, check_name: str, fingerprint: str
+) -> Optional[StoredResult]:
+    """Fetch and decode a shared entry (``None`` on a miss or bad blob)."""
+    blob = shared.get(shared_key(check_name, fingerprint))
+    entry = decode_blob(blob) if blob is not None else None
+    result = entry.get("result") if entry is not None else None
+    if entry is None or not isinstance(result, dict):
         return None
+    timestamp, commit = entry.get("timestamp"), entry.get("commit")
+    return StoredResult(
+        cast(Dict[str, Any], result),
+        timestamp if isinstance(timestamp, str) else None,
+        commit if isinstance(commit, str) else None,
+    )
+
+
+@dataclass
+class CacheStats:
+    """Result-cache counters for one run."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    shared_hits: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        counts = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+        if self.shared_hits:
+            counts["shared_hits"] = self.shared_hits
+        return counts
+
+
+class ResultCache:
+    """A run's handle on the result store: lookups, stores, LRU eviction.
+
+    Entries live in ``.slopmop/cache.db`` (see
+    :mod:`slopmop.core.cache_store`); a lookup is one indexed read and a
+    store one atomic upsert.  Each gate keeps its last
+    *entries_per_gate* fingerprints, so switching branches and back
+    still hits; :meth:`close` holds the whole store to *max_bytes* by
+    evicting the least recently used entries.  A ``cache.json`` left by
+    an older slop-mop is imported on first use, then removed.
+
+    Args:
+        project_root: Project whose store to use; ``None`` for a private
+            in-memory store.
+        shared: Optional shared backend (see
+            :mod:`slopmop.core.shared_cache`) consulted on local misses
+            and published to on stores.
+    """
 
+    def __init__(
+        self,
+        project_root: Optional[str] = None,
+        entries_per_gate: int = DEFAULT_ENTRIES_PER_GATE,
+        max_bytes: int = DEFAULT_MAX_CACHE_BYTES,
+        shared: Optional[SharedCacheBackend] = None,
+    ):
+        self.project_root = project_root
+        self.shared = shared
+        self.entries_per_gate = entries_per_gate
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._store = CacheStore(
+            None
+            if project_root is None
+            else Path(project_root) / CACHE_DIR / STORE_FILE
+        )
+        self._used: Set[Tuple[str, str]] = set()
+        self._dirty = False
+        self._migrated = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls, project_root: str, shared: Optional[SharedCacheBackend] = None
+    ) -> "ResultCache":
+        return cls(project_root, shared=shared)
+
+    def _migrate(self) -> None:
+        with self._lock:
+            if self._migrated or self.project_root is None:
+                return
+            self._migrated = True
+        legacy_path = _cache_path(self.project_root)
+        if not legacy_path.exists():
+            return
+        legacy = load_cache(self.project_root)
+        for check_name in legacy:
+            for entry in reversed(_gate_entries(legacy, check_name)):
+                result = entry.get("result")
+                if not isinstance(result, dict):
+                    continue
+                last_used = entry.get("last_used")
+                self._store.put(
+                    check_name,
+                    str(entry.get("fingerprint")),
+                    cast(Dict[str, Any], result),
+                    entry.get("timestamp"),
+                    entry.get("commit"),
+                    float(last_used) if isinstance(last_used, (int, float)) else 0.0,
+                    self.entries_per_gate,
+                )
+        try:
+            legacy_path.unlink()
+        except OSError as e:
+            logger.debug(f"Failed to remove migrated {legacy_path}: {e}")
+
+    def lookup(self, check_name: str, fingerprint: str) -> Optional[CheckResult]:
+        """Cached result for *check_name* at *fingerprint*, counting hit/miss.
+
+        A local miss falls back to the shared backend; a shared hit is
+        copied into the local store.
+        """
+        self._migrate()
+        row = self._store.get(check_name, fingerprint)
+        from_shared = False
+        if row is None and self.shared is not None:
+            row = _shared_row(self.shared, check_name, fingerprint)
+            if row is not None:
+                from_shared = True
+                self._store.put(
+                    check_name,
+                    fingerprint,
+                    row.result,
+                    row.timestamp,
+                    row.commit,
+                    time.time(),
+                    self.entries_per_gate,
+                )
+        result = None
+        if row is not None:
+            try:
+                result = CheckResult.from_dict(row.result)
+                result.duration = 0.0
+                result.cached = True
+                result.cache_timestamp = row.timestamp
+                result.cache_commit = row.commit
+            except Exception:
+                result = None
+        with self._lock:
+            if result is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+                self.stats.shared_hits += from_shared
+                self._used.add((check_name, fingerprint))
+                self._dirty = self._dirty or from_shared
+        return result
 
-def _get_head_short(project_root: Optional[str] = None) -> Optional[str]:
-    """Return the short (7-char) HEAD commit hash, or None on failure."""
-    try:
-        out = subprocess.run(
-            ["git", "rev-parse", "--short", "HEAD"],
-            capture_output=True,
-            text=True,
-            cwd=project_root,
-            timeout=5,
+    def store(
+        self,
+        check_name: str,
+        fingerprint: str,
+        result: CheckResult,
+        project_root: Optional[str] = None,
+        manifest: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """Remember *result* (and publish it to the shared backend).
+
+        *manifest* describes the inputs behind *fingerprint* (see
+        ``BaseCheck.cache_fingerprint``); the gate's latest is kept for
+        :mod:`slopmop.core.cache_explain`.  ERROR/TIMEOUT results
+        (transient) and auto_fixed ones (side-effecting) are never cached.
+        """
+        if not _cacheable(result):
+            return False
+        self._migrate()
+        result_dict = result.to_dict()
+        timestamp = datetime.now(timezone.utc).isoformat()
+        commit = git_context(project_root or ".").head_short
+        evicted = self._store.put(
+            check_name,
+            fingerprint,
+            result_dict,
+            timestamp,
+            commit,
+            time.time(),
+            self.entries_per_gate,
         )
-        if out.returncode == 0:
-            return out.stdout.strip()
-    except Exception:
-        pass
-    return None
-
-
-def store_result(
-    cache: Dict[str, Any],
-    check_name: str,
-    fingerprint: str,
-    result: CheckResult,
-    project_root: Optional[str] = None,
-) -> bool:
-    """Store a check result in the cache dict (call save_cache to persist).
-
-    Skips ERROR results (transient) and auto_fixed results (side-effecting).
-    """
-    if result.status == CheckStatus.ERROR:
-        return False
-    if result.auto_fixed:
-        return False
-    cache[check_name] = {
-        "fingerprint": fingerprint,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "commit": _get_head_short(project_root),
-        "result": result.to_dict(),
-    }
-    return True
+        if manifest is not None:
+            self._store.put_manifest(check_name, fingerprint, manifest)
+        if self.shared is not None and not self.shared.read_only:
+            self.shared.put(
+                shared_key(check_name, fingerprint),
+                encode_blob(
+                    {"result": result_dict, "timestamp": timestamp, "commit": commit}
+                ),
+            )
+        with self._lock:
+            self.stats.evictions += evicted
+            self._dirty = True
+        return True
+
+    def contains(self, check_name: str, fingerprint: str) -> bool:
+        """Whether the local store holds *fingerprint* (no stats, no LRU)."""
+        self._migrate()
+        return self._store.get(check_name, fingerprint) is not None
+
+    def last_manifest(self, check_name: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """``(fingerprint, manifest)`` of *check_name*'s latest store."""
+        self._migrate()
+        return self._store.get_manifest(check_name)
+
+    def close(self) -> None:
+        """Record this run's hits as recent, enforce the size cap, close."""
+        with self._lock:
+            used, self._used = self._used, set()
+            dirty, self._dirty = self._dirty, False
+        self._store.touch(used, time.time())
+        if dirty:
+            evicted = self._store.enforce_size_cap(self.max_bytes)
+            with self._lock:
+                self.stats.evictions += evicted
+        self._store.close()
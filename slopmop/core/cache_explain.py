@@ -0,0 +1,137 @@
+"""Why did a gate miss the result cache?
+
+A gate's cache key folds together its input files, its config and the
+tools it runs (see ``BaseCheck.cache_fingerprint``).  Each store records
+what went into the key as a manifest; :func:`explain` diffs the gate's
+last recorded manifest against the current one and names what changed,
+which is what ``sm cache explain GATE`` prints.
+"""
+
+import hashlib
+import json
+from typing import Any, Dict, List, Optional, cast
+
+from slopmop.core.cache import InputScope, ResultCache, scope_file_hashes
+
+# Changed paths listed per kind before "... and N more".
+MAX_LISTED_FILES = 10
+# Per-file hashes are kept short: they only need to tell versions apart.
+MANIFEST_HASH_CHARS = 16
+
+
+def input_manifest(
+    project_root: str,
+    inputs: str,
+    scope: Optional[InputScope],
+    config: Dict[str, Any],
+    tools: List[object],
+) -> Dict[str, Any]:
+    """What a gate's cache key was made of.
+
+    Args:
+        project_root: Project whose files *scope* selects.
+        inputs: The input fingerprint (scoped or project-wide).
+        scope: The gate's declared input scope, if any; its files are
+            listed so a later miss can name the ones that changed.
+        config: The config folded into the key.
+        tools: ``describe_tools`` output for the gate.
+    """
+    config_blob = json.dumps(config, sort_keys=True, default=str)
+    files: Optional[Dict[str, str]] = None
+    if scope is not None:
+        files = {
+            rel: digest[:MANIFEST_HASH_CHARS]
+            for rel, digest in scope_file_hashes(project_root, scope)
+        }
+    return {
+        "inputs": inputs,
+        "config": hashlib.sha256(config_blob.encode()).hexdigest(),
+        "tools": tools,
+        "files": files,
+    }
+
+
+def explain(
+    cache: ResultCache,
+    gate: str,
+    fingerprint: str,
+    manifest: Optional[Dict[str, Any]],
+) -> List[str]:
+    """Lines explaining whether *gate* would hit at *fingerprint*, and why not.
+
+    Args:
+        cache: The project's result cache.
+        gate: Full gate name.
+        fingerprint: The gate's current cache key.
+        manifest: The gate's current :func:`input_manifest`.
+    """
+    if cache.contains(gate, fingerprint):
+        return [f"{gate}: cache hit — a result for the current inputs is stored."]
+    last = cache.last_manifest(gate)
+    if last is None:
+        return [f"{gate}: cache miss — no result has been stored for this gate."]
+    last_fingerprint, previous = last
+    if last_fingerprint == fingerprint:
+        return [
+            f"{gate}: cache miss — inputs match the last stored result, "
+            "but it has since been evicted."
+        ]
+    reasons = _differences(previous, manifest or {})
+    if not reasons:
+        reasons = ["  the cache key changed (slop-mop version or key format)"]
+    return [f"{gate}: cache miss — since the last stored result:", *reasons]
+
+
+def _differences(previous: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    reasons: List[str] = []
+    if previous.get("config") != current.get("config"):
+        reasons.append("  the gate's config changed")
+    reasons.extend(_tool_changes(previous.get("tools"), current.get("tools")))
+    old_files, new_files = previous.get("files"), current.get("files")
+    if previous.get("inputs") == current.get("inputs"):
+        return reasons
+    if isinstance(old_files, dict) and isinstance(new_files, dict):
+        reasons.extend(
+            _file_changes(
+                cast(Dict[str, str], old_files), cast(Dict[str, str], new_files)
+            )
+        )
+    elif new_files is None and old_files is None:
+        reasons.append(
+            "  a project file changed (the gate declares no input scope, "
+            "so any change invalidates it)"
+        )
+    else:
+        reasons.append("  the gate's input scope changed")
+    return reasons
+
+
+def _tool_key(part: object) -> str:
+    if isinstance(part, list) and part:
+        return str(cast(List[object], part)[0])
+    return "python"
+
+
+def _tool_changes(previous: object, current: object) -> List[str]:
+    old = {_tool_key(p): p for p in cast(List[object], previous or [])}
+    new = {_tool_key(p): p for p in cast(List[object], current or [])}
+    return [
+        f"  tool changed: {name}"
+        for name in sorted(old.keys() | new.keys())
+        if old.get(name) != new.get(name)
+    ]
+
+
+def _file_changes(old: Dict[str, str], new: Dict[str, str]) -> List[str]:
+    reasons: List[str] = []
+    kinds = (
+        ("added", sorted(new.keys() - old.keys())),
+        ("removed", sorted(old.keys() - new.keys())),
+        ("modified", sorted(p for p in old.keys() & new.keys() if old[p] != new[p])),
+    )
+    for kind, paths in kinds:
+        for path in paths[:MAX_LISTED_FILES]:
+            reasons.append(f"  {kind}: {path}")
+        if len(paths) > MAX_LISTED_FILES:
+            reasons.append(f"  ... and {len(paths) - MAX_LISTED_FILES} more {kind}")
+    return reasons
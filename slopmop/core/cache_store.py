@@ -0,0 +1,307 @@
+"""SQLite storage for the result cache.
+
+``cache.json`` was read whole at the start of every run and rewritten
+whole at the end — megabytes of indented JSON to serve a handful of
+lookups, and two worktrees saving at once could clobber each other.
+:class:`CacheStore` keeps the same entries in ``.slopmop/cache.db``:
+
+* one row per ``(gate, fingerprint)``, so a lookup is one indexed read;
+* results stored as zlib-compressed JSON blobs;
+* each gate's latest input manifest (what its last stored key was made
+  of), so ``sm cache explain`` can say why a lookup missed;
+* every write an atomic upsert in its own transaction (WAL journal, so
+  concurrent runs serialize on SQLite's lock instead of overwriting
+  each other).
+
+Storage errors are logged and treated as misses — a broken cache must
+never fail a run.
+"""
+
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    cast,
+)
+
+logger = logging.getLogger(__name__)
+
+STORE_FILE = "cache.db"
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    gate TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    timestamp TEXT,
+    commit_sha TEXT,
+    last_used REAL NOT NULL,
+    size INTEGER NOT NULL,
+    result BLOB NOT NULL,
+    PRIMARY KEY (gate, fingerprint)
+);
+CREATE INDEX IF NOT EXISTS results_by_last_used ON results (last_used);
+CREATE TABLE IF NOT EXISTS manifests (
+    gate TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    manifest BLOB NOT NULL
+);
+"""
+
+
+class StoredResult(NamedTuple):
+    """A cached result row, with its result decoded."""
+
+    result: Dict[str, Any]
+    timestamp: Optional[str]
+    commit: Optional[str]
+
+
+def encode_blob(result: Dict[str, Any]) -> bytes:
+    """zlib-compressed compact JSON of *result*."""
+    return zlib.compress(json.dumps(result, separators=(",", ":")).encode())
+
+
+def decode_blob(blob: bytes) -> Optional[Dict[str, Any]]:
+    """Inverse of :func:`encode_blob` (``None`` if *blob* is damaged)."""
+    try:
+        data = json.loads(zlib.decompress(blob))
+    except (zlib.error, ValueError):
+        return None
+    return cast(Dict[str, Any], data) if isinstance(data, dict) else None
+
+
+class CacheStore:
+    """Result rows in an SQLite database.
+
+    The connection opens on first use; thread-safe.
+
+    Args:
+        path: Database file, or ``None`` for a private in-memory store.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            try:
+                self._conn = self._open()
+            except sqlite3.DatabaseError:
+                if self.path is None or not self.path.exists():
+                    raise
+                # Not a database (or damaged): it's only a cache.
+                logger.debug(f"Discarding unreadable cache store {self.path}")
+                self.path.unlink()
+                self._conn = self._open()
+        return self._conn
+
+    def _open(self) -> sqlite3.Connection:
+        target = ":memory:"
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            target = str(self.path)
+        conn = sqlite3.connect(
+            target, timeout=10, isolation_level=None, check_same_thread=False
+        )
+        try:
+            if self.path is not None:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != SCHEMA_VERSION:
+                conn.execute("DROP TABLE IF EXISTS results")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        except sqlite3.Error:
+            conn.close()
+            raise
+        return conn
+
+    def get(self, gate: str, fingerprint: str) -> Optional[StoredResult]:
+        """The row for ``(gate, fingerprint)``, or ``None``."""
+        with self._lock:
+            try:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT result, timestamp, commit_sha FROM results "
+                        "WHERE gate = ? AND fingerprint = ?",
+                        (gate, fingerprint),
+                    )
+                    .fetchone()
+                )
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Cache lookup failed: {e}")
+                return None
+        if row is None:
+            return None
+        result = decode_blob(row[0])
+        return None if result is None else StoredResult(result, row[1], row[2])
+
+    def put(
+        self,
+        gate: str,
+        fingerprint: str,
+        result: Dict[str, Any],
+        timestamp: Optional[str],
+        commit: Optional[str],
+        last_used: float,
+        max_entries: int,
+    ) -> int:
+        """Upsert a row, then trim *gate* to its *max_entries* most recent.
+
+        Returns:
+            The number of rows evicted by the trim.
+        """
+        blob = encode_blob(result)
+        with self._lock:
+            try:
+                conn = self._connect()
+                with _transaction(conn):
+                    conn.execute(
+                        "INSERT INTO results (gate, fingerprint, timestamp, "
+                        "commit_sha, last_used, size, result) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                        "ON CONFLICT (gate, fingerprint) DO UPDATE SET "
+                        "timestamp = excluded.timestamp, "
+                        "commit_sha = excluded.commit_sha, "
+                        "last_used = excluded.last_used, "
+                        "size = excluded.size, result = excluded.result",
+                        (
+                            gate,
+                            fingerprint,
+                            timestamp,
+                            commit,
+                            last_used,
+                            len(blob),
+                            blob,
+                        ),
+                    )
+                    return conn.execute(
+                        "DELETE FROM results WHERE gate = ? AND fingerprint NOT IN "
+                        "(SELECT fingerprint FROM results WHERE gate = ? "
+                        "ORDER BY last_used DESC LIMIT ?)",
+                        (gate, gate, max(1, max_entries)),
+                    ).rowcount
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Cache store failed: {e}")
+                return 0
+
+    def put_manifest(
+        self, gate: str, fingerprint: str, manifest: Dict[str, Any]
+    ) -> None:
+        """Record the inputs behind *gate*'s most recently stored key."""
+        blob = encode_blob(manifest)
+        with self._lock:
+            try:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO manifests (gate, fingerprint, manifest) "
+                    "VALUES (?, ?, ?)",
+                    (gate, fingerprint, blob),
+                )
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Cache manifest store failed: {e}")
+
+    def get_manifest(self, gate: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """``(fingerprint, manifest)`` last recorded for *gate*, or ``None``."""
+        with self._lock:
+            try:
+                row = (
+                    self._connect()
+                    .execute(
+                        "SELECT fingerprint, manifest FROM manifests WHERE gate = ?",
+                        (gate,),
+                    )
+                    .fetchone()
+                )
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Cache manifest lookup failed: {e}")
+                return None
+        if row is None:
+            return None
+        manifest = decode_blob(row[1])
+        return None if manifest is None else (str(row[0]), manifest)
+
+    def touch(self, keys: Iterable[Tuple[str, str]], last_used: float) -> None:
+        """Mark rows as used at *last_used* (recency for LRU eviction)."""
+        params = [(last_used, gate, fp) for gate, fp in keys]
+        if not params:
+            return
+        with self._lock:
+            try:
+                conn = self._connect()
+                with _transaction(conn):
+                    conn.executemany(
+                        "UPDATE results SET last_used = ? "
+                        "WHERE gate = ? AND fingerprint = ?",
+                        params,
+                    )
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Cache touch failed: {e}")
+
+    def enforce_size_cap(self, max_bytes: int) -> int:
+        """Evict least recently used rows until blobs total *max_bytes*.
+
+        Returns:
+            The number of rows evicted.
+        """
+        with self._lock:
+            try:
+                conn = self._connect()
+                with _transaction(conn):
+                    total = conn.execute(
+                        "SELECT COALESCE(SUM(size), 0) FROM results"
+                    ).fetchone()[0]
+                    if total <= max_bytes:
+                        return 0
+                    doomed: List[Tuple[str, str]] = []
+                    for gate, fp, size in conn.execute(
+                        "SELECT gate, fingerprint, size FROM results "
+                        "ORDER BY last_used"
+                    ):
+                        if total <= max_bytes:
+                            break
+                        doomed.append((gate, fp))
+                        total -= size
+                    conn.executemany(
+                        "DELETE FROM results WHERE gate = ? AND fingerprint = ?",
+                        doomed,
+                    )
+                    return len(doomed)
+            except (sqlite3.Error, OSError) as e:
+                logger.debug(f"Cache eviction failed: {e}")
+                return 0
+
+    def close(self) -> None:
+        """Close the connection (the next call reopens it)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+@contextlib.contextmanager
+def _transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """``BEGIN IMMEDIATE`` … ``COMMIT`` (``ROLLBACK`` on error)."""
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
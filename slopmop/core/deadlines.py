@@ -0,0 +1,156 @@
+"""Adaptive per-gate deadlines derived from timing history.
+
+Subprocess timeouts are fixed tiers (``slopmop.checks.timeouts``) sized
+for the slowest repo a gate might meet, so a wedged tool on a repo where
+it normally takes ten seconds still burns the full tier — often ten
+minutes — before anything notices.  Timing history already says what
+"normal" is for *this* repo, so each gate gets a wall-clock deadline
+from its own :class:`TimingStats`::
+
+    deadline = clamp(max(median × 4, Q3 + 4 × IQR, historical_max × 1.5),
+                     floor, ceiling)
+
+A gate whose check body is still running at its deadline has its
+process tree terminated and is reported as ``TIMEOUT``.  Gates with too
+little history get no deadline and keep their fixed subprocess timeouts.
+
+Deadlines are opt-in (``--adaptive-timeouts``): a cold or loaded machine
+can legitimately run far slower than its own history, and that must not
+become a blocking failure nobody asked for.
+"""
+
+import logging
+import threading
+from typing import Callable, Dict, Hashable, Optional, Set
+
+from slopmop.checks.timeouts import EXHAUSTIVE_TASK_TIMEOUT, QUICK_COMMAND_TIMEOUT
+from slopmop.core.result import CheckResult, CheckStatus
+from slopmop.reporting.timings import TimingStats
+
+logger = logging.getLogger(__name__)
+
+# Never kill a gate sooner than this — startup noise (cold caches, npx
+# downloads) dominates short gates and is not a hang.
+DEFAULT_DEADLINE_FLOOR = float(QUICK_COMMAND_TIMEOUT)
+
+# Never wait longer than the slowest legitimate fixed tier.
+DEFAULT_DEADLINE_CEILING = float(EXHAUSTIVE_TASK_TIMEOUT)
+
+# Below this many recorded runs the quartiles are not worth trusting.
+MIN_DEADLINE_SAMPLES = 5
+
+MEDIAN_MULTIPLE = 4.0
+IQR_FENCE = 4.0  # Well beyond Tukey's "far out" fence (Q3 + 3 × IQR)
+MAX_HEADROOM = 1.5  # Slack over the slowest run history has ever seen
+
+
+def gate_deadline(
+    stats: TimingStats,
+    floor: float = DEFAULT_DEADLINE_FLOOR,
+    ceiling: float = DEFAULT_DEADLINE_CEILING,
+    min_samples: int = MIN_DEADLINE_SAMPLES,
+) -> Optional[float]:
+    """Return the deadline in seconds for a gate with *stats*, or ``None``.
+
+    ``None`` means there is not enough history to set one.
+    """
+    if stats.sample_count < min_samples or stats.median <= 0:
+        return None
+    deadline = max(
+        stats.median * MEDIAN_MULTIPLE,
+        stats.q3 + IQR_FENCE * stats.iqr,
+        stats.historical_max * MAX_HEADROOM,
+    )
+    return min(max(deadline, floor), max(floor, ceiling))
+
+
+def gate_deadlines(
+    timings: Dict[str, TimingStats],
+    floor: float = DEFAULT_DEADLINE_FLOOR,
+    ceiling: float = DEFAULT_DEADLINE_CEILING,
+    min_samples: int = MIN_DEADLINE_SAMPLES,
+) -> Dict[str, float]:
+    """Map gate name → deadline for every gate with enough history."""
+    deadlines: Dict[str, float] = {}
+    for name, stats in timings.items():
+        deadline = gate_deadline(stats, floor, ceiling, min_samples)
+        if deadline is not None:
+            deadlines[name] = deadline
+    return deadlines
+
+
+def timed_out_result(result: CheckResult, deadline: float) -> CheckResult:
+    """Turn what a gate returned after its deadline kill into a TIMEOUT."""
+    return CheckResult(
+        name=result.name,
+        status=CheckStatus.TIMEOUT,
+        duration=result.duration,
+        output=result.output,
+        error=(
+            f"Still running after {deadline:.0f}s, far beyond its usual "
+            "duration; its processes were terminated"
+        ),
+        fix_suggestion=(
+            "Rerun the gate on its own to see whether the tool hangs; if it "
+            "has legitimately become slower, rerun without --adaptive-timeouts"
+        ),
+        category=result.category,
+        status_detail=f"{deadline:.0f}s deadline",
+        role=result.role,
+    )
+
+
+class DeadlineWatchdog:
+    """Stop gates whose check body outlives its deadline.
+
+    Each armed gate gets a timer; when it fires, *terminate* is called
+    with the gate's process owner (its ``GATE_OWNER`` name, which also
+    covers tools started from the gate's own pools via ``submit_in_gate``)
+    and returns the owners whose processes it actually stopped.  A gate that starts no processes cannot be
+    stopped this way and simply runs on.
+
+    Args:
+        terminate: Kills the process trees of the given owners (e.g. a
+            bound ``SubprocessRunner.terminate_owned_by``).
+    """
+
+    def __init__(self, terminate: Callable[[Set[Hashable]], Set[Hashable]]):
+        self._terminate = terminate
+        self._lock = threading.Lock()
+        self._timers: Dict[str, threading.Timer] = {}
+        self._expired: Set[str] = set()
+
+    def arm(self, name: str, owner: Hashable, seconds: float) -> None:
+        """Start *name*'s deadline clock."""
+        timer = threading.Timer(seconds, self._expire, args=(name, owner, seconds))
+        timer.daemon = True
+        with self._lock:
+            self._expired.discard(name)
+            self._timers[name] = timer
+        timer.start()
+
+    def disarm(self, name: str) -> bool:
+        """Stop *name*'s clock; return True if its deadline stopped it.
+
+        If the deadline is firing right now this waits for the kill to
+        finish, so the answer is final.  Must not be called from a thread
+        the kill itself depends on (such as the asyncio backend's loop).
+        """
+        with self._lock:
+            timer = self._timers.pop(name, None)
+        if timer is not None:
+            timer.cancel()
+            timer.join()
+        with self._lock:
+            return name in self._expired
+
+    def _expire(self, name: str, owner: Hashable, seconds: float) -> None:
+        try:
+            killed = self._terminate({owner})
+        except Exception as e:  # noqa: BLE001 — a failed kill must not crash the timer
+            logger.warning(f"Could not stop {name} at its deadline: {e}")
+            return
+        if owner in killed:
+            logger.debug(f"{name} exceeded its {seconds:.0f}s deadline; terminated")
+            with self._lock:
+                self._expired.add(name)
@@ -0,0 +1,210 @@
+"""Streaming view of a run: typed events instead of four callbacks.
+
+:meth:`CheckExecutor.iter_results` returns a :class:`ResultStream`, which
+runs the checks on a background thread and yields a :class:`CheckEvent`
+for everything that happens, as it happens::
+
+    stream = executor.iter_results(root, gates)
+    for event in stream:
+        print(event.kind, event.name)
+    summary = stream.summary
+
+The stream is also an async iterator (``async for event in stream``) for
+callers that live on an event loop.  Gates report findings only when
+they finish, so a gate's ``FINDING`` events arrive immediately before its
+``COMPLETED`` event.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Optional,
+    Union,
+)
+
+from slopmop.core.result import (
+    CheckResult,
+    CheckStatus,
+    ExecutionSummary,
+    Finding,
+    SkipReason,
+)
+
+if TYPE_CHECKING:
+    from slopmop.core.executor import CheckExecutor
+
+
+class EventKind(Enum):
+    """What a :class:`CheckEvent` reports."""
+
+    STARTED = "started"  # A gate began executing
+    FINDING = "finding"  # One structured finding from a finished gate
+    COMPLETED = "completed"  # A gate produced a result (passed/failed/...)
+    SKIPPED = "skipped"  # A gate did not run (disabled, n/a, fail-fast, ...)
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass(frozen=True)
+class CheckEvent:
+    """One thing that happened to one gate during a run.
+
+    Attributes:
+        kind: What happened
+        name: Full gate name (``category:name``)
+        timestamp: ``time.time()`` when the executor reported it
+        category: Category key, for ``STARTED`` events
+        result: The gate's result, for ``COMPLETED`` and (when one
+            exists) ``SKIPPED`` events
+        finding: The finding, for ``FINDING`` events
+        reason: Short skip-reason code (see :class:`SkipReason`)
+    """
+
+    kind: EventKind
+    name: str
+    timestamp: float
+    category: Optional[str] = None
+    result: Optional[CheckResult] = None
+    finding: Optional[Finding] = None
+    reason: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, object]:
+        """Serialize for JSON-lines output (``None`` fields omitted)."""
+        d: Dict[str, object] = {
+            "event": self.kind.value,
+            "name": self.name,
+            "time": round(self.timestamp, 3),
+        }
+        if self.category:
+            d["category"] = self.category
+        if self.reason:
+            d["reason"] = self.reason
+        if self.finding is not None:
+            d["finding"] = self.finding.to_dict()
+        elif self.result is not None:
+            d["result"] = self.result.to_dict()
+        return d
+
+
+_DONE = object()
+_SKIPPED_STATUSES = (CheckStatus.SKIPPED, CheckStatus.NOT_APPLICABLE)
+
+
+# Executor callbacks the stream borrows while its run is in flight.
+_STREAM_CALLBACKS = (
+    "_on_check_start",
+    "_on_check_complete",
+    "_on_check_disabled",
+    "_on_check_na",
+)
+
+
+class ResultStream:
+    """Iterate the events of one background run.
+
+    The stream installs its own progress/start/disabled/N/A callbacks on
+    the executor for the duration of the run, then restores the ones set
+    with ``set_*_callback``.  Iterate it
+    once; afterwards :attr:`summary` holds the run's summary.  Exceptions
+    raised by the run are re-raised from the iterator.
+
+    Args:
+        executor: Executor whose callbacks feed the stream.
+        run: Performs the run (e.g. a bound ``run_checks`` call).
+    """
+
+    def __init__(self, executor: "CheckExecutor", run: Callable[[], ExecutionSummary]):
+        self._executor = executor
+        self._run = run
+        self._events: "queue.Queue[Union[CheckEvent, BaseException, object]]" = (
+            queue.Queue()
+        )
+        self._thread: Optional[threading.Thread] = None
+        self._saved_callbacks: Dict[str, Any] = {}
+        self.summary: Optional[ExecutionSummary] = None
+
+    def _emit(self, event: CheckEvent) -> None:
+        self._events.put(event)
+
+    def _on_start(self, name: str, category: Optional[str]) -> None:
+        self._emit(CheckEvent(EventKind.STARTED, name, time.time(), category))
+
+    def _on_complete(self, result: CheckResult) -> None:
+        now = time.time()
+        if result.status in _SKIPPED_STATUSES:
+            reason = result.skip_reason.value if result.skip_reason else None
+            self._emit(
+                CheckEvent(
+                    EventKind.SKIPPED, result.name, now, result=result, reason=reason
+                )
+            )
+            return
+        for finding in result.findings:
+            self._emit(CheckEvent(EventKind.FINDING, result.name, now, finding=finding))
+        self._emit(CheckEvent(EventKind.COMPLETED, result.name, now, result=result))
+
+    def _on_excluded(self, reason: SkipReason) -> Callable[[str], None]:
+        def emit(name: str) -> None:
+            self._emit(
+                CheckEvent(EventKind.SKIPPED, name, time.time(), reason=reason.value)
+            )
+
+        return emit
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            raise RuntimeError("a ResultStream can only be iterated once")
+        self._saved_callbacks = {
+            attr: getattr(self._executor, attr) for attr in _STREAM_CALLBACKS
+        }
+        self._executor.set_start_callback(self._on_start)
+        self._executor.set_progress_callback(self._on_complete)
+        self._executor.set_disabled_callback(self._on_excluded(SkipReason.DISABLED))
+        self._executor.set_na_callback(self._on_excluded(SkipReason.NOT_APPLICABLE))
+        self._thread = threading.Thread(
+            target=self._worker, name="slopmop-result-stream", daemon=True
+        )
+        self._thread.start()
+
+    def _worker(self) -> None:
+        try:
+            self.summary = self._run()
+        except BaseException as e:  # noqa: BLE001 — re-raised in the consumer
+            self._events.put(e)
+        finally:
+            for attr, callback in self._saved_callbacks.items():
+                setattr(self._executor, attr, callback)
+            self._events.put(_DONE)
+
+    def _next(self) -> Optional[CheckEvent]:
+        item = self._events.get()
+        if item is _DONE:
+            return None
+        if isinstance(item, BaseException):
+            raise item
+        assert isinstance(item, CheckEvent)  # for type checker
+        return item
+
+    def __iter__(self) -> Iterator[CheckEvent]:
+        self._start()
+        while (event := self._next()) is not None:
+            yield event
+
+    async def _aiter(self) -> AsyncIterator[CheckEvent]:
+        self._start()
+        while (event := await asyncio.to_thread(self._next)) is not None:
+            yield event
+
+    def __aiter__(self) -> AsyncIterator[CheckEvent]:
+        return self._aiter()
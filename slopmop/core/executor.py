@@ -4,22 +4,31 @@ The executor manages running multiple checks in parallel, respecting
 dependencies, and implementing fail-fast behavior.
 """
 
+import asyncio
 import concurrent.futures
 import logging
+import multiprocessing
+import pickle  # nosec B403 - only our own check objects cross the boundary
 import threading
 import time
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
-
-from slopmop.checks.base import BaseCheck
-from slopmop.core.cache import (
-    compute_fingerprint,
-    get_cached_result,
-    load_cache,
-    save_cache,
-    store_result,
-)
+from dataclasses import replace
+from typing import Any, Callable, Dict, Hashable, List, Optional, Set, Tuple, Union
+
+from slopmop.checks.base import BaseCheck, ExecutionAffinity
+from slopmop.checks.duplicate_files import collapse_result_duplicates
+from slopmop.core.async_backend import BACKENDS, AsyncGateLoop
+from slopmop.core.cache import ResultCache, compute_fingerprint
+from slopmop.core.deadlines import DeadlineWatchdog, timed_out_result
+from slopmop.core.events import ResultStream
 from slopmop.core.gate_config import gate_enablement
+from slopmop.core.git_context import git_context
 from slopmop.core.registry import CheckRegistry, get_registry
+from slopmop.core.resources import (
+    MachineCapacity,
+    ResourceLedger,
+    detect_available_memory_mb,
+    detect_capacity,
+)
 from slopmop.core.result import (
     CheckResult,
     CheckStatus,
@@ -27,49 +36,36 @@ from slopmop.core.result import (
     ScopeInfo,
     SkipReason,
 )
+from slopmop.core.scheduling import (
+    ReadyQueue,
+    critical_path_lengths,
+    order_by_critical_path,
+    pack_budget,
+)
+from slopmop.core.shared_cache import SharedCacheBackend
+from slopmop.core.snapshot import ProjectSnapshot, active_snapshot, use_snapshot
+from slopmop.core.speculation import SpeculationOutcome, SpeculationTracker
+from slopmop.subprocess.runner import GATE_OWNER, get_runner
 
 logger = logging.getLogger(__name__)
 
 _SKIP_FAIL_FAST = "Skipped due to fail-fast"
+_CANCELLED_FAIL_FAST = "Cancelled — terminated after an earlier failure (fail-fast)"
 
+# Seconds an in-flight gate's processes get between SIGTERM and SIGKILL
+# when fail-fast trips.
+DEFAULT_KILL_GRACE_SECONDS = 3.0
 
-def _collapse_duplicate_findings(result: CheckResult, project_root: str) -> CheckResult:
-    """Merge findings repeated across byte-identical copies of a file.
 
-    A repo that distributes templates or vendors a tool contains identical
-    copies of the same source file, so every gate reports the same defect once
-    per copy. Collapsing here keeps the first-run finding count honest without
-    each gate having to know about it. Failures are swallowed deliberately —
-    noise reduction must never break a gate's real result.
-    """
-    if not result.findings:
-        return result
-    try:
-        from slopmop.checks.duplicate_files import collapse_duplicate_file_findings
+def _run_check_in_worker_process(payload: bytes, project_root: str) -> CheckResult:
+    """Process-pool entry point: run one pickled check and ship its result.
 
-        merged, collapsed = collapse_duplicate_file_findings(
-            result.findings, project_root
-        )
-        if not collapsed:
-            return result
-        result.findings = merged
-        note = (
-            f"({collapsed} finding(s) collapsed: the same issue in "
-            f"byte-identical copies of the same file.)"
-        )
-        result.output = f"{result.output}\n\n{note}" if result.output else note
-        # The gate baked its own count into `error` before we collapsed, so a
-        # summary reading "5 findings" would contradict the single line now
-        # shown. Annotate rather than rewrite — each gate phrases its count
-        # differently, and silently changing their number would be worse.
-        if result.error:
-            result.error = (
-                f"{result.error} ({len(merged)} unique; "
-                f"{collapsed} in identical copies)"
-            )
-    except Exception as exc:  # noqa: BLE001 — cosmetic pass, never fatal
-        logger.debug(f"finding collapse skipped for {result.name}: {exc}")
-    return result
+    Takes the check already pickled, so the parent serializes it once
+    rather than once to test picklability and again on submission.
+    Module-level so the spawn start method can import it by reference.
+    """
+    check: BaseCheck = pickle.loads(payload)  # nosec B301 - our own payload
+    return check.run(project_root)
 
 
 def _is_gate_enabled_in_config(
@@ -93,32 +89,68 @@ class CheckExecutor:
     - Dependency resolution
     - Fail-fast mode
     - Progress callbacks
-    - Configurable thread pool
+    - Resource-aware packing against detected cores and memory
+    - Optional process pool for CPU-bound in-process gates
+    - Optional speculative start of dependents
     """
 
-    DEFAULT_MAX_WORKERS = 4
-
     def __init__(
         self,
         registry: Optional[CheckRegistry] = None,
-        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_workers: Optional[int] = None,
         fail_fast: bool = True,
         process_results_in_remediation_order: bool = False,
+        process_workers: int = 0,
+        capacity: Optional[MachineCapacity] = None,
+        speculative: bool = False,
+        kill_grace_period: float = DEFAULT_KILL_GRACE_SECONDS,
+        backend: str = "thread",
     ):
         """Initialize the executor.
 
         Args:
             registry: Check registry to use (default: global registry)
-            max_workers: Maximum parallel workers
+            max_workers: Hard cap on concurrently running gates.  ``None``
+                derives it from the machine (see ``MachineCapacity``).
             fail_fast: Stop on first failure
             process_results_in_remediation_order: Buffer completed check results
                 and process them in remediation order instead of completion
                 order. Dispatch order is unchanged. In practice this matters
                 for remediation-mode runs; maintenance mode leaves results in
                 race-to-completion order.
+            process_workers: Size of the process pool that runs gates
+                declaring ``ExecutionAffinity.IN_PROCESS_CPU``.  ``0`` (the
+                default) keeps every gate on the thread pool.
+            capacity: Cores/memory to pack gate ``resource_profile``s
+                against.  ``None`` probes the current machine and re-reads
+                its available memory at every admission.
+            speculative: Start dependents before their dependencies finish
+                and keep the result only if the dependencies pass without
+                changing the tree (see ``slopmop.core.speculation``).
+            kill_grace_period: When fail-fast trips, in-flight gates'
+                process trees get SIGTERM, then SIGKILL after this many
+                seconds; those gates are reported as cancelled.
+            backend: ``"thread"`` runs each gate on a pool thread;
+                ``"asyncio"`` runs gates as coroutines on one event loop
+                that supervises every tool process they start (see
+                ``slopmop.core.async_backend``).
+
+        Raises:
+            ValueError: If *backend* is not a known backend.
         """
+        if backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown executor backend {backend!r} "
+                f"(expected one of: {', '.join(BACKENDS)})"
+            )
         self._registry = registry or get_registry()
-        self._max_workers = max_workers
+        self._capacity = capacity or detect_capacity()
+        self._sample_memory: Optional[Callable[[], Optional[int]]] = (
+            detect_available_memory_mb if capacity is None else None
+        )
+        self._max_workers = (
+            max_workers if max_workers is not None else self._capacity.thread_slots
+        )
         self._fail_fast = fail_fast
         self._process_results_in_remediation_order = (
             process_results_in_remediation_order
@@ -126,9 +158,8 @@ class CheckExecutor:
         self._lock = threading.Lock()
         self._stop_event = threading.Event()
         self._results: Dict[str, CheckResult] = {}
-        self._cache: Dict[str, Any] = {}
+        self._cache = ResultCache()
         self._fingerprint: Optional[str] = None
-        self._cache_dirty = False
         self._skip_cache_reads = False
         self._on_check_complete: Optional[Callable[[CheckResult], None]] = None
         self._on_check_start: Optional[Callable[[str, Optional[str]], None]] = None
@@ -139,6 +170,35 @@ class CheckExecutor:
             Callable[[List[tuple[str, Optional[str], bool, Optional[str]]]], None]
         ] = None
         self._processing_priority: Dict[str, Tuple[int, int, str]] = {}
+        self._ledger: Optional[ResourceLedger] = None
+        self._critical_path: Dict[str, float] = {}
+        self._speculative = speculative
+        self._speculation: Optional[SpeculationTracker] = None
+        # Cache stores for speculative results, held until the speculation
+        # is accepted: gate name → (fingerprint, result, project root,
+        # manifest).
+        self._held_stores: Dict[
+            str, Tuple[str, CheckResult, str, Optional[Dict[str, Any]]]
+        ] = {}
+        self._kill_grace_period = max(0.0, kill_grace_period)
+        # Gate name → owner of the processes its check body starts (the
+        # worker thread ident, or the gate name on the asyncio backend).
+        self._running_owners: Dict[str, Hashable] = {}
+        self._cancelled: Set[str] = set()
+        # Gates caught mid-run by a kill, and an event that is clear while
+        # the kill is still deciding which of them it actually stopped.
+        self._kill_candidates: Set[str] = set()
+        self._kill_settled = threading.Event()
+        self._kill_settled.set()
+        self._process_workers = max(0, process_workers)
+        self._process_pool: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        # Gate classes whose instances failed to pickle; not retried.
+        self._unpicklable: Set[type] = set()
+        self._process_pool_lock = threading.Lock()
+        self._backend = backend
+        self._gate_loop: Optional[AsyncGateLoop] = None
+        self._deadlines: Dict[str, float] = {}
+        self._watchdog = DeadlineWatchdog(self._terminate_owners)
 
     def set_progress_callback(self, callback: Callable[[CheckResult], None]) -> None:
         """Set callback for check completion events.
@@ -198,6 +258,20 @@ class CheckExecutor:
         """
         self._on_pending_checks = callback
 
+    def iter_results(
+        self, project_root: str, check_names: List[str], **run_kwargs: Any
+    ) -> ResultStream:
+        """Run checks in the background, streaming :class:`CheckEvent`s.
+
+        Takes the same arguments as :meth:`run_checks`; the stream's
+        ``summary`` is that call's return value once iteration ends.
+        The stream replaces the callbacks set via ``set_*_callback``
+        until its run ends.
+        """
+        return ResultStream(
+            self, lambda: self.run_checks(project_root, check_names, **run_kwargs)
+        )
+
     def run_checks(
         self,
         project_root: str,
@@ -207,6 +281,8 @@ class CheckExecutor:
         swabbing_timeout: Optional[int] = None,
         timings: Optional[Dict[str, float]] = None,
         use_cache: bool = True,
+        deadlines: Optional[Dict[str, float]] = None,
+        shared_cache: Optional[SharedCacheBackend] = None,
     ) -> ExecutionSummary:
         """Run specified checks against a project.
 
@@ -224,16 +300,56 @@ class CheckExecutor:
             timings: Historical timing data mapping check full_name to
                 average duration in seconds.  Typically loaded via
                 ``slopmop.reporting.timings.load_timings()``.
+            use_cache: Read results from the cache (fresh results are
+                always written back).
+            deadlines: Wall-clock seconds each gate's check body may run
+                before its processes are terminated and it is reported as
+                ``TIMEOUT`` (see ``slopmop.core.deadlines``).  Gates not
+                listed have no deadline.
+            shared_cache: Backend shared across machines/worktrees that
+                local cache misses fall back to and fresh results are
+                published to (see ``slopmop.core.shared_cache``).
 
         Returns:
             ExecutionSummary with all results
         """
+        # One walk of the tree, shared by every gate's scope and cache
+        # queries for the whole run (see slopmop.core.snapshot).
+        with use_snapshot(ProjectSnapshot(project_root)):
+            return self._run_checks(
+                project_root,
+                check_names,
+                config,
+                auto_fix,
+                swabbing_timeout,
+                timings,
+                use_cache,
+                deadlines,
+                shared_cache,
+            )
+
+    def _run_checks(
+        self,
+        project_root: str,
+        check_names: List[str],
+        config: Optional[Dict[str, Any]],
+        auto_fix: bool,
+        swabbing_timeout: Optional[int],
+        timings: Optional[Dict[str, float]],
+        use_cache: bool,
+        deadlines: Optional[Dict[str, float]],
+        shared_cache: Optional[SharedCacheBackend],
+    ) -> ExecutionSummary:
+        """Body of :meth:`run_checks`; runs with the project snapshot active."""
         start_time = time.time()
         config = config or {}
 
         # Reset state
         self._stop_event.clear()
         self._results.clear()
+        self._cancelled.clear()
+        self._kill_candidates = set()
+        self._deadlines = dict(deadlines or {})
 
         # Load cache and compute fingerprint for this run.
         # When --no-cache: load existing cache (to preserve entries for
@@ -241,18 +357,14 @@ class CheckExecutor:
         # storing fresh results), but skip reading from cache.  This
         # ensures fresh results replace stale entries so subsequent
         # cached runs see truth, not stale FAILED results.
-        if use_cache:
-            self._cache = load_cache(project_root)
-            self._skip_cache_reads = False
-        else:
-            self._cache = load_cache(project_root)
-            self._skip_cache_reads = True
+        self._cache = ResultCache.load(project_root, shared=shared_cache)
+        self._skip_cache_reads = not use_cache
+        if not use_cache:
             logger.debug(
                 "Cache reads disabled via --no-cache; "
                 "fresh results will still be written back"
             )
         self._fingerprint = compute_fingerprint(project_root)
-        self._cache_dirty = False
 
         # Get check instances
         checks = self._registry.get_checks(check_names, config)
@@ -406,12 +518,14 @@ class CheckExecutor:
             swabbing_timeout=swabbing_timeout,
         )
 
-        # Persist cache if any entries were added/updated
-        if self._cache_dirty:
-            save_cache(project_root, self._cache)
+        # Flush cache recency and enforce its size cap
+        self._cache.close()
 
         duration = time.time() - start_time
-        return ExecutionSummary.from_results(list(self._results.values()), duration)
+        summary = ExecutionSummary.from_results(list(self._results.values()), duration)
+        summary.cache_stats = self._cache.stats.to_dict()
+        summary.git = git_context(project_root)
+        return summary
 
     def _expand_dependencies(
         self, checks: List[BaseCheck], config: Dict[str, Any]
@@ -626,8 +740,21 @@ class CheckExecutor:
         Already-running gates finish naturally.  Gates without timing
         history always run regardless of budget (to build a baseline).
 
-        Without a budget, all ready gates are submitted at once, sorted
-        longest-first (existing behaviour preserved).
+        Without a budget, all ready gates are submitted at once, ordered
+        by critical-path length (own duration plus the longest chain of
+        dependents it unlocks), so gates that gate slow work start first.
+
+        In both modes a gate is only submitted once its
+        ``resource_profile`` fits the cores and memory left over by gates
+        already running (see :class:`~slopmop.core.resources.ResourceLedger`).
+        A gate that doesn't fit yet stays queued while smaller ready gates
+        behind it go ahead, so the machine is never overcommitted and no
+        worker sits idle waiting for room.
+
+        In speculative mode (no budget only) dependents whose dependencies
+        are already running start alongside them; their results are held
+        until the dependencies resolve, then kept, skipped or re-run by a
+        :class:`~slopmop.core.speculation.SpeculationTracker`.
 
         Args:
             checks: Checks to execute
@@ -652,33 +779,63 @@ class CheckExecutor:
         # Don't use `with` — we need to control shutdown behavior for fail-fast.
         # The context manager calls shutdown(wait=True) which blocks until all
         # in-flight futures complete, causing a multi-second hang after fail-fast.
-        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers)
+        executor = self._make_gate_pool()
         futures: Dict[concurrent.futures.Future[CheckResult], str] = {}
+        self._ledger = ResourceLedger(self._capacity, sample_memory=self._sample_memory)
+        self._critical_path = (
+            critical_path_lengths(dep_graph, timings) if timings else {}
+        )
+        self._held_stores = {}
+        ready_queue = ReadyQueue(dep_graph, self._critical_path, timings)
+        speculation: Optional[SpeculationTracker] = None
+        if self._speculative and not budget_active:
+            speculation = SpeculationTracker(
+                lambda: compute_fingerprint(project_root, fresh_walk=True)
+            )
+        self._speculation = speculation
+
+        def can_speculate(name: str) -> bool:
+            # A gate that may rewrite files would race its own dependency.
+            check = check_map[name]
+            if getattr(check, "terminal", False):
+                return False
+            return not (auto_fix and check.can_auto_fix())
 
         try:
-            while (pending or futures) and not self._stop_event.is_set():
+            while (
+                pending or futures or (speculation is not None and speculation.has_held)
+            ) and not self._stop_event.is_set():
                 dependency_results = self._dependency_results_for_scheduler(
                     available_results
                 )
-                satisfied_dependencies = set(dependency_results)
-                # Find checks whose dependencies are all completed
+                if speculation is not None and speculation.has_held:
+                    outcome = speculation.resolve(dependency_results)
+                    self._settle_speculation(
+                        outcome,
+                        pending,
+                        completed,
+                        available_results,
+                        buffered_results,
+                    )
+                    ready_queue.requeue(outcome.rerun)
+                    self._drain_completed_buffer(
+                        buffered_results, pending, futures, dep_graph
+                    )
+                    dependency_results = self._dependency_results_for_scheduler(
+                        available_results
+                    )
+                # Gates whose dependencies all have results, best first
+                ready_queue.observe(dependency_results)
                 ready: List[str] = []
                 skipped_due_to_deps: List[str] = []
-                for name in list(pending):  # Iterate over a copy
-                    deps = dep_graph.get(name, set())
-                    if deps <= satisfied_dependencies:
-                        # Check if dependencies all passed
-                        deps_passed = all(
-                            dependency_results.get(
-                                d, CheckResult(d, CheckStatus.PASSED, 0)
-                            ).passed
-                            for d in deps
-                        )
-                        if deps_passed or not deps:
-                            ready.append(name)
-                        else:
-                            # Mark for skipping due to failed dependency
-                            skipped_due_to_deps.append(name)
+                for name in ready_queue.pop_ready(pending):
+                    if all(
+                        dependency_results[d].passed for d in dep_graph.get(name, set())
+                    ):
+                        ready.append(name)
+                    else:
+                        # Mark for skipping due to failed dependency
+                        skipped_due_to_deps.append(name)
 
                 # Process skipped checks
                 for name in skipped_due_to_deps:
@@ -714,20 +871,40 @@ class CheckExecutor:
                     swabbing_timeout,
                 )
 
+                to_submit = self._admit(
+                    [n for n in to_submit if n in pending], check_map
+                )
+
+                if speculation is not None:
+                    speculative = self._admit(
+                        speculation.candidates(
+                            pending,
+                            to_submit,
+                            dep_graph,
+                            set(futures.values()),
+                            dependency_results,
+                            can_speculate,
+                        ),
+                        check_map,
+                    )
+                    speculation.start(speculative, dep_graph)
+                    to_submit = to_submit + speculative
+
                 # Submit selected gates
                 for name in to_submit:
                     if name in pending:
                         check = check_map[name]
 
-                        future = executor.submit(
-                            self._run_single_check,
-                            check,
-                            project_root,
-                            auto_fix,
+                        future = self._submit_gate(
+                            executor, check, project_root, auto_fix
                         )
                         futures[future] = name
                         pending.discard(name)
 
+                # Ready gates the budget or the ledger held back stay
+                # queued for next round
+                ready_queue.requeue(n for n in ready if n in pending)
+
                 # Wait for at least one check to complete.
                 if futures:
                     done, _ = concurrent.futures.wait(
@@ -739,11 +916,6 @@ class CheckExecutor:
                         name = futures.pop(future)
                         try:
                             result = future.result()
-                            with self._lock:
-                                available_results[name] = result
-                                buffered_results[name] = result
-                            completed.add(name)
-
                         except Exception as e:
                             logger.error(f"Check {name} raised exception: {e}")
                             result = CheckResult(
@@ -752,10 +924,13 @@ class CheckExecutor:
                                 duration=0,
                                 error=str(e),
                             )
-                            with self._lock:
-                                available_results[name] = result
-                                buffered_results[name] = result
-                            completed.add(name)
+                        if speculation is not None and name in speculation:
+                            speculation.hold(name, result)
+                            continue
+                        with self._lock:
+                            available_results[name] = result
+                            buffered_results[name] = result
+                        completed.add(name)
 
                     self._drain_completed_buffer(
                         buffered_results,
@@ -781,10 +956,25 @@ class CheckExecutor:
                 # the atexit handler becomes a no-op.
                 for future in futures:
                     future.cancel()
+                self._terminate_in_flight()
                 executor.shutdown(wait=True, cancel_futures=True)
             else:
                 # Normal exit: wait for everything to finish cleanly
                 executor.shutdown(wait=True)
+            self._shutdown_process_pool()
+            self._ledger = None
+            self._gate_loop = None
+
+        # Speculative runs whose dependencies never resolved are discarded
+        # like any other gate that fail-fast stopped.
+        if speculation is not None:
+            abandoned = set(speculation.abandon())
+            with self._lock:
+                self._held_stores.clear()
+            self._speculation = None
+            pending.update(abandoned)
+            for future in [f for f, n in futures.items() if n in abandoned]:
+                del futures[future]
 
         # Handle any remaining pending checks (due to fail-fast)
         for name in list(pending):
@@ -813,6 +1003,47 @@ class CheckExecutor:
         if buffered_results:
             self._drain_completed_buffer(buffered_results, pending, futures, dep_graph)
 
+    def _settle_speculation(
+        self,
+        outcome: SpeculationOutcome,
+        pending: Set[str],
+        completed: Set[str],
+        available_results: Dict[str, CheckResult],
+        buffered_results: Dict[str, CheckResult],
+    ) -> None:
+        """Apply a speculation round: commit, skip, or requeue gates.
+
+        Only accepted results reach the cache.  A discarded one ran against
+        a tree its dependency was rewriting, so it may describe neither the
+        old tree nor the new one.
+        """
+        settled = [*outcome.accepted, *outcome.failed_dependency, *outcome.rerun]
+        with self._lock:
+            held = {
+                name: self._held_stores.pop(name)
+                for name in settled
+                if name in self._held_stores
+            }
+        for name, result in outcome.accepted.items():
+            if name in held:
+                self._cache.store(name, *held[name])
+            available_results[name] = result
+            buffered_results[name] = result
+            completed.add(name)
+        for name in outcome.failed_dependency:
+            result = CheckResult(
+                name=name,
+                status=CheckStatus.SKIPPED,
+                duration=0,
+                output="Skipped due to failed dependency",
+                skip_reason=SkipReason.FAILED_DEPENDENCY,
+            )
+            available_results[name] = result
+            buffered_results[name] = result
+            completed.add(name)
+        # Requeued gates are ready now and go through the normal path.
+        pending.update(outcome.rerun)
+
     def _select_gates_for_submission(
         self,
         ready: List[str],
@@ -829,8 +1060,8 @@ class CheckExecutor:
 
         Implements three strategies depending on budget state:
 
-        1. **No budget** — submit all ready gates, longest-first
-           (maximise parallelism by starting slow work early).
+        1. **No budget** — submit all ready gates, longest critical path
+           first (start whatever the slowest chain of dependents waits on).
         2. **Budget expired** — skip all timed ready gates
            (record TIME_BUDGET results), submit only untimed gates.
           3. **Budget active, not expired** — budget-aware dual-lane
@@ -863,9 +1094,9 @@ class CheckExecutor:
             List of check names to submit to the thread pool.
         """
         if not budget_active:
-            # No budget: submit all, longest-first (original behaviour)
+            # No budget: submit all, longest critical path first
             if timings:
-                ready.sort(key=lambda n: timings.get(n, 0), reverse=True)
+                return order_by_critical_path(ready, self._critical_path, timings)
             return ready
 
         # Split ready gates into timed (have estimates) and untimed
@@ -929,73 +1160,27 @@ class CheckExecutor:
             heavy_slots = max(0, remaining_slots - len(selected))
             if heavy_slots > 0:
                 candidates = [n for n in timed_sorted if n != fast_pick]
-                heavy_pick = self._choose_packed_subset(
-                    candidates,
-                    timings,
-                    budget_left,
-                    heavy_slots,
-                )
+                heavy_pick = pack_budget(candidates, timings, budget_left, heavy_slots)
                 selected.extend(heavy_pick)
 
             to_submit.extend(selected)
 
         return to_submit
 
-    def _choose_packed_subset(
-        self,
-        candidates: List[str],
-        timings: Dict[str, float],
-        budget_left: float,
-        max_items: int,
-    ) -> List[str]:
-        """Choose a subset that packs budget with count-first objective.
-
-        Objective (lexicographic):
-        1. Maximize number of selected checks (throughput)
-        2. Maximize total estimated duration (pack remaining budget)
+    def _admit(self, names: List[str], check_map: Dict[str, BaseCheck]) -> List[str]:
+        """Reserve ledger room for those of *names* that fit right now.
 
-        The returned order is heavy-first to preserve heavy-lane behavior.
+        Walks *names* in order but skips over gates that don't fit, so one
+        large gate never holds back smaller ones queued behind it.
         """
-        if max_items <= 0 or budget_left <= 0 or not candidates:
-            return []
-
-        best: List[str] = []
-        best_count = -1
-        best_total = -1.0
-
-        ordered = sorted(candidates, key=lambda n: timings.get(n, 0.0), reverse=True)
-
-        def dfs(idx: int, current: List[str], total: float) -> None:
-            nonlocal best, best_count, best_total
-            count = len(current)
-
-            if count > best_count or (count == best_count and total > best_total):
-                best = list(current)
-                best_count = count
-                best_total = total
-
-            if idx >= len(ordered) or count >= max_items:
-                return
-
-            # Upper bound on achievable count from this point.
-            remaining = len(ordered) - idx
-            if count + remaining < best_count:
-                return
-
-            name = ordered[idx]
-            est = timings.get(name, 0.0)
-
-            # Include if it fits.
-            if total + est <= budget_left:
-                current.append(name)
-                dfs(idx + 1, current, total + est)
-                current.pop()
-
-            # Exclude
-            dfs(idx + 1, current, total)
-
-        dfs(0, [], 0.0)
-        return best
+        ledger = self._ledger
+        if ledger is None:
+            return names
+        return [
+            name
+            for name in names
+            if ledger.try_acquire(name, check_map[name].resource_profile)
+        ]
 
     def _record_budget_skips(
         self,
@@ -1049,17 +1234,143 @@ class CheckExecutor:
         Returns:
             CheckResult
         """
-        # Short-circuit if fail-fast already triggered — avoids
-        # starting expensive work after a failure is detected.
-        if self._stop_event.is_set():
-            return CheckResult(
-                name=check.full_name,
-                status=CheckStatus.SKIPPED,
-                duration=0,
-                output=_SKIP_FAIL_FAST,
-                skip_reason=SkipReason.FAIL_FAST,
+        # The dispatcher reserved this gate's resources; give them back
+        # however it ends.
+        ledger = self._ledger
+        try:
+            # Short-circuit if fail-fast already triggered — avoids
+            # starting expensive work after a failure is detected.
+            if self._stop_event.is_set():
+                return self._fail_fast_skip(check.full_name)
+            return self._run_admitted_check(check, project_root, auto_fix)
+        finally:
+            if ledger is not None:
+                ledger.release(check.full_name)
+
+    async def _run_single_check_async(
+        self,
+        check: BaseCheck,
+        project_root: str,
+        auto_fix: bool,
+    ) -> CheckResult:
+        """Asyncio-backend twin of :meth:`_run_single_check`.
+
+        Cache, scope and post-processing work runs on the loop's worker
+        threads; the gate body goes through ``BaseCheck.run_async`` with
+        the loop's subprocess runner.
+        """
+        name = check.full_name
+        ledger = self._ledger
+        try:
+            if self._stop_event.is_set():
+                return self._fail_fast_skip(name)
+            cached, fingerprint, scope = await asyncio.to_thread(
+                self._begin_check, check, project_root
+            )
+            if cached is not None:
+                return cached
+            fixed = await asyncio.to_thread(
+                self._apply_auto_fix, check, project_root, auto_fix
             )
+            if fixed is not None and fingerprint:
+                fingerprint = await asyncio.to_thread(
+                    check.cache_fingerprint, project_root
+                )
+            try:
+                armed = self._start_body(name, name)
+                try:
+                    result = await self._invoke_check_async(check, project_root)
+                finally:
+                    with self._lock:
+                        self._running_owners.pop(name, None)
+                    # Off the loop: a firing deadline kills through it.
+                    timed_out = armed and await asyncio.to_thread(
+                        self._watchdog.disarm, name
+                    )
+                if timed_out:
+                    result = timed_out_result(result, self._deadlines[name])
+                result.auto_fixed = result.auto_fixed or bool(fixed)
+                return await asyncio.to_thread(
+                    self._finish_check, check, project_root, result, fingerprint, scope
+                )
+            except Exception as e:
+                return self._errored_result(check, e, scope)
+        finally:
+            if ledger is not None:
+                ledger.release(name)
 
+    async def _invoke_check_async(
+        self, check: BaseCheck, project_root: str
+    ) -> CheckResult:
+        """Run a gate body on the asyncio backend.
+
+        Gates bound for the process pool keep the thread-backend path;
+        everything else has its processes attributed to the gate name,
+        including those started from the gate's own pools via
+        ``submit_in_gate``.
+        """
+        if (
+            self._process_workers > 0
+            and check.execution_affinity is ExecutionAffinity.IN_PROCESS_CPU
+        ):
+            return await asyncio.to_thread(self._invoke_check, check, project_root)
+        assert self._gate_loop is not None  # for type checker
+        GATE_OWNER.set(check.full_name)  # task-local: each gate is its own task
+        return await check.run_async(project_root, runner=self._gate_loop.runner)
+
+    def _run_admitted_check(
+        self,
+        check: BaseCheck,
+        project_root: str,
+        auto_fix: bool,
+    ) -> CheckResult:
+        """Run a check that already holds its resource reservation."""
+        cached, fingerprint, scope = self._begin_check(check, project_root)
+        if cached is not None:
+            return cached
+        fixed = self._apply_auto_fix(check, project_root, auto_fix)
+        if fixed is not None and fingerprint:
+            fingerprint = check.cache_fingerprint(project_root)
+
+        # Run the check
+        name = check.full_name
+        try:
+            armed = self._start_body(name, name)
+            # Worker threads outlive the gate, so the owner is reset after.
+            token = GATE_OWNER.set(name)
+            try:
+                result = self._invoke_check(check, project_root)
+            finally:
+                GATE_OWNER.reset(token)
+                with self._lock:
+                    self._running_owners.pop(name, None)
+                timed_out = armed and self._watchdog.disarm(name)
+            if timed_out:
+                result = timed_out_result(result, self._deadlines[name])
+            result.auto_fixed = result.auto_fixed or bool(fixed)
+            return self._finish_check(check, project_root, result, fingerprint, scope)
+        except Exception as e:
+            return self._errored_result(check, e, scope)
+
+    def _start_body(self, name: str, owner: Hashable) -> bool:
+        """Register a gate's process owner; return True if a deadline is armed."""
+        with self._lock:
+            self._running_owners[name] = owner
+        deadline = self._deadlines.get(name)
+        if deadline is None:
+            return False
+        self._watchdog.arm(name, owner, deadline)
+        return True
+
+    def _begin_check(
+        self, check: BaseCheck, project_root: str
+    ) -> Tuple[Optional[CheckResult], Optional[str], Optional[ScopeInfo]]:
+        """Announce a check, then consult the cache and measure its scope.
+
+        Returns:
+            ``(cached_result, fingerprint, scope)`` — a non-``None`` cached
+            result means the check need not run at all.
+        """
         # Notify start callback NOW — when the thread pool worker
         # actually picks up this task, not when it was submitted.
         # This ensures start_time aligns with actual execution time,
@@ -1075,9 +1386,9 @@ class CheckExecutor:
         # the global project fingerprint for checks that don't override.
         fingerprint: Optional[str] = None
         if self._fingerprint:
-            fingerprint = check.cache_inputs(project_root) or self._fingerprint
+            fingerprint = check.cache_fingerprint(project_root, self._fingerprint)
             if not self._skip_cache_reads:
-                cached = get_cached_result(self._cache, check.full_name, fingerprint)
+                cached = self._cache.lookup(check.full_name, fingerprint)
                 if cached is not None:
                     logger.debug(
                         f"Cache hit for {check.full_name} "
@@ -1087,7 +1398,11 @@ class CheckExecutor:
                     # older slop-mop) still hold per-copy duplicates, so a
                     # cache hit would report inflated counts. Normalize on the
                     # way out too — the operation is idempotent.
-                    return _collapse_duplicate_findings(cached, project_root)
+                    return (
+                        collapse_result_duplicates(cached, project_root),
+                        fingerprint,
+                        None,
+                    )
 
         logger.debug(f"Running {check.display_name}")
 
@@ -1101,48 +1416,211 @@ class CheckExecutor:
                     scope = scope_result
             except Exception as e:
                 logger.debug(f"Scope measurement failed for {check.full_name}: {e}")
+        return None, fingerprint, scope
 
-        # Try auto-fix first if enabled
-        if auto_fix and check.can_auto_fix():
-            try:
-                fixed = check.auto_fix(project_root)
-                if fixed:
-                    logger.debug(f"Auto-fixed issues for {check.name}")
-            except Exception as e:
-                logger.warning(f"Auto-fix failed for {check.name}: {e}")
+    def _apply_auto_fix(
+        self, check: BaseCheck, project_root: str, auto_fix: bool
+    ) -> Optional[bool]:
+        """Try auto-fix first if enabled (failures are logged, not raised).
 
-        # Run the check
+        Returns ``None`` if the tree is untouched, ``True`` if the fixer
+        fixed something and ``False`` if it failed part-way.
+        """
+        if not (auto_fix and check.can_auto_fix()):
+            return None
+        fixed: Optional[bool] = False
         try:
-            result = check.run(project_root)
-            # Collapse the same defect repeated across byte-identical copies of
-            # a file (distributed templates, vendored tools, starter packs).
-            # Applied here rather than per-gate so every gate benefits from one
-            # hook — see checks/duplicate_files.py.
-            result = _collapse_duplicate_findings(result, project_root)
-            # Attach scope metrics if the check reported them
-            if scope is not None and result.scope is None:
-                result.scope = scope
-            # Store result in cache for next run
-            if fingerprint:
-                stored = store_result(
-                    self._cache,
-                    check.full_name,
-                    fingerprint,
-                    result,
-                    project_root=project_root,
-                )
-                if stored:
-                    self._cache_dirty = True
-            return result
+            fixed = True if check.auto_fix(project_root) else None
+            if fixed:
+                logger.debug(f"Auto-fixed issues for {check.name}")
         except Exception as e:
-            logger.error(f"Check {check.full_name} failed with exception: {e}")
+            logger.warning(f"Auto-fix failed for {check.name}: {e}")
+        finally:
+            # Even a failed fixer may have rewritten files.
+            snapshot = active_snapshot(project_root)
+            if snapshot is not None:
+                snapshot.invalidate()
+        return fixed
+
+    def _finish_check(
+        self,
+        check: BaseCheck,
+        project_root: str,
+        result: CheckResult,
+        fingerprint: Optional[str],
+        scope: Optional[ScopeInfo],
+    ) -> CheckResult:
+        """Post-process a check body's result and store it in the cache."""
+        if check.full_name in self._kill_candidates:
+            self._kill_settled.wait()
+        if check.full_name in self._cancelled:
+            # Killed mid-run by fail-fast: whatever it returned reflects
+            # the kill, not the code.  Never cache it.
             return CheckResult(
                 name=check.full_name,
-                status=CheckStatus.ERROR,
-                duration=0,
-                error=str(e),
-                scope=scope,
+                status=CheckStatus.SKIPPED,
+                duration=result.duration,
+                output=_CANCELLED_FAIL_FAST,
+                skip_reason=SkipReason.CANCELLED,
+            )
+        # Collapse the same defect repeated across byte-identical copies of
+        # a file (distributed templates, vendored tools, starter packs).
+        # Applied here rather than per-gate so every gate benefits from one
+        # hook — see checks/duplicate_files.py.
+        result = collapse_result_duplicates(result, project_root)
+        # Attach scope metrics if the check reported them
+        if scope is not None and result.scope is None:
+            result.scope = scope
+        # Store result in cache for next run.  A fixed check was re-keyed
+        # to the post-fix tree, where the fix is already done: cache that
+        # verdict as a plain one, so the next run on the fixed tree hits.
+        if fingerprint:
+            stored = replace(result, auto_fixed=False) if result.auto_fixed else result
+            speculation = self._speculation
+            if speculation is not None and check.full_name in speculation:
+                # Speculative: cache only once the speculation is accepted.
+                with self._lock:
+                    self._held_stores[check.full_name] = (
+                        fingerprint,
+                        stored,
+                        project_root,
+                        check.cache_manifest,
+                    )
+            else:
+                self._cache.store(
+                    check.full_name,
+                    fingerprint,
+                    stored,
+                    project_root,
+                    check.cache_manifest,
+                )
+        return result
+
+    @staticmethod
+    def _fail_fast_skip(name: str) -> CheckResult:
+        return CheckResult(
+            name=name,
+            status=CheckStatus.SKIPPED,
+            duration=0,
+            output=_SKIP_FAIL_FAST,
+            skip_reason=SkipReason.FAIL_FAST,
+        )
+
+    @staticmethod
+    def _errored_result(
+        check: BaseCheck, error: Exception, scope: Optional[ScopeInfo]
+    ) -> CheckResult:
+        logger.error(f"Check {check.full_name} failed with exception: {error}")
+        return CheckResult(
+            name=check.full_name,
+            status=CheckStatus.ERROR,
+            duration=0,
+            error=str(error),
+            scope=scope,
+        )
+
+    def _terminate_in_flight(self) -> None:
+        """Kill the process trees of gates still running their check body.
+
+        Only the check body is registered in ``_running_owners`` — an
+        auto-fix that is mid-write is left to finish rather than risk a
+        half-rewritten file.  Gates on the process lane are not reached
+        (their children belong to the worker process).
+        """
+        with self._lock:
+            running = dict(self._running_owners)
+            if not running:
+                return
+            self._kill_candidates = set(running)
+            self._kill_settled.clear()
+        try:
+            killed = self._terminate_owners(set(running.values()))
+            cancelled = {name for name, owner in running.items() if owner in killed}
+            with self._lock:
+                self._cancelled.update(cancelled)
+        finally:
+            self._kill_settled.set()
+        if cancelled:
+            logger.debug(f"Fail-fast cancelled: {', '.join(sorted(cancelled))}")
+
+    def _terminate_owners(self, owners: Set[Hashable]) -> Set[Hashable]:
+        """Kill the process trees started by *owners*; return those hit."""
+        runner = self._gate_loop.runner if self._gate_loop else get_runner()
+        return runner.terminate_owned_by(owners, grace_period=self._kill_grace_period)
+
+    def _make_gate_pool(
+        self,
+    ) -> Union[concurrent.futures.ThreadPoolExecutor, AsyncGateLoop]:
+        """Create what gates are submitted to for one run of the backend."""
+        if self._backend == "asyncio":
+            self._gate_loop = AsyncGateLoop(self._max_workers)
+            return self._gate_loop
+        return concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers)
+
+    def _submit_gate(
+        self,
+        pool: Union[concurrent.futures.ThreadPoolExecutor, AsyncGateLoop],
+        check: BaseCheck,
+        project_root: str,
+        auto_fix: bool,
+    ) -> "concurrent.futures.Future[CheckResult]":
+        if isinstance(pool, AsyncGateLoop):
+            return pool.submit(
+                self._run_single_check_async, check, project_root, auto_fix
             )
+        return pool.submit(self._run_single_check, check, project_root, auto_fix)
+
+    def _invoke_check(self, check: BaseCheck, project_root: str) -> CheckResult:
+        """Call ``check.run()`` on the lane its execution affinity asks for.
+
+        Only the gate's own work crosses into the process pool — cache
+        lookups, callbacks, scope measurement and result post-processing
+        stay on the calling worker thread, so they behave identically on
+        both lanes.  Anything that can't make the trip (a dynamically
+        built class, unpicklable instance state) quietly runs in-thread.
+        """
+        if (
+            self._process_workers <= 0
+            or check.execution_affinity is not ExecutionAffinity.IN_PROCESS_CPU
+        ):
+            return check.run(project_root)
+        if type(check) in self._unpicklable:
+            return check.run(project_root)
+        try:
+            payload = pickle.dumps(check)
+        except Exception as e:  # noqa: BLE001 — any pickling failure → thread lane
+            logger.debug(f"{check.full_name} not picklable, running in-thread: {e}")
+            with self._process_pool_lock:
+                self._unpicklable.add(type(check))
+            return check.run(project_root)
+        pool = self._get_process_pool()
+        try:
+            future = pool.submit(_run_check_in_worker_process, payload, project_root)
+        except RuntimeError:
+            # Pool already shut down (fail-fast raced us) — run locally.
+            return check.run(project_root)
+        return future.result()
+
+    def _get_process_pool(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Create the process pool on first use; most runs never need it."""
+        with self._process_pool_lock:
+            if self._process_pool is None:
+                # spawn, not fork: the parent is multi-threaded by the time
+                # the first CPU gate arrives, and forking a threaded process
+                # can inherit locks held by other threads.
+                self._process_pool = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self._process_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._process_pool
+
+    def _shutdown_process_pool(self) -> None:
+        """Tear down the process pool at the end of a run."""
+        with self._process_pool_lock:
+            pool = self._process_pool
+            self._process_pool = None
+        if pool is not None:
+            pool.shutdown(wait=not self._stop_event.is_set(), cancel_futures=True)
 
 
 # Convenience function
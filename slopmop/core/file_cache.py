@@ -0,0 +1,197 @@
+"""Per-file finding cache for file-local gates.
+
+The result cache (:mod:`slopmop.core.cache`) is all-or-nothing per gate:
+one edited file changes the gate's fingerprint and the whole repo is
+rescanned.  Gates whose findings depend on one file at a time
+(debugger artifacts, bogus tests, LOC limits, …) can do much better —
+only the edited file's findings can have changed.
+
+A :class:`FileFindingCache` remembers each scanned file's findings keyed
+by ``(gate, gate config key, file content hash)``.  The gate asks for
+every file it would scan; unchanged files answer from the cache and only
+changed ones are rescanned::
+
+    with self.file_findings_cache(project_root) as cache:
+        for rel in files:
+            found = cache.scan(rel, lambda: scan_one(rel))
+
+Payloads must be JSON-serialisable (tuples come back as lists).  Content
+hashes come from the run's snapshot or the stat-keyed file index, so an
+unchanged file costs one ``stat``.
+
+Cache location: ``.slopmop/file_findings/<gate>.json``.  Each save keeps
+only the files scanned by that run, so deleted and newly excluded files
+drop out on their own.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import re
+import threading
+from pathlib import Path
+from types import ModuleType, TracebackType
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from slopmop._version import __version__
+from slopmop.core.file_index import get_file_index
+from slopmop.core.snapshot import active_snapshot
+from slopmop.utils.state_files import atomic_write_text, load_versioned_json
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = ".slopmop"
+CACHE_SUBDIR = "file_findings"
+CACHE_VERSION = 1
+
+T = TypeVar("T")
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def config_key(gate: str, config: object, salt: str = "") -> str:
+    """Hash everything besides file content that shapes a gate's findings.
+
+    Args:
+        gate: Gate full name.
+        config: The gate's effective config (JSON-serialisable).
+        salt: Anything else the findings depend on, e.g. the scanner's
+            own source, so upgrading the gate invalidates old entries.
+    """
+    blob = json.dumps(
+        {"gate": gate, "config": config, "salt": salt},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def source_salt(scanner: type, helpers: Tuple[ModuleType, ...] = ()) -> str:
+    """Fingerprint of the slop-mop version and the scanner's source.
+
+    Covers *scanner*'s own source file and those of *helpers* — shared
+    modules its findings also depend on (e.g. ``slopmop.core.text_scan``),
+    so editing one in a checkout, where the version doesn't change,
+    still invalidates old entries.
+    """
+    digest = hashlib.sha256()
+    sources: List[Union[type, ModuleType]] = [scanner]
+    sources.extend(sorted(helpers, key=lambda m: m.__name__))
+    for obj in sources:
+        try:
+            digest.update(Path(inspect.getfile(obj)).read_bytes())
+        except (OSError, TypeError):
+            pass
+        digest.update(b"\0")
+    return f"{__version__}:{digest.hexdigest()}"
+
+
+class FileFindingCache:
+    """One gate's cached per-file findings.
+
+    Use as a context manager: the cache is saved when the block exits
+    normally (an exception leaves the previous cache untouched).
+
+    Args:
+        project_root: Project the gate scans.
+        gate: Gate full name (names the cache file).
+        key: :func:`config_key` for the gate's current configuration;
+            a stored cache with a different key is discarded.
+    """
+
+    def __init__(self, project_root: str, gate: str, key: str):
+        self.project_root = project_root
+        self._root = Path(project_root)
+        self._path = (
+            self._root
+            / CACHE_DIR
+            / CACHE_SUBDIR
+            / f"{_UNSAFE_CHARS.sub('_', gate)}.json"
+        )
+        self._key = key
+        self._lock = threading.Lock()
+        self._entries = self._load()
+        self._kept: Dict[str, List[object]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, List[object]]:
+        data = load_versioned_json(self._path, CACHE_VERSION)
+        if data is None or data.get("key") != self._key:
+            return {}
+        files = data.get("files")
+        if not isinstance(files, dict):
+            return {}
+        return {
+            rel: entry
+            for rel, entry in cast(Dict[str, object], files).items()
+            if isinstance(entry, list) and len(cast(List[object], entry)) == 2
+        }
+
+    def _content_hash(self, rel: str) -> Optional[str]:
+        snapshot = active_snapshot(self.project_root)
+        if snapshot is not None:
+            return snapshot.content_hash(rel)
+        return get_file_index(self.project_root).content_hash(rel, self._root / rel)
+
+    def scan(self, rel: str, scan: Callable[[], T]) -> T:
+        """Return *rel*'s findings, calling *scan* only if the file changed.
+
+        Args:
+            rel: Project-relative POSIX path of the file.
+            scan: Computes the file's findings (JSON-serialisable).
+        """
+        digest = self._content_hash(rel)
+        with self._lock:
+            entry = self._entries.get(rel)
+            if digest is not None and entry is not None and entry[0] == digest:
+                self._kept[rel] = entry
+                self.hits += 1
+                return cast(T, entry[1])
+        value = scan()
+        with self._lock:
+            self.misses += 1
+            if digest is not None:
+                self._kept[rel] = [digest, value]
+        return value
+
+    def save(self) -> None:
+        """Persist the findings of every file scanned since loading."""
+        with self._lock:
+            if self._kept == self._entries:
+                return
+            payload = json.dumps(
+                {"version": CACHE_VERSION, "key": self._key, "files": self._kept},
+                separators=(",", ":"),
+            )
+            self._entries = dict(self._kept)
+        try:
+            atomic_write_text(self._path, payload)
+        except OSError as e:
+            logger.debug(f"Failed to write file findings cache: {e}")
+
+    def __enter__(self) -> "FileFindingCache":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.save()
+        get_file_index(self.project_root).save()
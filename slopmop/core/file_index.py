@@ -0,0 +1,188 @@
+"""Persistent stat index of file content hashes.
+
+Cache fingerprints hash file *content* so that mtime-only churn (IDE
+saves, checkouts, stash round-trips) doesn't invalidate results.  Reading
+every source byte on every run to prove nothing changed is the expensive
+part, so this index remembers each file's content hash alongside the
+stat tuple ``(size, mtime_ns, inode)`` it was computed from.  A file is only
+re-read when that tuple changes, which makes an unchanged-tree
+fingerprint cost one ``stat`` per file.
+
+Content hashes are git blob IDs (:func:`git_blob_id`), so for clean
+tracked files :mod:`slopmop.core.git_index` can supply the same digest
+from git's own index without reading the file.
+
+Index location: ``.slopmop/file_index.json``.
+
+Correctness notes:
+- A file rewritten within the filesystem's mtime granularity can keep
+  its stat tuple ("racy" files, as git calls them).  Hashes of files
+  modified less than ``RACY_WINDOW_NS`` before they were read are
+  therefore never stored; they are re-read until their mtime is old
+  enough to be trustworthy.
+- Entries are keyed by project-relative path and self-validate against
+  a fresh ``stat``, so a stale or foreign index can only cost re-reads,
+  never a wrong hash.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple, cast
+
+from slopmop.utils.state_files import atomic_write_text, load_versioned_json
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = ".slopmop"
+INDEX_FILE = "file_index.json"
+INDEX_VERSION = 2
+
+# Files modified this recently may still change without moving their
+# mtime; don't remember their hashes yet.
+RACY_WINDOW_NS = 2_000_000_000
+
+_StatKey = Tuple[int, int, int]
+
+
+def git_blob_id(content: bytes) -> str:
+    """The ID git gives a blob holding *content* (``git hash-object``)."""
+    hasher = hashlib.sha1(usedforsecurity=False)  # git's object naming
+    hasher.update(b"blob %d\0" % len(content))
+    hasher.update(content)
+    return hasher.hexdigest()
+
+
+class FileIndex:
+    """Content hashes of a project's files, keyed by stat tuple.
+
+    Thread-safe: gates hash their input scopes concurrently.
+
+    Args:
+        project_root: Project whose files (and ``.slopmop/``) this indexes.
+    """
+
+    def __init__(self, project_root: str):
+        self._root = Path(project_root)
+        self._path = self._root / INDEX_DIR / INDEX_FILE
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[object]] = self._load()
+        self._seen: Set[str] = set()
+        self._dirty = False
+        self._pruned = False
+
+    def _load(self) -> Dict[str, List[object]]:
+        data = load_versioned_json(self._path, INDEX_VERSION)
+        files = data.get("files") if data is not None else None
+        if not isinstance(files, dict):
+            return {}
+        return {
+            rel: entry
+            for rel, entry in cast(Dict[str, object], files).items()
+            if isinstance(entry, list) and len(cast(List[object], entry)) == 4
+        }
+
+    def content_hash(self, rel_path: str, path: Path) -> Optional[str]:
+        """Return the :func:`git_blob_id` of *path*'s content.
+
+        Args:
+            rel_path: Project-relative path (the index key).
+            path: Path to stat and, if needed, read.
+
+        Returns:
+            The digest, or ``None`` if the file can't be read.
+        """
+        try:
+            st = path.stat()
+        except OSError:
+            with self._lock:
+                if self._entries.pop(rel_path, None) is not None:
+                    self._dirty = True
+            return None
+        key: _StatKey = (st.st_size, st.st_mtime_ns, st.st_ino)
+        with self._lock:
+            self._seen.add(rel_path)
+            entry = self._entries.get(rel_path)
+        if entry is not None and tuple(entry[:3]) == key:
+            return str(entry[3])
+        try:
+            content = path.read_bytes()
+        except OSError:
+            return None
+        digest = git_blob_id(content)
+        racy = time.time_ns() - st.st_mtime_ns < RACY_WINDOW_NS
+        with self._lock:
+            if racy:
+                if self._entries.pop(rel_path, None) is not None:
+                    self._dirty = True
+            else:
+                self._entries[rel_path] = [*key, digest]
+                self._dirty = True
+        return digest
+
+    def save(self) -> None:
+        """Persist the index if it changed.
+
+        The first save also drops entries for files that no longer exist
+        (later deletions are dropped when a lookup fails to ``stat``).
+        """
+        with self._lock:
+            if not self._pruned:
+                self._pruned = True
+                for rel in [r for r in self._entries if r not in self._seen]:
+                    if not (self._root / rel).exists():
+                        del self._entries[rel]
+                        self._dirty = True
+            if not self._dirty:
+                return
+            payload = json.dumps(
+                {"version": INDEX_VERSION, "files": self._entries},
+                separators=(",", ":"),
+            )
+            self._dirty = False
+        try:
+            atomic_write_text(self._path, payload)
+        except OSError as e:
+            logger.debug(f"Failed to write file index: {e}")
+
+
+_indexes: Dict[str, FileIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_file_index(project_root: str) -> FileIndex:
+    """Return the process-wide :class:`FileIndex` for *project_root*."""
+    key = os.path.realpath(project_root)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = FileIndex(project_root)
+        return index
+
+
+def content_hashes(
+    project_root: str,
+    rels: Iterable[str],
+    known: Optional[Mapping[str, str]] = None,
+) -> List[Tuple[str, str]]:
+    """``(path, content hash)`` for each readable file in *rels*.
+
+    Paths in *known* (e.g. :func:`slopmop.core.git_index.git_blob_ids`)
+    take their hash from it without a ``stat``.  Saves the project's
+    index afterwards so the next run reuses the work.
+    """
+    index = get_file_index(project_root)
+    root = Path(project_root)
+    pairs: List[Tuple[str, str]] = []
+    for rel in rels:
+        digest = known.get(rel) if known else None
+        if digest is None:
+            digest = index.content_hash(rel, root / rel)
+        if digest is not None:
+            pairs.append((rel, digest))
+    index.save()
+    return pairs
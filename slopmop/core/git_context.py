@@ -0,0 +1,150 @@
+"""Run-level git metadata, resolved once and shared.
+
+The result cache stamps every stored entry with the HEAD commit, the run
+report names the commit cached results came from, and SARIF records the
+revision it describes.  Each used to shell out to git on its own — the
+cache once per stored gate, from worker threads.  :func:`git_context`
+resolves HEAD, branch, upstream, dirty state, merge-base and remote in at
+most three git processes and memoizes the answer on the run's
+:class:`~slopmop.core.snapshot.ProjectSnapshot`, so a run pays for it
+once and an auto-fix (which invalidates the snapshot) refreshes it.
+
+Outside a run there is no snapshot, and every call resolves afresh.
+"""
+
+import logging
+import subprocess
+import threading
+import urllib.parse
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from slopmop.core.snapshot import active_snapshot
+
+logger = logging.getLogger(__name__)
+
+GIT_TIMEOUT = 5
+
+# Serializes first resolution, so concurrent gates wait for one answer
+# instead of each spawning git.
+_lock = threading.Lock()
+
+
+@dataclass(frozen=True)
+class GitContext:
+    """What git says about the working tree at the start of a run.
+
+    Every field is ``None`` when git can't tell (not a repository, git
+    missing, no commits yet, detached HEAD for ``branch``).
+
+    Attributes:
+        head: Full SHA of HEAD.
+        branch: Current branch name.
+        upstream: The branch's upstream (e.g. ``origin/main``).
+        dirty: Whether tracked files differ from HEAD.
+        merge_base: Merge-base of HEAD with the upstream, or with the
+            remote's default branch when there is no upstream.
+        remote_url: URL of the upstream's remote (``origin`` otherwise),
+            with any credentials stripped.
+    """
+
+    head: Optional[str] = None
+    branch: Optional[str] = None
+    upstream: Optional[str] = None
+    dirty: Optional[bool] = None
+    merge_base: Optional[str] = None
+    remote_url: Optional[str] = None
+
+    @property
+    def head_short(self) -> Optional[str]:
+        """The 7-character abbreviation of :attr:`head`."""
+        return self.head[:7] if self.head else None
+
+    def to_dict(self) -> Dict[str, object]:
+        """The known fields, for machine output."""
+        return {
+            name: value
+            for name, value in (
+                ("head", self.head),
+                ("branch", self.branch),
+                ("upstream", self.upstream),
+                ("dirty", self.dirty),
+                ("merge_base", self.merge_base),
+                ("remote_url", self.remote_url),
+            )
+            if value is not None
+        }
+
+
+def git_context(project_root: str) -> GitContext:
+    """The run's :class:`GitContext` (resolved once per active snapshot)."""
+    snapshot = active_snapshot(project_root)
+    if snapshot is None:
+        return resolve_git_context(project_root)
+    with _lock:
+        return snapshot.memoize(
+            ("git_context",), lambda: resolve_git_context(project_root)
+        )
+
+
+def resolve_git_context(project_root: str) -> GitContext:
+    """Ask git about *project_root* now, bypassing any memo."""
+    status = _git(
+        project_root, "status", "--porcelain=v2", "--branch", "--untracked-files=no"
+    )
+    if status is None:
+        return GitContext()
+    head = branch = upstream = None
+    dirty = False
+    for line in status.splitlines():
+        if not line.startswith("# "):
+            dirty = dirty or bool(line.strip())
+            continue
+        key, _, value = line[2:].partition(" ")
+        if key == "branch.oid" and value != "(initial)":
+            head = value
+        elif key == "branch.head" and value != "(detached)":
+            branch = value
+        elif key == "branch.upstream":
+            upstream = value
+    remote = upstream.split("/", 1)[0] if upstream else "origin"
+    merge_base = None
+    if head is not None:
+        merge_base = _git(
+            project_root, "merge-base", "HEAD", upstream or f"{remote}/HEAD"
+        )
+    remote_url = _git(project_root, "config", "--get", f"remote.{remote}.url")
+    return GitContext(
+        head=head,
+        branch=branch,
+        upstream=upstream,
+        dirty=dirty,
+        merge_base=merge_base or None,
+        remote_url=_without_credentials(remote_url) if remote_url else None,
+    )
+
+
+def _git(project_root: str, *args: str) -> Optional[str]:
+    """Stripped stdout of ``git *args``, or ``None`` on any failure."""
+    try:
+        out = subprocess.run(
+            ["git", *args],
+            capture_output=True,
+            text=True,
+            cwd=project_root,
+            timeout=GIT_TIMEOUT,
+            stdin=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"git {args[0]} failed: {e}")
+        return None
+    return out.stdout.strip() if out.returncode == 0 else None
+
+
+def _without_credentials(url: str) -> str:
+    """*url* without the ``user:token@`` CI checkouts embed in http(s) URLs."""
+    parts = urllib.parse.urlsplit(url)
+    if parts.scheme not in ("http", "https") or "@" not in parts.netloc:
+        return url
+    host = parts.netloc.rsplit("@", 1)[1]
+    return urllib.parse.urlunsplit(parts._replace(netloc=host))
@@ -0,0 +1,77 @@
+"""Content hashes for clean tracked files, straight from git's index.
+
+Git already knows the blob ID of every tracked file, and the stat index
+(:mod:`slopmop.core.file_index`) hashes file content the way git does:
+a blob ID.  So for a tracked file whose worktree copy still matches the
+index, git's answer is the same digest the stat index would compute,
+and it costs nothing to read.  :func:`git_blob_ids` asks for all of them
+in one ``git ls-files`` call.  Fingerprinting a clean checkout then reads
+no file content, even on a fresh clone with a cold stat index.
+
+Files git can't vouch for are left out, and callers hash those
+themselves: modified and untracked files, conflicted or
+``assume-unchanged`` / ``skip-worktree`` entries, symlinks and
+submodules.  Outside a git work tree the map is ``None`` and
+everything falls back to the stat index.
+
+``git ls-files -m`` compares stat data and re-checks content for racily
+clean entries, like ``git status``, so a clean entry really does match
+the worktree.  A file kept clean only by a conversion filter (e.g.
+``core.autocrlf``) carries its blob ID while clean and its raw-bytes
+hash once edited, so at worst it costs one spurious cache miss.
+"""
+
+import logging
+import subprocess  # nosec B404 - fixed argv git query only
+from typing import Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+GIT_LS_FILES_TIMEOUT = 30
+
+# Regular and executable files; symlink (120000) and gitlink (160000)
+# blobs don't describe the bytes a walk reads.
+_FILE_MODES = frozenset({"100644", "100755"})
+
+
+def git_blob_ids(project_root: str) -> Optional[Dict[str, str]]:
+    """Blob IDs of tracked files whose worktree content matches the index.
+
+    Paths are relative to *project_root* (files outside it aren't listed).
+
+    Returns:
+        ``{path: blob id}``, or ``None`` when *project_root* isn't in a
+        git work tree or git can't be run.
+    """
+    try:
+        result = subprocess.run(  # nosec B603 B607 - fixed argv, no shell
+            ["git", "ls-files", "--cached", "--modified", "--stage", "-v", "-z"],
+            cwd=project_root,
+            capture_output=True,
+            timeout=GIT_LS_FILES_TIMEOUT,
+            stdin=subprocess.DEVNULL,
+            check=False,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"git ls-files failed: {e}")
+        return None
+    if result.returncode != 0:
+        return None
+    clean: Dict[str, str] = {}
+    untrusted: Set[str] = set()
+    for record in result.stdout.split(b"\0"):
+        # "<tag> <mode> <blob> <stage>\t<path>"; a modified file is listed
+        # twice, once tagged "C".
+        meta, sep, raw_path = record.partition(b"\t")
+        fields = meta.split(b" ")
+        if not sep or len(fields) != 4:
+            continue
+        path = raw_path.decode("utf-8", "surrogateescape")
+        tag, mode, blob, stage = (f.decode("ascii", "replace") for f in fields)
+        if tag == "H" and stage == "0" and mode in _FILE_MODES:
+            clean[path] = blob
+        else:
+            untrusted.add(path)
+    for path in untrusted:
+        clean.pop(path, None)
+    return clean
@@ -0,0 +1,74 @@
+"""Line counts for scope metrics, memoized by stat.
+
+Every gate's ``measure_scope`` reports how many lines it examined, and
+each used to read its files as text just to count newlines — decoding
+every byte, once per gate.  :func:`line_count` counts ``\\n`` bytes over
+fixed-size binary reads instead and remembers the answer against the
+file's stat tuple ``(size, mtime_ns, inode)``, so a file is read once
+per process however many gates measure it.  Files modified within
+:data:`~slopmop.core.file_index.RACY_WINDOW_NS` aren't remembered, for
+the same reason the stat index doesn't remember their hashes.
+
+Counting bytes rather than decoded text means a bare ``\\r`` (classic
+Mac line ending) no longer counts as a line break; CRLF files count the
+same as before.
+"""
+
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+from slopmop.core.file_index import RACY_WINDOW_NS
+
+_CHUNK_SIZE = 1 << 16
+
+_StatKey = Tuple[int, int, int]
+
+_counts: Dict[str, Tuple[_StatKey, int]] = {}
+_lock = threading.Lock()
+
+
+def count_lines(path: Path) -> int:
+    """Newline-terminated line count of *path*, read in binary chunks.
+
+    A final line without a trailing newline still counts.
+
+    Raises:
+        OSError: If *path* can't be read.
+    """
+    lines = 0
+    last = b""
+    with open(path, "rb") as f:
+        while True:
+            chunk = f.read(_CHUNK_SIZE)
+            if not chunk:
+                break
+            lines += chunk.count(b"\n")
+            last = chunk[-1:]
+    return lines + (1 if last and last != b"\n" else 0)
+
+
+def line_count(path: Path) -> int:
+    """:func:`count_lines`, reusing the last count while *path*'s stat holds.
+
+    Returns 0 for a file that can't be read.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return 0
+    key: _StatKey = (st.st_size, st.st_mtime_ns, st.st_ino)
+    name = str(path)
+    with _lock:
+        cached = _counts.get(name)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    try:
+        lines = count_lines(path)
+    except OSError:
+        return 0
+    if time.time_ns() - st.st_mtime_ns >= RACY_WINDOW_NS:
+        with _lock:
+            _counts[name] = (key, lines)
+    return lines
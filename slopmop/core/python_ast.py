@@ -0,0 +1,94 @@
+"""Parsed Python modules, shared by gates.
+
+bogus-tests, ambiguity-mines and the coverage gate's fix hints each
+called ``ast.parse`` on their own, and loc-lock parsed oversized files
+again to find what to move, so a file several of them look at was
+parsed once per gate.
+
+:func:`parse_python` parses a file once and shares the tree.  Trees are
+keyed by path and content hash (the same blob ID the result cache
+uses), so an edited file is reparsed and an unchanged one is not.  They
+are held in a bounded in-process LRU rather than for the whole run, so
+a scan over a large repo doesn't keep every tree alive.  Trees are
+shared: callers must not mutate them.
+"""
+
+import ast
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+from slopmop.core.file_index import get_file_index
+from slopmop.core.snapshot import active_snapshot
+
+# Parsed trees kept in memory at once.
+TREE_CACHE_SIZE = 512
+
+
+@dataclass(frozen=True)
+class ParsedPython:
+    """A Python file's source and tree.
+
+    Attributes:
+        source: The file's text (empty if it couldn't be read).
+        tree: The parsed module, or ``None`` if reading or parsing failed.
+        error: Why :attr:`tree` is ``None``.
+    """
+
+    source: str
+    tree: Optional[ast.Module]
+    error: Optional[str] = None
+
+
+def parse_source(source: str, filename: str = "<unknown>") -> ParsedPython:
+    """Parse *source*, capturing a syntax error instead of raising it."""
+    try:
+        return ParsedPython(source, ast.parse(source, filename=filename))
+    except (SyntaxError, ValueError) as e:
+        # ValueError: source with null bytes (a SyntaxError from 3.12).
+        return ParsedPython(source, None, str(e))
+
+
+_trees: "OrderedDict[Tuple[str, str, str], ParsedPython]" = OrderedDict()
+_trees_lock = threading.Lock()
+
+
+def _content_hash(project_root: str, rel: str) -> Optional[str]:
+    snapshot = active_snapshot(project_root)
+    if snapshot is not None:
+        return snapshot.content_hash(rel)
+    return get_file_index(project_root).content_hash(rel, Path(project_root) / rel)
+
+
+def _read_and_parse(project_root: str, rel: str) -> ParsedPython:
+    try:
+        source = (Path(project_root) / rel).read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        return ParsedPython("", None, str(e))
+    return parse_source(source, rel)
+
+
+def parse_python(project_root: str, rel: str) -> ParsedPython:
+    """The parsed form of *rel*, shared with every other caller.
+
+    Reads strictly as UTF-8; an undecodable or unparseable file comes
+    back with ``tree=None`` and the reason in ``error``.
+    """
+    digest = _content_hash(project_root, rel)
+    if digest is None:
+        return _read_and_parse(project_root, rel)
+    key = (os.path.realpath(project_root), rel, digest)
+    with _trees_lock:
+        parsed = _trees.get(key)
+        if parsed is not None:
+            _trees.move_to_end(key)
+            return parsed
+    parsed = _read_and_parse(project_root, rel)
+    with _trees_lock:
+        _trees[key] = parsed
+        while len(_trees) > TREE_CACHE_SIZE:
+            _trees.popitem(last=False)
+    return parsed
@@ -0,0 +1,221 @@
+"""Resource-class accounting for the check executor.
+
+A fixed worker count treats every gate as the same size: a 50ms regex scan
+and a pytest run that fans out across every core each take one slot.  On a
+32-core CI runner that leaves most of the machine idle; on a 4-core laptop
+pyright + mypy + pytest happily overcommit both CPU and memory.
+
+Instead, each gate declares a :class:`ResourceProfile` and the executor
+packs gates against the machine's detected :class:`MachineCapacity` via a
+:class:`ResourceLedger`: the dispatcher only hands a gate to a worker once
+its profile fits next to whatever is already running.  The ledger is
+advisory bookkeeping — it never kills anything — and always admits a gate
+when nothing else is running, so a profile larger than the machine degrades to serial execution
+rather than deadlock.
+"""
+
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Share of a core an I/O-bound gate is charged.  Such gates mostly wait on
+# the network or a child process; charging them a full core would leave
+# real cores idle, charging nothing would let hundreds pile up.
+IO_BOUND_CORE_SHARE = 0.25
+
+# Fraction of available memory the ledger will hand out.  The rest is
+# headroom for slop-mop itself, the OS page cache, and estimate error.
+MEMORY_HEADROOM = 0.8
+
+# Thread-slot bounds.  Slots are cheap (threads mostly sleep in
+# ``communicate()``) but a hard cap keeps a 128-core box from starting a
+# hundred tool processes at once.
+MIN_THREAD_SLOTS = 4
+MAX_THREAD_SLOTS = 32
+
+# Smallest core budget the ledger packs against.  Most gate time is spent
+# waiting on a child process, and the old fixed pool ran four gates at once
+# on any machine without trouble — a 1-core container must not serialise
+# every gate.
+MIN_CORE_BUDGET = 4
+
+
+@dataclass(frozen=True)
+class ResourceProfile:
+    """What one run of a gate costs the machine.
+
+    Attributes:
+        cores: CPU cores the gate keeps busy while running.
+        memory_mb: Expected peak RSS of the gate (including any tool it
+            spawns), in megabytes.
+        io_bound: The gate mostly waits (network, ``gh``, git) rather than
+            computes.  Charged :data:`IO_BOUND_CORE_SHARE` of a core.
+        spawns_parallelism: The tool fans out on its own (jest workers,
+            ``flutter test`` isolates, a scanner thread pool).  Charged at
+            least half the machine so two such gates never run together.
+    """
+
+    cores: float = 1.0
+    memory_mb: int = 256
+    io_bound: bool = False
+    spawns_parallelism: bool = False
+
+
+@dataclass(frozen=True)
+class MachineCapacity:
+    """Cores and memory the executor may pack gates into.
+
+    ``memory_mb`` is ``None`` when the platform gives no reliable answer;
+    the ledger then packs by cores alone.
+    """
+
+    cores: int
+    memory_mb: Optional[int] = None
+
+    @property
+    def core_budget(self) -> float:
+        """Cores the ledger hands out (never below :data:`MIN_CORE_BUDGET`)."""
+        return float(max(self.cores, MIN_CORE_BUDGET))
+
+    @property
+    def thread_slots(self) -> int:
+        """Worker threads to create for this machine."""
+        return max(MIN_THREAD_SLOTS, min(MAX_THREAD_SLOTS, self.cores * 2))
+
+
+def _detect_cores() -> int:
+    """Cores this process may run on (honours taskset/cgroup affinity)."""
+    sched_getaffinity = getattr(os, "sched_getaffinity", None)
+    if sched_getaffinity is not None:
+        try:
+            return max(1, len(sched_getaffinity(0)))
+        except OSError:
+            pass
+    return max(1, os.cpu_count() or 1)
+
+
+def detect_available_memory_mb() -> Optional[int]:
+    """Memory available for new work, in MB, or ``None`` if unknown.
+
+    Linux exposes ``MemAvailable`` (free + reclaimable cache), which is the
+    number that matters.  Elsewhere we fall back to half of physical memory
+    — a deliberately conservative guess.
+    """
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    return int(line.split()[1]) // 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        pages = os.sysconf("SC_PHYS_PAGES")
+        page_size = os.sysconf("SC_PAGE_SIZE")
+        if pages > 0 and page_size > 0:
+            return int(pages * page_size // (1024 * 1024) // 2)
+    except (AttributeError, ValueError, OSError):
+        pass
+    return None
+
+
+def detect_capacity() -> MachineCapacity:
+    """Probe the current machine once for cores and available memory."""
+    capacity = MachineCapacity(
+        cores=_detect_cores(), memory_mb=detect_available_memory_mb()
+    )
+    logger.debug(
+        f"Detected capacity: {capacity.cores} cores, "
+        f"{capacity.memory_mb if capacity.memory_mb is not None else '?'} MB"
+    )
+    return capacity
+
+
+class ResourceLedger:
+    """Tracks the cores and memory claimed by running gates.
+
+    The dispatcher calls :meth:`try_acquire` before submitting a gate and
+    the worker calls :meth:`release` when it finishes; a gate that doesn't
+    fit yet stays queued while smaller ones go ahead.  Thread-safe.
+
+    Args:
+        capacity: Cores and memory to pack against.
+        sample_memory: Re-reads available memory (MB, or ``None`` if
+            unknown) at each admission, so memory taken by anything else
+            since ``capacity`` was probed counts too.
+    """
+
+    def __init__(
+        self,
+        capacity: MachineCapacity,
+        sample_memory: Optional[Callable[[], Optional[int]]] = None,
+    ):
+        self._capacity = capacity
+        self._sample_memory = sample_memory
+        self._lock = threading.Lock()
+        self._claims: Dict[str, Tuple[float, int]] = {}
+        self._cores_used = 0.0
+        self._memory_used = 0
+
+    @property
+    def capacity(self) -> MachineCapacity:
+        return self._capacity
+
+    @property
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._claims)
+
+    def claim_for(self, profile: ResourceProfile) -> Tuple[float, int]:
+        """Translate a profile into the (cores, memory_mb) it is charged."""
+        cores = profile.cores
+        if profile.io_bound:
+            cores = min(cores, IO_BOUND_CORE_SHARE)
+        if profile.spawns_parallelism:
+            cores = max(cores, self._capacity.core_budget / 2)
+        cores = min(self._capacity.core_budget, max(0.0, cores))
+        return cores, max(0, profile.memory_mb)
+
+    def _fits(self, cores: float, memory: int) -> bool:
+        """Whether a claim fits now.  Caller holds the lock.
+
+        An empty ledger always admits, so an oversized profile runs alone
+        instead of never running.
+        """
+        if not self._claims:
+            return True
+        if self._cores_used + cores > self._capacity.core_budget + 1e-9:
+            return False
+        budget = self._capacity.memory_mb
+        if budget is not None and self._memory_used + memory > budget * MEMORY_HEADROOM:
+            return False
+        # Running gates' real usage is already out of the live figure.
+        live = self._sample_memory() if self._sample_memory is not None else None
+        if live is not None and memory > live * MEMORY_HEADROOM:
+            return False
+        return True
+
+    def try_acquire(self, name: str, profile: ResourceProfile) -> bool:
+        """Reserve resources for *name* if they fit right now."""
+        cores, memory = self.claim_for(profile)
+        with self._lock:
+            if name in self._claims:
+                return True
+            if not self._fits(cores, memory):
+                return False
+            self._claims[name] = (cores, memory)
+            self._cores_used += cores
+            self._memory_used += memory
+            return True
+
+    def release(self, name: str) -> None:
+        """Return *name*'s reservation to the pool (no-op if none)."""
+        with self._lock:
+            claim = self._claims.pop(name, None)
+            if claim is None:
+                return
+            self._cores_used -= claim[0]
+            self._memory_used -= claim[1]
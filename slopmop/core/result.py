@@ -9,6 +9,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Callable, Dict, List, Optional, cast
 
+from slopmop.core.git_context import GitContext
+
 
 class CheckStatus(Enum):
     """Status of a quality gate check."""
@@ -19,6 +21,7 @@ class CheckStatus(Enum):
     SKIPPED = "skipped"
     NOT_APPLICABLE = "not_applicable"
     ERROR = "error"
+    TIMEOUT = "timeout"  # Overran its adaptive deadline; processes terminated
 
     def __str__(self) -> str:
         return self.value
@@ -40,6 +43,7 @@ class SkipReason(Enum):
     DISABLED = "off"  # Turned off in .sb_config.json
     TIME_BUDGET = "time"  # Would exceed --swabbing-timeout budget
     SUPERSEDED = "sup"  # Replaced by a more thorough check in this run
+    CANCELLED = "kill"  # In flight at fail-fast; its processes were terminated
 
     def __str__(self) -> str:
         return self.value
@@ -230,6 +234,37 @@ class Finding:
             d["fix_strategy"] = self.fix_strategy
         return d
 
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Finding":
+        """Deserialize from a plain dict (inverse of to_dict)."""
+        level = FindingLevel.ERROR
+        raw_level: object = d.get("level")
+        if isinstance(raw_level, str):
+            try:
+                level = FindingLevel(raw_level)
+            except ValueError:
+                pass
+
+        def _int(key: str) -> Optional[int]:
+            value = d.get(key)
+            return int(value) if isinstance(value, (int, float)) else None
+
+        def _str(key: str) -> Optional[str]:
+            value = d.get(key)
+            return str(value) if value is not None else None
+
+        return cls(
+            message=str(d.get("message", "")),
+            level=level,
+            file=_str("file"),
+            line=_int("line"),
+            column=_int("column"),
+            end_line=_int("end_line"),
+            end_column=_int("end_column"),
+            rule_id=_str("rule_id"),
+            fix_strategy=_str("fix_strategy"),
+        )
+
 
 @dataclass
 class CheckResult:
@@ -321,46 +356,7 @@ class CheckResult:
             findings_list = cast(List[object], raw_findings)
             for fd_raw in findings_list:
                 if isinstance(fd_raw, dict):
-                    fd: Dict[str, Any] = cast(Dict[str, Any], fd_raw)
-                    level = FindingLevel.ERROR
-                    raw_level: object = fd.get("level")
-                    if isinstance(raw_level, str):
-                        try:
-                            level = FindingLevel(raw_level)
-                        except ValueError:
-                            pass
-                    _file = fd.get("file")
-                    _line = fd.get("line")
-                    _col = fd.get("column")
-                    _end_line = fd.get("end_line")
-                    _end_col = fd.get("end_column")
-                    _rule = fd.get("rule_id")
-                    _fix = fd.get("fix_strategy")
-                    findings.append(
-                        Finding(
-                            message=str(fd.get("message", "")),
-                            level=level,
-                            file=str(_file) if _file is not None else None,
-                            line=(
-                                int(_line) if isinstance(_line, (int, float)) else None
-                            ),
-                            column=(
-                                int(_col) if isinstance(_col, (int, float)) else None
-                            ),
-                            end_line=(
-                                int(_end_line)
-                                if isinstance(_end_line, (int, float))
-                                else None
-                            ),
-                            end_column=(
-                                int(_end_col)
-                                if isinstance(_end_col, (int, float))
-                                else None
-                            ),
-                            rule_id=str(_rule) if _rule is not None else None,
-                            fix_strategy=str(_fix) if _fix is not None else None,
-                        )
-                    )
+                    findings.append(Finding.from_dict(cast(Dict[str, Any], fd_raw)))
 
         scope = None
         raw_scope = d.get("scope")
@@ -428,6 +424,7 @@ class CheckResult:
             CheckStatus.SKIPPED: "⏭️",
             CheckStatus.NOT_APPLICABLE: "⊘",
             CheckStatus.ERROR: "💥",
+            CheckStatus.TIMEOUT: "⏰",
         }.get(self.status, "❓")
         return f"{emoji} {self.name}: {self.status.value} ({self.duration:.2f}s)"
 
@@ -471,6 +468,7 @@ class ExecutionSummary:
         errors: Number of checks that had errors
         total_duration: Total execution time in seconds
         results: List of individual check results
+        timed_out: Number of checks stopped at their deadline
     """
 
     total_checks: int
@@ -484,11 +482,16 @@ class ExecutionSummary:
     results: List[CheckResult] = field(
         default_factory=lambda: cast(List[CheckResult], [])
     )
+    timed_out: int = 0
+    # Result-cache hits/misses/evictions for the run (set by the executor).
+    cache_stats: Optional[Dict[str, int]] = None
+    # The run's git metadata, resolved once (set by the executor).
+    git: Optional[GitContext] = None
 
     @property
     def all_passed(self) -> bool:
-        """Return True if all checks passed (no failures or errors)."""
-        return self.failed == 0 and self.errors == 0
+        """Return True if all checks passed (no failures, errors or timeouts)."""
+        return self.failed == 0 and self.errors == 0 and self.timed_out == 0
 
     def scope_by_category(self) -> Dict[str, ScopeInfo]:
         """Aggregate scope info by category, taking max per category.
@@ -571,6 +574,8 @@ class ExecutionSummary:
             "all_passed": self.all_passed,
             "total_duration": round(self.total_duration, 3),
         }
+        if self.timed_out:
+            summary["timed_out"] = self.timed_out
         if scope:
             summary["scope"] = scope.to_dict()
         if skip_reasons:
@@ -590,6 +595,7 @@ class ExecutionSummary:
                 CheckStatus.FAILED,
                 CheckStatus.WARNED,
                 CheckStatus.ERROR,
+                CheckStatus.TIMEOUT,
             )
         ]
 
@@ -617,4 +623,5 @@ class ExecutionSummary:
             errors=sum(1 for r in results if r.status == CheckStatus.ERROR),
             total_duration=duration,
             results=results,
+            timed_out=sum(1 for r in results if r.status == CheckStatus.TIMEOUT),
         )
@@ -0,0 +1,332 @@
+"""Critical-path ordering for the check executor.
+
+Sorting only the currently ready gates longest-first ignores what each gate
+unlocks: ``sloppy-formatting.py`` is quick, but mypy and pytest cannot start
+until it finishes, so starting it late pushes the whole tail of the run out.
+The classic list-scheduling fix is to dispatch by *critical-path length* —
+a gate's own expected duration plus the longest chain of dependents hanging
+off it — which keeps the makespan close to the true lower bound.
+
+Under ``--swabbing-timeout`` the executor also has to decide which timed
+gates still fit the remaining budget; :func:`pack_budget` does that in
+bounded time on every scheduler iteration.
+"""
+
+import bisect
+import heapq
+import itertools
+import logging
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def invert_dependency_graph(
+    dep_graph: Mapping[str, Set[str]],
+) -> Dict[str, Set[str]]:
+    """Turn a ``name → dependencies`` map into ``name → dependents``.
+
+    Dependencies outside the graph are ignored; every graph node gets an
+    entry (possibly empty).
+    """
+    dependents: Dict[str, Set[str]] = {name: set() for name in dep_graph}
+    for name, deps in dep_graph.items():
+        for dep in deps:
+            if dep in dependents:
+                dependents[dep].add(name)
+    return dependents
+
+
+def critical_path_lengths(
+    dep_graph: Mapping[str, Set[str]],
+    timings: Mapping[str, float],
+    default_duration: Optional[float] = None,
+) -> Dict[str, float]:
+    """Compute each gate's critical-path length in seconds.
+
+    ``length(g) = duration(g) + max(length(d) for d in dependents(g))``
+
+    Args:
+        dep_graph: Mapping of gate name to the names it depends on (as built
+            by ``CheckExecutor._build_dependency_graph``).
+        timings: Historical expected duration per gate (seconds).
+        default_duration: Duration assumed for gates with no history.
+            Defaults to the median of the known timings, or 0.0 when there
+            is no history at all, so an untimed gate that unlocks a long
+            chain still ranks by that chain.
+
+    Returns:
+        Mapping of gate name to critical-path length.  A dependency cycle
+        (which the executor would never schedule anyway) is cut at the
+        back-edge rather than recursing forever.
+    """
+    if default_duration is None:
+        known = sorted(timings[name] for name in dep_graph if name in timings)
+        default_duration = known[len(known) // 2] if known else 0.0
+
+    dependents = invert_dependency_graph(dep_graph)
+    lengths: Dict[str, float] = {}
+    visiting: Set[str] = set()
+
+    for root in dep_graph:
+        if root in lengths:
+            continue
+        # Iterative post-order DFS: the graph is small, but terminal gates
+        # depend on everything, so chains can be as deep as the gate count.
+        stack: List[tuple[str, bool]] = [(root, False)]
+        while stack:
+            name, expanded = stack.pop()
+            if expanded:
+                visiting.discard(name)
+                tail = max(
+                    (lengths.get(d, 0.0) for d in dependents[name]),
+                    default=0.0,
+                )
+                lengths[name] = timings.get(name, default_duration) + tail
+                continue
+            if name in lengths or name in visiting:
+                continue
+            visiting.add(name)
+            stack.append((name, True))
+            for dependent in dependents[name]:
+                if dependent not in lengths and dependent not in visiting:
+                    stack.append((dependent, False))
+                elif dependent in visiting:
+                    logger.debug(
+                        f"Dependency cycle through {name} → {dependent}; "
+                        "ignoring back-edge for critical-path ordering"
+                    )
+
+    return lengths
+
+
+def order_by_critical_path(
+    names: Iterable[str],
+    lengths: Mapping[str, float],
+    timings: Mapping[str, float],
+) -> List[str]:
+    """Return *names* sorted longest critical path first.
+
+    Ties fall back to the gate's own duration (longest first); the sort is
+    stable, so gates that still tie keep their incoming order.
+    """
+    return sorted(
+        names,
+        key=lambda n: (-lengths.get(n, 0.0), -timings.get(n, 0.0)),
+    )
+
+
+# Budget grid for pack_budget: durations are rounded down to budget/256.
+PACKING_RESOLUTION = 256
+# Near-budget totals pack_budget verifies before settling for a safe one.
+_PACKING_TRIES = 4
+
+
+def pack_budget(
+    candidates: Iterable[str],
+    timings: Mapping[str, float],
+    budget: float,
+    max_items: int,
+    resolution: int = PACKING_RESOLUTION,
+) -> List[str]:
+    """Choose the gates to start so they best fill *budget* seconds.
+
+    Objective (lexicographic), at most *max_items* gates:
+
+    1. Maximize the number of gates — exact: the *k* shortest gates are a
+       maximum-count packing, so *k* is found by a single sorted scan.
+    2. Maximize their total expected duration — a dynamic program over
+       durations rounded down to a grid of ``budget / resolution`` steps
+       (see :func:`_pack_exact_count`).  Rounding down keeps every real
+       packing representable; each pick is checked against the real
+       budget.  Whenever the best packing leaves *k* grid steps of slack
+       the result is within ``k * budget / resolution`` of it, and a final
+       exchange pass swaps picks for longer gates while they still fit.
+
+    Only gates that fit alongside the *k - 1* shortest others can be part
+    of any *k*-gate packing, so the DP sees that prefix of the candidates.
+    Each DP step is a constant number of big-integer operations, so
+    packing costs ``O(n)`` word-parallel steps however many subsets exist
+    — not the ``O(2^n)`` of a search.
+
+    Returns:
+        The chosen gates, longest first (ties keep incoming order).
+    """
+    if max_items <= 0 or budget <= 0:
+        return []
+    by_duration = sorted(candidates, key=lambda n: timings.get(n, 0.0))
+    durations = [max(0.0, timings.get(n, 0.0)) for n in by_duration]
+
+    k = 0
+    total = 0.0
+    for duration in durations:
+        if k == max_items or total + duration > budget:
+            break
+        total += duration
+        k += 1
+    if k == 0:
+        return []
+
+    picked = list(range(k))  # the k shortest: always a valid packing
+    room = budget - sum(durations[: k - 1])
+    usable = [i for i, duration in enumerate(durations) if duration <= room]
+    chosen = _pack_exact_count([durations[i] for i in usable], k, budget, resolution)
+    if chosen is not None and sum(durations[usable[i]] for i in chosen) > total:
+        picked = [usable[i] for i in chosen]
+    picked = _upgrade(picked, durations, budget)
+    names = [by_duration[i] for i in sorted(picked)]
+    return sorted(names, key=lambda n: timings.get(n, 0.0), reverse=True)
+
+
+def _upgrade(picked: List[int], durations: List[float], budget: float) -> List[int]:
+    """Swap picks for longer gates while the real budget still allows.
+
+    *durations* is sorted ascending.  Each pick, shortest first, is
+    replaced by the longest unpicked gate the remaining slack admits.
+    """
+    taken = set(picked)
+    slack = budget - sum(durations[i] for i in picked)
+    for i in sorted(picked):
+        j = bisect.bisect_right(durations, durations[i] + slack) - 1
+        while j > i and j in taken:
+            j -= 1
+        if j > i and durations[j] > durations[i]:
+            taken.discard(i)
+            taken.add(j)
+            slack -= durations[j] - durations[i]
+    return sorted(taken)
+
+
+def _pack_exact_count(
+    durations: List[float], k: int, budget: float, resolution: int
+) -> Optional[List[int]]:
+    """Indices of *k* durations filling *budget* best, on a rounded grid.
+
+    The DP state is a single integer bitset: bit ``c * stride + s`` is set
+    when some *c* of the gates seen so far have rounded-down total *s*
+    grid steps.  Adding a gate of weight *w* is one shift by
+    ``stride + w`` (one more gate, *w* more steps) masked back to totals
+    within the budget.  Reachable *k*-gate totals are then tried from the
+    top, verifying each reconstructed pick against the real durations.
+    A total at least *k* steps under the budget always verifies, so after
+    a few misses the search jumps straight to the best such total.
+    Returns ``None`` when nothing fits.
+    """
+    step = budget / resolution
+    weights = [int(d / step) for d in durations]
+    # Wide enough that a shifted total can't spill into the next band.
+    stride = resolution + max(weights, default=0) + 1
+    band = (1 << (resolution + 1)) - 1
+    mask = 0
+    for c in range(k + 1):
+        mask |= band << (c * stride)
+    reach = 1
+    history: List[int] = []
+    for w in weights:
+        history.append(reach)
+        reach |= (reach << (stride + w)) & mask
+
+    totals = (reach >> (k * stride)) & band
+    tries = 0
+    while totals:
+        if tries == _PACKING_TRIES:
+            # Totals k or more steps under the budget always verify.
+            totals &= (1 << max(0, resolution - k + 1)) - 1
+            if not totals:
+                break
+        tries += 1
+        target = totals.bit_length() - 1
+        totals ^= 1 << target
+        chosen: List[int] = []
+        c, remaining = k, target
+        for i in range(len(weights) - 1, -1, -1):
+            if c == 0:
+                break
+            if (history[i] >> (c * stride + remaining)) & 1:
+                continue  # reachable without gate i
+            chosen.append(i)
+            remaining -= weights[i]
+            c -= 1
+        if sum(durations[i] for i in chosen) <= budget:
+            return chosen
+    return None
+
+
+class ReadyQueue:
+    """Indegree-counting ready queue over the gate dependency graph.
+
+    Rescanning every pending gate on every scheduler iteration is
+    quadratic in the gate count — noticeable with a hundred custom gates.
+    Instead each gate carries a count of dependencies still without a
+    result; :meth:`observe` walks only results that are *new* since the
+    last call, decrements their dependents, and pushes any that reach zero
+    onto a heap ordered by critical-path length (then own duration, then
+    graph order).
+
+    The queue only says *when* a gate's dependencies have all resolved;
+    whether they passed is still the executor's call.
+    """
+
+    def __init__(
+        self,
+        dep_graph: Mapping[str, Set[str]],
+        lengths: Optional[Mapping[str, float]] = None,
+        timings: Optional[Mapping[str, float]] = None,
+    ):
+        self._lengths = lengths or {}
+        self._timings = timings or {}
+        self._order = {name: i for i, name in enumerate(dep_graph)}
+        self._dependents: Dict[str, List[str]] = {}
+        self._waiting: Dict[str, int] = {}
+        for name, deps in dep_graph.items():
+            self._waiting[name] = len(deps)
+            for dep in deps:
+                self._dependents.setdefault(dep, []).append(name)
+        self._resolved: Set[str] = set()
+        self._observed = 0
+        self._heap: List[Tuple[Tuple[float, float, int], str]] = []
+        for name, waiting in self._waiting.items():
+            if waiting == 0:
+                self._push(name)
+
+    def _push(self, name: str) -> None:
+        key = (
+            -self._lengths.get(name, 0.0),
+            -self._timings.get(name, 0.0),
+            self._order.get(name, len(self._order)),
+        )
+        heapq.heappush(self._heap, (key, name))
+
+    def observe(self, results: Mapping[str, Any]) -> None:
+        """Account for results added to *results* since the last call.
+
+        *results* must only ever grow (insertion-ordered, never deleted),
+        which holds for both of the executor's dependency-result views.
+        """
+        if len(results) == self._observed:
+            return
+        for name in itertools.islice(results, self._observed, None):
+            if name in self._resolved:
+                continue
+            self._resolved.add(name)
+            for dependent in self._dependents.get(name, ()):
+                self._waiting[dependent] -= 1
+                if self._waiting[dependent] == 0:
+                    self._push(dependent)
+        self._observed = len(results)
+
+    def pop_ready(self, pending: Set[str]) -> List[str]:
+        """Drain every queued gate that is still pending, best first."""
+        ready: List[str] = []
+        seen: Set[str] = set()
+        while self._heap:
+            _, name = heapq.heappop(self._heap)
+            if name in pending and name not in seen:
+                seen.add(name)
+                ready.append(name)
+        return ready
+
+    def requeue(self, names: Iterable[str]) -> None:
+        """Put ready gates back (not submitted this round, or re-run)."""
+        for name in names:
+            self._push(name)
@@ -0,0 +1,213 @@
+"""Content-addressed result cache shared across machines and worktrees.
+
+CI and every developer run the same gates on the same commits.  The
+local store (:mod:`slopmop.core.cache_store`) only helps the machine
+that computed a result; a shared backend lets a developer who pulls a
+commit CI already scoured reuse CI's results for every untouched scope.
+
+Entries are addressed by :func:`shared_key` — a hash of the gate name,
+its cache fingerprint (the scoped input hash from ``cache_inputs``,
+which already folds in the gate's config) and the slop-mop version —
+so identical inputs on any machine land on the same key.
+
+Trust model: the key makes an entry *findable*, not *authentic*.  A
+verdict read from the shared backend is accepted as stored, so anyone
+who can write to the directory or the HTTP store can turn a failing
+gate into PASSED for every consumer.  Only point slop-mop at a store
+whose writers you trust as much as CI itself — in practice, one only CI
+can write to.  To keep that the default:
+
+* :class:`HttpBackend` is read-only unless writes are enabled
+  explicitly (``"read_only": false`` or ``SLOPMOP_SHARED_CACHE_WRITE=1``)
+  *and* a bearer token is set (``SLOPMOP_SHARED_CACHE_TOKEN``), so the
+  server can authenticate every publisher;
+* :class:`DirectoryBackend` is exactly as trustworthy as the directory's
+  permissions — keep it writable by CI only and mount it read-only (or
+  set ``"read_only": true``) everywhere else.
+
+Configure with ``"shared_cache"`` in ``.sb_config.json`` (a path or
+``http(s)://`` URL, or ``{"location": ..., "read_only": ...}``) or the
+``SLOPMOP_SHARED_CACHE`` environment variable, which takes precedence.
+A shared cache is an accelerator only: every failure reads as a miss.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import urllib.error
+import urllib.parse
+import urllib.request
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional, cast
+
+from slopmop._version import __version__
+from slopmop.utils.state_files import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+SHARED_CACHE_ENV = "SLOPMOP_SHARED_CACHE"
+SHARED_CACHE_TOKEN_ENV = "SLOPMOP_SHARED_CACHE_TOKEN"
+SHARED_CACHE_WRITE_ENV = "SLOPMOP_SHARED_CACHE_WRITE"
+SHARED_KEY_VERSION = 1
+HTTP_TIMEOUT = 5.0
+
+
+def shared_key(gate: str, fingerprint: str) -> str:
+    """Content address of *gate*'s result for inputs hashing to *fingerprint*."""
+    blob = json.dumps([SHARED_KEY_VERSION, __version__, gate, fingerprint])
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+class SharedCacheBackend(ABC):
+    """Blob storage addressed by :func:`shared_key`.
+
+    Args:
+        read_only: Never publish results (e.g. developers reading a
+            cache only CI writes).
+    """
+
+    def __init__(self, read_only: bool = False):
+        self.read_only = read_only
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """The blob stored under *key*, or ``None``."""
+
+    @abstractmethod
+    def put(self, key: str, blob: bytes) -> None:
+        """Store *blob* under *key* (failures are logged, not raised)."""
+
+
+class DirectoryBackend(SharedCacheBackend):
+    """Blobs as files under *root*, fanned out by key prefix."""
+
+    def __init__(self, root: Path, read_only: bool = False):
+        super().__init__(read_only)
+        self.root = root
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / key
+
+    def get(self, key: str) -> Optional[bytes]:
+        try:
+            return self._path(key).read_bytes()
+        except OSError:
+            return None
+
+    def put(self, key: str, blob: bytes) -> None:
+        path = self._path(key)
+        try:
+            atomic_write_bytes(path, blob)
+        except OSError as e:
+            logger.debug(f"Shared cache write to {path} failed: {e}")
+
+
+class HttpBackend(SharedCacheBackend):
+    """``GET``/``PUT {url}/{key}`` against an HTTP blob server.
+
+    The first connection failure disables the backend for the rest of
+    the process, so an unreachable server costs one timeout, not one
+    per gate.
+
+    Read-only by default.  Publishing needs ``read_only=False`` and a
+    *token*: unauthenticated writes would let anyone who can reach the
+    server rewrite every consumer's verdicts.
+
+    Args:
+        url: Base URL (``http`` or ``https``).
+        token: Sent as ``Authorization: Bearer <token>`` when set.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        token: Optional[str] = None,
+        read_only: bool = True,
+        timeout: float = HTTP_TIMEOUT,
+    ):
+        if not read_only and not token:
+            logger.warning(
+                f"Shared cache {url}: writes need {SHARED_CACHE_TOKEN_ENV}; "
+                "reading only"
+            )
+            read_only = True
+        super().__init__(read_only)
+        if urllib.parse.urlparse(url).scheme not in ("http", "https"):
+            raise ValueError(f"Shared cache URL must be http(s): {url}")
+        self.url = url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self._down = False
+
+    def _request(self, key: str, method: str, blob: Optional[bytes] = None) -> bytes:
+        request = urllib.request.Request(f"{self.url}/{key}", data=blob, method=method)
+        if blob is not None:
+            request.add_header("Content-Type", "application/octet-stream")
+        if self.token:
+            request.add_header("Authorization", f"Bearer {self.token}")
+        with urllib.request.urlopen(  # nosec B310 - scheme checked in __init__
+            request, timeout=self.timeout
+        ) as response:
+            return cast(bytes, response.read())
+
+    def get(self, key: str) -> Optional[bytes]:
+        if self._down:
+            return None
+        try:
+            return self._request(key, "GET")
+        except urllib.error.HTTPError as e:
+            if e.code != 404:
+                logger.debug(f"Shared cache GET {key} failed: HTTP {e.code}")
+            return None
+        except (urllib.error.URLError, OSError) as e:
+            self._down = True
+            logger.debug(f"Shared cache unreachable, disabling: {e}")
+            return None
+
+    def put(self, key: str, blob: bytes) -> None:
+        if self._down:
+            return
+        try:
+            self._request(key, "PUT", blob)
+        except urllib.error.HTTPError as e:
+            logger.debug(f"Shared cache PUT {key} failed: HTTP {e.code}")
+        except (urllib.error.URLError, OSError) as e:
+            self._down = True
+            logger.debug(f"Shared cache unreachable, disabling: {e}")
+
+
+def shared_cache_backend(
+    project_root: str, config: Optional[Dict[str, Any]] = None
+) -> Optional[SharedCacheBackend]:
+    """Build the configured shared backend, or ``None`` if there is none.
+
+    Args:
+        project_root: Relative directory locations resolve against it.
+        config: The loaded ``.sb_config.json``.
+    """
+    raw: object = (config or {}).get("shared_cache")
+    read_only: Optional[bool] = None
+    location: object = raw
+    if isinstance(raw, dict):
+        raw_d = cast(Dict[str, object], raw)
+        location = raw_d.get("location")
+        if "read_only" in raw_d:
+            read_only = bool(raw_d["read_only"])
+    if os.environ.get(SHARED_CACHE_WRITE_ENV, "").strip().lower() in ("1", "true"):
+        read_only = False
+    location = os.environ.get(SHARED_CACHE_ENV) or location
+    if not isinstance(location, str) or not location.strip():
+        return None
+    location = location.strip()
+    if location.startswith(("http://", "https://")):
+        return HttpBackend(
+            location,
+            token=os.environ.get(SHARED_CACHE_TOKEN_ENV),
+            read_only=True if read_only is None else read_only,
+        )
+    path = Path(location).expanduser()
+    if not path.is_absolute():
+        path = Path(project_root) / path
+    return DirectoryBackend(path, read_only=bool(read_only))
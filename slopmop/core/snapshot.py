@@ -0,0 +1,332 @@
+"""One walk of the project per run, shared by every gate.
+
+Without this, a single scour walks the tree over and over: once for the
+cache fingerprint, once per gate input scope (each gate's
+``input_scope``), once per ``count_source_scope`` (each gate's
+``measure_scope``), once per gate that walks for its own files, plus a
+``git ls-files`` per ``git_project_files`` call.  A
+:class:`ProjectSnapshot` walks once, lazily, and answers all of those:
+
+* the pruned file list, bucketed by extension;
+* content hashes, from git's index for clean tracked files
+  (:mod:`slopmop.core.git_index`) and the stat-keyed
+  :mod:`slopmop.core.file_index` for the rest;
+* memoized per-scope file hashes, line counts and ``git ls-files`` output
+  (plus values other modules memoize via :meth:`ProjectSnapshot.memoize`).
+
+The executor builds a snapshot per run and activates it with
+:func:`use_snapshot`; helpers look it up with :func:`active_snapshot` and
+fall back to walking when none is active (direct calls, tests, gates on
+the process-pool lane).  Anything that may have changed the tree — an
+auto-fix — calls :meth:`ProjectSnapshot.invalidate`, after which the
+next query walks again.
+
+The walk prunes what every walker in the tree already prunes: dot
+directories (except ``.github``, which the fingerprint covers), the
+common build/vendor directories in :data:`PRUNED_DIRS`, and
+``*.egg-info``.  Callers with stricter rules filter the listing further
+via :meth:`ProjectSnapshot.files`.
+"""
+
+import contextlib
+import os
+import subprocess
+import threading
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    cast,
+)
+
+from slopmop.core.file_index import content_hashes, get_file_index
+from slopmop.core.git_index import git_blob_ids
+from slopmop.core.line_count import line_count
+from slopmop.utils import is_path_excluded
+
+T = TypeVar("T")
+
+# Same names as ``checks.base.SCOPE_EXCLUDED_DIRS`` and the cache's
+# fingerprint exclusions (kept in step by a unit test).
+PRUNED_DIRS: FrozenSet[str] = frozenset(
+    {
+        "node_modules",
+        "venv",
+        "__pycache__",
+        "dist",
+        "build",
+        "htmlcov",
+        "cursor-rules",
+        "logs",
+    }
+)
+
+# Dot directories the walk keeps because some consumer reads them.
+_KEPT_DOT_DIRS: FrozenSet[str] = frozenset({".github"})
+
+
+def _pruned(name: str) -> bool:
+    return (
+        (name.startswith(".") and name not in _KEPT_DOT_DIRS)
+        or name in PRUNED_DIRS
+        or ".egg-info" in name
+    )
+
+
+def _normalize_dir(dir_name: str) -> str:
+    norm = os.path.normpath(dir_name).replace(os.sep, "/")
+    return "" if norm == "." else norm
+
+
+class ProjectSnapshot:
+    """A run's shared view of the project's files.
+
+    Thread-safe; every query is computed on first use.
+
+    Args:
+        project_root: Project to snapshot.
+    """
+
+    def __init__(self, project_root: str):
+        self.project_root = project_root
+        self._root = Path(project_root)
+        self._lock = threading.RLock()
+        self._files: Optional[List[str]] = None
+        self._memo: Dict[Tuple[object, ...], object] = {}
+        self._generation = 0
+
+    # ── Walk ─────────────────────────────────────────────────────────
+
+    def _walk(self) -> List[str]:
+        files: List[str] = []
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                entries = list(os.scandir(self._root / rel_dir))
+            except OSError:
+                continue
+            for entry in entries:
+                rel = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+                try:
+                    if entry.is_dir():
+                        # Like os.walk: symlinked directories aren't entered.
+                        if not entry.is_symlink() and not _pruned(entry.name):
+                            stack.append(rel)
+                    elif entry.is_file():
+                        files.append(rel)
+                except OSError:
+                    continue
+        files.sort()
+        return files
+
+    def all_files(self) -> List[str]:
+        """Every file the walk kept, as sorted project-relative POSIX paths."""
+        with self._lock:
+            if self._files is None:
+                self._files = self._walk()
+            return self._files
+
+    def invalidate(self) -> None:
+        """Forget everything; the next query walks the tree again."""
+        with self._lock:
+            self._files = None
+            self._memo.clear()
+            self._generation += 1
+
+    def _memoized(self, key: Tuple[object, ...], compute: Callable[[], T]) -> T:
+        with self._lock:
+            if key in self._memo:
+                return cast(T, self._memo[key])
+            generation = self._generation
+        value = compute()
+        with self._lock:
+            # Computed across an invalidate: correct for the caller, but
+            # not worth remembering.
+            if generation == self._generation:
+                self._memo.setdefault(key, value)
+        return value
+
+    def memoize(self, key: Tuple[object, ...], compute: Callable[[], T]) -> T:
+        """Remember *compute*'s value for this snapshot (until invalidated).
+
+        For derived values owned by other modules, such as the cache's
+        per-scope digests; *key* should start with a name unique to the
+        caller.
+        """
+        return self._memoized(("memo", *key), compute)
+
+    # ── Queries ──────────────────────────────────────────────────────
+
+    def covers(self, dirs: Iterable[str]) -> bool:
+        """True if the walk kept every directory in *dirs* (and its parents)."""
+        for dir_name in dirs:
+            if os.path.isabs(dir_name):
+                return False
+            norm = _normalize_dir(dir_name)
+            if norm and any(
+                part.startswith(".") or _pruned(part) for part in norm.split("/")
+            ):
+                return False
+        return True
+
+    def by_extension(self) -> Dict[str, List[str]]:
+        """Files bucketed by suffix (``".py"`` → paths; ``""`` for none)."""
+
+        def compute() -> Dict[str, List[str]]:
+            buckets: Dict[str, List[str]] = {}
+            for rel in self.all_files():
+                buckets.setdefault(os.path.splitext(rel)[1], []).append(rel)
+            return buckets
+
+        return self._memoized(("by_extension",), compute)
+
+    def has_files(self, extensions: Iterable[str]) -> bool:
+        """True if any kept file has one of *extensions*."""
+        buckets = self.by_extension()
+        return any(buckets.get(ext) for ext in extensions)
+
+    def files(
+        self,
+        dirs: Iterable[str] = (".",),
+        extensions: Optional[Iterable[str]] = None,
+        exclude: Iterable[str] = (),
+        hidden: bool = False,
+    ) -> List[str]:
+        """Files under *dirs* matching *extensions*, minus *exclude*.
+
+        Args:
+            dirs: Directories relative to the root (``"."`` for all).
+            extensions: Suffixes to keep; ``None`` keeps every file.
+            exclude: Path filters (see :func:`slopmop.utils.is_path_excluded`),
+                applied to each file and each of its parent directories.
+            hidden: Keep files under kept dot directories (``.github``).
+
+        Returns:
+            Sorted project-relative POSIX paths.
+        """
+        prefixes = tuple(sorted({_normalize_dir(d) for d in dirs}))
+        exts = None if extensions is None else tuple(sorted(set(extensions)))
+        excluded = tuple(sorted(set(exclude)))
+
+        def compute() -> List[str]:
+            candidates: Iterable[str]
+            if exts is None:
+                candidates = self.all_files()
+            else:
+                buckets = self.by_extension()
+                candidates = sorted(f for ext in exts for f in buckets.get(ext, ()))
+            dir_verdicts: Dict[str, bool] = {}
+
+            def dir_excluded(rel_dir: str) -> bool:
+                verdict = dir_verdicts.get(rel_dir)
+                if verdict is None:
+                    parent, _, name = rel_dir.rpartition("/")
+                    verdict = (
+                        (not hidden and name.startswith("."))
+                        or is_path_excluded(rel_dir, excluded)
+                        or (bool(parent) and dir_excluded(parent))
+                    )
+                    dir_verdicts[rel_dir] = verdict
+                return verdict
+
+            kept: List[str] = []
+            for rel in candidates:
+                if "" not in prefixes and not any(
+                    rel.startswith(f"{p}/") for p in prefixes
+                ):
+                    continue
+                rel_dir = rel.rpartition("/")[0]
+                if rel_dir and dir_excluded(rel_dir):
+                    continue
+                if excluded and is_path_excluded(rel, excluded):
+                    continue
+                kept.append(rel)
+            return kept
+
+        return self._memoized(("files", prefixes, exts, excluded, hidden), compute)
+
+    def blob_ids(self) -> Dict[str, str]:
+        """Git's blob IDs for clean tracked files (empty outside git).
+
+        One ``git ls-files`` per snapshot; see :mod:`slopmop.core.git_index`.
+        """
+        return self._memoized(
+            ("blob_ids",), lambda: git_blob_ids(self.project_root) or {}
+        )
+
+    def content_hash(self, rel: str) -> Optional[str]:
+        """Blob ID of a file's content (``None`` if unreadable)."""
+        known = self.blob_ids().get(rel)
+        if known is not None:
+            return known
+        return get_file_index(self.project_root).content_hash(rel, self._root / rel)
+
+    def file_hashes(self, rels: Iterable[str]) -> List[Tuple[str, str]]:
+        """``(path, content hash)`` for each readable file in *rels*."""
+        rels = tuple(rels)
+
+        return self._memoized(
+            ("hashes", rels),
+            lambda: content_hashes(self.project_root, rels, self.blob_ids()),
+        )
+
+    def line_count(self, rel: str) -> int:
+        """Newline-terminated line count of a file (0 if unreadable)."""
+
+        return self._memoized(("lines", rel), lambda: line_count(self._root / rel))
+
+    def git_files(self, timeout: int = 30) -> Optional[List[str]]:
+        """``git ls-files -co --exclude-standard`` output, or ``None``."""
+
+        def compute() -> Optional[List[str]]:
+            try:
+                result = subprocess.run(  # nosec B603 B607 - fixed argv, no shell
+                    ["git", "ls-files", "-co", "--exclude-standard", "-z"],
+                    cwd=self.project_root,
+                    capture_output=True,
+                    text=True,
+                    timeout=timeout,
+                    check=False,
+                )
+            except (OSError, subprocess.SubprocessError):
+                return None
+            if result.returncode != 0:
+                return None
+            return [entry for entry in result.stdout.split("\0") if entry]
+
+        return self._memoized(("git_files",), compute)
+
+
+_active: Dict[str, ProjectSnapshot] = {}
+_active_lock = threading.Lock()
+
+
+def active_snapshot(project_root: str) -> Optional[ProjectSnapshot]:
+    """The snapshot of the run in progress for *project_root*, if any."""
+    with _active_lock:
+        return _active.get(os.path.realpath(project_root))
+
+
+@contextlib.contextmanager
+def use_snapshot(snapshot: ProjectSnapshot) -> Iterator[ProjectSnapshot]:
+    """Make *snapshot* the active one for its project while the block runs."""
+    key = os.path.realpath(snapshot.project_root)
+    with _active_lock:
+        previous = _active.get(key)
+        _active[key] = snapshot
+    try:
+        yield snapshot
+    finally:
+        with _active_lock:
+            if previous is None:
+                _active.pop(key, None)
+            else:
+                _active[key] = previous
@@ -0,0 +1,176 @@
+"""Speculative execution of dependent gates.
+
+Gates such as ``overconfidence:untested-code.py`` declare
+``depends_on = ["laziness:sloppy-formatting.py"]`` so they never test a
+tree the formatter is about to rewrite.  In practice formatting almost
+always passes without touching a file, so the dependents sit idle for a
+whole serial stage for nothing.
+
+In speculative mode the executor starts such dependents immediately,
+against the current tree, while their dependencies are still running.
+The :class:`SpeculationTracker` remembers the project fingerprint each
+speculative run started from and holds its result until every dependency
+has a result.  Then the held result is:
+
+* **kept** — every dependency passed, none reports ``auto_fixed``, and the
+  project fingerprint is unchanged since the speculative start;
+* **skipped** — a dependency did not pass (exactly what the normal path
+  would have produced);
+* **re-run** — otherwise (a dependency rewrote files), by putting the gate
+  back in the pending set, where it is now simply ready.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+from slopmop.core.result import CheckResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Speculation:
+    """One in-flight or held speculative run."""
+
+    deps: Set[str]
+    fingerprint: str
+    result: Optional[CheckResult] = None
+
+
+def _no_results() -> Dict[str, CheckResult]:
+    """Typed default-factory (a bare ``dict`` is ``dict[Unknown, Unknown]``)."""
+    return {}
+
+
+def _no_names() -> List[str]:
+    """Typed default-factory (a bare ``list`` is ``list[Unknown]``)."""
+    return []
+
+
+@dataclass
+class SpeculationOutcome:
+    """What :meth:`SpeculationTracker.resolve` decided this round."""
+
+    accepted: Dict[str, CheckResult] = field(default_factory=_no_results)
+    failed_dependency: List[str] = field(default_factory=_no_names)
+    rerun: List[str] = field(default_factory=_no_names)
+
+
+class SpeculationTracker:
+    """Bookkeeping for speculatively started gates.  Thread-safe.
+
+    Args:
+        fingerprint_fn: Returns the current project fingerprint.  Called
+            at most once per :meth:`start` batch and once per
+            :meth:`resolve` round that has something to verify.
+    """
+
+    def __init__(self, fingerprint_fn: Callable[[], str]):
+        self._fingerprint_fn = fingerprint_fn
+        self._lock = threading.Lock()
+        self._runs: Dict[str, _Speculation] = {}
+
+    def __contains__(self, name: str) -> bool:
+        with self._lock:
+            return name in self._runs
+
+    @property
+    def has_held(self) -> bool:
+        """Whether any speculative result is waiting on its dependencies."""
+        with self._lock:
+            return any(run.result is not None for run in self._runs.values())
+
+    def candidates(
+        self,
+        pending: Set[str],
+        ready: List[str],
+        dep_graph: Mapping[str, Set[str]],
+        in_flight: Set[str],
+        dependency_results: Mapping[str, CheckResult],
+        eligible: Callable[[str], bool],
+    ) -> List[str]:
+        """Pending gates that may start before their dependencies finish.
+
+        A gate qualifies when it is not already ready, *eligible* accepts
+        it, every dependency that has a result passed, and every dependency
+        still without a result is already running (or about to be, i.e. in
+        *ready*).  Dependencies that are themselves still waiting are not
+        speculated through — one level of speculation only.
+        """
+        runnable = in_flight | set(ready)
+        chosen: List[str] = []
+        for name in sorted(pending - set(ready)):
+            deps = dep_graph.get(name, set())
+            unresolved = {d for d in deps if d not in dependency_results}
+            if not unresolved or not unresolved <= runnable:
+                continue
+            if not all(dependency_results[d].passed for d in deps - unresolved):
+                continue
+            if eligible(name):
+                chosen.append(name)
+        return chosen
+
+    def start(self, names: List[str], dep_graph: Mapping[str, Set[str]]) -> None:
+        """Record that *names* are being started speculatively now."""
+        if not names:
+            return
+        fingerprint = self._fingerprint_fn()
+        with self._lock:
+            for name in names:
+                self._runs[name] = _Speculation(
+                    deps=set(dep_graph.get(name, set())), fingerprint=fingerprint
+                )
+        logger.debug(f"Speculatively started: {', '.join(names)}")
+
+    def hold(self, name: str, result: CheckResult) -> None:
+        """Park a finished speculative result until its deps resolve."""
+        with self._lock:
+            self._runs[name].result = result
+
+    def resolve(
+        self, dependency_results: Mapping[str, CheckResult]
+    ) -> SpeculationOutcome:
+        """Settle every held result whose dependencies all have results."""
+        outcome = SpeculationOutcome()
+        with self._lock:
+            settled: List[Tuple[str, _Speculation]] = [
+                (name, run)
+                for name, run in self._runs.items()
+                if run.result is not None and run.deps <= set(dependency_results)
+            ]
+            for name, _ in settled:
+                del self._runs[name]
+        if not settled:
+            return outcome
+
+        current: Optional[str] = None
+        for name, run in settled:
+            dep_results = [dependency_results[d] for d in run.deps]
+            if not all(r.passed for r in dep_results):
+                outcome.failed_dependency.append(name)
+                continue
+            if any(r.auto_fixed for r in dep_results):
+                outcome.rerun.append(name)
+                continue
+            if current is None:
+                current = self._fingerprint_fn()
+            if current == run.fingerprint:
+                assert run.result is not None  # for type checker
+                outcome.accepted[name] = run.result
+            else:
+                outcome.rerun.append(name)
+
+        if outcome.rerun:
+            logger.debug(
+                f"Speculation discarded (tree changed): {', '.join(outcome.rerun)}"
+            )
+        return outcome
+
+    def abandon(self) -> List[str]:
+        """Forget every speculation (fail-fast) and return their names."""
+        with self._lock:
+            names = list(self._runs)
+            self._runs.clear()
+        return names
@@ -0,0 +1,191 @@
+"""One read and one regex pass per file, shared by the line-pattern gates.
+
+Some PURE gates are line scans: "does any line of this file match one
+of these regexes?"  debugger-artifacts and interactive-assumptions each
+used to read every file they cared about themselves, then try each of
+their patterns on each line.  So a file both gates care about was read
+and decoded twice, and a file with no hits was still split into lines
+and matched N times per line.
+
+Gates register a :class:`PatternSet` at import instead: the file names
+it applies to, its :class:`LineRule` patterns and the comment prefixes
+it skips.  :func:`scan_file` reads a file once and searches its whole
+buffer with a single alternation of every registered rule that applies
+to the file's name.  That is one compiled pattern per language, built on
+first use.  Only the lines a candidate match touches are split out and
+checked against each rule on its own, which applies comment skipping and
+``unless`` patterns.  Hits come back keyed by owning gate.  During a run
+the result is memoized on the project snapshot, so the second gate to
+ask about a file gets its hits without another read.
+
+Rule patterns are combined by source (their ``IGNORECASE``, ``DOTALL``
+and ``VERBOSE`` flags become scoped groups), so they must not use
+backreferences.  They are matched line by line: ``^`` and ``$`` anchor
+to the line, and a line ends at ``\\n`` or ``\\r\\n``.
+"""
+
+import functools
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, List, Mapping, Optional, Tuple
+
+from slopmop.core.snapshot import active_snapshot
+
+
+@dataclass(frozen=True)
+class LineRule:
+    """One pattern a gate looks for on each line.
+
+    Attributes:
+        rule_id: Reported with each hit.
+        pattern: A line matching this is a hit...
+        unless: ...unless it also matches this.
+    """
+
+    rule_id: str
+    pattern: re.Pattern[str]
+    unless: Optional[re.Pattern[str]] = None
+
+
+@dataclass(frozen=True)
+class PatternSet:
+    """A gate's rules for one kind of file.
+
+    Attributes:
+        owner: Name hits are reported under (normally the gate's name).
+        applies_to: Takes a file's base name; True if the rules apply.
+        rules: Rules tried on every non-comment line.
+        comment_prefixes: Lines whose stripped text starts with one of
+            these are skipped.
+    """
+
+    owner: str
+    applies_to: Callable[[str], bool]
+    rules: Tuple[LineRule, ...]
+    comment_prefixes: Tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class LineHit:
+    """A rule matching a line (1-based)."""
+
+    rule_id: str
+    line: int
+
+
+_registry: List[PatternSet] = []
+_registry_lock = threading.Lock()
+
+
+def register_patterns(*pattern_sets: PatternSet) -> None:
+    """Add *pattern_sets* to every subsequent :func:`scan_file`."""
+    with _registry_lock:
+        for pattern_set in pattern_sets:
+            if pattern_set not in _registry:
+                _registry.append(pattern_set)
+
+
+def suffix_in(
+    extensions: FrozenSet[str], ignore_case: bool = False
+) -> Callable[[str], bool]:
+    """An ``applies_to`` for files whose suffix is in *extensions*."""
+
+    def applies(name: str) -> bool:
+        dot = name.rfind(".")
+        suffix = name[dot:] if dot > 0 else ""
+        return (suffix.lower() if ignore_case else suffix) in extensions
+
+    return applies
+
+
+def scan_file(project_root: str, rel: str) -> Mapping[str, List[LineHit]]:
+    """Hits of every registered rule in *rel*, keyed by owner.
+
+    Owners with no hits are absent; an unreadable file has none.
+    Callers must not mutate the result (it is shared within a run).
+    """
+    snapshot = active_snapshot(project_root)
+    path = Path(project_root) / rel
+    if snapshot is None:
+        return _scan(path)
+    return snapshot.memoize(("text_scan", rel), lambda: _scan(path))
+
+
+def _applicable(name: str) -> Tuple[PatternSet, ...]:
+    with _registry_lock:
+        registered = tuple(_registry)
+    return tuple(s for s in registered if s.applies_to(name))
+
+
+# Flags that survive combining, as scoped inline groups.
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+
+
+@functools.lru_cache(maxsize=None)
+def _combined(pattern_sets: Tuple[PatternSet, ...]) -> re.Pattern[str]:
+    """One alternation of every rule in *pattern_sets*."""
+    parts: List[str] = []
+    for pattern_set in pattern_sets:
+        for rule in pattern_set.rules:
+            flags = "".join(
+                letter for flag, letter in _SCOPED_FLAGS if rule.pattern.flags & flag
+            )
+            parts.append(f"(?{flags}:{rule.pattern.pattern})")
+    return re.compile("|".join(parts), re.MULTILINE)
+
+
+def _scan(path: Path) -> Dict[str, List[LineHit]]:
+    pattern_sets = _applicable(path.name)
+    if not pattern_sets:
+        return {}
+    try:
+        text = path.read_bytes().decode("utf-8", "replace")
+    except OSError:
+        return {}
+    if "\r" in text:
+        # So ``$`` sees CRLF line ends the way a per-line match would.
+        text = text.replace("\r\n", "\n")
+    combined = _combined(pattern_sets)
+    hits: Dict[str, List[LineHit]] = {}
+    lineno, counted, pos = 1, 0, 0
+    while True:
+        match = combined.search(text, pos)
+        if match is None:
+            break
+        # A candidate can span lines (``\s`` matches newlines in the
+        # buffer), so check every line it touches, then resume after them.
+        start = text.rfind("\n", 0, match.start()) + 1
+        end = text.find("\n", max(match.end() - 1, match.start()))
+        if end < 0:
+            end = len(text)
+        lineno += text.count("\n", counted, start)
+        counted = start
+        for offset, line in enumerate(text[start:end].split("\n")):
+            _match_line(line, lineno + offset, pattern_sets, hits)
+        pos = end + 1
+        if pos > len(text):
+            break
+    return hits
+
+
+def _match_line(
+    line: str,
+    lineno: int,
+    pattern_sets: Tuple[PatternSet, ...],
+    hits: Dict[str, List[LineHit]],
+) -> None:
+    stripped = line.lstrip()
+    for pattern_set in pattern_sets:
+        if pattern_set.comment_prefixes and stripped.startswith(
+            pattern_set.comment_prefixes
+        ):
+            continue
+        for rule in pattern_set.rules:
+            if rule.pattern.search(line) and not (
+                rule.unless is not None and rule.unless.search(line)
+            ):
+                hits.setdefault(pattern_set.owner, []).append(
+                    LineHit(rule.rule_id, lineno)
+                )
@@ -0,0 +1,217 @@
+"""Identity of the external tools a gate's result depends on.
+
+A cache fingerprint covers a gate's input files and config, but black,
+pyright or semgrep upgrading underneath a project changes results just
+as surely as editing a file.  :func:`describe_tools` lists everything
+a gate shells out to — the interpreter slop-mop runs on, each resolved
+tool and its version, the packages installed in a project venv — and
+:func:`with_tool_identity` folds its digest into the fingerprint, so a tool
+change invalidates exactly the gates that use the tool.
+
+Versions are probed once (``<tool> --version``) and memoized by the
+executable's stat in ``.slopmop/tool_versions.json``, so a warm run pays
+one ``stat`` per tool, not one subprocess.
+
+The identity is deliberately machine-independent: tools inside the
+project are named by their project-relative path, tools outside it by
+name and version only.  Two machines with the same tool versions
+produce the same keys, which keeps the shared cache
+(:mod:`slopmop.core.shared_cache`) useful across CI and laptops.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import subprocess  # nosec B404 - fixed argv version probes only
+import sys
+import threading
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, cast
+
+from slopmop.checks.timeouts import PROBE_TIMEOUT
+from slopmop.core.file_index import INDEX_DIR
+from slopmop.utils.state_files import atomic_write_text, load_versioned_json
+
+logger = logging.getLogger(__name__)
+
+VERSIONS_FILE = "tool_versions.json"
+VERSIONS_VERSION = 1
+
+_lock = threading.Lock()
+# realpath -> (size, mtime_ns, version); shared by every gate in a process.
+_memo: Dict[str, Tuple[int, int, str]] = {}
+
+
+def interpreter_identity() -> str:
+    """The Python implementation and version slop-mop is running on."""
+    return f"{sys.implementation.name}-{platform.python_version()}"
+
+
+def tool_version(path: str, project_root: str) -> str:
+    """First line of ``<path> --version``, memoized by the file's stat.
+
+    Returns ``"unknown"`` when the probe fails; the tool's stat still
+    keys the memo, so a broken tool isn't re-probed every run.
+    """
+    real = os.path.realpath(path)
+    try:
+        st = os.stat(real)
+    except OSError:
+        return "missing"
+    stat_key = (st.st_size, st.st_mtime_ns)
+    with _lock:
+        if real not in _memo:
+            _memo.update(_load(project_root))
+        known = _memo.get(real)
+        if known is not None and known[:2] == stat_key:
+            return known[2]
+    version = _probe(path)
+    with _lock:
+        _memo[real] = (*stat_key, version)
+        _save(project_root)
+    return version
+
+
+def _probe(path: str) -> str:
+    try:
+        proc = subprocess.run(  # nosec B603 - fixed argv, no shell
+            [path, "--version"],
+            capture_output=True,
+            text=True,
+            timeout=PROBE_TIMEOUT,
+            stdin=subprocess.DEVNULL,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Version probe of {path} failed: {e}")
+        return "unknown"
+    for line in (proc.stdout + "\n" + proc.stderr).splitlines():
+        if line.strip():
+            return line.strip()
+    return "unknown"
+
+
+def _versions_path(project_root: str) -> Path:
+    return Path(project_root) / INDEX_DIR / VERSIONS_FILE
+
+
+def _load(project_root: str) -> Dict[str, Tuple[int, int, str]]:
+    data = load_versioned_json(_versions_path(project_root), VERSIONS_VERSION)
+    tools = data.get("tools") if data is not None else None
+    if not isinstance(tools, dict):
+        return {}
+    loaded: Dict[str, Tuple[int, int, str]] = {}
+    for real, entry in cast(Dict[str, object], tools).items():
+        if isinstance(entry, list) and len(cast(List[object], entry)) == 3:
+            size, mtime, version = cast(List[object], entry)
+            if isinstance(size, int) and isinstance(mtime, int):
+                loaded[real] = (size, mtime, str(version))
+    return loaded
+
+
+def _save(project_root: str) -> None:
+    path = _versions_path(project_root)
+    data: Dict[str, object] = {
+        "version": VERSIONS_VERSION,
+        "tools": {real: list(entry) for real, entry in sorted(_memo.items())},
+    }
+    try:
+        atomic_write_text(path, json.dumps(data, indent=2))
+    except OSError as e:
+        logger.debug(f"Failed to save tool versions: {e}")
+
+
+def package_version(name: str) -> str:
+    """Installed version of distribution *name* in slop-mop's environment."""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "missing"
+
+
+def venv_packages(python_path: str) -> List[str]:
+    """Installed distributions of the venv owning *python_path*, sorted.
+
+    Empty when *python_path* isn't a venv interpreter; listing
+    ``*.dist-info`` names is one directory read, not an interpreter launch.
+    """
+    venv = Path(python_path).parent.parent
+    if not (venv / "pyvenv.cfg").is_file():
+        return []
+    found: List[str] = []
+    for site in [*venv.glob("lib/python*/site-packages"), venv / "Lib/site-packages"]:
+        try:
+            found.extend(
+                entry.name
+                for entry in os.scandir(site)
+                if entry.name.endswith((".dist-info", ".egg-info"))
+            )
+        except OSError:
+            continue
+    return sorted(found)
+
+
+def _display_path(path: str, project_root: str) -> str:
+    """*path* relative to the project, or ``<external>`` outside it."""
+    try:
+        rel = Path(os.path.abspath(path)).relative_to(os.path.abspath(project_root))
+    except ValueError:
+        return "<external>"
+    return rel.as_posix()
+
+
+def describe_tools(
+    project_root: str,
+    tools: Mapping[str, Optional[str]],
+    packages: Iterable[str] = (),
+    project_python: Optional[str] = None,
+) -> List[object]:
+    """Describe the environment a gate's result depends on.
+
+    Args:
+        project_root: Resolves project-local tool paths and the version memo.
+        tools: Tool name -> resolved executable (``None`` when missing).
+        packages: Distributions the gate imports in-process.
+        project_python: The project interpreter, for gates that run
+            inside the project's environment.
+
+    Returns:
+        JSON-able parts, one per tool; :func:`tool_identity` hashes them.
+    """
+    parts: List[object] = [interpreter_identity()]
+    for name, path in sorted(tools.items()):
+        if path is None:
+            parts.append([name, None])
+        else:
+            parts.append(
+                [
+                    name,
+                    _display_path(path, project_root),
+                    tool_version(path, project_root),
+                ]
+            )
+    for name in sorted(packages):
+        parts.append([name, package_version(name)])
+    if project_python is not None:
+        parts.append(
+            [
+                "project-python",
+                _display_path(project_python, project_root),
+                tool_version(project_python, project_root),
+                venv_packages(project_python),
+            ]
+        )
+    return parts
+
+
+def tool_identity(parts: List[object]) -> str:
+    """Stable digest of :func:`describe_tools` output."""
+    blob = json.dumps(parts, separators=(",", ":"))
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+def with_tool_identity(fingerprint: str, identity: str) -> str:
+    """Fold a gate's :func:`tool_identity` into its input *fingerprint*."""
+    return hashlib.sha256(f"{fingerprint}\0{identity}".encode()).hexdigest()
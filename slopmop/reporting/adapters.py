@@ -154,7 +154,7 @@ class JsonAdapter:
             )
 
         cache = report.cache_metadata()
-        if cache:
+        if cache and cache["cached_results"]:
             diagnostics.append(
                 Diagnostic(
                     code="cached_results_present",
@@ -220,7 +220,7 @@ class PorcelainAdapter:
             lines.append(f"next: {report.next_step}")
 
         cache = report.cache_metadata()
-        if cache:
+        if cache and cache["cached_results"]:
             lines.append(
                 "cache: "
                 f"{cache['cached_results']}/{cache['total_ran']} cached; "
@@ -240,7 +240,7 @@ class PorcelainAdapter:
     def _summary_line(report: RunReport) -> str:
         summary = report.summary
         parts = [
-            f"{summary.failed + summary.errors} fail",
+            f"{summary.failed + summary.errors + summary.timed_out} fail",
             f"{summary.passed} pass",
         ]
         if summary.warned:
@@ -456,7 +456,7 @@ class ConsoleAdapter:
     def _render_cache_refresh_hint(self) -> None:
         """Print a short freshness hint when cached results were used."""
         cache = self.report.cache_metadata()
-        if not cache:
+        if not cache or not cache["cached_results"]:
             return
         print(
             "   🔄 Fresh run: rerun `"
@@ -52,6 +52,7 @@ STATUS_COLORS = {
     CheckStatus.SKIPPED: Color.GRAY,
     CheckStatus.NOT_APPLICABLE: Color.GRAY,
     CheckStatus.ERROR: Color.BRIGHT_RED,
+    CheckStatus.TIMEOUT: Color.BRIGHT_RED,
 }
 
 
@@ -639,7 +639,11 @@ class DynamicDisplay:
             left += f" {detail_sc}{info.result.status_detail}{rc}"
 
         # Inline failure preview for failed/error checks
-        if info.result.status in (CheckStatus.FAILED, CheckStatus.ERROR):
+        if info.result.status in (
+            CheckStatus.FAILED,
+            CheckStatus.ERROR,
+            CheckStatus.TIMEOUT,
+        ):
             preview_text = info.result.error or info.result.output
             if preview_text:
                 # Dynamically compute max preview width so sparkline stays visible
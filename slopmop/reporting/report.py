@@ -33,6 +33,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, List, Optional, cast
 
+from slopmop.core.git_context import GitContext
 from slopmop.core.result import (
     CheckResult,
     CheckStatus,
@@ -315,6 +316,7 @@ class RunReport:
             CheckStatus.FAILED: [],
             CheckStatus.WARNED: [],
             CheckStatus.ERROR: [],
+            CheckStatus.TIMEOUT: [],
             CheckStatus.SKIPPED: [],
             CheckStatus.NOT_APPLICABLE: [],
         }
@@ -323,7 +325,13 @@ class RunReport:
 
         failed = status_buckets[CheckStatus.FAILED]
         warned = status_buckets[CheckStatus.WARNED]
-        errored = status_buckets[CheckStatus.ERROR]
+        # A gate stopped at its deadline blocks like an errored one; it
+        # keeps its own status so adapters can still tell them apart.
+        errored = [
+            r
+            for r in summary.results
+            if r.status in (CheckStatus.ERROR, CheckStatus.TIMEOUT)
+        ]
 
         if sort_actionable_by_remediation_order and registry is not None:
             failed = _sort_results_for_remediation_display(failed, registry)
@@ -508,6 +516,11 @@ class RunReport:
                 counts["diagnostic"] += 1
         return counts
 
+    @property
+    def git(self) -> Optional[GitContext]:
+        """The run's git metadata, as the executor resolved it."""
+        return self.summary.git
+
     def cache_summary(self) -> Optional[str]:
         """One-line cache summary, or None if no results came from cache.
 
@@ -545,9 +558,14 @@ class RunReport:
         return " ".join(parts)
 
     def cache_metadata(self) -> Optional[Dict[str, object]]:
-        """Structured cache provenance for adapters and machine output."""
+        """Structured cache provenance for adapters and machine output.
+
+        Present when any result came from cache or the executor reported
+        cache activity (``hits``/``misses``/``evictions``).
+        """
         cached = [r for r in self.summary.results if r.cached]
-        if not cached:
+        stats = self.summary.cache_stats
+        if not cached and not (stats and any(stats.values())):
             return None
 
         refresh_command = f"sm {self.level or 'swab'} --no-cache"
@@ -556,7 +574,11 @@ class RunReport:
             "total_ran": self._cache_total_ran(cached),
             "refresh_command": refresh_command,
         }
+        if stats:
+            metadata.update(stats)
 
+        if self.git is not None and self.git.head_short:
+            metadata["head_commit"] = self.git.head_short
         commits = _unique_non_empty([r.cache_commit for r in cached])
         if len(commits) == 1:
             metadata["source_commit"] = commits[0]
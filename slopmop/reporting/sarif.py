@@ -15,7 +15,8 @@ for the authoritative list of supported fields.
 
 The mapping:
 
-- One slopmop run → one SARIF ``run``
+- One slopmop run → one SARIF ``run``, with the scanned commit in
+  ``versionControlProvenance`` when the repo has a remote
 - One gate → one ``reportingDescriptor`` in ``tool.driver.rules[]``
 - One :class:`Finding` → one ``result`` with ``physicalLocation``
 
@@ -50,6 +51,7 @@ import urllib.parse
 from pathlib import Path, PurePosixPath
 from typing import Dict, List, Optional
 
+from slopmop.core.git_context import GitContext
 from slopmop.core.result import (
     CheckResult,
     CheckStatus,
@@ -65,10 +67,11 @@ SARIF_VERSION = "2.1.0"
 # Only results from gates in these states make it into the SARIF file.
 # PASSED means nothing to report.  SKIPPED / NOT_APPLICABLE similarly
 # have no code findings.  ERROR (infrastructure failure — tool missing,
-# timeout) is included because crashed gates still deserve visibility
-# in the Security tab.
+# timeout) and TIMEOUT (stopped at its adaptive deadline) are included
+# because crashed or wedged gates still deserve visibility in the
+# Security tab.
 _EMITTING_STATUSES = frozenset(
-    [CheckStatus.FAILED, CheckStatus.ERROR, CheckStatus.WARNED]
+    [CheckStatus.FAILED, CheckStatus.ERROR, CheckStatus.TIMEOUT, CheckStatus.WARNED]
 )
 
 
@@ -120,6 +123,9 @@ class SarifReporter:
             "tool": {"driver": driver},
             "results": results,
         }
+        provenance = self._provenance(summary.git)
+        if provenance is not None:
+            run["versionControlProvenance"] = [provenance]
 
         return {
             "$schema": SARIF_SCHEMA_URI,
@@ -127,6 +133,25 @@ class SarifReporter:
             "runs": [run],
         }
 
+    @staticmethod
+    def _provenance(git: Optional[GitContext]) -> Optional[Dict[str, object]]:
+        """The ``versionControlDetails`` for the scanned revision, if known.
+
+        SARIF requires ``repositoryUri``, so a repo without a remote gets
+        none.  scp-style remotes (``git@host:org/repo``) aren't URIs and
+        are rewritten to their ``ssh://`` form.
+        """
+        if git is None or git.head is None or git.remote_url is None:
+            return None
+        uri = git.remote_url
+        if "://" not in uri and ":" in uri:
+            host, _, path = uri.partition(":")
+            uri = f"ssh://{host}/{path}"
+        details: Dict[str, object] = {"repositoryUri": uri, "revisionId": git.head}
+        if git.branch:
+            details["branch"] = f"refs/heads/{git.branch}"
+        return details
+
     def _collect(
         self, summary: ExecutionSummary
     ) -> tuple[List[Dict[str, object]], List[Dict[str, object]]]:
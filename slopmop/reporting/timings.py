@@ -84,6 +84,7 @@ _RESULT_STATUS_COLORS: Dict[str, str] = {
     "failed": "\033[31m",  # red
     "warned": "\033[33m",  # yellow
     "error": "\033[91m",  # bright red
+    "timeout": "\033[91m",  # bright red
     "skipped": "\033[90m",  # gray
     "not_applicable": "\033[90m",  # gray
 }
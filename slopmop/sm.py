@@ -48,6 +48,7 @@ from slopmop.cli.parser_builders import (
     AgentParserBuilder,
     BarnacleParserBuilder,
     BuffParserBuilder,
+    CacheParserBuilder,
     CapabilitiesParserBuilder,
     RefitParserBuilder,
     SchemaParserBuilder,
@@ -197,6 +198,16 @@ def _add_output_flags(parser: argparse.ArgumentParser) -> None:
         action="store_false",
         help="Force human-readable console output.",
     )
+    parser.add_argument(
+        "--jsonl",
+        dest="jsonl_output",
+        action="store_true",
+        default=False,
+        help=(
+            "Stream JSON lines to stdout: one event per gate start, finding, "
+            "result or skip as it happens, then a final summary line."
+        ),
+    )
     parser.add_argument(
         "--sarif",
         dest="sarif_output",
@@ -326,6 +337,60 @@ def _add_validation_flags(parser: argparse.ArgumentParser) -> None:
             "Overrides the config-file default. Set to 0 to disable."
         ),
     )
+    parser.add_argument(
+        "--process-workers",
+        type=int,
+        metavar="N",
+        default=0,
+        help=(
+            "Run CPU-bound pure-Python gates in a pool of N worker processes "
+            "instead of threads, so they stop queueing behind the GIL. "
+            "Default 0 keeps every gate on the thread pool."
+        ),
+    )
+    parser.add_argument(
+        "--speculative",
+        action="store_true",
+        default=False,
+        help=(
+            "Start gates before the gates they depend on finish (e.g. tests "
+            "alongside formatting). A result is kept only if its dependencies "
+            "pass without changing any file; otherwise it is re-run."
+        ),
+    )
+    parser.add_argument(
+        "--kill-grace",
+        type=float,
+        metavar="SECONDS",
+        default=None,
+        dest="kill_grace",
+        help=(
+            "When fail-fast stops a run, gates still running have their "
+            "processes terminated; this is how long they get to exit after "
+            "SIGTERM before SIGKILL (default: 3)."
+        ),
+    )
+    parser.add_argument(
+        "--adaptive-timeouts",
+        action="store_true",
+        default=False,
+        dest="adaptive_timeouts",
+        help=(
+            "Stop gates that run far longer than their timing history says "
+            "they should and report them as timeout, instead of waiting out "
+            "each tool's fixed timeout (off by default)."
+        ),
+    )
+    parser.add_argument(
+        "--backend",
+        choices=["thread", "asyncio"],
+        default="thread",
+        help=(
+            "How gates are driven: one worker thread each (default), or "
+            "one asyncio event loop supervising every tool process; "
+            "single-command gates then hold no thread while their tool runs."
+        ),
+    )
     parser.add_argument(
         "--swabbing-time",
         type=int,
@@ -1025,6 +1090,7 @@ def create_parser() -> argparse.ArgumentParser:
     _add_audit_parser(subparsers)
     SchemaParserBuilder(subparsers).build()
     CapabilitiesParserBuilder(subparsers).build()
+    CacheParserBuilder(subparsers).build()
 
     parser.add_argument(
         "--no-tty",
@@ -1069,6 +1135,7 @@ def main(args: Optional[List[str]] = None) -> int:
         cmd_audit,
         cmd_barnacle,
         cmd_buff,
+        cmd_cache,
         cmd_capabilities,
         cmd_captain,
         cmd_commit_hooks,
@@ -1138,6 +1205,7 @@ def main(args: Optional[List[str]] = None) -> int:
             cmd_status=cmd_status,
             cmd_schema=cmd_schema,
             cmd_capabilities=cmd_capabilities,
+            cmd_cache=cmd_cache,
             cmd_doctor=cmd_doctor,
             cmd_config=cmd_config,
             cmd_help=cmd_help,
@@ -1182,6 +1250,8 @@ def _dispatch(
         return handlers["cmd_schema"](parsed_args)
     elif parsed_args.verb == "capabilities":
         return handlers["cmd_capabilities"](parsed_args)
+    elif parsed_args.verb == "cache":
+        return handlers["cmd_cache"](parsed_args)
     elif parsed_args.verb == "doctor":
         return handlers["cmd_doctor"](parsed_args)
     elif parsed_args.verb == "config":
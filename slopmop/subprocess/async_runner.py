@@ -0,0 +1,264 @@
+"""Asyncio subprocess execution with the same guarantees as ``runner``.
+
+:class:`AsyncSubprocessRunner` mirrors :class:`SubprocessRunner` — the
+same command validation, the same :class:`SubprocessResult`, the same
+process-group isolation and tree-kill escalation — but is built on
+``asyncio.create_subprocess_exec``.  One event loop can then supervise
+every tool process of a run: output is read incrementally as it arrives,
+timeouts are ``asyncio`` timeouts, and cancelling the awaiting task
+kills the process tree instead of leaving it orphaned.
+"""
+
+import asyncio
+import codecs
+import logging
+import os
+import signal
+import subprocess  # nosec B404 - only for the DEVNULL/PIPE constants
+import time
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set
+
+from .runner import GATE_OWNER, SubprocessResult, SubprocessRunner
+from .validator import CommandValidator, get_validator
+
+logger = logging.getLogger(__name__)
+
+# Callback for incremental output: ``(stream_name, text)`` where
+# stream_name is ``"stdout"`` or ``"stderr"``.
+OutputCallback = Callable[[str, str], None]
+
+_READ_CHUNK = 64 * 1024
+_KILL_WAIT_SECONDS = 5.0
+
+
+class AsyncSubprocessRunner:
+    """Validated subprocess runner for use inside an event loop.
+
+    Not thread-safe: every coroutine must run on the loop that owns the
+    runner.  Callers on other threads go through that loop (see
+    ``slopmop.core.async_backend``).
+    """
+
+    def __init__(
+        self,
+        validator: Optional[CommandValidator] = None,
+        default_timeout: int = SubprocessRunner.DEFAULT_TIMEOUT,
+    ):
+        """Initialize the runner.
+
+        Args:
+            validator: Command validator to use (default: global validator)
+            default_timeout: Default timeout in seconds
+        """
+        self._validator = validator or get_validator()
+        self._default_timeout = min(default_timeout, SubprocessRunner.MAX_TIMEOUT)
+        self._running_processes: Dict[int, asyncio.subprocess.Process] = {}
+        self._process_owners: Dict[int, Hashable] = {}
+
+    async def run(
+        self,
+        command: List[str],
+        timeout: Optional[int] = None,
+        cwd: Optional[str] = None,
+        env: Optional[Dict[str, str]] = None,
+        capture_output: bool = True,
+        on_output: Optional[OutputCallback] = None,
+        owner: Optional[Hashable] = None,
+        validator: Optional[CommandValidator] = None,
+    ) -> SubprocessResult:
+        """Run a command and wait for completion.
+
+        Args:
+            command: Command to run as list of strings
+            timeout: Timeout in seconds (None = use default)
+            cwd: Working directory for the command
+            env: Environment variables (None = inherit)
+            capture_output: Whether to capture stdout/stderr
+            on_output: Called with each decoded chunk as it is read
+            owner: Key for :meth:`terminate_owned_by` (default: the
+                current ``GATE_OWNER``)
+            validator: Validator for this command only (default: the
+                runner's own)
+
+        Returns:
+            SubprocessResult with exit code and output
+
+        Raises:
+            SecurityError: If command fails validation
+        """
+        (validator or self._validator).validate(command)
+
+        effective_timeout = min(
+            timeout or self._default_timeout, SubprocessRunner.MAX_TIMEOUT
+        )
+        start_time = time.time()
+        logger.debug(f"Running command (async): {' '.join(command)}")
+
+        pipe = subprocess.PIPE if capture_output else None
+        try:
+            # SECURITY: never a shell — create_subprocess_exec takes argv.
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdin=subprocess.DEVNULL,
+                stdout=pipe,
+                stderr=pipe,
+                cwd=cwd,
+                env=env,
+                **SubprocessRunner._popen_process_group_kwargs(),
+            )
+        except FileNotFoundError as e:
+            return SubprocessResult(
+                returncode=-1,
+                stdout="",
+                stderr=f"Command not found: {command[0]}\n{str(e)}",
+                duration=time.time() - start_time,
+            )
+        except Exception as e:
+            logger.error(f"Subprocess error: {e}")
+            return SubprocessResult(
+                returncode=-1,
+                stdout="",
+                stderr=str(e),
+                duration=time.time() - start_time,
+            )
+
+        self._running_processes[process.pid] = process
+        self._process_owners[process.pid] = (
+            owner if owner is not None else GATE_OWNER.get()
+        )
+        stdout: List[str] = []
+        stderr: List[str] = []
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    _pump(process.stdout, "stdout", stdout, on_output),
+                    _pump(process.stderr, "stderr", stderr, on_output),
+                    process.wait(),
+                ),
+                timeout=effective_timeout,
+            )
+        except asyncio.TimeoutError:
+            await self._terminate_many([process], _KILL_WAIT_SECONDS)
+            logger.warning(
+                f"Command timed out after {effective_timeout}s: {' '.join(command)}"
+            )
+            return SubprocessResult(
+                returncode=-1,
+                stdout="".join(stdout),
+                stderr=(
+                    f"Command timed out after {effective_timeout}s\n" + "".join(stderr)
+                ),
+                duration=time.time() - start_time,
+                timed_out=True,
+            )
+        except asyncio.CancelledError:
+            # Whoever awaited us is gone; don't leave the tree running.
+            await self._terminate_many([process], 0.0)
+            raise
+        finally:
+            self._running_processes.pop(process.pid, None)
+            self._process_owners.pop(process.pid, None)
+
+        return SubprocessResult(
+            returncode=process.returncode if process.returncode is not None else -1,
+            stdout="".join(stdout),
+            stderr="".join(stderr),
+            duration=time.time() - start_time,
+        )
+
+    async def terminate_all(self, grace_period: float = 5.0) -> int:
+        """Terminate all tracked running processes.
+
+        Returns:
+            Number of processes terminated
+        """
+        processes = list(self._running_processes.values())
+        return len(await self._terminate_many(processes, grace_period))
+
+    async def terminate_owned_by(
+        self, owners: Iterable[Hashable], grace_period: float = 5.0
+    ) -> Set[Hashable]:
+        """Terminate the process trees started on behalf of *owners*.
+
+        Returns:
+            The subset of *owners* that actually had a process terminated.
+        """
+        wanted = set(owners)
+        targets = [
+            (self._process_owners.get(pid), process)
+            for pid, process in self._running_processes.items()
+            if self._process_owners.get(pid) in wanted
+        ]
+        if not targets:
+            return set()
+        terminated = await self._terminate_many([p for _, p in targets], grace_period)
+        terminated_pids = {p.pid for p in terminated}
+        return {
+            owner
+            for owner, process in targets
+            if owner is not None and process.pid in terminated_pids
+        }
+
+    async def _terminate_many(
+        self, processes: List[asyncio.subprocess.Process], grace_period: float
+    ) -> List[asyncio.subprocess.Process]:
+        """SIGTERM every live tree, then SIGKILL what outlives *grace_period*."""
+        live = [p for p in processes if p.returncode is None]
+        if not live:
+            return []
+        for process in live:
+            _signal_process_tree(process, signal.SIGTERM)
+        if grace_period > 0:
+            await asyncio.wait(
+                [asyncio.ensure_future(p.wait()) for p in live], timeout=grace_period
+            )
+        for process in live:
+            if process.returncode is not None:
+                continue
+            _signal_process_tree(process, signal.SIGKILL)
+            try:
+                await asyncio.wait_for(process.wait(), timeout=_KILL_WAIT_SECONDS)
+            except asyncio.TimeoutError:
+                logger.warning("Process %s did not exit after SIGKILL", process.pid)
+        return live
+
+
+async def _pump(
+    stream: Optional[asyncio.StreamReader],
+    name: str,
+    sink: List[str],
+    on_output: Optional[OutputCallback],
+) -> None:
+    """Drain *stream* into *sink* chunk by chunk as output arrives."""
+    if stream is None:
+        return
+    # Chunks, not readline(): one JSON report on a single line would
+    # overrun the StreamReader line limit.
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        chunk = await stream.read(_READ_CHUNK)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            sink.append(text)
+            if on_output is not None:
+                on_output(name, text)
+        if not chunk:
+            return
+
+
+def _signal_process_tree(
+    process: asyncio.subprocess.Process, sig: signal.Signals
+) -> None:
+    """Signal the full process tree for one tracked child."""
+    if process.returncode is not None:
+        return
+    try:
+        if os.name == "nt":
+            if sig == signal.SIGTERM:
+                process.terminate()
+            else:
+                process.kill()
+            return
+        os.killpg(os.getpgid(process.pid), sig)
+    except ProcessLookupError:
+        return
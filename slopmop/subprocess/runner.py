@@ -10,13 +10,36 @@ import signal
 import subprocess  # nosec B404 - subprocess is core to this module's purpose
 import threading
 import time
+from concurrent.futures import Executor, Future
+from contextvars import ContextVar, copy_context
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
 
 from .validator import CommandValidator, get_validator
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# The gate a thread or coroutine is working for.  The executor sets it per
+# gate so processes are attributed without every call site passing an
+# owner; threads a gate starts itself inherit it only when the work goes
+# through :func:`submit_in_gate`.
+GATE_OWNER: ContextVar[Optional[Hashable]] = ContextVar(
+    "slopmop_gate_owner", default=None
+)
+
 
 @dataclass
 class SubprocessResult:
@@ -80,6 +103,20 @@ class SubprocessRunner:
         self._default_timeout = min(default_timeout, self.MAX_TIMEOUT)
         self._process_lock = threading.Lock()
         self._running_processes: Dict[int, subprocess.Popen[str]] = {}
+        # pid → the gate (``GATE_OWNER``) that started it, or the starting
+        # thread's ident outside any gate, so a caller can stop just the
+        # work one gate owns.
+        self._process_owners: Dict[int, Hashable] = {}
+
+    @property
+    def validator(self) -> CommandValidator:
+        """The validator every command this runner starts must pass."""
+        return self._validator
+
+    @staticmethod
+    def _current_owner() -> Hashable:
+        owner = GATE_OWNER.get()
+        return owner if owner is not None else threading.get_ident()
 
     @staticmethod
     def _popen_process_group_kwargs() -> Dict[str, Any]:
@@ -194,6 +231,7 @@ class SubprocessRunner:
             # Track the process
             with self._process_lock:
                 self._running_processes[process.pid] = process
+                self._process_owners[process.pid] = self._current_owner()
 
             try:
                 # Wait for completion with timeout
@@ -230,6 +268,7 @@ class SubprocessRunner:
                 # Remove from tracking
                 with self._process_lock:
                     self._running_processes.pop(process.pid, None)
+                    self._process_owners.pop(process.pid, None)
 
         except FileNotFoundError as e:
             duration = time.time() - start_time
@@ -323,31 +362,101 @@ class SubprocessRunner:
 
         with self._process_lock:
             self._running_processes[process.pid] = process
+            self._process_owners[process.pid] = self._current_owner()
 
         return process, process.pid
 
-    def terminate_all(self) -> int:
+    def _terminate_many(
+        self, processes: List[subprocess.Popen[str]], grace_period: float
+    ) -> List[subprocess.Popen[str]]:
+        """SIGTERM every tree at once, then SIGKILL whatever outlives the grace.
+
+        Signalling all trees before waiting means N processes cost one
+        grace period, not N of them.
+
+        Returns:
+            The processes that were still running when signalled.
+        """
+        live = [p for p in processes if p.poll() is None]
+        for process in live:
+            try:
+                self._signal_process_tree(process, signal.SIGTERM)
+            except Exception as e:
+                logger.warning(f"Failed to terminate process {process.pid}: {e}")
+
+        deadline = time.monotonic() + max(0.0, grace_period)
+        for process in live:
+            try:
+                process.wait(timeout=max(0.0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                pass
+
+        for process in live:
+            if process.poll() is not None:
+                continue
+            try:
+                self._signal_process_tree(process, signal.SIGKILL)
+                process.wait(timeout=5.0)
+            except subprocess.TimeoutExpired:
+                logger.warning("Process %s did not exit after SIGKILL", process.pid)
+            except Exception as e:
+                logger.warning(f"Failed to kill process {process.pid}: {e}")
+        return live
+
+    def terminate_all(self, grace_period: float = 5.0) -> int:
         """Terminate all tracked running processes.
 
+        Args:
+            grace_period: Seconds to wait after SIGTERM before SIGKILL.
+
         Returns:
             Number of processes terminated
         """
         with self._process_lock:
             processes = list(self._running_processes.values())
 
-        count = 0
-        for process in processes:
-            try:
-                if self._terminate_process_tree(process):
-                    count += 1
-            except Exception as e:
-                logger.warning(f"Failed to terminate process {process.pid}: {e}")
+        count = len(self._terminate_many(processes, grace_period))
 
         with self._process_lock:
             self._running_processes.clear()
+            self._process_owners.clear()
 
         return count
 
+    def terminate_owned_by(
+        self, owners: Collection[Hashable], grace_period: float = 5.0
+    ) -> Set[Hashable]:
+        """Terminate the process trees started by the given owners.
+
+        Processes stay tracked — the ``run()`` call that started each one
+        still owns its cleanup and returns normally (with the non-zero exit
+        of a killed process).
+
+        Args:
+            owners: Gate owners (``GATE_OWNER`` values), or thread idents
+                for processes started outside a gate, to stop.
+            grace_period: Seconds to wait after SIGTERM before SIGKILL.
+
+        Returns:
+            The subset of *owners* that actually had a process terminated.
+        """
+        with self._process_lock:
+            targets = [
+                (self._process_owners.get(pid), process)
+                for pid, process in self._running_processes.items()
+                if self._process_owners.get(pid) in owners
+            ]
+        if not targets:
+            return set()
+
+        terminated = self._terminate_many([p for _, p in targets], grace_period)
+        terminated_pids = {p.pid for p in terminated}
+        return {
+            owner
+            for owner, process in targets
+            if owner is not None and process.pid in terminated_pids
+        }
+
     def is_running(self, pid: int) -> bool:
         """Check if a process is still running.
 
@@ -363,6 +472,15 @@ class SubprocessRunner:
             return self._running_processes[pid].poll() is None
 
 
+def submit_in_gate(pool: Executor, fn: Callable[..., T], *args: Any) -> "Future[T]":
+    """Submit *fn* to a gate's own pool, keeping the gate as process owner.
+
+    Pool threads don't inherit context variables, so without this the
+    tools a gate fans out to would escape fail-fast and deadline kills.
+    """
+    return pool.submit(copy_context().run, fn, *args)
+
+
 # Module-level singleton for convenience
 _default_runner: Optional[SubprocessRunner] = None
 
@@ -0,0 +1,60 @@
+"""Shared persistence for the JSON state files under ``.slopmop/``.
+
+The file index, per-file findings caches, tool versions, string
+inventory and the shared cache's directory backend each wrote their
+state through a private temp file plus ``os.replace`` and read it back
+through the same "parse, check it's an object, check ``version``" dance.
+These helpers are the one implementation they share.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Union, cast
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace *path* with *data* so readers never see a partial file.
+
+    The temp file is named for this process and thread, so concurrent
+    writers never share one.  Parent directories are created.
+
+    Raises:
+        OSError: The write failed; *path* is left as it was.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """:func:`atomic_write_bytes` for text."""
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+def load_versioned_json(
+    path: Path, version: Union[int, str]
+) -> Optional[Dict[str, object]]:
+    """The JSON object in *path* if its ``version`` field is *version*.
+
+    ``None`` if the file is missing, unreadable, not a JSON object or
+    written by another format version — callers then start empty.
+    """
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict):
+        return None
+    data_d = cast(Dict[str, object], data)
+    if data_d.get("version") != version:
+        return None
+    return data_d
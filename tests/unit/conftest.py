@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
 
 import pytest
@@ -40,3 +41,21 @@ def mk_project_venv(root: Path) -> Path:
     python = bin_dir / "python"
     python.write_text("#!/bin/false\n")
     return python
+
+
+def git(root: Path, *args: str) -> None:
+    """Run ``git`` in *root*, failing the test if it exits non-zero."""
+    subprocess.run(["git", *args], cwd=root, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    """A git checkout on ``main`` with ``a.py`` and ``b.py`` committed."""
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "config", "user.email", "dev@example.com")
+    git(tmp_path, "config", "user.name", "dev")
+    (tmp_path / "a.py").write_text("a = 1\n")
+    (tmp_path / "b.py").write_text("b = 1\n")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "init")
+    return tmp_path
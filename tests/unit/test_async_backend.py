@@ -0,0 +1,197 @@
+"""Tests for the executor's asyncio backend."""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+from slopmop.core.async_backend import AsyncGateLoop, LoopBackedRunner
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from slopmop.core.result import CheckResult, CheckStatus, SkipReason
+from tests.unit.test_executor import make_mock_check_class
+
+SLEEP_30 = [sys.executable, "-c", "import time\ntime.sleep(30)"]
+
+
+def _shelling_class(name: str, command):
+    cls = make_mock_check_class(name)
+
+    def run(self, project_root):
+        cls.runner_type = type(self._runner)
+        proc = self._runner.run(command, timeout=60)
+        status = CheckStatus.PASSED if proc.success else CheckStatus.FAILED
+        return CheckResult(self.full_name, status, proc.duration, output=proc.stdout)
+
+    cls.run = run
+    return cls
+
+
+class TestAsyncGateLoop:
+    def test_submit_and_shutdown(self):
+        loop = AsyncGateLoop(max_workers=2)
+
+        async def double(x):
+            return x * 2
+
+        futures = [loop.submit(double, i) for i in range(5)]
+        assert [f.result(timeout=5) for f in futures] == [0, 2, 4, 6, 8]
+        loop.shutdown()
+
+    def test_concurrency_capped_at_max_workers(self):
+        loop = AsyncGateLoop(max_workers=2)
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        async def gate():
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            await asyncio.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        for future in [loop.submit(gate) for _ in range(6)]:
+            future.result(timeout=5)
+        loop.shutdown()
+        assert peak[0] == 2
+
+    def test_runner_runs_commands_on_loop(self):
+        loop = AsyncGateLoop(max_workers=1)
+        result = loop.runner.run([sys.executable, "-c", "print('hi')"])
+        loop.shutdown()
+
+        assert isinstance(loop.runner, LoopBackedRunner)
+        assert result.stdout.strip() == "hi"
+
+
+class TestAsyncExecutorBackend:
+    def test_rejects_unknown_backend(self):
+        with pytest.raises(ValueError, match="backend"):
+            CheckExecutor(registry=CheckRegistry(), backend="fibers")
+
+    def test_gates_shell_out_through_loop(self, tmp_path):
+        registry = CheckRegistry()
+        cls = _shelling_class("echo", [sys.executable, "-c", "print('ok')"])
+        registry.register(cls)
+        registry.register(make_mock_check_class("plain"))
+        registry.register(
+            make_mock_check_class("after", depends_on=["overconfidence:echo"])
+        )
+
+        executor = CheckExecutor(registry=registry, backend="asyncio")
+        summary = executor.run_checks(
+            str(tmp_path),
+            ["overconfidence:echo", "overconfidence:plain", "overconfidence:after"],
+        )
+
+        assert summary.passed == 3
+        assert cls.runner_type is LoopBackedRunner
+        echo = next(r for r in summary.results if r.name == "overconfidence:echo")
+        assert echo.output.strip() == "ok"
+
+    def test_gates_overlap(self, tmp_path):
+        registry = CheckRegistry()
+        for name in ("a", "b", "c"):
+            registry.register(make_mock_check_class(name, duration=0.3))
+
+        executor = CheckExecutor(registry=registry, max_workers=3, backend="asyncio")
+        start = time.time()
+        summary = executor.run_checks(
+            str(tmp_path),
+            ["overconfidence:a", "overconfidence:b", "overconfidence:c"],
+        )
+
+        assert summary.passed == 3
+        assert time.time() - start < 0.8  # serial would be >= 0.9s
+
+    @pytest.mark.skipif(
+        os.name == "nt",
+        reason="Process-group tree cleanup is exercised on POSIX runners.",
+    )
+    def test_fail_fast_terminates_slow_gate(self, tmp_path):
+        registry = CheckRegistry()
+        registry.register(_shelling_class("sleeper", SLEEP_30))
+        registry.register(
+            make_mock_check_class("boom", status=CheckStatus.FAILED, duration=0.3)
+        )
+        executor = CheckExecutor(
+            registry=registry,
+            fail_fast=True,
+            kill_grace_period=0.5,
+            backend="asyncio",
+        )
+
+        start = time.time()
+        summary = executor.run_checks(
+            str(tmp_path), ["overconfidence:sleeper", "overconfidence:boom"]
+        )
+
+        assert time.time() - start < 10
+        sleeper = next(r for r in summary.results if r.name.endswith("sleeper"))
+        assert sleeper.skip_reason == SkipReason.CANCELLED
+
+
+class TestCommandChecksOnLoop:
+    """Command gates await their tool on the loop instead of a thread."""
+
+    def _custom(self, name, command):
+        from slopmop.checks.custom import make_custom_check_class
+
+        cls = make_custom_check_class(name, name, "overconfidence", command)
+
+        def no_sync_run(self, project_root):
+            raise AssertionError("command gate fell back to a worker thread")
+
+        cls.run = no_sync_run
+        return cls
+
+    def test_custom_gate_runs_natively(self, tmp_path):
+        registry = CheckRegistry()
+        registry.register(self._custom("piped", "echo hi | grep hi"))
+
+        executor = CheckExecutor(registry=registry, backend="asyncio")
+        summary = executor.run_checks(str(tmp_path), ["overconfidence:piped"])
+
+        assert summary.passed == 1
+        assert summary.results[0].output == "hi"
+
+    def test_custom_gate_failure_is_reported(self, tmp_path):
+        registry = CheckRegistry()
+        registry.register(self._custom("nope", "exit 3"))
+
+        executor = CheckExecutor(registry=registry, backend="asyncio")
+        summary = executor.run_checks(str(tmp_path), ["overconfidence:nope"])
+
+        assert summary.failed == 1
+        assert "exit code 3" in (summary.results[0].error or "")
+
+    @pytest.mark.skipif(
+        os.name == "nt",
+        reason="Process-group tree cleanup is exercised on POSIX runners.",
+    )
+    def test_fail_fast_terminates_command_gate(self, tmp_path):
+        registry = CheckRegistry()
+        registry.register(self._custom("sleeper", "sleep 30"))
+        registry.register(
+            make_mock_check_class("boom", status=CheckStatus.FAILED, duration=0.3)
+        )
+        executor = CheckExecutor(
+            registry=registry,
+            fail_fast=True,
+            kill_grace_period=0.5,
+            backend="asyncio",
+        )
+
+        start = time.time()
+        summary = executor.run_checks(
+            str(tmp_path), ["overconfidence:sleeper", "overconfidence:boom"]
+        )
+
+        assert time.time() - start < 10
+        sleeper = next(r for r in summary.results if r.name.endswith("sleeper"))
+        assert sleeper.skip_reason == SkipReason.CANCELLED
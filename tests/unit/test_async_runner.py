@@ -0,0 +1,101 @@
+"""Tests for the asyncio subprocess runner."""
+
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from slopmop.subprocess.async_runner import GATE_OWNER, AsyncSubprocessRunner
+from slopmop.subprocess.validator import SecurityError
+
+SLEEP_30 = [sys.executable, "-c", "import time\ntime.sleep(30)"]
+
+
+def _runner() -> AsyncSubprocessRunner:
+    return AsyncSubprocessRunner(validator=MagicMock())
+
+
+class TestAsyncSubprocessRunner:
+    def test_captures_output_and_exit_code(self):
+        code = "import sys\nprint('out')\nprint('err', file=sys.stderr)\nsys.exit(3)"
+        result = asyncio.run(_runner().run([sys.executable, "-c", code]))
+
+        assert result.returncode == 3
+        assert result.stdout.strip() == "out"
+        assert result.stderr.strip() == "err"
+        assert not result.success
+
+    def test_streams_output_incrementally(self):
+        chunks = []
+        code = "print('x' * 200000)"
+        result = asyncio.run(
+            _runner().run(
+                [sys.executable, "-c", code],
+                on_output=lambda stream, text: chunks.append((stream, text)),
+            )
+        )
+
+        # A single line longer than the StreamReader limit still arrives.
+        assert len(result.stdout) == 200001
+        assert "".join(t for s, t in chunks if s == "stdout") == result.stdout
+
+    def test_validates_before_spawning(self):
+        validator = MagicMock()
+        validator.validate.side_effect = SecurityError("nope")
+        runner = AsyncSubprocessRunner(validator=validator)
+
+        with pytest.raises(SecurityError):
+            asyncio.run(runner.run(["rm", "-rf", "/"]))
+
+    def test_missing_command(self):
+        result = asyncio.run(_runner().run(["definitely-not-a-real-tool-xyz"]))
+        assert result.returncode == -1
+        assert "Command not found" in result.stderr
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX process groups")
+    def test_timeout_kills_process(self):
+        start = time.time()
+        result = asyncio.run(_runner().run(SLEEP_30, timeout=1))
+
+        assert result.timed_out
+        assert time.time() - start < 10
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX process groups")
+    def test_terminate_owned_by_stops_only_that_owner(self):
+        runner = _runner()
+
+        async def scenario():
+            GATE_OWNER.set("gate-a")
+            slow = asyncio.ensure_future(runner.run(SLEEP_30, timeout=60))
+            quick = asyncio.ensure_future(
+                runner.run([sys.executable, "-c", "print(1)"], owner="gate-b")
+            )
+            await asyncio.sleep(0.5)
+            killed = await runner.terminate_owned_by({"gate-a"}, grace_period=0.5)
+            return killed, await slow, await quick
+
+        killed, slow, quick = asyncio.run(scenario())
+
+        assert killed == {"gate-a"}
+        assert not slow.success
+        assert quick.success
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX process groups")
+    def test_cancellation_kills_process(self):
+        runner = _runner()
+
+        async def scenario():
+            task = asyncio.ensure_future(runner.run(SLEEP_30, timeout=60))
+            await asyncio.sleep(0.5)
+            pid = next(iter(runner._running_processes))
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            return pid
+
+        pid = asyncio.run(scenario())
+        with pytest.raises(ProcessLookupError):
+            os.kill(pid, 0)
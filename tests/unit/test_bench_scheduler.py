@@ -0,0 +1,54 @@
+"""Tests for scripts/bench_scheduler.py (synthetic 1,000-gate graphs)."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+_SPEC = importlib.util.spec_from_file_location(
+    "bench_scheduler",
+    Path(__file__).resolve().parents[2] / "scripts" / "bench_scheduler.py",
+)
+assert _SPEC is not None
+assert _SPEC.loader is not None
+bench_scheduler = importlib.util.module_from_spec(_SPEC)
+_SPEC.loader.exec_module(bench_scheduler)
+
+
+def test_synthetic_graph_is_acyclic_and_seeded():
+    graph = bench_scheduler.synthetic_graph(1000, seed=7)
+    names = list(graph)
+
+    assert len(graph) == 1000
+    assert graph == bench_scheduler.synthetic_graph(1000, seed=7)
+    for i, name in enumerate(names):
+        assert graph[name] <= set(names[:i])
+
+
+def test_ready_queue_and_rescan_replays_agree():
+    graph = bench_scheduler.synthetic_graph(1000)
+
+    assert bench_scheduler.replay_ready_queue(graph) == bench_scheduler.replay_rescan(
+        graph
+    )
+
+
+def test_executor_runs_a_thousand_gate_graph():
+    graph = bench_scheduler.synthetic_graph(1000)
+    assert bench_scheduler.run_executor(graph) < 30.0
+
+
+def test_main_skip_executor(capsys):
+    assert (
+        bench_scheduler.main(["--gates", "50", "--repeat", "1", "--skip-executor"]) == 0
+    )
+    out = capsys.readouterr().out
+    assert "ready-queue" in out
+    assert "packing" in out
+    assert "executor" not in out
+
+
+def test_packing_benchmark_reports_per_call_seconds():
+    timings = bench_scheduler.synthetic_timings(200)
+    assert len(timings) == 200
+    assert bench_scheduler.time_packing(timings, calls=5) < 0.05
@@ -1,17 +1,21 @@
 """Tests for fingerprint-based result caching."""
 
+import json
 import os
 import time
 
 from slopmop.checks.base import BaseCheck, Flaw, GateCategory
+from slopmop.core import cache as cache_module
 from slopmop.core.cache import (
+    InputScope,
+    ResultCache,
     compute_fingerprint,
-    get_cached_result,
     hash_file_scope,
     load_cache,
-    save_cache,
-    store_result,
+    scope_digest,
+    scoped_fingerprint,
 )
+from slopmop.core.cache_store import STORE_FILE, encode_blob
 from slopmop.core.executor import CheckExecutor
 from slopmop.core.registry import CheckRegistry
 from slopmop.core.result import (
@@ -21,6 +25,7 @@ from slopmop.core.result import (
     FindingLevel,
     ScopeInfo,
 )
+from slopmop.core.snapshot import ProjectSnapshot, use_snapshot
 
 
 class TestComputeFingerprint:
@@ -145,15 +150,19 @@ class TestComputeFingerprint:
         assert fp1 != fp2
 
 
+def _write_legacy_cache(project_root, cache) -> None:
+    cache_dir = project_root / ".slopmop"
+    cache_dir.mkdir(exist_ok=True)
+    (cache_dir / "cache.json").write_text(json.dumps(cache))
+
+
 class TestCacheIO:
-    """Tests for load_cache / save_cache."""
+    """Tests for load_cache (the legacy cache.json reader)."""
 
-    def test_save_and_load(self, tmp_path):
-        """Round-trip: save then load returns same data."""
+    def test_load(self, tmp_path):
         cache = {"check1": {"fingerprint": "abc", "result": {"name": "check1"}}}
-        save_cache(str(tmp_path), cache)
-        loaded = load_cache(str(tmp_path))
-        assert loaded == cache
+        _write_legacy_cache(tmp_path, cache)
+        assert load_cache(str(tmp_path)) == cache
 
     def test_load_nonexistent(self, tmp_path):
         """Loading from a path with no cache file returns empty dict."""
@@ -176,134 +185,82 @@ class TestCacheIO:
         loaded = load_cache(str(tmp_path))
         assert loaded == {}
 
-    def test_save_creates_directory(self, tmp_path):
-        """save_cache creates .slopmop directory if needed."""
-        cache = {"a": 1}
-        save_cache(str(tmp_path), cache)
-        assert (tmp_path / ".slopmop" / "cache.json").exists()
-
 
-class TestGetCachedResult:
-    """Tests for get_cached_result()."""
-
-    def test_cache_hit(self):
-        """Returns result when fingerprint matches."""
-        result = CheckResult(
-            name="check1", status=CheckStatus.PASSED, duration=1.5, output="ok"
-        )
-        cache = {"check1": {"fingerprint": "abc123", "result": result.to_dict()}}
-        cached = get_cached_result(cache, "check1", "abc123")
-        assert cached is not None
-        assert cached.name == "check1"
-        assert cached.status == CheckStatus.PASSED
-        assert cached.duration == 0.0  # Cached results have zero duration
-        assert cached.cached is True
-
-    def test_cache_miss_different_fingerprint(self):
-        """Returns None when fingerprint doesn't match."""
-        result = CheckResult(name="check1", status=CheckStatus.PASSED, duration=1.5)
-        cache = {"check1": {"fingerprint": "abc123", "result": result.to_dict()}}
-        cached = get_cached_result(cache, "check1", "different")
-        assert cached is None
-
-    def test_cache_miss_no_entry(self):
-        """Returns None when check isn't in cache."""
-        cached = get_cached_result({}, "check1", "abc123")
-        assert cached is None
-
-    def test_cache_miss_bad_entry(self):
-        """Returns None when cache entry is malformed."""
-        cache = {"check1": "not a dict"}
-        cached = get_cached_result(cache, "check1", "abc123")
-        assert cached is None
-
-    def test_preserves_findings(self):
-        """Cached result preserves structured findings."""
-        result = CheckResult(
-            name="check1",
-            status=CheckStatus.FAILED,
-            duration=2.0,
-            output="issues found",
-            findings=[
-                Finding(
-                    message="unused import",
-                    level=FindingLevel.WARNING,
-                    file="main.py",
-                    line=5,
-                )
-            ],
+class TestResultCache:
+    """Tests for the run-level cache over the SQLite store."""
+
+    @staticmethod
+    def _result(name: str = "check1") -> CheckResult:
+        return CheckResult(name, CheckStatus.PASSED, 0.1, output="x" * 200)
+
+    def test_persists_across_runs(self, tmp_path):
+        cache = ResultCache.load(str(tmp_path))
+        cache.store("check1", "fp", self._result())
+        cache.close()
+
+        assert (tmp_path / ".slopmop" / STORE_FILE).exists()
+        hit = ResultCache.load(str(tmp_path)).lookup("check1", "fp")
+        assert hit is not None and hit.cached and hit.output == "x" * 200
+
+    def test_hit_refreshes_recency(self, tmp_path):
+        cache = ResultCache(str(tmp_path), entries_per_gate=2)
+        cache.store("check1", "a", self._result())
+        cache.store("check1", "b", self._result())
+        cache.close()
+
+        cache = ResultCache(str(tmp_path), entries_per_gate=2)
+        assert cache.lookup("check1", "a") is not None
+        cache.close()
+
+        cache = ResultCache(str(tmp_path), entries_per_gate=2)
+        cache.store("check1", "c", self._result())
+        assert cache.lookup("check1", "a") is not None
+        assert cache.lookup("check1", "b") is None
+        assert cache.stats.to_dict() == {"hits": 1, "misses": 1, "evictions": 1}
+
+    def test_size_cap_evicts_oldest_across_gates(self, tmp_path):
+        cache = ResultCache(str(tmp_path))
+        cache.store("old", "fp", self._result("old"))
+        cache.store("new", "fp", self._result("new"))
+        cache.max_bytes = 1 + max(
+            len(encode_blob(r.to_dict()))
+            for r in (self._result("old"), self._result("new"))
         )
-        cache = {"check1": {"fingerprint": "fp1", "result": result.to_dict()}}
-        cached = get_cached_result(cache, "check1", "fp1")
-        assert cached is not None
-        assert len(cached.findings) == 1
-        assert cached.findings[0].message == "unused import"
-        assert cached.findings[0].file == "main.py"
-
-    def test_preserves_scope(self):
-        """Cached result preserves scope info."""
-        result = CheckResult(
-            name="check1",
-            status=CheckStatus.PASSED,
-            duration=1.0,
-            scope=ScopeInfo(files=42, lines=3000),
-        )
-        cache = {"check1": {"fingerprint": "fp1", "result": result.to_dict()}}
-        cached = get_cached_result(cache, "check1", "fp1")
-        assert cached is not None
-        assert cached.scope is not None
-        assert cached.scope.files == 42
-        assert cached.scope.lines == 3000
-
-
-class TestStoreResult:
-    """Tests for store_result()."""
-
-    def test_stores_passed_result(self):
-        """Passing results are stored."""
-        cache: dict = {}
-        result = CheckResult(name="check1", status=CheckStatus.PASSED, duration=1.0)
-        stored = store_result(cache, "check1", "fp1", result)
-        assert stored is True
-        assert "check1" in cache
-        assert cache["check1"]["fingerprint"] == "fp1"
-
-    def test_stores_failed_result(self):
-        """Failing results are stored (user explicitly requested this)."""
-        cache: dict = {}
-        result = CheckResult(name="check1", status=CheckStatus.FAILED, duration=1.0)
-        store_result(cache, "check1", "fp1", result)
-        assert "check1" in cache
-
-    def test_skips_error_result(self):
-        """ERROR results are not cached (transient)."""
-        cache: dict = {}
-        result = CheckResult(
-            name="check1", status=CheckStatus.ERROR, duration=0.0, error="boom"
-        )
-        stored = store_result(cache, "check1", "fp1", result)
-        assert stored is False
-        assert "check1" not in cache
-
-    def test_skips_auto_fixed_result(self):
-        """Auto-fixed results are not cached (side-effecting)."""
-        cache: dict = {}
-        result = CheckResult(
-            name="check1",
-            status=CheckStatus.PASSED,
-            duration=1.0,
-            auto_fixed=True,
-        )
-        stored = store_result(cache, "check1", "fp1", result)
-        assert stored is False
-        assert "check1" not in cache
-
-    def test_overwrites_previous_entry(self):
-        """New result overwrites previous cache entry."""
-        cache: dict = {"check1": {"fingerprint": "old", "result": {"name": "check1"}}}
-        result = CheckResult(name="check1", status=CheckStatus.PASSED, duration=0.5)
-        store_result(cache, "check1", "new_fp", result)
-        assert cache["check1"]["fingerprint"] == "new_fp"
+        cache.close()
+
+        fresh = ResultCache(str(tmp_path))
+        assert fresh.lookup("old", "fp") is None
+        assert fresh.lookup("new", "fp") is not None
+        assert cache.stats.evictions == 1
+
+    def test_skips_transient_results(self):
+        cache = ResultCache()
+        error = CheckResult("check1", CheckStatus.ERROR, 0.1, error="boom")
+        assert cache.store("check1", "fp", error) is False
+        assert cache.lookup("check1", "fp") is None
+
+    def test_imports_legacy_cache_json(self, tmp_path):
+        legacy = {"check1": {"fingerprint": "fp", "result": self._result().to_dict()}}
+        _write_legacy_cache(tmp_path, legacy)
+        cache = ResultCache.load(str(tmp_path))
+        assert cache.lookup("check1", "fp") is not None
+        assert not (tmp_path / ".slopmop" / "cache.json").exists()
+
+    def test_imports_every_legacy_entry(self, tmp_path):
+        result = self._result().to_dict()
+        entries = [{"fingerprint": fp, "result": result} for fp in ("new", "old")]
+        _write_legacy_cache(tmp_path, {"check1": {"entries": entries}})
+        cache = ResultCache.load(str(tmp_path))
+        assert cache.lookup("check1", "new") is not None
+        assert cache.lookup("check1", "old") is not None
+
+    def test_corrupt_store_is_replaced(self, tmp_path):
+        (tmp_path / ".slopmop").mkdir()
+        (tmp_path / ".slopmop" / STORE_FILE).write_bytes(b"not a database" * 100)
+        cache = ResultCache.load(str(tmp_path))
+        assert cache.lookup("check1", "fp") is None
+        cache.store("check1", "fp", self._result())
+        assert cache.lookup("check1", "fp") is not None
 
 
 class TestCheckResultFromDict:
@@ -474,6 +431,28 @@ class TestExecutorCache:
         cached_results = [r for r in s2.results if r.cached]
         assert len(cached_results) == 1
 
+    def test_switching_back_hits_cache(self, tmp_path):
+        """Returning to earlier file content (a branch switch) still hits."""
+        src = tmp_path / "main.py"
+        src.write_text("print('main')")
+        check_cls = _make_slow_check_class("branch-switch")
+        registry = CheckRegistry()
+        registry.register(check_cls)
+        executor = CheckExecutor(registry=registry, fail_fast=False)
+        names = ["overconfidence:branch-switch"]
+
+        executor.run_checks(str(tmp_path), names)
+        src.write_text("print('feature')")
+        executor.run_checks(str(tmp_path), names)
+        src.write_text("print('main')")
+        s3 = executor.run_checks(str(tmp_path), names)
+        src.write_text("print('feature')")
+        s4 = executor.run_checks(str(tmp_path), names)
+
+        assert check_cls.run_count == 2
+        assert s3.results[0].cached and s4.results[0].cached
+        assert s4.cache_stats == {"hits": 1, "misses": 0, "evictions": 0}
+
     def test_second_run_is_fast(self, tmp_path):
         """Back-to-back runs: second run takes virtually zero time."""
         (tmp_path / "main.py").write_text("print('hello')")
@@ -568,6 +547,68 @@ class TestExecutorCache:
         assert check_cls.run_count == 1  # Still 1 — served from disk cache
 
 
+def _make_formatter_check_class(name: str):
+    """A fixable check that 'formats' main.py by stripping trailing spaces."""
+
+    class DynamicFormatterCheck(_SlowCheck):
+        _name = name
+        run_count = 0
+        fix_count = 0
+
+        def can_auto_fix(self) -> bool:
+            return True
+
+        def auto_fix(self, project_root: str) -> bool:
+            path = os.path.join(project_root, "main.py")
+            with open(path) as f:
+                text = f.read()
+            if text == text.rstrip(" "):
+                return False
+            type(self).fix_count += 1
+            with open(path, "w") as f:
+                f.write(text.rstrip(" "))
+            return True
+
+    return DynamicFormatterCheck
+
+
+class TestAutoFixCaching:
+    """A run that auto-fixes files caches its verdict for the fixed tree."""
+
+    def _run(self, registry, tmp_path):
+        return CheckExecutor(registry=registry, fail_fast=False).run_checks(
+            str(tmp_path), ["overconfidence:fmt"], auto_fix=True
+        )
+
+    def test_next_run_on_fixed_tree_hits(self, tmp_path):
+        (tmp_path / "main.py").write_text("x = 1   ")
+        check_cls = _make_formatter_check_class("fmt")
+        registry = CheckRegistry()
+        registry.register(check_cls)
+
+        first = self._run(registry, tmp_path)
+        assert first.results[0].auto_fixed
+        assert check_cls.fix_count == 1
+
+        second = self._run(registry, tmp_path)
+        assert second.results[0].cached
+        assert not second.results[0].auto_fixed
+        assert check_cls.run_count == 1
+
+    def test_unfixed_tree_is_not_served_the_fixed_verdict(self, tmp_path):
+        (tmp_path / "main.py").write_text("x = 1   ")
+        check_cls = _make_formatter_check_class("fmt")
+        registry = CheckRegistry()
+        registry.register(check_cls)
+
+        self._run(registry, tmp_path)
+        (tmp_path / "main.py").write_text("x = 1   ")
+        again = self._run(registry, tmp_path)
+
+        assert not again.results[0].cached
+        assert check_cls.fix_count == 2
+
+
 class TestNoCacheFlag:
     """Tests for use_cache=False (--no-cache CLI flag)."""
 
@@ -600,7 +641,7 @@ class TestNoCacheFlag:
         assert check_cls.run_count == 2  # Ran again
 
     def test_no_cache_writes_fresh_results_to_disk(self, tmp_path):
-        """use_cache=False still writes fresh results to cache.json.
+        """use_cache=False still writes fresh results to the cache store.
 
         This ensures that subsequent cached runs see fresh results
         instead of stale entries from a previous run.
@@ -612,7 +653,7 @@ class TestNoCacheFlag:
         registry.register(check_cls)
         executor = CheckExecutor(registry=registry, fail_fast=False)
 
-        cache_file = tmp_path / ".slopmop" / "cache.json"
+        cache_file = tmp_path / ".slopmop" / STORE_FILE
         assert not cache_file.exists()
 
         # Run with cache disabled — fresh results should still be persisted
@@ -857,6 +898,48 @@ class TestHashFileScope:
         assert fp1 != fp2
 
 
+class TestInputScope:
+    """Tests for declared input scopes and their per-run dedup."""
+
+    def test_of_normalizes(self):
+        assert InputScope.of(["b", "a", "a"], [".py"]) == InputScope.of(
+            ("a", "b"), {".py"}
+        )
+        assert InputScope.of([], {".py"}).dirs == (".",)
+
+    def test_matches_hash_file_scope(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1")
+        scope = InputScope.of(["."], {".py"})
+        assert scoped_fingerprint(str(tmp_path), scope, {"k": 1}) == (
+            hash_file_scope(str(tmp_path), ["."], {".py"}, {"k": 1})
+        )
+
+    def test_equal_scopes_hashed_once_per_run(self, tmp_path, monkeypatch):
+        (tmp_path / "a.py").write_text("x = 1")
+        calls = []
+        original = cache_module._scope_file_hashes
+
+        def counting(*args):
+            calls.append(1)
+            return original(*args)
+
+        monkeypatch.setattr(cache_module, "_scope_file_hashes", counting)
+        root = str(tmp_path)
+        with use_snapshot(ProjectSnapshot(root)):
+            fp1 = scoped_fingerprint(root, InputScope.of(["."], {".py"}), {"a": 1})
+            fp2 = scoped_fingerprint(root, InputScope.of(["."], [".py"]), {"b": 2})
+        assert fp1 != fp2  # config still separates the gates
+        assert len(calls) == 1
+
+    def test_extra_files_feed_the_digest(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1")
+        (tmp_path / "pytest.ini").write_text("[pytest]\n")
+        scope = InputScope.of(["."], {".py"}, extra_files=["pytest.ini", "gone.cfg"])
+        before = scope_digest(str(tmp_path), scope)
+        (tmp_path / "pytest.ini").write_text("[pytest]\naddopts = -x\n")
+        assert scope_digest(str(tmp_path), scope) != before
+
+
 def _make_scoped_check_class(name: str, scope_dirs: list):
     """Factory: a check that overrides cache_inputs with a scoped fingerprint."""
 
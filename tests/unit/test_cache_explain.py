@@ -0,0 +1,100 @@
+"""Tests for `sm cache explain` — why a gate missed the result cache."""
+
+import argparse
+
+from slopmop.cli.cache import cmd_cache
+from slopmop.core.cache import InputScope, ResultCache, compute_fingerprint
+from slopmop.core.cache_explain import MAX_LISTED_FILES, explain
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from tests.unit.test_cache import _make_slow_check_class
+
+
+def _declared_scope_class(name):
+    cls = _make_slow_check_class(name)
+    cls.input_scope = lambda self, project_root: InputScope.of(["src"], {".py"})
+    return cls
+
+
+def _run_and_explain(tmp_path, cls, config=None, edit=None):
+    """Run *cls* once, apply *edit*, then explain its next lookup."""
+    registry = CheckRegistry()
+    registry.register(cls)
+    gate = f"overconfidence:{cls._name}"
+    root = str(tmp_path)
+    CheckExecutor(registry=registry).run_checks(root, [gate])
+    if edit is not None:
+        edit()
+    check = cls(config or {})
+    fingerprint = check.cache_fingerprint(root, compute_fingerprint(root))
+    cache = ResultCache.load(root)
+    try:
+        return "\n".join(explain(cache, gate, fingerprint, check.cache_manifest))
+    finally:
+        cache.close()
+
+
+def _src(tmp_path, **files):
+    src = tmp_path / "src"
+    src.mkdir(exist_ok=True)
+    for name, text in files.items():
+        (src / f"{name}.py").write_text(text)
+
+
+class TestExplain:
+    def test_hit(self, tmp_path):
+        _src(tmp_path, app="x = 1")
+        out = _run_and_explain(tmp_path, _declared_scope_class("ex-hit"))
+        assert "cache hit" in out
+
+    def test_never_stored(self, tmp_path):
+        cache = ResultCache.load(str(tmp_path))
+        lines = explain(cache, "overconfidence:ex-none", "f" * 64, None)
+        cache.close()
+        assert "no result has been stored" in lines[0]
+
+    def test_names_changed_files(self, tmp_path):
+        _src(tmp_path, app="x = 1", old="y = 1")
+
+        def edit():
+            (tmp_path / "src" / "app.py").write_text("x = 2")
+            (tmp_path / "src" / "old.py").unlink()
+            (tmp_path / "src" / "new.py").write_text("z = 1")
+
+        out = _run_and_explain(tmp_path, _declared_scope_class("ex-files"), edit=edit)
+        assert "modified: src/app.py" in out
+        assert "removed: src/old.py" in out
+        assert "added: src/new.py" in out
+        assert "config" not in out
+
+    def test_caps_listed_files(self, tmp_path):
+        _src(tmp_path, app="x = 1")
+
+        def edit():
+            _src(tmp_path, **{f"m{i}": "" for i in range(MAX_LISTED_FILES + 3)})
+
+        out = _run_and_explain(tmp_path, _declared_scope_class("ex-cap"), edit=edit)
+        assert "... and 3 more added" in out
+
+    def test_config_change(self, tmp_path):
+        _src(tmp_path, app="x = 1")
+        cls = _declared_scope_class("ex-config")
+        out = _run_and_explain(tmp_path, cls, config={"threshold": 3})
+        assert "config changed" in out
+        assert "modified:" not in out
+
+    def test_unscoped_gate_blames_project(self, tmp_path):
+        (tmp_path / "README.md").write_text("# a")
+
+        def edit():
+            (tmp_path / "README.md").write_text("# b")
+
+        out = _run_and_explain(tmp_path, _make_slow_check_class("ex-global"), edit=edit)
+        assert "declares no input scope" in out
+
+
+class TestCmdCache:
+    def test_unknown_gate(self, tmp_path, capsys):
+        args = argparse.Namespace(gate="nope:missing", project_root=str(tmp_path))
+        assert cmd_cache(args) == 1
+        assert "Unknown gate" in capsys.readouterr().out
@@ -0,0 +1,200 @@
+"""Tests for adaptive per-gate deadlines."""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from slopmop.core import executor as executor_module
+from slopmop.core.deadlines import (
+    DeadlineWatchdog,
+    gate_deadline,
+    gate_deadlines,
+    timed_out_result,
+)
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from slopmop.core.result import CheckResult, CheckStatus, ExecutionSummary
+from slopmop.reporting.timings import TimingStats
+from slopmop.subprocess.runner import SubprocessRunner, submit_in_gate
+from tests.unit.test_executor import make_mock_check_class
+
+SLEEP_30 = [sys.executable, "-c", "import time\ntime.sleep(30)"]
+
+
+def _stats(median, q1=None, q3=None, historical_max=None, samples=10):
+    q1 = median if q1 is None else q1
+    q3 = median if q3 is None else q3
+    return TimingStats(
+        median=median,
+        q1=q1,
+        q3=q3,
+        iqr=q3 - q1,
+        historical_max=median if historical_max is None else historical_max,
+        sample_count=samples,
+    )
+
+
+class TestGateDeadline:
+    def test_steady_gate_gets_a_multiple_of_its_median(self):
+        assert gate_deadline(_stats(10.0)) == 40.0
+
+    def test_noisy_gate_gets_room_for_its_spread(self):
+        deadline = gate_deadline(_stats(10.0, q1=8.0, q3=20.0))
+        assert deadline == 20.0 + 4 * 12.0
+
+    def test_never_below_slowest_seen_run(self):
+        assert gate_deadline(_stats(10.0, historical_max=50.0)) == 75.0
+
+    def test_floor_and_ceiling(self):
+        assert gate_deadline(_stats(0.5)) == 30.0
+        assert gate_deadline(_stats(500.0)) == 900.0
+        assert gate_deadline(_stats(10.0), floor=60.0) == 60.0
+        assert gate_deadline(_stats(10.0), ceiling=25.0) == 30.0
+
+    def test_no_deadline_without_enough_history(self):
+        assert gate_deadline(_stats(10.0, samples=2)) is None
+        assert gate_deadline(_stats(0.0)) is None
+
+    def test_gate_deadlines_skips_gates_without_history(self):
+        deadlines = gate_deadlines(
+            {"a:known": _stats(10.0), "a:new": _stats(10.0, samples=1)}
+        )
+        assert deadlines == {"a:known": 40.0}
+
+    def test_deadlines_are_opt_in(self):
+        from slopmop.sm import create_parser
+
+        parser = create_parser()
+        assert not parser.parse_args(["swab"]).adaptive_timeouts
+        assert parser.parse_args(["swab", "--adaptive-timeouts"]).adaptive_timeouts
+
+
+class TestTimedOutResult:
+    def test_keeps_identity_and_marks_timeout(self):
+        result = CheckResult("a:b", CheckStatus.FAILED, 41.0, output="partial")
+        timed_out = timed_out_result(result, 40.0)
+
+        assert timed_out.status == CheckStatus.TIMEOUT
+        assert timed_out.output == "partial"
+        assert "40s" in (timed_out.error or "")
+
+    def test_summary_counts_timeouts_as_blocking(self):
+        result = CheckResult("a:b", CheckStatus.TIMEOUT, 41.0)
+        summary = ExecutionSummary.from_results([result], 41.0)
+
+        assert summary.timed_out == 1
+        assert not summary.all_passed
+        assert summary.to_dict()["summary"]["timed_out"] == 1
+
+
+class TestDeadlineWatchdog:
+    def test_disarm_before_deadline(self):
+        terminate = MagicMock(return_value=set())
+        watchdog = DeadlineWatchdog(terminate)
+        watchdog.arm("a:b", 1, 5.0)
+
+        assert watchdog.disarm("a:b") is False
+        terminate.assert_not_called()
+
+    def test_expired_gate_is_reported(self):
+        watchdog = DeadlineWatchdog(lambda owners: set(owners))
+        watchdog.arm("a:b", 1, 0.01)
+        time.sleep(0.2)
+
+        assert watchdog.disarm("a:b") is True
+
+    def test_nothing_to_kill_is_not_a_timeout(self):
+        watchdog = DeadlineWatchdog(lambda owners: set())
+        watchdog.arm("a:b", 1, 0.01)
+        time.sleep(0.2)
+
+        assert watchdog.disarm("a:b") is False
+
+
+@pytest.mark.skipif(
+    os.name == "nt",
+    reason="Process-group tree cleanup is exercised on POSIX runners.",
+)
+class TestExecutorDeadlines:
+    def _sleeper(self):
+        cls = make_mock_check_class("sleeper")
+
+        def run(self, project_root):
+            proc = self._runner.run(SLEEP_30, timeout=60)
+            status = CheckStatus.PASSED if proc.success else CheckStatus.FAILED
+            return CheckResult(self.full_name, status, proc.duration)
+
+        cls.run = run
+        return cls
+
+    @pytest.mark.parametrize("backend", ["thread", "asyncio"])
+    def test_wedged_gate_times_out(self, tmp_path, monkeypatch, backend):
+        runner = SubprocessRunner(validator=MagicMock())
+        monkeypatch.setattr(executor_module, "get_runner", lambda: runner)
+        monkeypatch.setattr("slopmop.checks.base.get_runner", lambda: runner)
+        registry = CheckRegistry()
+        registry.register(self._sleeper())
+        executor = CheckExecutor(
+            registry=registry, kill_grace_period=0.5, backend=backend
+        )
+
+        start = time.time()
+        summary = executor.run_checks(
+            str(tmp_path),
+            ["overconfidence:sleeper"],
+            deadlines={"overconfidence:sleeper": 1.0},
+        )
+
+        assert time.time() - start < 10
+        (result,) = summary.results
+        assert result.status == CheckStatus.TIMEOUT
+        assert summary.timed_out == 1
+        assert not summary.all_passed
+
+    @pytest.mark.parametrize("backend", ["thread", "asyncio"])
+    def test_wedged_tool_in_gate_pool_times_out(self, tmp_path, monkeypatch, backend):
+        """A scanner wedged in the gate's own pool (security-local) is stopped."""
+        runner = SubprocessRunner(validator=MagicMock())
+        monkeypatch.setattr(executor_module, "get_runner", lambda: runner)
+        monkeypatch.setattr("slopmop.checks.base.get_runner", lambda: runner)
+        cls = make_mock_check_class("scanners")
+
+        def run(self, project_root):
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                proc = submit_in_gate(pool, self._runner.run, SLEEP_30, 60).result()
+            status = CheckStatus.PASSED if proc.success else CheckStatus.FAILED
+            return CheckResult(self.full_name, status, proc.duration)
+
+        cls.run = run
+        registry = CheckRegistry()
+        registry.register(cls)
+        executor = CheckExecutor(
+            registry=registry, kill_grace_period=0.5, backend=backend
+        )
+
+        start = time.time()
+        summary = executor.run_checks(
+            str(tmp_path),
+            ["overconfidence:scanners"],
+            deadlines={"overconfidence:scanners": 1.0},
+        )
+
+        assert time.time() - start < 10
+        assert summary.results[0].status == CheckStatus.TIMEOUT
+
+    def test_gate_within_deadline_keeps_its_result(self, tmp_path):
+        registry = CheckRegistry()
+        registry.register(make_mock_check_class("quick", duration=0.1))
+        executor = CheckExecutor(registry=registry)
+
+        summary = executor.run_checks(
+            str(tmp_path),
+            ["overconfidence:quick"],
+            deadlines={"overconfidence:quick": 5.0},
+        )
+
+        assert summary.results[0].status == CheckStatus.PASSED
@@ -1,19 +1,18 @@
-"""Tests for string duplication check (wrapper for find-duplicate-strings)."""
+"""Tests for string duplication check."""
 
 import json
 import os
-import shutil
-from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
+from slopmop.checks.quality._string_inventory import extract_strings
 from slopmop.checks.quality.duplicate_strings import StringDuplicationCheck
 from slopmop.core.result import CheckStatus
 
 
 class TestStringDuplicationCheck:
-    """Tests for StringDuplicationCheck wrapper."""
+    """Tests for StringDuplicationCheck."""
 
     @pytest.fixture
     def check(self):
@@ -64,13 +63,6 @@ class TestStringDuplicationCheck:
         (tmp_path / "test.txt").write_text("hello")
         assert check.is_applicable(str(tmp_path)) is False
 
-    def test_get_tool_path(self, check):
-        """Test tool path points to find-duplicate-strings (vendored or global)."""
-        tool_path = check._get_tool_path()
-        if tool_path is not None:
-            # Tool can be vendored (tools/.../index.js) or globally installed
-            assert "find-duplicate-strings" in str(tool_path)
-
     def test_get_effective_config_defaults(self, check):
         """Test effective config has defaults."""
         config = check._get_effective_config()
@@ -89,43 +81,6 @@ class TestStringDuplicationCheck:
         # Default should still be present
         assert config["min_file_count"] == 1
 
-    def test_build_command_basic(self, check):
-        """Test command building with basic config."""
-        config = check._get_effective_config()
-        cmd = check._build_command(config)
-
-        # Tool may be invoked via "node <path>/index.js" (vendored)
-        # or directly as a binary (global install) — both are valid
-        assert any("find-duplicate-strings" in c for c in cmd)
-        assert "--threshold" in cmd
-        assert "--json" in cmd
-        assert "2" in cmd  # default threshold
-
-    def test_node_resolved_through_find_tool(self, check, monkeypatch, tmp_path):
-        """node is resolved via find_tool (the same primitive the requirements
-        contract probes), not invoked bare — so "declared present" and "the gate
-        runs it" can't drift."""
-        monkeypatch.setattr(
-            "slopmop.checks.quality.duplicate_strings.find_tool",
-            lambda name, root: "/opt/node/bin/node" if name == "node" else None,
-        )
-        js_tool = tmp_path / "index.js"
-        js_tool.write_text("// tool")
-        cmd = check._build_command(
-            check._get_effective_config(), js_tool, str(tmp_path)
-        )
-        assert cmd[0] == "/opt/node/bin/node"  # resolved, not bare "node"
-
-    def test_build_command_with_ignore(self, check):
-        """Test command includes ignore patterns."""
-        config = check._get_effective_config()
-        cmd = check._build_command(config)
-
-        assert "--ignore" in cmd
-        # Should have comma-separated ignore list with glob patterns
-        ignore_idx = cmd.index("--ignore")
-        assert "**/node_modules/**" in cmd[ignore_idx + 1]
-
     def test_is_noise_short_strings(self, check):
         """Test that short strings (< 8 chars) are detected as noise."""
         assert check._is_noise("\\n") is True
@@ -319,215 +274,77 @@ class TestStringDuplicationCheck:
 
         assert "and 7 more files" in output
 
-    @patch.object(StringDuplicationCheck, "_run_command")
-    def test_run_tool_not_found(self, mock_run, check, tmp_path):
-        """Test run handles missing tool gracefully."""
-        # _get_tool_path returns None when tool not found
-        with patch.object(check, "_get_tool_path", return_value=None):
-            result = check.run(str(tmp_path))
-
-            assert result.status == CheckStatus.WARNED
-            assert "not installed" in result.error.lower()
-
-    @patch.object(StringDuplicationCheck, "_run_command")
-    def test_run_no_duplicates(self, mock_run, check, tmp_path):
+    def test_run_no_duplicates(self, check, tmp_path):
         """Test run when no duplicates found."""
-        mock_result = MagicMock()
-        mock_result.stdout = "[]"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        (tmp_path / "a.py").write_text('MSG = "only said once here"\n')
 
-        with patch.object(
-            check, "_get_tool_path", return_value=Path("/fake/tool/index.js")
-        ):
-            result = check.run(str(tmp_path))
+        result = check.run(str(tmp_path))
 
-            assert result.status == CheckStatus.PASSED
+        assert result.status == CheckStatus.PASSED
 
-    @patch.object(StringDuplicationCheck, "_run_command")
-    def test_run_with_duplicates(self, mock_run, check, tmp_path):
+    def test_run_with_duplicates(self, check, tmp_path):
         """Test run when duplicates are found."""
-        # Return findings that pass the filter (multi-word to pass min_words=3)
-        findings = [
-            {
-                "key": "a significant duplicate string found here",
-                "count": 10,
-                "fileCount": 5,
-                "files": [f"file{i}.py" for i in range(5)],
-            }
-        ]
-        mock_result = MagicMock()
-        mock_result.stdout = str(findings).replace("'", '"')  # JSON format
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        for name in ("a.py", "b.py"):
+            (tmp_path / name).write_text(
+                'MSG = "a significant duplicate string found here"\n'
+                'ALSO = "a significant duplicate string found here"\n'
+            )
+
+        result = check.run(str(tmp_path))
+
+        assert result.status == CheckStatus.FAILED
+        assert "a significant duplicate string found here" in result.output
+        assert "4 occurrences in 2 files" in result.output
+        assert {f.file for f in result.findings} == {"a.py"}
+
+    def test_run_threshold_is_exclusive(self, tmp_path):
+        """A literal must occur MORE than threshold times to be reported."""
+        (tmp_path / "a.py").write_text('A = "said exactly twice here"\n')
+        (tmp_path / "b.py").write_text('B = "said exactly twice here"\n')
+
+        assert StringDuplicationCheck({}).run(str(tmp_path)).status == (
+            CheckStatus.PASSED
+        )
+        result = StringDuplicationCheck({"threshold": 1}).run(str(tmp_path))
+        assert result.status == CheckStatus.FAILED
 
-        with patch.object(
-            check, "_get_tool_path", return_value=Path("/fake/tool/index.js")
-        ):
-            with patch("json.loads", return_value=findings):
-                result = check.run(str(tmp_path))
-
-                assert result.status == CheckStatus.FAILED
-                assert "a significant duplicate string found here" in result.output
-
-    @patch.object(StringDuplicationCheck, "_run_command")
-    def test_run_json_parse_error(self, mock_run, check, tmp_path):
-        """Test run handles JSON parse errors."""
-        mock_result = MagicMock()
-        mock_result.stdout = "invalid json {"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        with patch.object(
-            check, "_get_tool_path", return_value=Path("/fake/tool/index.js")
-        ):
+    def test_run_scan_exception(self, check, tmp_path):
+        """Test run handles scan exceptions."""
+        with patch.object(check, "_scan_files", side_effect=Exception("walk broke")):
             result = check.run(str(tmp_path))
 
-            assert result.status == CheckStatus.ERROR
-            assert "parse" in result.error.lower()
+        assert result.status == CheckStatus.ERROR
+        assert "failed" in result.error.lower()
 
-    @patch.object(StringDuplicationCheck, "_run_command")
-    def test_run_command_exception(self, mock_run, check, tmp_path):
-        """Test run handles command exceptions."""
-        mock_run.side_effect = Exception("Command failed")
+    def test_run_ignores_inventory_write_errors(self, check, tmp_path):
+        """Best-effort inventory failures should not fail the gate."""
+        (tmp_path / "a.py").write_text('MSG = "only said once here"\n')
+        (tmp_path / ".slopmop").write_text("not a directory")
 
-        with patch.object(
-            check, "_get_tool_path", return_value=Path("/fake/tool/index.js")
-        ):
-            result = check.run(str(tmp_path))
+        result = check.run(str(tmp_path))
 
-            assert result.status == CheckStatus.ERROR
-            assert "failed" in result.error.lower()
+        assert result.status == CheckStatus.PASSED
 
-    @patch.object(StringDuplicationCheck, "_run_command")
-    def test_run_ignores_inventory_write_errors(self, mock_run, check, tmp_path):
-        """Best-effort inventory failures should not fail the gate."""
-        mock_result = MagicMock()
-        mock_result.stdout = "[]"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
-
-        with (
-            patch.object(
-                check, "_get_tool_path", return_value=Path("/fake/tool/index.js")
-            ),
-            patch.object(
-                check,
-                "_write_string_inventory",
-                side_effect=ValueError("bad inventory"),
-            ),
+    def test_scan_files_respects_patterns(self, check, tmp_path):
+        """Include globs match at any depth; ignore globs and noise dirs drop."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "tests").mkdir()
+        (tmp_path / "node_modules").mkdir()
+        for rel in (
+            "top.py",
+            "pkg/mod.py",
+            "pkg/test_mod.py",
+            "pkg/notes.txt",
+            "tests/helper.py",
+            "node_modules/dep.py",
         ):
-            result = check.run(str(tmp_path))
+            (tmp_path / rel).write_text("x = 1\n")
 
-        assert result.status == CheckStatus.PASSED
+        files = check._scan_files(str(tmp_path), check._get_effective_config())
 
-    def test_load_strip_function_success(self, check):
-        """Test loading the strip_docstrings function from vendored tool."""
-        fn = check._load_strip_function()
-        # The function should be loadable if the tool is vendored
-        strip_path = check._get_strip_docstrings_path()
-        if strip_path is not None and strip_path.exists():
-            assert fn is not None
-            assert callable(fn)
-            # Verify it strips docstrings
-            result = fn('def foo():\n    """docstring"""\n    pass\n')
-            assert '"""docstring"""' not in result
-            assert "pass" in result
-        else:
-            assert fn is None
-
-    def test_load_strip_function_missing_script(self, check):
-        """Test loading returns None when script doesn't exist."""
-        with patch.object(check, "_get_strip_docstrings_path", return_value=None):
-            assert check._load_strip_function() is None
-
-    def test_preprocess_preserves_line_numbers(self, check, tmp_path):
-        """Test that preprocessing preserves line count in stripped files."""
-        src = tmp_path / "src"
-        src.mkdir()
-        # Write a file with a multi-line docstring
-        code = (
-            "def foo():\n"
-            '    """This is\n'
-            "    a multi-line\n"
-            '    docstring."""\n'
-            '    x = "real string"\n'
-            "    return x\n"
-        )
-        (src / "example.py").write_text(code)
-
-        config = {
-            "include_patterns": ["**/*.py"],
-            "ignore_patterns": [],
-        }
-        tmp_dir = check._preprocess_python_files(str(src), config)
-
-        if tmp_dir is not None:
-            try:
-                stripped_file = Path(tmp_dir) / "example.py"
-                assert stripped_file.exists()
-                stripped = stripped_file.read_text()
-                # Line count should be preserved
-                assert stripped.count("\n") == code.count("\n")
-                # Real string should still be present
-                assert '"real string"' in stripped
-                # Docstring content should be gone
-                assert "multi-line" not in stripped
-            finally:
-                shutil.rmtree(tmp_dir, ignore_errors=True)
-
-    def test_preprocess_no_python_patterns(self, check, tmp_path):
-        """Test preprocessing returns None for non-Python patterns."""
-        config = {
-            "include_patterns": ["**/*.js"],
-            "ignore_patterns": [],
-        }
-        result = check._preprocess_python_files(str(tmp_path), config)
-        assert result is None
-
-    def test_preprocess_no_matching_files(self, check, tmp_path):
-        """Test preprocessing returns None when no .py files match."""
-        config = {
-            "include_patterns": ["**/*.py"],
-            "ignore_patterns": [],
-        }
-        # tmp_path has no .py files
-        result = check._preprocess_python_files(str(tmp_path), config)
-        assert result is None
-
-    def test_preprocess_respects_ignore_patterns(self, check, tmp_path):
-        """Test preprocessing skips files matching ignore patterns."""
-        (tmp_path / "good.py").write_text("x = 1\n")
-        (tmp_path / "test_bad.py").write_text("x = 1\n")
-
-        config = {
-            "include_patterns": ["**/*.py"],
-            "ignore_patterns": ["test_*"],
-        }
-        tmp_dir = check._preprocess_python_files(str(tmp_path), config)
-
-        if tmp_dir is not None:
-            try:
-                # good.py should be present, test_bad.py should not
-                assert (Path(tmp_dir) / "good.py").exists()
-                assert not (Path(tmp_dir) / "test_bad.py").exists()
-            finally:
-                shutil.rmtree(tmp_dir, ignore_errors=True)
-
-    def test_preprocess_strip_function_unavailable(self, check, tmp_path):
-        """Test preprocessing returns None when strip function unavailable."""
-        (tmp_path / "code.py").write_text("x = 1\n")
-
-        config = {
-            "include_patterns": ["**/*.py"],
-            "ignore_patterns": [],
-        }
-        with patch.object(check, "_load_strip_function", return_value=None):
-            result = check._preprocess_python_files(str(tmp_path), config)
-            assert result is None
-
-    @patch.object(StringDuplicationCheck, "_run_command")
-    def test_run_writes_per_file_string_inventory(self, mock_run, check, tmp_path):
+        assert sorted(files) == ["pkg/mod.py", "top.py"]
+
+    def test_run_writes_per_file_string_inventory(self, check, tmp_path):
         """Run stores per-file string counts for incremental scans."""
         src = tmp_path / "src"
         src.mkdir()
@@ -536,15 +353,8 @@ class TestStringDuplicationCheck:
             'FIRST = "shared release prep literal"\n'
             'SECOND = "shared release prep literal"\n'
         )
-        mock_result = MagicMock()
-        mock_result.stdout = "[]"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
 
-        with patch.object(
-            check, "_get_tool_path", return_value=Path("/fake/tool/index.js")
-        ):
-            result = check.run(str(tmp_path))
+        result = check.run(str(tmp_path))
 
         assert result.status == CheckStatus.PASSED
         inventory_path = tmp_path / ".slopmop" / "string-duplication-inventory.json"
@@ -553,6 +363,25 @@ class TestStringDuplicationCheck:
         assert file_inventory["strings"]["shared release prep literal"] == 2
         assert "ignored module docstring" not in file_inventory["strings"]
 
+    def test_run_reextracts_only_changed_files(self, check, tmp_path):
+        """A second run reuses the inventory for files whose hash matches."""
+        (tmp_path / "a.py").write_text('A = "one shared message text"\n')
+        (tmp_path / "b.py").write_text('B = "one shared message text"\n')
+        check.run(str(tmp_path))
+
+        (tmp_path / "b.py").write_text(
+            'B = "one shared message text"\nC = "one shared message text"\n'
+        )
+        with patch(
+            "slopmop.checks.quality._string_inventory.extract_strings",
+            wraps=extract_strings,
+        ) as spy:
+            result = check.run(str(tmp_path))
+
+        assert [c.args[0] for c in spy.call_args_list] == ["b.py"]
+        assert result.status == CheckStatus.FAILED
+        assert "3 occurrences in 2 files" in result.output
+
 
 class TestStringDuplicationCacheInputs:
     """Tests for the cache_inputs scoped fingerprint."""
@@ -649,39 +478,10 @@ class TestFindingPathsAreProjectRelative:
 
         assert "x.py" in out
 
-    def test_resolved_tempdir_paths_map_back_to_project(self, tmp_path):
-        """The scanner reports RESOLVED paths, the caller holds the raw one.
-
-        On macOS /var is a symlink to /private/var, so tempfile hands back
-        /var/folders/... while the scanner reports /private/var/folders/...
-        Replacing only the unresolved spelling matched the suffix and left
-        "/private" glued to the front of the project path. A real symlink is
-        used here so the two spellings genuinely differ on any platform.
-        """
-        from slopmop.checks.quality.duplicate_strings import _remap_scan_paths
-
-        real_tmp = tmp_path / "real_tmp"
-        real_tmp.mkdir()
-        link_tmp = tmp_path / "link_tmp"
-        link_tmp.symlink_to(real_tmp)
-
-        project_root = str(tmp_path / "proj")
-        # What the scanner emits: the resolved spelling.
-        stdout = json.dumps({"file": f"{real_tmp}/pkg/mod.py"})
-
-        # What the caller passes: the unresolved spelling it created.
-        remapped = _remap_scan_paths(stdout, str(link_tmp), project_root)
-
-        assert json.loads(remapped)["file"] == f"{project_root}/pkg/mod.py"
-        assert str(real_tmp) not in remapped
-        assert not os.path.relpath(
-            json.loads(remapped)["file"], project_root
-        ).startswith("..")
-
 
 class TestSymlinkedProjectRoot:
     def test_symlinked_root_still_yields_relative_paths(self, tmp_path):
-        """The scanner emits realpaths; a symlinked root must still match."""
+        """Realpath'd file paths must still match a symlinked root."""
         from slopmop.checks.quality.duplicate_strings import StringDuplicationCheck
 
         real_root = tmp_path / "real"
@@ -698,7 +498,6 @@ class TestSymlinkedProjectRoot:
                 "key": "a repeated message",
                 "count": 3,
                 "fileCount": 1,
-                # What the scanner actually emits: a resolved realpath.
                 "files": [str(target.resolve())],
             }
         ]
@@ -0,0 +1,137 @@
+"""Tests for the streaming results API (CheckExecutor.iter_results)."""
+
+import asyncio
+import json
+
+import pytest
+
+from slopmop.cli.validate import _run_streaming_jsonl
+from slopmop.core.events import CheckEvent, EventKind
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from slopmop.core.result import CheckResult, CheckStatus, Finding
+from tests.unit.test_executor import make_mock_check_class
+
+LINT = "overconfidence:lint"
+TESTS = "overconfidence:tests"
+
+
+def _executor(*classes) -> CheckExecutor:
+    registry = CheckRegistry()
+    for cls in classes:
+        registry.register(cls)
+    return CheckExecutor(registry=registry, fail_fast=False)
+
+
+def _linter_with_findings():
+    cls = make_mock_check_class("lint", status=CheckStatus.FAILED)
+
+    def run(self, project_root):
+        return CheckResult(
+            self.full_name,
+            CheckStatus.FAILED,
+            0.0,
+            findings=[
+                Finding(message="unused import", file="a.py", line=1),
+                Finding(message="unused variable", file="b.py", line=2),
+            ],
+        )
+
+    cls.run = run
+    return cls
+
+
+class TestIterResults:
+    def test_events_in_order(self, tmp_path):
+        executor = _executor(
+            _linter_with_findings(),
+            make_mock_check_class("tests", depends_on=[LINT]),
+        )
+        stream = executor.iter_results(str(tmp_path), [LINT, TESTS])
+
+        events = [(e.kind, e.name) for e in stream]
+
+        assert events == [
+            (EventKind.STARTED, LINT),
+            (EventKind.FINDING, LINT),
+            (EventKind.FINDING, LINT),
+            (EventKind.COMPLETED, LINT),
+            (EventKind.SKIPPED, TESTS),
+        ]
+        assert stream.summary is not None
+        assert stream.summary.failed == 1
+
+    def test_not_applicable_gate_is_skipped_event(self, tmp_path):
+        executor = _executor(make_mock_check_class("absent", applicable=False))
+        events = list(executor.iter_results(str(tmp_path), ["overconfidence:absent"]))
+
+        assert [(e.kind, e.reason) for e in events] == [(EventKind.SKIPPED, "n/a")]
+
+    def test_async_iteration(self, tmp_path):
+        executor = _executor(make_mock_check_class("lint"))
+
+        async def collect():
+            return [e.kind async for e in executor.iter_results(str(tmp_path), [LINT])]
+
+        assert asyncio.run(collect()) == [EventKind.STARTED, EventKind.COMPLETED]
+
+    def test_run_errors_reach_the_consumer(self, tmp_path):
+        executor = _executor(make_mock_check_class("lint"))
+        stream = executor.iter_results(str(tmp_path), [LINT], not_an_option=True)
+
+        with pytest.raises(TypeError):
+            list(stream)
+
+    def test_stream_is_single_use(self, tmp_path):
+        stream = _executor(make_mock_check_class("lint")).iter_results(
+            str(tmp_path), [LINT]
+        )
+        list(stream)
+        with pytest.raises(RuntimeError):
+            list(stream)
+
+    def test_executor_callbacks_are_restored(self, tmp_path):
+        executor = _executor(make_mock_check_class("lint"))
+        completed = []
+        executor.set_progress_callback(completed.append)
+
+        list(executor.iter_results(str(tmp_path), [LINT]))
+        assert completed == []
+
+        executor.run_checks(str(tmp_path), [LINT], use_cache=False)
+        assert len(completed) == 1
+        assert executor._on_check_start is None
+
+
+class TestCheckEvent:
+    def test_to_dict_omits_empty_fields(self):
+        event = CheckEvent(EventKind.STARTED, LINT, 12.3456, category="python")
+        assert event.to_dict() == {
+            "event": "started",
+            "name": LINT,
+            "time": 12.346,
+            "category": "python",
+        }
+
+    def test_finding_event_carries_finding_only(self):
+        finding = Finding(message="boom", file="a.py", line=3)
+        result = CheckResult(LINT, CheckStatus.FAILED, 0.0, findings=[finding])
+        event = CheckEvent(EventKind.FINDING, LINT, 0.0, result=result, finding=finding)
+        assert "result" not in event.to_dict()
+        assert event.to_dict()["finding"] == finding.to_dict()
+
+
+def test_jsonl_output_is_one_event_per_line(tmp_path, capsys):
+    executor = _executor(_linter_with_findings())
+    summary = _run_streaming_jsonl(
+        executor, dict(project_root=str(tmp_path), check_names=[LINT])
+    )
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["event"] for line in lines] == [
+        "started",
+        "finding",
+        "finding",
+        "completed",
+    ]
+    assert summary.failed == 1
@@ -0,0 +1,129 @@
+"""Tests for the process-pool lane used by CPU-bound in-process gates."""
+
+import os
+
+from slopmop.checks.base import BaseCheck, ExecutionAffinity, Flaw, GateCategory
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from slopmop.core.result import CheckResult, CheckStatus
+from tests.unit.test_executor import make_mock_check_class
+
+
+class CpuBoundCheck(BaseCheck):
+    """Module-level so the spawn start method can import it by reference."""
+
+    execution_affinity = ExecutionAffinity.IN_PROCESS_CPU
+
+    @property
+    def name(self) -> str:
+        return "cpu-bound"
+
+    @property
+    def display_name(self) -> str:
+        return "CPU bound"
+
+    @property
+    def category(self) -> GateCategory:
+        return GateCategory.OVERCONFIDENCE
+
+    @property
+    def flaw(self) -> Flaw:
+        return Flaw.OVERCONFIDENCE
+
+    def is_applicable(self, project_root: str) -> bool:
+        return True
+
+    def run(self, project_root: str) -> CheckResult:
+        return CheckResult(
+            name=self.full_name,
+            status=CheckStatus.PASSED,
+            duration=0.0,
+            output=f"pid={os.getpid()}",
+        )
+
+
+class CountingCpuCheck(CpuBoundCheck):
+    """Counts how often the parent process pickles it."""
+
+    pickles = 0
+
+    @property
+    def name(self) -> str:
+        return "counting-cpu"
+
+    def __getstate__(self):
+        type(self).pickles += 1
+        return super().__getstate__()
+
+
+class TestProcessLane:
+    """CPU-affinity gates run out-of-process; everything else is unchanged."""
+
+    def _registry(self) -> CheckRegistry:
+        registry = CheckRegistry()
+        registry.register(CpuBoundCheck)
+        return registry
+
+    def test_default_keeps_cpu_gates_in_thread(self, tmp_path):
+        executor = CheckExecutor(registry=self._registry())
+        summary = executor.run_checks(str(tmp_path), ["overconfidence:cpu-bound"])
+
+        assert summary.passed == 1
+        assert summary.results[0].output == f"pid={os.getpid()}"
+
+    def test_cpu_gate_runs_in_worker_process(self, tmp_path):
+        executor = CheckExecutor(registry=self._registry(), process_workers=1)
+        summary = executor.run_checks(str(tmp_path), ["overconfidence:cpu-bound"])
+
+        assert summary.passed == 1
+        assert summary.results[0].output.startswith("pid=")
+        assert summary.results[0].output != f"pid={os.getpid()}"
+        assert executor._process_pool is None  # torn down after the run
+
+    def test_callbacks_and_cache_behave_as_thread_lane(self, tmp_path):
+        started: list = []
+        completed: list = []
+        executor = CheckExecutor(registry=self._registry(), process_workers=1)
+        executor.set_start_callback(lambda name, _cat: started.append(name))
+        executor.set_progress_callback(completed.append)
+
+        executor.run_checks(str(tmp_path), ["overconfidence:cpu-bound"])
+        second = executor.run_checks(str(tmp_path), ["overconfidence:cpu-bound"])
+
+        assert started == ["overconfidence:cpu-bound"] * 2
+        assert [r.name for r in completed] == ["overconfidence:cpu-bound"] * 2
+        assert second.results[0].cached is True
+
+    def test_cpu_gate_is_pickled_once(self, tmp_path):
+        registry = CheckRegistry()
+        registry.register(CountingCpuCheck)
+        executor = CheckExecutor(registry=registry, process_workers=1)
+
+        summary = executor.run_checks(str(tmp_path), ["overconfidence:counting-cpu"])
+
+        assert summary.results[0].output != f"pid={os.getpid()}"
+        assert CountingCpuCheck.pickles == 1
+
+    def test_unpicklable_cpu_gate_falls_back_to_thread(self, tmp_path):
+        # Classes built inside a factory can't be pickled by reference.
+        check_class = make_mock_check_class("dynamic-cpu")
+        check_class.execution_affinity = ExecutionAffinity.IN_PROCESS_CPU
+        registry = CheckRegistry()
+        registry.register(check_class)
+
+        executor = CheckExecutor(registry=registry, process_workers=1)
+        summary = executor.run_checks(str(tmp_path), ["overconfidence:dynamic-cpu"])
+
+        assert summary.passed == 1
+        # run_count is a class attribute in *this* process, so it only moves
+        # when the check ran in-thread.
+        assert check_class.run_count == 1
+
+    def test_check_survives_pickle_round_trip(self):
+        import pickle
+
+        check = CpuBoundCheck({"enabled": True})
+        clone = pickle.loads(pickle.dumps(check))
+
+        assert clone.config == {"enabled": True}
+        assert clone._runner is not None
@@ -0,0 +1,121 @@
+"""Tests for terminating in-flight gates when fail-fast trips."""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from slopmop.core import executor as executor_module
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from slopmop.core.result import CheckResult, CheckStatus, SkipReason
+from slopmop.subprocess.runner import SubprocessRunner, submit_in_gate
+from tests.unit.test_executor import make_mock_check_class
+
+SLEEP_30 = [sys.executable, "-c", "import time\ntime.sleep(30)"]
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    runner = SubprocessRunner(validator=MagicMock())
+    monkeypatch.setattr(executor_module, "get_runner", lambda: runner)
+    return runner
+
+
+def _sleeper_class(runner: SubprocessRunner):
+    cls = make_mock_check_class("sleeper")
+
+    def run(self, project_root):
+        proc = runner.run(SLEEP_30, timeout=60)
+        status = CheckStatus.PASSED if proc.success else CheckStatus.FAILED
+        return CheckResult(self.full_name, status, proc.duration)
+
+    cls.run = run
+    return cls
+
+
+def _fan_out_sleeper_class():
+    """A gate that shells out from its own pool, as security-local does."""
+    cls = make_mock_check_class("sleeper")
+
+    def run(self, project_root):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [
+                submit_in_gate(pool, self._runner.run, SLEEP_30, 60) for _ in range(2)
+            ]
+            procs = [f.result() for f in futures]
+        passed = all(proc.success for proc in procs)
+        status = CheckStatus.PASSED if passed else CheckStatus.FAILED
+        return CheckResult(self.full_name, status, max(p.duration for p in procs))
+
+    cls.run = run
+    return cls
+
+
+@pytest.mark.skipif(
+    os.name == "nt",
+    reason="Process-group tree cleanup is exercised on POSIX runners.",
+)
+class TestFailFastKill:
+    def test_failure_terminates_slow_gate(self, tmp_path, runner):
+        registry = CheckRegistry()
+        registry.register(_sleeper_class(runner))
+        registry.register(
+            make_mock_check_class("boom", status=CheckStatus.FAILED, duration=0.3)
+        )
+        executor = CheckExecutor(
+            registry=registry, fail_fast=True, kill_grace_period=0.5
+        )
+
+        start = time.time()
+        summary = executor.run_checks(
+            str(tmp_path), ["overconfidence:sleeper", "overconfidence:boom"]
+        )
+        elapsed = time.time() - start
+
+        results = {r.name: r for r in summary.results}
+        assert elapsed < 10
+        sleeper = results["overconfidence:sleeper"]
+        assert sleeper.status == CheckStatus.SKIPPED
+        assert sleeper.skip_reason == SkipReason.CANCELLED
+
+    def test_gate_without_processes_keeps_its_result(self, tmp_path, runner):
+        registry = CheckRegistry()
+        registry.register(make_mock_check_class("steady", duration=0.6))
+        registry.register(
+            make_mock_check_class("boom", status=CheckStatus.FAILED, duration=0.1)
+        )
+        executor = CheckExecutor(registry=registry, fail_fast=True)
+
+        summary = executor.run_checks(
+            str(tmp_path), ["overconfidence:steady", "overconfidence:boom"]
+        )
+
+        steady = next(r for r in summary.results if r.name == "steady")
+        assert steady.status == CheckStatus.PASSED
+
+    @pytest.mark.parametrize("backend", ["thread", "asyncio"])
+    def test_failure_terminates_gate_pool_processes(
+        self, tmp_path, runner, monkeypatch, backend
+    ):
+        monkeypatch.setattr("slopmop.checks.base.get_runner", lambda: runner)
+        registry = CheckRegistry()
+        registry.register(_fan_out_sleeper_class())
+        registry.register(
+            make_mock_check_class("boom", status=CheckStatus.FAILED, duration=0.3)
+        )
+        executor = CheckExecutor(
+            registry=registry, fail_fast=True, kill_grace_period=0.5, backend=backend
+        )
+
+        start = time.time()
+        summary = executor.run_checks(
+            str(tmp_path), ["overconfidence:sleeper", "overconfidence:boom"]
+        )
+
+        assert time.time() - start < 10
+        sleeper = next(r for r in summary.results if r.name.endswith("sleeper"))
+        assert sleeper.skip_reason == SkipReason.CANCELLED
@@ -0,0 +1,161 @@
+"""Tests for the per-file finding cache."""
+
+import importlib.util
+import json
+import os
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from slopmop.checks.quality.debugger_artifacts import DebuggerArtifactsCheck
+from slopmop.checks.quality.loc_lock import LocLockCheck
+from slopmop.core.file_cache import (
+    CACHE_DIR,
+    CACHE_SUBDIR,
+    FileFindingCache,
+    config_key,
+    source_salt,
+)
+from slopmop.core.result import CheckStatus, Finding, FindingLevel
+from slopmop.core.snapshot import ProjectSnapshot, use_snapshot
+
+HOUR_AGO = time.time() - 3600
+
+
+def _write(path: Path, text: str, mtime: float = HOUR_AGO) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+class TestFileFindingCache:
+    def test_unchanged_file_is_not_rescanned(self, tmp_path):
+        _write(tmp_path / "a.py", "x = 1\n")
+        scan = MagicMock(return_value=[["a.py", 1]])
+
+        with FileFindingCache(str(tmp_path), "g:a", "k") as cache:
+            assert cache.scan("a.py", scan) == [["a.py", 1]]
+        with FileFindingCache(str(tmp_path), "g:a", "k") as cache:
+            assert cache.scan("a.py", scan) == [["a.py", 1]]
+            assert (cache.hits, cache.misses) == (1, 0)
+        assert scan.call_count == 1
+
+    def test_edited_file_is_rescanned(self, tmp_path):
+        path = _write(tmp_path / "a.py", "x = 1\n")
+        with FileFindingCache(str(tmp_path), "g:a", "k") as cache:
+            cache.scan("a.py", lambda: "old")
+
+        _write(path, "x = 2\n", mtime=HOUR_AGO + 1)
+        with FileFindingCache(str(tmp_path), "g:a", "k") as cache:
+            assert cache.scan("a.py", lambda: "new") == "new"
+
+    def test_config_change_discards_entries(self, tmp_path):
+        _write(tmp_path / "a.py", "x = 1\n")
+        with FileFindingCache(str(tmp_path), "g:a", "k1") as cache:
+            cache.scan("a.py", lambda: "old")
+        with FileFindingCache(str(tmp_path), "g:a", "k2") as cache:
+            assert cache.scan("a.py", lambda: "new") == "new"
+
+    def test_save_keeps_only_scanned_files(self, tmp_path):
+        _write(tmp_path / "a.py", "a\n")
+        _write(tmp_path / "b.py", "b\n")
+        with FileFindingCache(str(tmp_path), "g:a", "k") as cache:
+            cache.scan("a.py", lambda: 1)
+            cache.scan("b.py", lambda: 2)
+        with FileFindingCache(str(tmp_path), "g:a", "k") as cache:
+            cache.scan("a.py", lambda: 1)
+
+        data = json.loads(
+            (tmp_path / CACHE_DIR / CACHE_SUBDIR / "g_a.json").read_text()
+        )
+        assert set(data["files"]) == {"a.py"}
+
+    def test_exception_leaves_cache_untouched(self, tmp_path):
+        _write(tmp_path / "a.py", "a\n")
+        try:
+            with FileFindingCache(str(tmp_path), "g:a", "k") as cache:
+                cache.scan("a.py", lambda: 1)
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+        assert not (tmp_path / CACHE_DIR / CACHE_SUBDIR).exists()
+
+    def test_config_key_is_order_independent(self):
+        assert config_key("g", {"a": 1, "b": [2]}) == config_key(
+            "g", {"b": [2], "a": 1}
+        )
+        assert config_key("g", {"a": 1}) != config_key("g", {"a": 2})
+        assert config_key("g", {}) != config_key("g", {}, salt="v2")
+
+    def test_source_salt_covers_helper_modules(self, tmp_path):
+        def load(name, text):
+            path = _write(tmp_path / f"{name}.py", text)
+            spec = importlib.util.spec_from_file_location(name, path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+
+        old = load("helper_old", "RULE = 1\n")
+        new = load("helper_new", "RULE = 2\n")
+
+        plain = source_salt(DebuggerArtifactsCheck)
+        assert source_salt(DebuggerArtifactsCheck, (old,)) != plain
+        assert source_salt(DebuggerArtifactsCheck, (old,)) != source_salt(
+            DebuggerArtifactsCheck, (new,)
+        )
+
+
+class TestFindingRoundTrip:
+    def test_from_dict_inverts_to_dict(self):
+        finding = Finding(
+            message="m",
+            level=FindingLevel.WARNING,
+            file="a.py",
+            line=3,
+            column=2,
+            rule_id="r",
+            fix_strategy="f",
+        )
+        assert Finding.from_dict(finding.to_dict()) == finding
+
+
+class TestCachedGates:
+    def test_debugger_artifacts_only_rescans_edited_file(self, tmp_path):
+        _write(tmp_path / "src" / "a.py", "breakpoint()\n")
+        _write(tmp_path / "src" / "b.py", "x = 1\n")
+        check = DebuggerArtifactsCheck({})
+        first = check.run(str(tmp_path))
+
+        _write(tmp_path / "src" / "b.py", "import pdb\npdb.set_trace()\n")
+        scanned = []
+        original = DebuggerArtifactsCheck._scan_file
+
+        def spy(root, rel):
+            scanned.append(rel)
+            return original(root, rel)
+
+        check._scan_file = spy
+        with use_snapshot(ProjectSnapshot(str(tmp_path))):
+            second = check.run(str(tmp_path))
+
+        assert first.status == second.status == CheckStatus.FAILED
+        assert scanned == ["src/b.py"]
+        assert [(f.file, f.line) for f in second.findings] == [
+            ("src/a.py", 1),
+            ("src/b.py", 2),
+        ]
+
+    def test_loc_lock_cached_run_matches_fresh_run(self, tmp_path):
+        body = "".join(f"    x{i} = {i}\n" for i in range(20))
+        _write(tmp_path / "big.py", f"def f():\n{body}")
+        check = LocLockCheck({"max_function_lines": 10, "max_file_lines": 5})
+
+        first = check.run(str(tmp_path))
+        second = check.run(str(tmp_path))
+
+        assert first.status == second.status == CheckStatus.FAILED
+        assert first.output == second.output
+        assert [f.to_dict() for f in first.findings] == [
+            f.to_dict() for f in second.findings
+        ]
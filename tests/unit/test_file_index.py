@@ -0,0 +1,115 @@
+"""Tests for the stat-keyed file content index."""
+
+import json
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from slopmop.core.cache import compute_fingerprint
+from slopmop.core.file_index import INDEX_DIR, INDEX_FILE, FileIndex, get_file_index
+
+HOUR_AGO = time.time() - 3600
+
+
+def _write(path: Path, text: str, mtime: float = HOUR_AGO) -> Path:
+    path.write_text(text)
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def _no_reads(monkeypatch):
+    def fail(self):
+        raise AssertionError(f"unexpected read of {self}")
+
+    monkeypatch.setattr(Path, "read_bytes", fail)
+
+
+class TestFileIndex:
+    def test_hashes_content_as_git_blob_id(self, tmp_path):
+        path = _write(tmp_path / "a.py", "x = 1\n")
+        digest = FileIndex(str(tmp_path)).content_hash("a.py", path)
+        # `printf 'x = 1\n' | git hash-object --stdin`
+        assert digest == "7d4290a117a4ddcc11daae7ea675841033830c8f"
+
+    def test_unchanged_file_is_not_reread(self, tmp_path, monkeypatch):
+        path = _write(tmp_path / "a.py", "x = 1\n")
+        index = FileIndex(str(tmp_path))
+        first = index.content_hash("a.py", path)
+
+        _no_reads(monkeypatch)
+        assert index.content_hash("a.py", path) == first
+
+    def test_stat_change_triggers_rehash(self, tmp_path):
+        path = _write(tmp_path / "a.py", "x = 1\n")
+        index = FileIndex(str(tmp_path))
+        first = index.content_hash("a.py", path)
+
+        _write(path, "x = 2\n", mtime=HOUR_AGO + 1)
+        assert index.content_hash("a.py", path) != first
+
+    def test_racy_file_is_not_remembered(self, tmp_path, monkeypatch):
+        path = _write(tmp_path / "a.py", "x = 1\n", mtime=time.time())
+        index = FileIndex(str(tmp_path))
+        index.content_hash("a.py", path)
+
+        _no_reads(monkeypatch)
+        with pytest.raises(AssertionError, match="unexpected read"):
+            index.content_hash("a.py", path)
+
+    def test_persists_across_instances(self, tmp_path, monkeypatch):
+        path = _write(tmp_path / "a.py", "x = 1\n")
+        index = FileIndex(str(tmp_path))
+        first = index.content_hash("a.py", path)
+        index.save()
+
+        _no_reads(monkeypatch)
+        assert FileIndex(str(tmp_path)).content_hash("a.py", path) == first
+
+    def test_save_drops_deleted_files(self, tmp_path):
+        keep = _write(tmp_path / "keep.py", "k\n")
+        gone = _write(tmp_path / "gone.py", "g\n")
+        index = FileIndex(str(tmp_path))
+        index.content_hash("keep.py", keep)
+        index.content_hash("gone.py", gone)
+        index.save()
+        gone.unlink()
+
+        fresh = FileIndex(str(tmp_path))
+        fresh.content_hash("keep.py", keep)
+        fresh.save()
+
+        data = json.loads((tmp_path / INDEX_DIR / INDEX_FILE).read_text())
+        assert set(data["files"]) == {"keep.py"}
+
+    def test_corrupt_index_is_ignored(self, tmp_path):
+        (tmp_path / INDEX_DIR).mkdir()
+        (tmp_path / INDEX_DIR / INDEX_FILE).write_text("{not json")
+        path = _write(tmp_path / "a.py", "x = 1\n")
+
+        assert FileIndex(str(tmp_path)).content_hash("a.py", path)
+
+    def test_unreadable_file(self, tmp_path):
+        index = FileIndex(str(tmp_path))
+        assert index.content_hash("missing.py", tmp_path / "missing.py") is None
+
+
+class TestIndexedFingerprint:
+    def test_unchanged_tree_fingerprints_without_reads(self, tmp_path, monkeypatch):
+        _write(tmp_path / "a.py", "x = 1\n")
+        _write(tmp_path / "README.md", "# hi\n")
+        first = compute_fingerprint(str(tmp_path))
+
+        _no_reads(monkeypatch)
+        assert compute_fingerprint(str(tmp_path)) == first
+
+    def test_same_size_edit_changes_fingerprint(self, tmp_path):
+        path = _write(tmp_path / "a.py", "x = 1\n")
+        first = compute_fingerprint(str(tmp_path))
+
+        _write(path, "x = 2\n", mtime=HOUR_AGO + 5)
+        assert compute_fingerprint(str(tmp_path)) != first
+
+    def test_shared_per_project(self, tmp_path):
+        assert get_file_index(str(tmp_path)) is get_file_index(str(tmp_path) + "/")
@@ -372,20 +372,11 @@ class TestHardGateRequirements:
         (ds,) = reqs.items
         assert ds.import_name == "detect_secrets"  # pragma: allowlist secret
 
-    def test_duplicate_strings_declares_scanner_and_node(self):
+    def test_duplicate_strings_needs_no_tools(self):
         from slopmop.checks.quality.duplicate_strings import StringDuplicationCheck
 
-        reqs = StringDuplicationCheck({}).requirements().items
-        by_name = {r.name: r for r in reqs}
-        # The scanner is an npm tool (the vendored copy is dev-only, gitignored),
-        # so a deployed slop-mop installs it from npm — pinned, optional.
-        scanner = by_name["find-duplicate-strings"]
-        assert scanner.kind == "npm"
-        assert scanner.version == "3.1.1"
-        assert scanner.optional is True
-        # node is the runtime, also optional (gate WARNs if absent).
-        assert by_name["node"].kind == "system"
-        assert by_name["node"].optional is True
+        # Literals are counted in-process; no npm scanner or node runtime.
+        assert StringDuplicationCheck({}).requirements().items == ()
 
 
 class TestPythonToolGates:
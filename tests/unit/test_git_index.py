@@ -0,0 +1,51 @@
+"""Tests for fingerprinting clean tracked files from git's index."""
+
+import os
+from pathlib import Path
+
+from slopmop.core.cache import compute_fingerprint
+from slopmop.core.file_index import FileIndex
+from slopmop.core.git_index import git_blob_ids
+from tests.unit.conftest import git
+
+
+class TestGitBlobIds:
+    def test_clean_files_match_the_stat_index(self, repo):
+        ids = git_blob_ids(str(repo))
+        assert ids is not None and set(ids) == {"a.py", "b.py"}
+        index = FileIndex(str(repo))
+        assert ids["a.py"] == index.content_hash("a.py", repo / "a.py")
+
+    def test_modified_and_untracked_files_left_out(self, repo):
+        (repo / "a.py").write_text("a = 2\n")
+        (repo / "new.py").write_text("")
+        assert set(git_blob_ids(str(repo)) or {}) == {"b.py"}
+
+    def test_assume_unchanged_not_trusted(self, repo):
+        git(repo, "update-index", "--assume-unchanged", "a.py")
+        (repo / "a.py").write_text("a = 2\n")
+        assert "a.py" not in (git_blob_ids(str(repo)) or {})
+
+    def test_symlink_left_out(self, repo):
+        os.symlink("a.py", repo / "link.py")
+        git(repo, "add", "link.py")
+        assert "link.py" not in (git_blob_ids(str(repo)) or {})
+
+    def test_outside_git(self, tmp_path):
+        assert git_blob_ids(str(tmp_path)) is None
+
+
+class TestGitBackedFingerprint:
+    def test_clean_checkout_read_without_reading_files(self, repo, monkeypatch):
+        def fail(self):
+            raise AssertionError(f"unexpected read of {self}")
+
+        monkeypatch.setattr(Path, "read_bytes", fail)
+        compute_fingerprint(str(repo))
+
+    def test_agrees_with_the_walker(self, repo):
+        (repo / "a.py").write_text("a = 2\n")
+        (repo / "new.py").write_text("n = 1\n")
+        with_git = compute_fingerprint(str(repo))
+        (repo / ".git").rename(repo / "not-git")
+        assert compute_fingerprint(str(repo)) == with_git
@@ -1,5 +1,6 @@
 """Tests for LocLockCheck."""
 
+from pathlib import Path
 from textwrap import dedent
 
 from slopmop.checks.quality.loc_lock import (
@@ -184,6 +185,32 @@ def short_function():
         assert "func1" in result.output
         assert "func2" in result.output
 
+    def test_multiline_signature_extent_is_unchanged(self):
+        """A dedented closing paren ends the measured extent.
+
+        This pins the gate's long-standing measurement: the indentation
+        walk stops at a signature's closing line, so a function whose
+        signature wraps is measured up to that line.  Changing it moves
+        every repo's baseline and belongs in its own CHANGELOG entry.
+        """
+        lines = ["def wrapped(", "    a: int,", "    b: int,", ") -> int:"]
+        lines.extend(_python_assignment_lines(25, indent="    "))
+        lines.append("    return a + b")
+
+        check = LocLockCheck({})
+        assert check._find_functions("\n".join(lines), ".py") == [("wrapped", 1, 3)]
+
+    def test_multiline_signature_function_passes(self, tmp_path):
+        """A long body behind a wrapped signature doesn't newly fail."""
+        lines = ["def wrapped(", "    a: int,", ") -> int:"]
+        lines.extend(_python_assignment_lines(25, indent="    "))
+        lines.append("    return a")
+        (tmp_path / "wrapped.py").write_text("\n".join(lines))
+
+        result = LocLockCheck({"max_function_lines": 10}).run(str(tmp_path))
+
+        assert result.status == CheckStatus.PASSED
+
 
 class TestLocLockExclusions:
     """Tests for directory and file exclusions."""
@@ -525,10 +552,15 @@ class TestSqueezeDefeat:
 # ---------------------------------------------------------------------------
 
 
+def _biggest_definition(tmp_path: Path, src: str):
+    (tmp_path / "mod.py").write_text(src)
+    return _find_biggest_python_definition(str(tmp_path), "mod.py")
+
+
 class TestMoveTarget:
     """``_find_biggest_python_definition`` — what to point the agent at."""
 
-    def test_finds_biggest_class(self) -> None:
+    def test_finds_biggest_class(self, tmp_path: Path) -> None:
         src = dedent("""\
             class Small:
                 x = 1
@@ -543,14 +575,14 @@ class TestMoveTarget:
             def tiny():
                 pass
         """)
-        hit = _find_biggest_python_definition(src)
+        hit = _biggest_definition(tmp_path, src)
         assert hit is not None
         name, line, span = hit
         assert name == "Large"
         assert line == 4
         assert span == 6  # lines 4-9 inclusive
 
-    def test_prefers_class_over_nested_method(self) -> None:
+    def test_prefers_class_over_nested_method(self, tmp_path: Path) -> None:
         """A 50-line class with one 45-line method → point at the CLASS.
 
         We're answering "what to move out of the file", not "what to
@@ -559,11 +591,11 @@ class TestMoveTarget:
         """
         body = "\n".join(_python_assignment_lines(45, indent="        "))
         src = f"class Wrapper:\n    def huge(self):\n{body}\n\ndef small(): pass\n"
-        hit = _find_biggest_python_definition(src)
+        hit = _biggest_definition(tmp_path, src)
         assert hit is not None
         assert hit[0] == "Wrapper"  # not "huge"
 
-    def test_no_definitions_returns_none(self) -> None:
+    def test_no_definitions_returns_none(self, tmp_path: Path) -> None:
         """A file of module-level assignments has nothing to 'move'.
 
         The caller falls back to a generic message.  Rare case — a
@@ -571,10 +603,10 @@ class TestMoveTarget:
         almost certainly generated code that should be excluded anyway.
         """
         src = "\n".join(f"CONST_{i} = {i}" for i in range(50))
-        assert _find_biggest_python_definition(src) is None
+        assert _biggest_definition(tmp_path, src) is None
 
-    def test_syntax_error_returns_none(self) -> None:
-        assert _find_biggest_python_definition("def broken(:\n") is None
+    def test_syntax_error_returns_none(self, tmp_path: Path) -> None:
+        assert _biggest_definition(tmp_path, "def broken(:\n") is None
 
 
 class TestFileAction:
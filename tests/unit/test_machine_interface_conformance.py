@@ -99,14 +99,15 @@ _MIGRATED_VERBS: list[str] = [
 ]
 
 
-def _synthetic_report(level: str) -> "object":
+def _synthetic_report(level: str, timed_out: bool = False) -> "object":
     """Build a RunReport exercising passed/failed/warned/skipped + findings.
 
     Validation conformance must not shell out to a real gate run (slow,
     environment-dependent). A synthetic report drives JsonAdapter through
     every payload branch — actionable results with findings, a passed
     name list, the fix-first pointer — so the schema is checked against
-    real adapter output, not a hand-built fixture.
+    real adapter output, not a hand-built fixture.  *timed_out* adds a
+    gate stopped at its adaptive deadline.
     """
     from slopmop.core.registry import get_registry
     from slopmop.core.result import (
@@ -156,6 +157,15 @@ def _synthetic_report(level: str) -> "object":
             skip_reason=SkipReason.NOT_APPLICABLE,
         ),
     ]
+    if timed_out:
+        results.append(
+            CheckResult(
+                name="python:tests",
+                status=CheckStatus.TIMEOUT,
+                duration=40.0,
+                error="Stopped after 40.0s (adaptive deadline)",
+            )
+        )
     summary = ExecutionSummary.from_results(results, duration=1.9)
     return RunReport.from_summary(
         summary,
@@ -187,6 +197,27 @@ def test_validation_output_conforms_to_schema(level: str) -> None:
     assert not errors, [e.message for e in errors]
 
 
+@pytest.mark.parametrize("level", ["swab", "scour"])
+def test_timeout_output_conforms_to_schema(level: str) -> None:
+    from slopmop.checks import ensure_checks_registered
+    from slopmop.reporting.adapters import JsonAdapter
+
+    ensure_checks_registered()
+    report = _synthetic_report(level, timed_out=True)
+    envelope = JsonAdapter.render(report)  # type: ignore[arg-type]
+
+    assert envelope["data"]["summary"]["timed_out"] == 1
+    assert any(r["status"] == "timeout" for r in envelope["data"]["results"])
+
+    data_schema = load_data_schema(level)
+    assert data_schema is not None
+    composed = _compose_output_schema(level, data_schema)
+
+    jsonschema = pytest.importorskip("jsonschema")
+    errors = list(jsonschema.Draft202012Validator(composed).iter_errors(envelope))
+    assert not errors, [e.message for e in errors]
+
+
 @pytest.mark.parametrize("verb", ["swab", "scour"])
 def test_validation_describe_emits_output_schema(
     verb: str,
@@ -0,0 +1,24 @@
+"""Tests for the shared Python AST service."""
+
+from slopmop.core.python_ast import parse_python
+from slopmop.core.snapshot import ProjectSnapshot, use_snapshot
+
+
+class TestParsePython:
+    def test_shared_until_edited(self, tmp_path):
+        (tmp_path / "a.py").write_text("x = 1\n")
+        with use_snapshot(ProjectSnapshot(str(tmp_path))):
+            first = parse_python(str(tmp_path), "a.py")
+            assert parse_python(str(tmp_path), "a.py") is first
+            (tmp_path / "a.py").write_text("x = 22\n")
+            edited = parse_python(str(tmp_path), "a.py")
+        assert edited is not first and edited.source == "x = 22\n"
+
+    def test_syntax_error_captured(self, tmp_path):
+        (tmp_path / "bad.py").write_text("def broken(:\n")
+        parsed = parse_python(str(tmp_path), "bad.py")
+        assert parsed.tree is None and parsed.error
+
+    def test_undecodable_file(self, tmp_path):
+        (tmp_path / "latin.py").write_bytes(b"s = '\xe9'\n")
+        assert parse_python(str(tmp_path), "latin.py").tree is None
@@ -0,0 +1,213 @@
+"""Tests for resource-profile packing in the executor."""
+
+import threading
+import time
+
+from slopmop.checks.base import BaseCheck
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from slopmop.core.resources import (
+    IO_BOUND_CORE_SHARE,
+    MAX_THREAD_SLOTS,
+    MIN_CORE_BUDGET,
+    MIN_THREAD_SLOTS,
+    MachineCapacity,
+    ResourceLedger,
+    ResourceProfile,
+    detect_available_memory_mb,
+    detect_capacity,
+)
+from tests.unit.test_executor import make_mock_check_class
+
+
+class TestMachineCapacity:
+    def test_detect_capacity_reports_at_least_one_core(self):
+        capacity = detect_capacity()
+        assert capacity.cores >= 1
+        assert capacity.memory_mb is None or capacity.memory_mb > 0
+
+    def test_thread_slots_scale_with_cores_within_bounds(self):
+        assert MachineCapacity(cores=1).thread_slots == MIN_THREAD_SLOTS
+        assert MachineCapacity(cores=8).thread_slots == 16
+        assert MachineCapacity(cores=128).thread_slots == MAX_THREAD_SLOTS
+
+    def test_core_budget_has_a_floor(self):
+        assert MachineCapacity(cores=1).core_budget == MIN_CORE_BUDGET
+        assert MachineCapacity(cores=16).core_budget == 16
+
+    def test_base_check_default_profile(self):
+        assert BaseCheck.resource_profile == ResourceProfile()
+
+
+class TestResourceLedger:
+    def test_packs_by_cores(self):
+        ledger = ResourceLedger(MachineCapacity(cores=2))
+        one_core = ResourceProfile(cores=MIN_CORE_BUDGET / 2)
+
+        assert ledger.try_acquire("a", one_core)
+        assert ledger.try_acquire("b", one_core)
+        assert not ledger.try_acquire("c", one_core)
+
+        ledger.release("a")
+        assert ledger.try_acquire("c", one_core)
+
+    def test_packs_by_memory_with_headroom(self):
+        ledger = ResourceLedger(MachineCapacity(cores=16, memory_mb=2000))
+        heavy = ResourceProfile(memory_mb=1000)
+
+        assert ledger.try_acquire("pyright", heavy)
+        # 2000 MB * 0.8 headroom = 1600 MB → a second 1000 MB gate waits.
+        assert not ledger.try_acquire("mypy", heavy)
+
+    def test_empty_ledger_admits_oversized_profile(self):
+        ledger = ResourceLedger(MachineCapacity(cores=2, memory_mb=100))
+        assert ledger.try_acquire("huge", ResourceProfile(cores=64, memory_mb=9999))
+        assert ledger.in_flight == 1
+
+    def test_io_bound_gates_share_a_core(self):
+        ledger = ResourceLedger(MachineCapacity(cores=1))
+        io = ResourceProfile(io_bound=True)
+
+        admitted = [ledger.try_acquire(f"io{i}", io) for i in range(30)]
+        assert sum(admitted) == int(MIN_CORE_BUDGET / IO_BOUND_CORE_SHARE)
+
+    def test_self_parallel_gate_claims_half_the_machine(self):
+        ledger = ResourceLedger(MachineCapacity(cores=8))
+        cores, _ = ledger.claim_for(ResourceProfile(spawns_parallelism=True))
+        assert cores == 4
+
+        assert ledger.try_acquire("jest", ResourceProfile(spawns_parallelism=True))
+        assert ledger.try_acquire("flutter", ResourceProfile(spawns_parallelism=True))
+        assert not ledger.try_acquire("black", ResourceProfile())
+
+    def test_admission_resamples_available_memory(self):
+        live = [4000]
+        ledger = ResourceLedger(
+            MachineCapacity(cores=16, memory_mb=4000), sample_memory=lambda: live[0]
+        )
+        gate = ResourceProfile(memory_mb=1000)
+
+        assert ledger.try_acquire("first", gate)
+        # Something outside the run ate memory since capacity was probed.
+        live[0] = 1000
+        assert not ledger.try_acquire("second", gate)
+        live[0] = 3000
+        assert ledger.try_acquire("second", gate)
+
+    def test_release_unknown_name_is_noop(self):
+        ledger = ResourceLedger(MachineCapacity(cores=1))
+        ledger.release("never-acquired")
+        assert ledger.in_flight == 0
+
+
+def _tracking_check_class(name: str, profile: ResourceProfile, tracker: dict):
+    cls = make_mock_check_class(name, duration=0.05)
+    base_run = cls.run
+
+    def run(self, project_root):
+        with tracker["lock"]:
+            tracker["now"] += 1
+            tracker["peak"] = max(tracker["peak"], tracker["now"])
+        try:
+            return base_run(self, project_root)
+        finally:
+            with tracker["lock"]:
+                tracker["now"] -= 1
+
+    cls.run = run
+    cls.resource_profile = profile
+    return cls
+
+
+class TestExecutorPacking:
+    def _run(self, tmp_path, profile, capacity, count=4):
+        tracker = {"lock": threading.Lock(), "now": 0, "peak": 0}
+        registry = CheckRegistry()
+        names = []
+        for i in range(count):
+            cls = _tracking_check_class(f"g{i}", profile, tracker)
+            registry.register(cls)
+            names.append(f"overconfidence:g{i}")
+        executor = CheckExecutor(registry=registry, capacity=capacity)
+        summary = executor.run_checks(str(tmp_path), names)
+        assert summary.passed == count
+        return tracker["peak"]
+
+    def test_heavy_gates_do_not_overcommit_cores(self, tmp_path):
+        peak = self._run(tmp_path, ResourceProfile(cores=6), MachineCapacity(cores=8))
+        assert peak == 1
+
+    def test_light_gates_fill_the_machine(self, tmp_path):
+        start = time.time()
+        peak = self._run(
+            tmp_path, ResourceProfile(cores=1), MachineCapacity(cores=4), count=4
+        )
+        assert peak == 4
+        assert time.time() - start < 1.0
+
+    def test_explicit_max_workers_still_caps_concurrency(self, tmp_path):
+        tracker = {"lock": threading.Lock(), "now": 0, "peak": 0}
+        registry = CheckRegistry()
+        for i in range(3):
+            registry.register(
+                _tracking_check_class(f"w{i}", ResourceProfile(io_bound=True), tracker)
+            )
+        executor = CheckExecutor(
+            registry=registry, max_workers=1, capacity=MachineCapacity(cores=16)
+        )
+        executor.run_checks(str(tmp_path), [f"overconfidence:w{i}" for i in range(3)])
+        assert tracker["peak"] == 1
+
+    def test_default_max_workers_derived_from_capacity(self):
+        executor = CheckExecutor(capacity=MachineCapacity(cores=6))
+        assert executor._max_workers == 12
+
+
+class TestDispatcherAdmission:
+    def test_small_gate_starts_while_large_gate_waits(self, tmp_path):
+        spans = {}
+        registry = CheckRegistry()
+        for name, cores, duration in [
+            ("big1", 3, 0.3),
+            ("big2", 3, 0.05),
+            ("small", 1, 0.05),
+        ]:
+            cls = make_mock_check_class(name, duration=duration)
+            base_run = cls.run
+
+            def run(self, project_root, _base=base_run, _name=name):
+                start = time.time()
+                try:
+                    return _base(self, project_root)
+                finally:
+                    spans[_name] = (start, time.time())
+
+            cls.run = run
+            cls.resource_profile = ResourceProfile(cores=cores)
+            registry.register(cls)
+        executor = CheckExecutor(
+            registry=registry, max_workers=2, capacity=MachineCapacity(cores=4)
+        )
+        names = ["overconfidence:big1", "overconfidence:big2", "overconfidence:small"]
+        summary = executor.run_checks(str(tmp_path), names)
+
+        assert summary.passed == 3
+        # small fits next to big1 and must not queue behind big2.
+        assert spans["small"][0] < spans["big1"][1]
+        assert spans["big2"][0] >= spans["big1"][1]
+
+    def test_empty_pool_admits_a_gate_larger_than_the_machine(self, tmp_path):
+        registry = CheckRegistry()
+        cls = make_mock_check_class("huge")
+        cls.resource_profile = ResourceProfile(cores=64, memory_mb=10**6)
+        registry.register(cls)
+        executor = CheckExecutor(
+            registry=registry, capacity=MachineCapacity(cores=1, memory_mb=100)
+        )
+        summary = executor.run_checks(str(tmp_path), ["overconfidence:huge"])
+        assert summary.passed == 1
+
+    def test_auto_detected_capacity_resamples_memory(self):
+        assert CheckExecutor()._sample_memory is detect_available_memory_mb
+        explicit = CheckExecutor(capacity=MachineCapacity(cores=2))
+        assert explicit._sample_memory is None
@@ -12,6 +12,7 @@ from typing import Optional
 
 import pytest
 
+from slopmop.core.git_context import GitContext
 from slopmop.core.result import (
     CheckResult,
     CheckStatus,
@@ -429,6 +430,19 @@ class TestJsonAdapter:
         out = JsonAdapter.render(report)
         assert "diagnostics" not in out
 
+    def test_cache_counters_without_cached_results(self) -> None:
+        summary = _summary([_result("p", CheckStatus.PASSED)])
+        summary.cache_stats = {"hits": 0, "misses": 1, "evictions": 2}
+        report = RunReport.from_summary(summary, level="swab")
+        out = JsonAdapter.render(report)
+        cache = out["data"]["cache"]
+        assert (cache["cached_results"], cache["misses"], cache["evictions"]) == (
+            0,
+            1,
+            2,
+        )
+        assert "diagnostics" not in out
+
     def test_cache_block_in_data_and_diagnostic_for_cached_results(self) -> None:
         summary = _summary(
             [
@@ -450,6 +464,24 @@ class TestJsonAdapter:
         assert isinstance(diagnostics, list)
         assert any(d["code"] == "cached_results_present" for d in diagnostics)
 
+    def test_cache_block_names_current_head(self) -> None:
+        summary = _summary(
+            [
+                CheckResult(
+                    name="p",
+                    status=CheckStatus.PASSED,
+                    duration=0.1,
+                    cached=True,
+                    cache_commit="abc1234",
+                )
+            ]
+        )
+        summary.git = GitContext(head="def5678" + "0" * 33)
+        report = RunReport.from_summary(summary, level="swab")
+        cache = JsonAdapter.render(report)["data"]["cache"]
+        assert cache["head_commit"] == "def5678"
+        assert cache["source_commit"] == "abc1234"
+
     def test_cache_block_counts_skipped_results_in_denominator(self) -> None:
         summary = _summary(
             [
@@ -19,6 +19,7 @@ from typing import Any, Optional
 
 import pytest
 
+from slopmop.core.git_context import GitContext
 from slopmop.core.result import (
     CheckResult,
     CheckStatus,
@@ -192,6 +193,29 @@ class TestSarifStructure:
         doc = _emit(_make_summary(r))
         assert len(doc["runs"][0]["results"]) == 3
 
+    def test_scanned_revision_recorded_as_provenance(self) -> None:
+        """With a remote, the run names the commit it describes so a
+        consumer can tie alerts to a revision without asking git.
+        """
+        summary = _make_summary()
+        summary.git = GitContext(
+            head="a" * 40, branch="main", remote_url="git@github.com:o/r.git"
+        )
+        run = _emit(summary)["runs"][0]
+        assert run["versionControlProvenance"] == [
+            {
+                "repositoryUri": "ssh://git@github.com/o/r.git",
+                "revisionId": "a" * 40,
+                "branch": "refs/heads/main",
+            }
+        ]
+
+    def test_no_provenance_without_remote(self) -> None:
+        """repositoryUri is required, so a remoteless repo gets none."""
+        summary = _make_summary()
+        summary.git = GitContext(head="a" * 40, branch="main")
+        assert "versionControlProvenance" not in _emit(summary)["runs"][0]
+
 
 class TestSarifResultShape:
     """The result object is where GitHub's inline PR annotations come
@@ -825,6 +849,13 @@ class TestSchemaValidation:
         doc = _emit(_make_summary())
         self._validate(doc, schema, validator_cls)
 
+    def test_provenance_is_schema_valid(self, schema: Any, validator_cls: type) -> None:
+        summary = _make_summary()
+        summary.git = GitContext(
+            head="a" * 40, branch="main", remote_url="https://github.com/o/r"
+        )
+        self._validate(_emit(summary), schema, validator_cls)
+
     def test_full_featured_document_is_schema_valid(
         self, schema: Any, validator_cls: type, tmp_path: Path
     ) -> None:
@@ -0,0 +1,204 @@
+"""Tests for critical-path ordering of gates."""
+
+import itertools
+import random
+import threading
+import time
+
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from slopmop.core.scheduling import (
+    ReadyQueue,
+    critical_path_lengths,
+    invert_dependency_graph,
+    order_by_critical_path,
+    pack_budget,
+)
+from tests.unit.test_executor import make_mock_check_class
+
+
+class TestCriticalPathLengths:
+    def test_invert_dependency_graph(self):
+        graph = {"fmt": set(), "mypy": {"fmt"}, "pytest": {"fmt", "external"}}
+        assert invert_dependency_graph(graph) == {
+            "fmt": {"mypy", "pytest"},
+            "mypy": set(),
+            "pytest": set(),
+        }
+
+    def test_length_includes_longest_dependent_chain(self):
+        graph = {
+            "fmt": set(),
+            "annotations": set(),
+            "mypy": {"fmt", "annotations"},
+            "pytest": {"fmt"},
+            "coverage": {"pytest"},
+        }
+        timings = {
+            "fmt": 1.0,
+            "annotations": 2.0,
+            "mypy": 20.0,
+            "pytest": 30.0,
+            "coverage": 5.0,
+        }
+
+        lengths = critical_path_lengths(graph, timings)
+
+        assert lengths["coverage"] == 5.0
+        assert lengths["pytest"] == 35.0
+        assert lengths["mypy"] == 20.0
+        assert lengths["annotations"] == 22.0
+        assert lengths["fmt"] == 36.0
+
+    def test_untimed_gates_default_to_median(self):
+        graph = {"a": set(), "b": set(), "c": set(), "new": set()}
+        timings = {"a": 1.0, "b": 4.0, "c": 9.0}
+
+        assert critical_path_lengths(graph, timings)["new"] == 4.0
+        explicit = critical_path_lengths(graph, timings, default_duration=0.0)
+        assert explicit["new"] == 0.0
+
+    def test_cycle_does_not_recurse_forever(self):
+        graph = {"a": {"b"}, "b": {"a"}}
+        lengths = critical_path_lengths(graph, {"a": 1.0, "b": 2.0})
+        assert set(lengths) == {"a", "b"}
+
+    def test_order_prefers_gate_that_unlocks_slow_work(self):
+        lengths = {"fmt": 36.0, "lint": 10.0, "annotations": 22.0}
+        timings = {"fmt": 1.0, "lint": 10.0, "annotations": 2.0}
+
+        assert order_by_critical_path(
+            ["lint", "annotations", "fmt"], lengths, timings
+        ) == ["fmt", "annotations", "lint"]
+
+    def test_order_is_stable_for_ties(self):
+        assert order_by_critical_path(["b", "a"], {}, {}) == ["b", "a"]
+
+
+class TestExecutorCriticalPathDispatch:
+    def test_gatekeeper_of_slow_chain_starts_first(self, tmp_path):
+        started: list = []
+        lock = threading.Lock()
+        registry = CheckRegistry()
+        registry.register(make_mock_check_class("fmt"))
+        registry.register(make_mock_check_class("lint"))
+        registry.register(
+            make_mock_check_class("pytest", depends_on=["overconfidence:fmt"])
+        )
+        timings = {
+            "overconfidence:fmt": 1.0,
+            "overconfidence:lint": 10.0,
+            "overconfidence:pytest": 60.0,
+        }
+
+        executor = CheckExecutor(registry=registry, max_workers=1, fail_fast=False)
+
+        def on_start(name, _category):
+            with lock:
+                started.append(name)
+
+        executor.set_start_callback(on_start)
+        summary = executor.run_checks(
+            str(tmp_path),
+            [
+                "overconfidence:lint",
+                "overconfidence:fmt",
+                "overconfidence:pytest",
+            ],
+            timings=timings,
+        )
+
+        assert summary.passed == 3
+        # Plain longest-first would start lint (10s) before fmt (1s), even
+        # though pytest (60s) is waiting on fmt.
+        assert started[0] == "overconfidence:fmt"
+
+
+class TestReadyQueue:
+    GRAPH = {"fmt": set(), "lint": set(), "mypy": {"fmt"}, "pytest": {"fmt", "lint"}}
+
+    def test_roots_ready_immediately(self):
+        queue = ReadyQueue(self.GRAPH)
+        assert queue.pop_ready(set(self.GRAPH)) == ["fmt", "lint"]
+
+    def test_dependents_ready_once_all_deps_resolve(self):
+        queue = ReadyQueue(self.GRAPH)
+        pending = set(self.GRAPH)
+        for name in queue.pop_ready(pending):
+            pending.discard(name)
+
+        results = {"fmt": "passed"}
+        queue.observe(results)
+        assert queue.pop_ready(pending) == ["mypy"]
+        pending.discard("mypy")
+
+        results["lint"] = "passed"
+        queue.observe(results)
+        queue.observe(results)  # idempotent for already-seen results
+        assert queue.pop_ready(pending) == ["pytest"]
+
+    def test_priority_follows_critical_path(self):
+        queue = ReadyQueue(self.GRAPH, lengths={"lint": 9.0, "fmt": 5.0})
+        assert queue.pop_ready(set(self.GRAPH)) == ["lint", "fmt"]
+
+    def test_requeue_returns_only_pending(self):
+        queue = ReadyQueue(self.GRAPH)
+        ready = queue.pop_ready(set(self.GRAPH))
+        queue.requeue(ready)
+
+        assert queue.pop_ready({"lint"}) == ["lint"]
+        assert queue.pop_ready(set(self.GRAPH)) == []
+
+
+class TestPackBudget:
+    TIMINGS = {"a": 5.0, "b": 10.0, "c": 20.0, "d": 40.0}
+
+    def test_count_first_then_duration(self):
+        # Three gates fit; {d, b, a} = 55s beats {c, b, a} = 35s, and
+        # {d, c} = 60s fills the budget but with one gate fewer.
+        assert pack_budget(list(self.TIMINGS), self.TIMINGS, 60.0, 4) == [
+            "d",
+            "b",
+            "a",
+        ]
+
+    def test_fills_budget_for_fixed_count(self):
+        # Two gates fit; 40 + 20 packs 60s exactly, 5 + 10 would idle.
+        assert pack_budget(list(self.TIMINGS), self.TIMINGS, 60.0, 2) == ["d", "c"]
+
+    def test_nothing_fits(self):
+        assert pack_budget(["d"], self.TIMINGS, 30.0, 2) == []
+        assert pack_budget(list(self.TIMINGS), self.TIMINGS, 0.0, 2) == []
+        assert pack_budget(list(self.TIMINGS), self.TIMINGS, 60.0, 0) == []
+
+    def test_matches_exhaustive_search(self):
+        rng = random.Random(3)
+        for _ in range(300):
+            timings = {f"g{i}": round(rng.uniform(0.5, 60.0), 1) for i in range(8)}
+            budget = rng.uniform(1.0, 150.0)
+            slots = rng.randint(1, 5)
+            best = (0, 0.0)
+            for size in range(1, slots + 1):
+                for combo in itertools.combinations(timings, size):
+                    total = sum(timings[n] for n in combo)
+                    if total <= budget:
+                        best = max(best, (size, total))
+
+            picked = pack_budget(list(timings), timings, budget, slots)
+            total = sum(timings[n] for n in picked)
+
+            assert total <= budget
+            assert len(picked) == best[0]
+            # Rounding may cost a little packing, never a gate.
+            assert total >= best[1] - 0.02 * budget
+
+    def test_two_hundred_candidates_is_cheap(self):
+        rng = random.Random(0)
+        timings = {f"g{i}": rng.uniform(1.0, 120.0) for i in range(200)}
+        start = time.perf_counter()
+        picked = pack_budget(list(timings), timings, 600.0, 32)
+        elapsed = time.perf_counter() - start
+
+        assert 0 < len(picked) <= 32
+        assert sum(timings[n] for n in picked) <= 600.0
+        assert elapsed < 0.05  # exhaustive search here would never finish
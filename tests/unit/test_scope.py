@@ -4,6 +4,8 @@ Tests ScopeInfo data structure, count_source_scope utility,
 measure_scope implementations, executor integration, and display output.
 """
 
+import os
+
 from slopmop.checks.base import (
     BaseCheck,
     Flaw,
@@ -11,6 +13,7 @@ from slopmop.checks.base import (
     count_source_scope,
 )
 from slopmop.checks.mixins import PythonCheckMixin
+from slopmop.core import line_count as line_count_module
 from slopmop.core.result import CheckResult, CheckStatus, ExecutionSummary, ScopeInfo
 from slopmop.reporting.display import config
 from slopmop.reporting.display.renderer import build_category_header
@@ -264,6 +267,57 @@ class TestCountSourceScope:
         )
         assert scope.files == 1
 
+    def test_does_not_enter_pruned_dirs(self, tmp_path, monkeypatch):
+        """Vendored trees are skipped without being listed."""
+        (tmp_path / "main.py").write_text("x = 1\n")
+        vendored = tmp_path / "node_modules" / "pkg"
+        vendored.mkdir(parents=True)
+        (vendored / "index.py").write_text("y = 1\n")
+        listed = []
+        scandir = os.scandir
+
+        def recording(path="."):
+            listed.append(os.fspath(path))
+            return scandir(path)
+
+        monkeypatch.setattr(os, "scandir", recording)
+        scope = count_source_scope(str(tmp_path), extensions={".py"})
+        assert (scope.files, scope.lines) == (1, 1)
+        assert not any("node_modules" in p for p in listed)
+
+    def test_counts_crlf_and_unterminated_lines(self, tmp_path):
+        """CRLF lines count once; a final unterminated line counts."""
+        (tmp_path / "a.py").write_bytes(b"x = 1\r\ny = 2\r\nz = 3")
+        assert count_source_scope(str(tmp_path)).lines == 3
+
+
+class TestLineCount:
+    """Tests for the chunked, stat-memoized line counter."""
+
+    def test_counts_across_chunk_boundaries(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(line_count_module, "_CHUNK_SIZE", 4)
+        path = tmp_path / "a.txt"
+        path.write_bytes(b"ab\ncdef\n\ngh")
+        assert line_count_module.count_lines(path) == 4
+
+    def test_reused_while_stat_unchanged(self, tmp_path, monkeypatch):
+        path = tmp_path / "a.py"
+        path.write_text("x = 1\n")
+        os.utime(path, (0, 0))
+        assert line_count_module.line_count(path) == 1
+
+        def fail(_path):
+            raise AssertionError("re-read an unchanged file")
+
+        monkeypatch.setattr(line_count_module, "count_lines", fail)
+        assert line_count_module.line_count(path) == 1
+        monkeypatch.undo()
+        path.write_text("x = 1\ny = 2\n")
+        assert line_count_module.line_count(path) == 2
+
+    def test_unreadable_file_is_zero(self, tmp_path):
+        assert line_count_module.line_count(tmp_path / "missing.py") == 0
+
 
 class TestPythonCheckMixinScope:
     """Tests for PythonCheckMixin.measure_scope."""
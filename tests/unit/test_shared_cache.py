@@ -0,0 +1,184 @@
+"""Tests for the shared, content-addressed result cache."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from slopmop.core.cache import ResultCache
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from slopmop.core.result import CheckResult, CheckStatus
+from slopmop.core.shared_cache import (
+    SHARED_CACHE_ENV,
+    SHARED_CACHE_TOKEN_ENV,
+    SHARED_CACHE_WRITE_ENV,
+    DirectoryBackend,
+    HttpBackend,
+    shared_cache_backend,
+    shared_key,
+)
+from tests.unit.test_executor import make_mock_check_class
+
+
+class _BlobHandler(BaseHTTPRequestHandler):
+    blobs: dict = {}
+
+    def do_GET(self):
+        blob = self.blobs.get(self.path)
+        if blob is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(blob)))
+        self.end_headers()
+        self.wfile.write(blob)
+
+    def do_PUT(self):
+        length = int(self.headers["Content-Length"])
+        self.blobs[self.path] = self.rfile.read(length)
+        self.send_response(201)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def blob_server():
+    _BlobHandler.blobs = {}
+    server = HTTPServer(("127.0.0.1", 0), _BlobHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/cache", _BlobHandler.blobs
+    server.shutdown()
+    server.server_close()
+
+
+def _result(name="overconfidence:x"):
+    return CheckResult(name, CheckStatus.PASSED, 1.0, output="ok")
+
+
+class TestBackends:
+    def test_directory_round_trip(self, tmp_path):
+        backend = DirectoryBackend(tmp_path / "shared")
+        assert backend.get("ab" * 32) is None
+        backend.put("ab" * 32, b"blob")
+        assert backend.get("ab" * 32) == b"blob"
+
+    def test_http_round_trip(self, blob_server):
+        url, blobs = blob_server
+        backend = HttpBackend(url)
+        assert backend.get("k1") is None
+        backend.put("k1", b"blob")
+        assert blobs == {"/cache/k1": b"blob"}
+        assert backend.get("k1") == b"blob"
+
+    def test_http_is_read_only_by_default(self):
+        assert HttpBackend("https://cache.example/sm").read_only
+
+    def test_http_writes_need_a_token(self):
+        assert HttpBackend("https://cache.example/sm", read_only=False).read_only
+        writer = HttpBackend("https://cache.example/sm", token="t", read_only=False)
+        assert not writer.read_only
+
+    def test_unreachable_server_disables_backend(self):
+        backend = HttpBackend("http://127.0.0.1:9", timeout=0.5)
+        assert backend.get("k") is None
+        assert backend._down
+
+    def test_rejects_other_schemes(self):
+        with pytest.raises(ValueError):
+            HttpBackend("ftp://example.com")
+
+    def test_key_depends_on_gate_and_fingerprint(self):
+        assert shared_key("a:b", "fp") == shared_key("a:b", "fp")
+        assert shared_key("a:b", "fp") != shared_key("a:c", "fp")
+        assert shared_key("a:b", "fp") != shared_key("a:b", "fp2")
+
+
+class TestBackendConfig:
+    def test_none_when_unconfigured(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(SHARED_CACHE_ENV, raising=False)
+        assert shared_cache_backend(str(tmp_path), {}) is None
+
+    def test_relative_directory_and_read_only(self, tmp_path, monkeypatch):
+        monkeypatch.delenv(SHARED_CACHE_ENV, raising=False)
+        backend = shared_cache_backend(
+            str(tmp_path), {"shared_cache": {"location": "ci", "read_only": True}}
+        )
+        assert isinstance(backend, DirectoryBackend)
+        assert backend.root == tmp_path / "ci"
+        assert backend.read_only
+
+    def test_environment_wins(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(SHARED_CACHE_ENV, "https://cache.example/sm")
+        backend = shared_cache_backend(str(tmp_path), {"shared_cache": "local"})
+        assert isinstance(backend, HttpBackend)
+        assert backend.read_only
+
+    def test_http_writes_enabled_by_environment(self, tmp_path, monkeypatch):
+        monkeypatch.setenv(SHARED_CACHE_ENV, "https://cache.example/sm")
+        monkeypatch.setenv(SHARED_CACHE_TOKEN_ENV, "ci-token")
+        monkeypatch.setenv(SHARED_CACHE_WRITE_ENV, "1")
+        backend = shared_cache_backend(str(tmp_path), {})
+        assert backend is not None and not backend.read_only
+
+
+class TestSharedResultCache:
+    def test_local_miss_falls_back_and_copies_locally(self, tmp_path):
+        shared = DirectoryBackend(tmp_path / "shared")
+        producer = ResultCache(str(tmp_path / "ci"), shared=shared)
+        producer.store("overconfidence:x", "fp", _result())
+
+        consumer = ResultCache(str(tmp_path / "dev"), shared=shared)
+        hit = consumer.lookup("overconfidence:x", "fp")
+        consumer.close()
+
+        assert hit is not None and hit.cached
+        assert consumer.stats.to_dict()["shared_hits"] == 1
+        local = ResultCache(str(tmp_path / "dev"))
+        assert local.lookup("overconfidence:x", "fp") is not None
+
+    def test_read_only_backend_is_not_written(self, tmp_path):
+        shared = DirectoryBackend(tmp_path / "shared", read_only=True)
+        ResultCache(str(tmp_path / "dev"), shared=shared).store(
+            "overconfidence:x", "fp", _result()
+        )
+        assert not (tmp_path / "shared").exists()
+
+    def test_http_backend_shares_between_worktrees(self, tmp_path, blob_server):
+        url, _ = blob_server
+        publisher = HttpBackend(url, token="ci-token", read_only=False)
+        ResultCache(str(tmp_path / "ci"), shared=publisher).store(
+            "overconfidence:x", "fp", _result()
+        )
+        consumer = ResultCache(str(tmp_path / "dev"), shared=HttpBackend(url))
+        assert consumer.lookup("overconfidence:x", "fp") is not None
+
+
+class TestExecutorSharedCache:
+    def test_second_checkout_reuses_first_checkouts_results(self, tmp_path):
+        cls = make_mock_check_class("shared")
+        calls = []
+        original_run = cls.run
+
+        def run(self, project_root):
+            calls.append(project_root)
+            return original_run(self, project_root)
+
+        cls.run = run
+        registry = CheckRegistry()
+        registry.register(cls)
+        shared = DirectoryBackend(tmp_path / "shared")
+        for checkout in ("ci", "dev"):
+            root = tmp_path / checkout
+            root.mkdir()
+            (root / "main.py").write_text("x = 1\n")
+            summary = CheckExecutor(registry=registry).run_checks(
+                str(root), ["overconfidence:shared"], shared_cache=shared
+            )
+
+        assert calls == [str(tmp_path / "ci")]
+        assert summary.results[0].cached
@@ -0,0 +1,173 @@
+"""Tests for the shared per-run project snapshot."""
+
+import subprocess
+from unittest.mock import patch
+
+from slopmop.checks.base import (
+    SCOPE_EXCLUDED_DIRS,
+    count_source_scope,
+    git_project_files,
+    iter_source_files,
+)
+from slopmop.core import cache as cache_module
+from slopmop.core.cache import compute_fingerprint, hash_file_scope
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from slopmop.core.snapshot import (
+    PRUNED_DIRS,
+    ProjectSnapshot,
+    active_snapshot,
+    use_snapshot,
+)
+from tests.unit.test_executor import make_mock_check_class
+
+
+def _tree(tmp_path):
+    files = {
+        "src/app.py": "a = 1\nb = 2\n",
+        "src/util.js": "x()\n",
+        "src/gen/out.py": "g = 1",
+        "tests/test_app.py": "t = 1\n",
+        "node_modules/lib/index.js": "n\n",
+        ".venv/lib/site.py": "v\n",
+        ".github/workflows/ci.yml": "on: push\n",
+        "pkg.egg-info/x.py": "e\n",
+        "README.md": "# r\n",
+    }
+    for rel, text in files.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+    return tmp_path
+
+
+class TestProjectSnapshot:
+    def test_pruned_dirs_match_scope_exclusions(self):
+        assert PRUNED_DIRS == SCOPE_EXCLUDED_DIRS == cache_module._EXCLUDED_DIRS
+
+    def test_walk_prunes_noise_but_keeps_github(self, tmp_path):
+        snapshot = ProjectSnapshot(str(_tree(tmp_path)))
+        assert snapshot.all_files() == [
+            ".github/workflows/ci.yml",
+            "README.md",
+            "src/app.py",
+            "src/gen/out.py",
+            "src/util.js",
+            "tests/test_app.py",
+        ]
+
+    def test_files_filters(self, tmp_path):
+        snapshot = ProjectSnapshot(str(_tree(tmp_path)))
+
+        assert snapshot.files(extensions={".py"}) == [
+            "src/app.py",
+            "src/gen/out.py",
+            "tests/test_app.py",
+        ]
+        assert snapshot.files(["src"], {".py"}, exclude={"gen"}) == ["src/app.py"]
+        assert snapshot.files(extensions={".yml"}) == []
+        assert snapshot.files(extensions={".yml"}, hidden=True) == [
+            ".github/workflows/ci.yml"
+        ]
+
+    def test_covers(self, tmp_path):
+        snapshot = ProjectSnapshot(str(tmp_path))
+        assert snapshot.covers([".", "src", "./src/lib"])
+        assert not snapshot.covers([".venv"])
+        assert not snapshot.covers(["node_modules/x"])
+        assert not snapshot.covers(["/abs"])
+
+    def test_walks_once_until_invalidated(self, tmp_path):
+        snapshot = ProjectSnapshot(str(_tree(tmp_path)))
+        with patch.object(snapshot, "_walk", wraps=snapshot._walk) as walk:
+            snapshot.files(extensions={".py"})
+            snapshot.files(["src"], {".js"})
+            assert walk.call_count == 1
+
+            (tmp_path / "src" / "new.py").write_text("n = 1\n")
+            snapshot.invalidate()
+            assert "src/new.py" in snapshot.files(extensions={".py"})
+            assert walk.call_count == 2
+
+    def test_use_snapshot_is_scoped(self, tmp_path):
+        snapshot = ProjectSnapshot(str(tmp_path))
+        with use_snapshot(snapshot):
+            assert active_snapshot(str(tmp_path) + "/") is snapshot
+        assert active_snapshot(str(tmp_path)) is None
+
+
+class TestSnapshotConsumers:
+    def test_scope_hash_matches_walk(self, tmp_path):
+        root = str(_tree(tmp_path))
+        walked = hash_file_scope(root, ["src"], {".py"}, {"k": 1}, {"gen"})
+        with use_snapshot(ProjectSnapshot(root)):
+            shared = hash_file_scope(root, ["src"], {".py"}, {"k": 1}, {"gen"})
+        assert walked == shared
+
+    def test_fingerprint_matches_walk(self, tmp_path):
+        root = str(_tree(tmp_path))
+        walked = compute_fingerprint(root)
+        with use_snapshot(ProjectSnapshot(root)):
+            assert compute_fingerprint(root) == walked
+
+    def test_fingerprint_sees_edits_without_invalidate(self, tmp_path):
+        root = str(_tree(tmp_path))
+        with use_snapshot(ProjectSnapshot(root)):
+            before = compute_fingerprint(root)
+            (tmp_path / "src" / "app.py").write_text("a = 100\n")
+            assert compute_fingerprint(root) != before
+
+    def test_source_scope_matches_walk(self, tmp_path):
+        root = str(_tree(tmp_path))
+        walked = count_source_scope(root, extensions={".py", ".js"})
+        with use_snapshot(ProjectSnapshot(root)):
+            shared = count_source_scope(root, extensions={".py", ".js"})
+        assert walked == shared
+        assert (shared.files, shared.lines) == (4, 5)
+
+    def test_iter_source_files_matches_walk(self, tmp_path):
+        root = str(_tree(tmp_path))
+        walked = sorted(iter_source_files(root, ["."], {".py"}, {"tests"}))
+        with use_snapshot(ProjectSnapshot(root)):
+            shared = list(iter_source_files(root, ["."], {".py"}, {"tests"}))
+        assert walked == shared == ["src/app.py", "src/gen/out.py"]
+
+    def test_git_listing_runs_once(self, tmp_path):
+        subprocess.run(["git", "init", "-q"], cwd=tmp_path, check=True)
+        root = str(_tree(tmp_path))
+        with use_snapshot(ProjectSnapshot(root)):
+            with patch("subprocess.run", wraps=subprocess.run) as run:
+                py = git_project_files(root, {".py"})
+                everything = git_project_files(root)
+        assert run.call_count == 1
+        assert py is not None and everything is not None
+        assert "src/app.py" in py and "README.md" not in py
+        assert "README.md" in everything
+
+
+class TestExecutorSnapshot:
+    def test_run_activates_and_auto_fix_invalidates(self, tmp_path):
+        seen = {}
+        cls = make_mock_check_class("fixer")
+
+        def can_auto_fix(self):
+            return True
+
+        def auto_fix(self, project_root):
+            seen["snapshot"] = active_snapshot(project_root)
+            seen["before"] = seen["snapshot"].all_files()
+            (tmp_path / "made.py").write_text("m = 1\n")
+            return True
+
+        cls.can_auto_fix = can_auto_fix
+        cls.auto_fix = auto_fix
+        registry = CheckRegistry()
+        registry.register(cls)
+
+        CheckExecutor(registry=registry).run_checks(
+            str(tmp_path), ["overconfidence:fixer"]
+        )
+
+        assert "made.py" not in seen["before"]
+        assert "made.py" in seen["snapshot"].all_files()
+        assert active_snapshot(str(tmp_path)) is None
@@ -0,0 +1,191 @@
+"""Tests for speculative execution of dependent gates."""
+
+import time
+from pathlib import Path
+
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from slopmop.core.result import CheckResult, CheckStatus, SkipReason
+from slopmop.core.speculation import SpeculationTracker
+from tests.unit.test_executor import make_mock_check_class
+
+FMT = "overconfidence:fmt"
+TESTS = "overconfidence:tests"
+
+
+def _passed(name: str) -> CheckResult:
+    return CheckResult(name, CheckStatus.PASSED, 0.0)
+
+
+class TestSpeculationTracker:
+    def _tracker(self, fingerprints):
+        values = iter(fingerprints)
+        return SpeculationTracker(lambda: next(values))
+
+    def test_candidates_need_running_dependencies(self):
+        tracker = self._tracker([])
+        graph = {"fmt": set(), "tests": {"fmt"}, "cov": {"tests"}}
+
+        chosen = tracker.candidates(
+            pending={"tests", "cov"},
+            ready=[],
+            dep_graph=graph,
+            in_flight={"fmt"},
+            dependency_results={},
+            eligible=lambda _name: True,
+        )
+
+        # cov waits on tests, which is not running yet — one level only.
+        assert chosen == ["tests"]
+
+    def test_candidates_respect_eligibility(self):
+        tracker = self._tracker([])
+        chosen = tracker.candidates(
+            pending={"tests"},
+            ready=["fmt"],
+            dep_graph={"fmt": set(), "tests": {"fmt"}},
+            in_flight=set(),
+            dependency_results={},
+            eligible=lambda _name: False,
+        )
+        assert chosen == []
+
+    def test_unchanged_tree_keeps_result(self):
+        tracker = self._tracker(["fp1", "fp1"])
+        tracker.start(["tests"], {"tests": {"fmt"}})
+        tracker.hold("tests", _passed("tests"))
+
+        assert tracker.resolve({}).accepted == {}  # fmt still running
+        outcome = tracker.resolve({"fmt": _passed("fmt")})
+
+        assert list(outcome.accepted) == ["tests"]
+        assert not tracker.has_held
+
+    def test_changed_tree_reruns(self):
+        tracker = self._tracker(["fp1", "fp2"])
+        tracker.start(["tests"], {"tests": {"fmt"}})
+        tracker.hold("tests", _passed("tests"))
+
+        assert tracker.resolve({"fmt": _passed("fmt")}).rerun == ["tests"]
+
+    def test_auto_fixed_dependency_reruns(self):
+        tracker = self._tracker(["fp1"])
+        tracker.start(["tests"], {"tests": {"fmt"}})
+        tracker.hold("tests", _passed("tests"))
+        fixed = CheckResult("fmt", CheckStatus.PASSED, 0.0, auto_fixed=True)
+
+        assert tracker.resolve({"fmt": fixed}).rerun == ["tests"]
+
+    def test_failed_dependency_skips(self):
+        tracker = self._tracker(["fp1"])
+        tracker.start(["tests"], {"tests": {"fmt"}})
+        tracker.hold("tests", _passed("tests"))
+        failed = CheckResult("fmt", CheckStatus.FAILED, 0.0)
+
+        assert tracker.resolve({"fmt": failed}).failed_dependency == ["tests"]
+
+
+class TestSpeculativeExecutor:
+    def _run(self, tmp_path, fmt_cls, speculative=True):
+        tests_cls = make_mock_check_class("tests", duration=0.2, depends_on=[FMT])
+        registry = CheckRegistry()
+        registry.register(fmt_cls)
+        registry.register(tests_cls)
+        executor = CheckExecutor(
+            registry=registry, fail_fast=False, speculative=speculative
+        )
+        start = time.time()
+        summary = executor.run_checks(str(tmp_path), [FMT, TESTS])
+        return summary, tests_cls, time.time() - start
+
+    def test_dependent_overlaps_passing_dependency(self, tmp_path):
+        fmt_cls = make_mock_check_class("fmt", duration=0.2)
+        summary, tests_cls, elapsed = self._run(tmp_path, fmt_cls)
+
+        assert summary.passed == 2
+        assert tests_cls.run_count == 1
+        assert elapsed < 0.35  # serial would be >= 0.4s
+
+    def test_failed_dependency_discards_speculative_result(self, tmp_path):
+        fmt_cls = make_mock_check_class("fmt", duration=0.1, status=CheckStatus.FAILED)
+        summary, tests_cls, _ = self._run(tmp_path, fmt_cls)
+
+        results = {r.name: r for r in summary.results}
+        assert results[TESTS].skip_reason == SkipReason.FAILED_DEPENDENCY
+        assert tests_cls.run_count == 1
+
+    def test_dependency_that_rewrites_files_forces_rerun(self, tmp_path):
+        fmt_cls = make_mock_check_class("fmt", duration=0.1)
+        base_run = fmt_cls.run
+
+        def rewriting_run(self, project_root):
+            result = base_run(self, project_root)
+            Path(project_root, "module.py").write_text("x = 1\n")
+            return result
+
+        fmt_cls.run = rewriting_run
+        summary, tests_cls, _ = self._run(tmp_path, fmt_cls)
+
+        assert summary.passed == 2
+        assert tests_cls.run_count == 2
+
+    def test_off_by_default(self, tmp_path):
+        fmt_cls = make_mock_check_class("fmt", duration=0.2)
+        _summary, _tests_cls, elapsed = self._run(tmp_path, fmt_cls, speculative=False)
+
+        assert elapsed >= 0.4
+
+
+class TestSpeculativeCacheStores:
+    """Speculative results reach the cache only once accepted."""
+
+    def _stores(self, monkeypatch):
+        from slopmop.core.cache import ResultCache
+
+        stored = []
+        original = ResultCache.store
+
+        def store(self, check_name, fingerprint, result, *args, **kwargs):
+            stored.append((check_name, fingerprint, result.status))
+            return original(self, check_name, fingerprint, result, *args, **kwargs)
+
+        monkeypatch.setattr(ResultCache, "store", store)
+        return stored
+
+    def _run(self, tmp_path, fmt_cls):
+        registry = CheckRegistry()
+        registry.register(fmt_cls)
+        registry.register(
+            make_mock_check_class("tests", duration=0.2, depends_on=[FMT])
+        )
+        executor = CheckExecutor(registry=registry, fail_fast=False, speculative=True)
+        return executor.run_checks(str(tmp_path), [FMT, TESTS])
+
+    def test_accepted_result_is_stored(self, tmp_path, monkeypatch):
+        stored = self._stores(monkeypatch)
+        self._run(tmp_path, make_mock_check_class("fmt", duration=0.1))
+
+        assert [s[2] for s in stored if s[0] == TESTS] == [CheckStatus.PASSED]
+
+    def test_failed_dependency_result_is_not_stored(self, tmp_path, monkeypatch):
+        stored = self._stores(monkeypatch)
+        fmt_cls = make_mock_check_class("fmt", duration=0.1, status=CheckStatus.FAILED)
+        self._run(tmp_path, fmt_cls)
+
+        assert [s for s in stored if s[0] == TESTS] == []
+
+    def test_discarded_result_is_not_stored(self, tmp_path, monkeypatch):
+        stored = self._stores(monkeypatch)
+        fmt_cls = make_mock_check_class("fmt", duration=0.1)
+        base_run = fmt_cls.run
+
+        def rewriting_run(self, project_root):
+            result = base_run(self, project_root)
+            Path(project_root, "module.py").write_text("x = 1\n")
+            return result
+
+        fmt_cls.run = rewriting_run
+        self._run(tmp_path, fmt_cls)
+
+        # Only the rerun on the rewritten tree is cached.
+        assert len([s for s in stored if s[0] == TESTS]) == 1
@@ -0,0 +1,44 @@
+"""Tests for the shared .slopmop/ state-file helpers."""
+
+import json
+
+import pytest
+
+from slopmop.utils.state_files import (
+    atomic_write_bytes,
+    atomic_write_text,
+    load_versioned_json,
+)
+
+
+class TestAtomicWrite:
+    def test_creates_parents_and_replaces(self, tmp_path):
+        path = tmp_path / ".slopmop" / "state.json"
+        atomic_write_text(path, "one")
+        atomic_write_text(path, "two")
+        assert path.read_text() == "two"
+        assert [p.name for p in path.parent.iterdir()] == ["state.json"]
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path):
+        target = tmp_path / "taken"
+        target.mkdir()
+        (target / "child").write_text("x")
+        with pytest.raises(OSError):
+            atomic_write_bytes(target, b"blob")
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["taken"]
+
+
+class TestLoadVersionedJson:
+    def test_matching_version(self, tmp_path):
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps({"version": 2, "files": {}}))
+        assert load_versioned_json(path, 2) == {"version": 2, "files": {}}
+
+    @pytest.mark.parametrize(
+        "content", ['{"version": 1, "files": {}}', "[2]", "{corrupt", None]
+    )
+    def test_unusable_file_is_none(self, tmp_path, content):
+        path = tmp_path / "state.json"
+        if content is not None:
+            path.write_text(content)
+        assert load_versioned_json(path, 2) is None
@@ -0,0 +1,133 @@
+"""Tests for the incremental string-literal inventory."""
+
+import json
+
+from slopmop.checks.quality import _string_inventory as si
+from slopmop.checks.quality._string_inventory import (
+    StringInventory,
+    extract_strings,
+    get_string_inventory,
+    python_strings,
+)
+
+
+class TestPythonStrings:
+    def test_skips_docstrings_and_comments(self):
+        source = (
+            '"""Module docstring."""\n'
+            "# 'quoted in a comment'\n"
+            "def f():\n"
+            "    '''Function docstring.'''\n"
+            '    return "kept literal"\n'
+        )
+        assert python_strings(source) == {"kept literal": 1}
+
+    def test_strips_prefixes_and_triple_quotes(self):
+        source = 'A = b"bytes here"\nB = r"""raw\\d here"""\nC = f"hi {name}"\n'
+        assert python_strings(source) == {
+            "bytes here": 1,
+            "raw\\d here": 1,
+            "hi {name}": 1,
+        }
+
+    def test_quotes_inside_strings_are_not_literals(self):
+        assert python_strings("A = \"it's 'nested' text\"\n") == {
+            "it's 'nested' text": 1
+        }
+
+    def test_empty_strings_skipped(self):
+        assert python_strings("A = ''\nB = \"\"\n") == {}
+
+    def test_untokenizable_python_falls_back_to_regex(self):
+        assert extract_strings("bad.py", 'x = ("open paren "\n') == {"open paren ": 1}
+
+    def test_other_files_use_regex(self):
+        assert extract_strings("app.js", "const a = 'x y'; // \"x y\"\n") == {"x y": 2}
+
+
+class TestStringInventory:
+    def test_counts_across_files(self, tmp_path):
+        (tmp_path / "a.py").write_text('A = "shared"\nB = "shared"\n')
+        (tmp_path / "b.py").write_text('C = "shared"\nD = "solo"\n')
+        inventory = StringInventory(str(tmp_path))
+
+        assert inventory.refresh(["a.py", "b.py"]) == 2
+
+        (dup,) = inventory.duplicates(threshold=2)
+        assert dup["key"] == "shared"
+        assert dup["count"] == 3 and dup["fileCount"] == 2
+        assert dup["files"] == [str(tmp_path / "a.py"), str(tmp_path / "b.py")]
+
+    def test_unchanged_files_not_reextracted(self, tmp_path):
+        (tmp_path / "a.py").write_text('A = "shared"\n')
+        inventory = StringInventory(str(tmp_path))
+        inventory.refresh(["a.py"])
+
+        assert inventory.refresh(["a.py"]) == 0
+
+    def test_edit_and_delete_adjust_counts(self, tmp_path):
+        (tmp_path / "a.py").write_text('A = "shared"\nB = "shared"\n')
+        (tmp_path / "b.py").write_text('C = "shared"\n')
+        inventory = StringInventory(str(tmp_path))
+        inventory.refresh(["a.py", "b.py"])
+
+        (tmp_path / "a.py").write_text('A = "shared"\n')
+        assert inventory.refresh(["a.py", "b.py"]) == 1
+        assert inventory.duplicates(threshold=1)[0]["count"] == 2
+
+        (tmp_path / "b.py").unlink()
+        inventory.refresh(["a.py", "b.py"])
+        assert inventory.duplicates(threshold=0) == [
+            {
+                "key": "shared",
+                "count": 1,
+                "fileCount": 1,
+                "files": [str(tmp_path / "a.py")],
+            }
+        ]
+
+    def test_deselected_files_dropped(self, tmp_path):
+        (tmp_path / "a.py").write_text('A = "shared"\n')
+        (tmp_path / "b.py").write_text('B = "shared"\n')
+        inventory = StringInventory(str(tmp_path))
+        inventory.refresh(["a.py", "b.py"])
+
+        inventory.refresh(["a.py"])
+
+        assert inventory.duplicates(threshold=1) == []
+
+    def test_saved_inventory_reused_by_next_process(self, tmp_path, monkeypatch):
+        (tmp_path / "a.py").write_text('A = "shared"\nB = "shared"\n')
+        first = StringInventory(str(tmp_path))
+        first.refresh(["a.py"])
+        first.save(generated_by="test")
+
+        saved = json.loads(
+            (tmp_path / ".slopmop" / "string-duplication-inventory.json").read_text()
+        )
+        assert saved["version"] == si.INVENTORY_VERSION
+        assert saved["generated_by"] == "test"
+        assert saved["files"]["a.py"]["strings"] == {"shared": 2}
+
+        def fail(rel, source):
+            raise AssertionError(f"re-extracted {rel}")
+
+        monkeypatch.setattr(si, "extract_strings", fail)
+        second = StringInventory(str(tmp_path))
+        assert second.refresh(["a.py"]) == 0
+        assert second.duplicates(threshold=1)[0]["count"] == 2
+
+    def test_old_version_ignored(self, tmp_path):
+        (tmp_path / "a.py").write_text('A = "shared"\n')
+        inventory_dir = tmp_path / ".slopmop"
+        inventory_dir.mkdir()
+        (inventory_dir / "string-duplication-inventory.json").write_text(
+            json.dumps({"version": 1, "files": {"a.py": {"sha256": "x"}}})
+        )
+
+        assert StringInventory(str(tmp_path)).refresh(["a.py"]) == 1
+
+    def test_process_wide_instance(self, tmp_path):
+        assert get_string_inventory(str(tmp_path)) is get_string_inventory(
+            str(tmp_path / ".")
+        )
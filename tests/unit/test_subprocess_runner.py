@@ -9,10 +9,12 @@ from unittest.mock import MagicMock
 import pytest
 
 from slopmop.subprocess.runner import (
+    GATE_OWNER,
     SubprocessResult,
     SubprocessRunner,
     get_runner,
     run_command,
+    submit_in_gate,
 )
 from slopmop.subprocess.validator import SecurityError
 
@@ -291,6 +293,80 @@ class TestSubprocessRunner:
             if child_pid and _pid_exists(child_pid):
                 os.kill(child_pid, signal.SIGKILL)
 
+    @pytest.mark.skipif(
+        os.name == "nt",
+        reason="Process-group tree cleanup is exercised on POSIX runners.",
+    )
+    def test_terminate_owned_by_only_stops_that_threads_processes(self):
+        """terminate_owned_by leaves other threads' processes running."""
+        import threading
+
+        runner = SubprocessRunner(validator=MagicMock())
+        sleep = [sys.executable, "-c", "import time\ntime.sleep(30)"]
+        mine, _ = runner.start_background(sleep)
+        theirs: list = []
+        worker = threading.Thread(
+            target=lambda: theirs.append(runner.start_background(sleep)[0])
+        )
+        worker.start()
+        worker.join()
+
+        try:
+            owner = threading.get_ident()
+            start = time.time()
+            assert runner.terminate_owned_by({owner}, grace_period=0.5) == {owner}
+            assert time.time() - start < 5
+            assert mine.poll() is not None
+            assert theirs[0].poll() is None
+            assert runner.terminate_owned_by({-1}) == set()
+        finally:
+            runner.terminate_all(grace_period=0.5)
+
+    @pytest.mark.skipif(
+        os.name == "nt",
+        reason="Process-group tree cleanup is exercised on POSIX runners.",
+    )
+    def test_gate_pool_processes_belong_to_the_gate(self):
+        """Work a gate fans out to its own pool stays the gate's to kill."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        runner = SubprocessRunner(validator=MagicMock())
+        sleep = [sys.executable, "-c", "import time\ntime.sleep(30)"]
+        token = GATE_OWNER.set("myopia:security")
+        try:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                future = submit_in_gate(pool, runner.run, sleep, 60)
+                while not runner.terminate_owned_by({"myopia:security"}, 0.5):
+                    time.sleep(0.05)
+                result = future.result(timeout=10)
+        finally:
+            GATE_OWNER.reset(token)
+            runner.terminate_all(grace_period=0.5)
+
+        assert not result.success
+        assert result.duration < 10
+
+    @pytest.mark.skipif(
+        os.name == "nt",
+        reason="Process-group tree cleanup is exercised on POSIX runners.",
+    )
+    def test_terminate_all_honours_grace_period(self):
+        """A process that ignores SIGTERM is SIGKILLed after the grace."""
+        runner = SubprocessRunner(validator=MagicMock())
+        stubborn = (
+            "import signal, time\n"
+            "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+            "print('ready', flush=True)\n"
+            "time.sleep(30)\n"
+        )
+        process, _ = runner.start_background([sys.executable, "-c", stubborn])
+        process.stdout.readline()
+
+        start = time.time()
+        assert runner.terminate_all(grace_period=0.3) == 1
+        assert 0.25 <= time.time() - start < 5
+        assert process.poll() is not None
+
     def test_run_captures_stderr(self):
         """Test that stderr is captured."""
         # Create a runner with a mock validator that allows anything
@@ -0,0 +1,85 @@
+"""Tests for the shared single-pass text-scan engine."""
+
+import re
+from pathlib import Path
+
+from slopmop.core.snapshot import ProjectSnapshot, use_snapshot
+from slopmop.core.text_scan import (
+    LineHit,
+    LineRule,
+    PatternSet,
+    register_patterns,
+    scan_file,
+    suffix_in,
+)
+
+_TODO = PatternSet(
+    owner="scan-test-todo",
+    applies_to=suffix_in(frozenset({".scantest"})),
+    rules=(
+        LineRule("todo", re.compile(r"\bTODO\b"), unless=re.compile(r"TODO\(\w+\)")),
+        LineRule("stop", re.compile(r"^\s*stop\s*$")),
+    ),
+    comment_prefixes=("#",),
+)
+_SHOUT = PatternSet(
+    owner="scan-test-shout",
+    applies_to=suffix_in(frozenset({".scantest"})),
+    rules=(LineRule("shout", re.compile(r"todo", re.IGNORECASE)),),
+)
+register_patterns(_TODO, _SHOUT)
+
+
+def _naive(text, pattern_set):
+    """The per-line scan the engine replaces."""
+    hits = []
+    for lineno, line in enumerate(text.splitlines(), 1):
+        if pattern_set.comment_prefixes and line.lstrip().startswith(
+            pattern_set.comment_prefixes
+        ):
+            continue
+        for rule in pattern_set.rules:
+            if rule.pattern.search(line) and not (
+                rule.unless and rule.unless.search(line)
+            ):
+                hits.append(LineHit(rule.rule_id, lineno))
+    return hits
+
+
+class TestScanFile:
+    def test_hits_keyed_by_owner(self, tmp_path):
+        (tmp_path / "a.scantest").write_text("x\nTODO fix\n# TODO\nTODO(bob) ok\n")
+        hits = scan_file(str(tmp_path), "a.scantest")
+        assert hits["scan-test-todo"] == [LineHit("todo", 2)]
+        assert [h.line for h in hits["scan-test-shout"]] == [2, 3, 4]
+
+    def test_matches_per_line_scan(self, tmp_path):
+        text = "\n\n  stop\r\nstop later\nTODO\r\n\n\n   \nstop\n# stop\nend TODO"
+        (tmp_path / "b.scantest").write_bytes(text.encode())
+        hits = scan_file(str(tmp_path), "b.scantest")
+        for pattern_set in (_TODO, _SHOUT):
+            expected = _naive(text, pattern_set)
+            assert hits.get(pattern_set.owner, []) == expected
+
+    def test_other_files_untouched(self, tmp_path):
+        (tmp_path / "c.txt").write_text("TODO\n")
+        assert scan_file(str(tmp_path), "c.txt") == {}
+
+    def test_unreadable_file(self, tmp_path):
+        assert scan_file(str(tmp_path), "missing.scantest") == {}
+
+    def test_one_read_per_run(self, tmp_path, monkeypatch):
+        (tmp_path / "d.scantest").write_text("TODO\n")
+        reads = []
+        original = Path.read_bytes
+
+        def counting(self):
+            reads.append(self.name)
+            return original(self)
+
+        monkeypatch.setattr(Path, "read_bytes", counting)
+        with use_snapshot(ProjectSnapshot(str(tmp_path))):
+            first = scan_file(str(tmp_path), "d.scantest")
+            second = scan_file(str(tmp_path), "d.scantest")
+        assert first is second
+        assert reads == ["d.scantest"]
@@ -0,0 +1,133 @@
+"""Tests for tool-version-aware cache keys."""
+
+import stat
+import sys
+
+import pytest
+
+from slopmop.checks.base import Requirement, Requirements
+from slopmop.core import tool_identity as ti
+from slopmop.core.executor import CheckExecutor
+from slopmop.core.registry import CheckRegistry
+from tests.unit.test_executor import make_mock_check_class
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memo():
+    ti._memo.clear()
+    yield
+    ti._memo.clear()
+
+
+def _fake_tool(path, version):
+    """A ``--version``-answering script that counts its invocations."""
+    path.write_text(
+        f"#!{sys.executable}\n"
+        "import pathlib, sys\n"
+        f"log = pathlib.Path({str(path) + '.calls'!r})\n"
+        "log.write_text(log.read_text() + 'x' if log.exists() else 'x')\n"
+        f"print('faketool {version}')\n"
+    )
+    path.chmod(path.stat().st_mode | stat.S_IEXEC)
+    return path
+
+
+def _identity(root, tools):
+    return ti.tool_identity(ti.describe_tools(root, tools))
+
+
+def _calls(path):
+    calls = path.with_name(path.name + ".calls")
+    return len(calls.read_text()) if calls.exists() else 0
+
+
+class TestToolVersion:
+    def test_probed_once_then_memoized(self, tmp_path):
+        tool = _fake_tool(tmp_path / "faketool", "1.0")
+        assert ti.tool_version(str(tool), str(tmp_path)) == "faketool 1.0"
+        assert ti.tool_version(str(tool), str(tmp_path)) == "faketool 1.0"
+        assert _calls(tool) == 1
+
+    def test_memo_persists_across_processes(self, tmp_path):
+        tool = _fake_tool(tmp_path / "faketool", "1.0")
+        ti.tool_version(str(tool), str(tmp_path))
+        ti._memo.clear()
+        assert ti.tool_version(str(tool), str(tmp_path)) == "faketool 1.0"
+        assert _calls(tool) == 1
+
+    def test_reprobed_when_tool_changes(self, tmp_path):
+        tool = _fake_tool(tmp_path / "faketool", "1.0")
+        ti.tool_version(str(tool), str(tmp_path))
+        _fake_tool(tool, "2.0.0")
+        assert ti.tool_version(str(tool), str(tmp_path)) == "faketool 2.0.0"
+
+    def test_unrunnable_tool_is_unknown(self, tmp_path):
+        tool = tmp_path / "broken"
+        tool.write_text("not executable")
+        assert ti.tool_version(str(tool), str(tmp_path)) == "unknown"
+
+
+class TestToolIdentity:
+    def test_changes_with_tool_version(self, tmp_path):
+        tool = _fake_tool(tmp_path / "faketool", "1.0")
+        before = _identity(str(tmp_path), {"faketool": str(tool)})
+        _fake_tool(tool, "2.0.0")
+        after = _identity(str(tmp_path), {"faketool": str(tool)})
+        assert before != after
+
+    def test_missing_tool_differs_from_present(self, tmp_path):
+        tool = _fake_tool(tmp_path / "faketool", "1.0")
+        assert _identity(str(tmp_path), {"faketool": None}) != (
+            _identity(str(tmp_path), {"faketool": str(tool)})
+        )
+
+    def test_same_tools_in_different_checkouts_agree(self, tmp_path):
+        identities = []
+        for checkout in ("a", "b"):
+            root = tmp_path / checkout
+            (root / "venv" / "bin").mkdir(parents=True)
+            tool = _fake_tool(root / "venv" / "bin" / "faketool", "1.0")
+            identities.append(_identity(str(root), {"faketool": str(tool)}))
+        assert identities[0] == identities[1]
+
+    def test_venv_packages_listed(self, tmp_path):
+        venv = tmp_path / "venv"
+        site = venv / "lib" / "python3.11" / "site-packages"
+        (site / "pytest-8.0.0.dist-info").mkdir(parents=True)
+        (site / "pytest").mkdir()
+        (venv / "pyvenv.cfg").write_text("home = /usr/bin\n")
+        python = str(venv / "bin" / "python")
+        assert ti.venv_packages(python) == ["pytest-8.0.0.dist-info"]
+        assert ti.venv_packages(str(tmp_path / "bin" / "python")) == []
+
+
+class TestExecutorToolIdentity:
+    def test_tool_upgrade_invalidates_cached_result(self, tmp_path):
+        (tmp_path / "venv" / "bin").mkdir(parents=True)
+        tool = _fake_tool(tmp_path / "venv" / "bin" / "faketool", "1.0")
+        cls = make_mock_check_class("tooled")
+        cls.requirements = lambda self: Requirements(
+            items=(Requirement(kind="system", name="faketool"),)
+        )
+        runs = []
+        original_run = cls.run
+
+        def run(self, project_root):
+            runs.append(1)
+            return original_run(self, project_root)
+
+        cls.run = run
+        registry = CheckRegistry()
+        registry.register(cls)
+        (tmp_path / "main.py").write_text("x = 1\n")
+
+        def validate():
+            return CheckExecutor(registry=registry).run_checks(
+                str(tmp_path), ["overconfidence:tooled"]
+            )
+
+        validate()
+        assert validate().results[0].cached
+        _fake_tool(tool, "2.0.0")
+        assert not validate().results[0].cached
+        assert len(runs) == 2
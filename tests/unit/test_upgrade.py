@@ -2,6 +2,7 @@
 
 import argparse
 import json
+import sqlite3
 import subprocess
 from importlib.metadata import PackageNotFoundError
 from pathlib import Path
@@ -223,6 +224,36 @@ class TestBackupUpgradeState:
         assert (backup_dir / "manifest.json").exists()
         assert not (backup_dir / ".sb_config.json").exists()
 
+    def test_backup_checkpoints_wal_cache_store(self, tmp_path: Path):
+        state_dir = tmp_path / ".slopmop"
+        state_dir.mkdir()
+        live = sqlite3.connect(str(state_dir / "cache.db"), isolation_level=None)
+        live.execute("PRAGMA journal_mode=WAL")
+        live.execute("PRAGMA wal_autocheckpoint=0")
+        live.execute("CREATE TABLE results (gate TEXT)")
+        live.execute("INSERT INTO results VALUES ('laziness:dead-code')")
+        assert (state_dir / "cache.db-wal").stat().st_size > 0
+
+        try:
+            backup_dir = _backup_upgrade_state(
+                tmp_path,
+                from_version="0.9.0",
+                target_version="0.9.1",
+                install_type="venv",
+            )
+        finally:
+            live.close()
+
+        # The backed-up main file alone must carry the committed rows.
+        copy = sqlite3.connect(str(backup_dir / "cache.db"))
+        try:
+            rows = copy.execute("SELECT gate FROM results").fetchall()
+        finally:
+            copy.close()
+        assert rows == [("laziness:dead-code",)]
+        manifest = json.loads((backup_dir / "manifest.json").read_text())
+        assert "cache.db-wal" not in manifest["copied_files"]
+
 
 class TestInstallCommandHelpers:
     @patch("slopmop.cli.upgrade.shutil.which", return_value=None)
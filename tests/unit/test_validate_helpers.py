@@ -87,6 +87,13 @@ class TestPorcelainMode:
     def test_reads_flag(self):
         assert _is_porcelain_mode(argparse.Namespace(porcelain=True)) is True
 
+    def test_jsonl_disables_agent_autodetect(self, monkeypatch):
+        monkeypatch.setattr(
+            "slopmop.utils.environment.is_agent_environment", lambda: True
+        )
+        ns = argparse.Namespace(jsonl_output=True)
+        assert _is_porcelain_mode(ns) is False
+
     def test_multiple_args_are_merged(self):
         result = _parse_quality_gates(
             self._ns(["myopia:code-sprawl", "laziness:dead-code.py"])